@@ -22,14 +22,19 @@ Why this works:
 
 import asyncio
 import base64
+import concurrent.futures
 import json
 import logging
 import os
+import threading
 import time
 import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from email.mime.text import MIMEText
 from typing import Any
+from urllib.parse import urlencode
 
 # WebSocket import for Railway log subscriptions
 try:
@@ -96,68 +101,256 @@ DOCS_API = "https://docs.googleapis.com/v1"
 OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"  # noqa: S105
 
 
-class WorkspaceAuth:
-    """Handles Google Workspace OAuth authentication."""
+@dataclass(frozen=True)
+class OAuthClientCredentials:
+    """OAuth client credentials used to mint access tokens.
 
-    _instance = None
-    _access_token: str | None = None
-    _token_expiry: float = 0
+    Attributes:
+        client_id: Google OAuth client ID
+        client_secret: Google OAuth client secret
+        refresh_token: Long-lived refresh token
+    """
 
-    def __new__(cls) -> "WorkspaceAuth":
-        """Singleton pattern for token management."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    client_id: str
+    client_secret: str
+    refresh_token: str
+
+
+class TokenRefreshError(ValueError):
+    """Raised when the token endpoint rejects a refresh.
+
+    Attributes:
+        status_code: HTTP status returned by the token endpoint
+    """
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class GoogleTokenProvider:
+    """Caches a Google OAuth access token and refreshes it with a single flight.
+
+    Attributes:
+        expiry_buffer: Seconds before expiry at which the token is no longer used
+        refresh_ahead: Seconds before expiry_buffer at which a background
+            refresh starts
+        timeout: Token endpoint request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        load_credentials: Callable[[], OAuthClientCredentials],
+        token_url: str = OAUTH_TOKEN_URL,
+        expiry_buffer: float = 60.0,
+        refresh_ahead: float = 300.0,
+        timeout: float = 30.0,
+    ):
+        """Initialize the provider.
+
+        Args:
+            load_credentials: Returns the OAuth client credentials. Called once
+                and cached until the token endpoint rejects them.
+            token_url: OAuth token endpoint
+            expiry_buffer: Seconds before expiry at which the token is stale
+            refresh_ahead: Extra seconds before that to refresh in the background
+            timeout: Token endpoint request timeout in seconds
+        """
+        self._load_credentials = load_credentials
+        self.token_url = token_url
+        self.expiry_buffer = expiry_buffer
+        self.refresh_ahead = refresh_ahead
+        self.timeout = timeout
+
+        self._credentials: OAuthClientCredentials | None = None
+        self._access_token: str | None = None
+        self._expires_at: float = 0.0
+
+        self._lock = threading.Lock()
+        self._inflight: concurrent.futures.Future[str] | None = None
+        self._background: set[asyncio.Task] = set()
+
+        self.refresh_count = 0
+
+    @property
+    def access_token(self) -> str | None:
+        """Currently cached access token, if any."""
+        return self._access_token
+
+    @property
+    def expires_at(self) -> float:
+        """Epoch time at which the cached token expires."""
+        return self._expires_at
+
+    def is_valid(self) -> bool:
+        """Check whether the cached token can still be used.
+
+        Returns:
+            True if a token is cached and not within expiry_buffer of expiry
+        """
+        return bool(self._access_token) and time.time() < self._expires_at - self.expiry_buffer
 
     async def get_access_token(self) -> str:
         """Get a valid access token, refreshing if needed.
 
+        Concurrent callers share one refresh. A token within refresh_ahead of
+        going stale is returned as-is while a refresh runs in the background.
+
         Returns:
             Valid access token
 
         Raises:
-            Exception: If unable to get token
+            TokenRefreshError: If the token endpoint rejects the refresh
+            ValueError: If the credentials cannot be loaded
         """
-        # Check if current token is still valid (with 60s buffer)
-        if self._access_token and time.time() < self._token_expiry - 60:
-            return self._access_token
-
-        # Get credentials from Secret Manager
-        client_id = get_secret("GOOGLE-OAUTH-CLIENT-ID")
-        client_secret = get_secret("GOOGLE-OAUTH-CLIENT-SECRET")
-        refresh_token = get_secret("GOOGLE-OAUTH-REFRESH-TOKEN")
-
-        if not all([client_id, client_secret, refresh_token]):
-            missing = []
-            if not client_id:
-                missing.append("GOOGLE-OAUTH-CLIENT-ID")
-            if not client_secret:
-                missing.append("GOOGLE-OAUTH-CLIENT-SECRET")
-            if not refresh_token:
-                missing.append("GOOGLE-OAUTH-REFRESH-TOKEN")
-            raise ValueError(f"Missing OAuth secrets: {missing}")
-
-        # Refresh the token
-        async with httpx.AsyncClient() as client:
+        if self.is_valid():
+            if time.time() >= self._expires_at - self.expiry_buffer - self.refresh_ahead:
+                self._refresh_in_background()
+            return self._access_token  # type: ignore[return-value]
+
+        return await self.refresh()
+
+    async def refresh(self) -> str:
+        """Refresh the access token, joining a refresh already in progress.
+
+        Returns:
+            New access token
+        """
+        with self._lock:
+            future = self._inflight
+            leader = future is None
+            if leader:
+                future = self._inflight = concurrent.futures.Future()
+
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            token = await self._fetch_token()
+        except asyncio.CancelledError:
+            future.set_exception(RuntimeError("Token refresh was cancelled"))
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(token)
+            return token
+        finally:
+            with self._lock:
+                self._inflight = None
+
+    def invalidate(self, credentials: bool = False) -> None:
+        """Drop the cached token so the next call refreshes.
+
+        Args:
+            credentials: Also drop cached credentials so they are reloaded
+        """
+        self._access_token = None
+        self._expires_at = 0.0
+        if credentials:
+            self._credentials = None
+
+    def _refresh_in_background(self) -> None:
+        """Start a refresh without waiting for it, unless one is running."""
+        if self._inflight is not None or self._background:
+            return
+
+        task = asyncio.get_running_loop().create_task(self.refresh())
+        self._background.add(task)
+        task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        """Log a failed background refresh; the current token stays in use."""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background token refresh failed: {task.exception()}")
+
+    async def _fetch_token(self) -> str:
+        """Post the refresh token to the token endpoint and cache the result."""
+        if self._credentials is None:
+            self._credentials = self._load_credentials()
+        credentials = self._credentials
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
             response = await client.post(
-                OAUTH_TOKEN_URL,
+                self.token_url,
                 data={
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "refresh_token": refresh_token,
+                    "client_id": credentials.client_id,
+                    "client_secret": credentials.client_secret,
+                    "refresh_token": credentials.refresh_token,
                     "grant_type": "refresh_token",
                 },
             )
 
-            if response.status_code != 200:
-                raise ValueError(f"Token refresh failed: {response.text}")
+        if response.status_code != 200:
+            if response.status_code in (400, 401):
+                # Rejected credentials may have been rotated - reload next time
+                self._credentials = None
+            raise TokenRefreshError(
+                f"Token refresh failed: {response.text}", response.status_code
+            )
+
+        data = response.json()
+        self._access_token = data["access_token"]
+        self._expires_at = time.time() + data.get("expires_in", 3600)
+        self.refresh_count += 1
+
+        logger.info("Google OAuth access token refreshed")
+        return self._access_token
+
+
+def _load_oauth_credentials() -> OAuthClientCredentials:
+    """Load the Workspace OAuth client credentials from Secret Manager.
+
+    Raises:
+        ValueError: If any of the secrets is missing
+    """
+    client_id = get_secret("GOOGLE-OAUTH-CLIENT-ID")
+    client_secret = get_secret("GOOGLE-OAUTH-CLIENT-SECRET")
+    refresh_token = get_secret("GOOGLE-OAUTH-REFRESH-TOKEN")
 
-            data = response.json()
-            self._access_token = data["access_token"]
-            self._token_expiry = time.time() + data.get("expires_in", 3600)
+    if not all([client_id, client_secret, refresh_token]):
+        missing = []
+        if not client_id:
+            missing.append("GOOGLE-OAUTH-CLIENT-ID")
+        if not client_secret:
+            missing.append("GOOGLE-OAUTH-CLIENT-SECRET")
+        if not refresh_token:
+            missing.append("GOOGLE-OAUTH-REFRESH-TOKEN")
+        raise ValueError(f"Missing OAuth secrets: {missing}")
 
-            logger.info("Google Workspace access token refreshed")
-            return self._access_token
+    return OAuthClientCredentials(client_id, client_secret, refresh_token)
+
+
+class WorkspaceAuth:
+    """Handles Google Workspace OAuth authentication.
+
+    Mirrors src/google_token_provider.py, which this function cannot import.
+    Each request runs its tool in asyncio.run on its own thread, so the
+    provider coordinates refreshes across threads: a burst of requests on an
+    expired token triggers a single refresh.
+    """
+
+    _instance = None
+    _provider = GoogleTokenProvider(_load_oauth_credentials)
+
+    def __new__(cls) -> "WorkspaceAuth":
+        """Singleton pattern for token management."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    async def get_access_token(self) -> str:
+        """Get a valid access token, refreshing if needed.
+
+        Returns:
+            Valid access token
+
+        Raises:
+            Exception: If unable to get token
+        """
+        return await self._provider.get_access_token()
 
 
 # Global auth instance
@@ -170,6 +363,176 @@ async def _get_workspace_headers() -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+# =============================================================================
+# Gmail Batch Fetch Layer
+# =============================================================================
+
+# Gmail's multipart batch endpoint accepts up to 100 calls per request, but
+# Google recommends at most 50 to avoid per-item rate limiting.
+GMAIL_BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+GMAIL_BATCH_SIZE = 50
+GMAIL_BATCH_CONCURRENCY = 4
+
+# Field mask for metadata fetches - only what the summaries use
+GMAIL_METADATA_FIELDS = "id,threadId,snippet,payload/headers"
+
+
+def _build_batch_body(requests: list[tuple[str, str]], boundary: str) -> bytes:
+    """Encode (method, path) pairs as a multipart/mixed batch body.
+
+    Each part's Content-ID is its index so responses can be matched back.
+    """
+    lines: list[str] = []
+    for index, (method, path) in enumerate(requests):
+        lines.extend(
+            [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <item{index}>",
+                "",
+                f"{method} {path}",
+                "",
+            ]
+        )
+    lines.append(f"--{boundary}--")
+    return "\r\n".join(lines).encode()
+
+
+def _parse_batch_response(
+    content: bytes, content_type: str, count: int
+) -> list[tuple[int, Any]]:
+    """Split a multipart/mixed batch response into (status, body) pairs.
+
+    Results are returned in request order. Parts missing from the response
+    come back as (0, None).
+    """
+    boundary = ""
+    for param in content_type.split(";"):
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        raise ValueError(f"Batch response has no boundary: {content_type}")
+
+    results: list[tuple[int, Any]] = [(0, None)] * count
+    for part in content.decode("utf-8", "replace").split(f"--{boundary}"):
+        part = part.strip()
+        if not part or part == "--":
+            continue
+
+        part_headers, _, http_message = part.replace("\r\n", "\n").partition("\n\n")
+        index = None
+        for line in part_headers.split("\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                # Responses echo the ID as <response-itemN>
+                index = int(value.strip().strip("<>").rsplit("item", 1)[-1])
+        if index is None or not 0 <= index < count:
+            continue
+
+        status_line, _, rest = http_message.partition("\n")
+        status = int(status_line.split()[1])
+        _, _, body = rest.partition("\n\n")
+        body = body.strip()
+        try:
+            results[index] = (status, json.loads(body) if body else {})
+        except json.JSONDecodeError:
+            results[index] = (status, body)
+
+    return results
+
+
+async def _gmail_batch(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    requests: list[tuple[str, str]],
+) -> list[tuple[int, Any]]:
+    """Run Gmail API calls through the multipart batch endpoint.
+
+    Calls are split into chunks of GMAIL_BATCH_SIZE and the chunks are sent
+    concurrently (at most GMAIL_BATCH_CONCURRENCY at a time), so 100 calls
+    cost about one round trip instead of 100.
+
+    Args:
+        client: HTTP client shared by the calling tool
+        headers: Authorization headers, applied to every call in the batch
+        requests: (method, path) pairs, e.g. ("GET", "/gmail/v1/users/me/...")
+
+    Returns:
+        (status_code, parsed_body) for each request, in request order
+
+    Raises:
+        ValueError: If a batch request itself is rejected
+    """
+    semaphore = asyncio.Semaphore(GMAIL_BATCH_CONCURRENCY)
+
+    async def send_chunk(chunk: list[tuple[str, str]]) -> list[tuple[int, Any]]:
+        boundary = f"batch_{uuid.uuid4().hex}"
+        async with semaphore:
+            response = await client.post(
+                GMAIL_BATCH_URL,
+                headers={
+                    **headers,
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+                content=_build_batch_body(chunk, boundary),
+            )
+        if response.status_code != 200:
+            raise ValueError(f"Gmail batch request failed: {response.text}")
+        return _parse_batch_response(
+            response.content, response.headers.get("content-type", ""), len(chunk)
+        )
+
+    chunks = [
+        requests[i : i + GMAIL_BATCH_SIZE]
+        for i in range(0, len(requests), GMAIL_BATCH_SIZE)
+    ]
+    chunk_results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+    return [result for chunk_result in chunk_results for result in chunk_result]
+
+
+async def _gmail_fetch_metadata(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    message_ids: list[str],
+    metadata_headers: list[str],
+) -> list[dict[str, Any]]:
+    """Fetch metadata for many messages in batched calls.
+
+    Args:
+        client: HTTP client shared by the calling tool
+        headers: Authorization headers
+        message_ids: Gmail message IDs to fetch
+        metadata_headers: Header names to include (e.g. ["Subject", "From"])
+
+    Returns:
+        Message resources in input order; messages that failed are omitted
+    """
+    query = urlencode(
+        [("format", "metadata")]
+        + [("metadataHeaders", name) for name in metadata_headers]
+        + [("fields", GMAIL_METADATA_FIELDS)]
+    )
+    results = await _gmail_batch(
+        client,
+        headers,
+        [("GET", f"/gmail/v1/users/me/messages/{mid}?{query}") for mid in message_ids],
+    )
+
+    messages = []
+    for message_id, (status, body) in zip(message_ids, results, strict=True):
+        if status == 200 and isinstance(body, dict):
+            messages.append(body)
+        else:
+            logger.warning(f"Gmail metadata fetch for {message_id} failed: {status}")
+    return messages
+
+
+def _message_headers(message: dict[str, Any]) -> dict[str, str]:
+    """Map a message resource's payload headers by name."""
+    return {h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])}
+
+
 class MCPRouter:
     """
     Routes MCP JSON-RPC requests to appropriate tool handlers.
@@ -1020,40 +1383,35 @@ class MCPRouter:
                 response = await client.get(
                     f"{GMAIL_API}/users/me/messages",
                     headers=headers,
-                    params={"labelIds": label, "maxResults": max_results},
+                    params={
+                        "labelIds": label,
+                        "maxResults": max_results,
+                        "fields": "messages/id",
+                    },
                 )
 
                 if response.status_code != 200:
                     return {"success": False, "error": response.text}
 
                 data = response.json()
-                messages = data.get("messages", [])
+                message_ids = [msg["id"] for msg in data.get("messages", [])]
+
+                fetched = await _gmail_fetch_metadata(
+                    client, headers, message_ids, ["Subject", "From", "Date"]
+                )
 
                 results = []
-                for msg in messages:
-                    msg_response = await client.get(
-                        f"{GMAIL_API}/users/me/messages/{msg['id']}",
-                        headers=headers,
-                        params={
-                            "format": "metadata",
-                            "metadataHeaders": ["Subject", "From", "Date"],
-                        },
-                    )
-                    if msg_response.status_code == 200:
-                        msg_data = msg_response.json()
-                        hdrs = {
-                            h["name"]: h["value"]
-                            for h in msg_data.get("payload", {}).get("headers", [])
+                for msg_data in fetched:
+                    hdrs = _message_headers(msg_data)
+                    results.append(
+                        {
+                            "id": msg_data.get("id"),
+                            "subject": hdrs.get("Subject", ""),
+                            "from": hdrs.get("From", ""),
+                            "date": hdrs.get("Date", ""),
+                            "snippet": msg_data.get("snippet", ""),
                         }
-                        results.append(
-                            {
-                                "id": msg["id"],
-                                "subject": hdrs.get("Subject", ""),
-                                "from": hdrs.get("From", ""),
-                                "date": hdrs.get("Date", ""),
-                                "snippet": msg_data.get("snippet", ""),
-                            }
-                        )
+                    )
 
                 return {
                     "success": True,
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming backup pipeline against the temp-file path.
+
+Both paths back up the same generated database dump into a local directory
+standing in for the GCS bucket. The file path (streaming=False) writes the
+dump to disk, gzips it into memory and back to disk, re-reads it for the
+checksum and copies it out, as gsutil would. The streaming path pipes the
+dump through compression and hashing straight into the upload writer.
+
+Without --database-url the dump comes from a generator that writes
+pg_dump-style COPY data; with it, the real pg_dump runs against that
+database.
+
+Usage:
+    python scripts/benchmark_backup_pipeline.py
+    python scripts/benchmark_backup_pipeline.py --size-mb 1024
+    python scripts/benchmark_backup_pipeline.py --database-url postgresql://localhost/bench
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backup_manager import BackupManager, zstandard
+
+# Writes pg_dump-style COPY data: argv = size in MB [, output file]
+GENERATED_DUMP = """
+import random
+import sys
+
+rows = random.Random(38)
+words = ["pending", "active", "completed", "failed", "retry", "archived"]
+target = int(sys.argv[1]) * 1024 * 1024
+out = open(sys.argv[2], "w") if len(sys.argv) > 2 else sys.stdout
+out.write("COPY public.events (id, trace_id, status, created_at, payload) FROM stdin;\\n")
+written, row_id = 0, 0
+while written < target:
+    block = []
+    for _ in range(10000):
+        row_id += 1
+        block.append(
+            f"{row_id}\\t{rows.randbytes(16).hex()}\\t{rows.choice(words)}\\t"
+            f"2026-01-{row_id % 28 + 1:02d} {row_id % 24:02d}:00:00+00\\t"
+            f'{{"agent": "agent-{row_id % 97}", "score": {rows.random():.6f}}}\\n'
+        )
+    data = "".join(block)
+    out.write(data)
+    written += len(data)
+out.write("\\\\.\\n")
+out.close()
+"""
+
+
+class BenchBackupManager(BackupManager):
+    """BackupManager writing to a local directory instead of GCS."""
+
+    def __init__(self, args: argparse.Namespace, bucket_dir: Path, **kwargs):
+        super().__init__(
+            database_url=args.database_url or "postgresql://bench@localhost/bench",
+            gcs_bucket="bench",
+            temp_dir=str(bucket_dir / "tmp"),
+            **kwargs,
+        )
+        self.args = args
+        self.bucket_dir = bucket_dir
+        self.temp_bytes = 0
+
+    def _local_path(self, gcs_path: str) -> Path:
+        return self.bucket_dir / Path(gcs_path).name
+
+    def _pg_dump_command(self, output_file: Path | None = None) -> list[str]:
+        if self.args.database_url:
+            return super()._pg_dump_command(output_file)
+        cmd = [sys.executable, "-c", GENERATED_DUMP, str(self.args.size_mb)]
+        return cmd + [str(output_file)] if output_file else cmd
+
+    def _open_gcs_writer(self, gcs_path: str):
+        return open(self._local_path(gcs_path), "wb")  # noqa: SIM115
+
+    async def _upload_to_gcs(self, local_file: Path, gcs_path: str) -> None:
+        await asyncio.to_thread(shutil.copyfile, local_file, self._local_path(gcs_path))
+
+    def _cleanup_temp_files(self, temp_dir: Path) -> None:
+        self.temp_bytes = sum(f.stat().st_size for f in temp_dir.iterdir())
+        super()._cleanup_temp_files(temp_dir)
+
+    async def _get_pg_dump_version(self) -> str:
+        return "bench"
+
+    async def _verify_gcs_upload(self, gcs_path: str, expected_checksum: str) -> bool:
+        return True
+
+    async def _save_metadata(self, metadata, gcs_path: str) -> None:
+        return None
+
+
+async def run_backup(args: argparse.Namespace, **kwargs) -> dict:
+    """Run one backup and return elapsed time, memory and disk usage."""
+    with tempfile.TemporaryDirectory() as bucket_dir:
+        manager = BenchBackupManager(args, Path(bucket_dir), **kwargs)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = await manager.create_backup(backup_id="bench")
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    if not result.success:
+        raise RuntimeError(f"Backup failed: {result.error}")
+    return {
+        "elapsed": elapsed,
+        "peak_mb": peak / (1024 * 1024),
+        "temp_mb": manager.temp_bytes / (1024 * 1024),
+        "size_mb": result.metadata.size_mb,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, dict]:
+    """Time the temp-file path and the streaming path."""
+    results = {
+        "files": await run_backup(args, streaming=False),
+        "stream-gz": await run_backup(args),
+    }
+    if zstandard is not None:
+        results["stream-zst"] = await run_backup(args, compression="zstd")
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the backup pipeline")
+    parser.add_argument("--size-mb", type=int, default=256, help="Generated dump size")
+    parser.add_argument(
+        "--database-url", default=None, help="Dump this database with pg_dump instead"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table.
+
+    Returns:
+        Exit code.
+    """
+    args = parse_args()
+    results = asyncio.run(run_benchmark(args))
+
+    print(f"{'path':>10} | {'seconds':>8} | {'peak MB':>8} | {'temp MB':>8} | {'output MB':>9}")
+    print("-" * 56)
+    for name, result in results.items():
+        print(
+            f"{name:>10} | {result['elapsed']:>8.2f} | {result['peak_mb']:>8.1f} | "
+            f"{result['temp_mb']:>8.1f} | {result['size_mb']:>9.1f}"
+        )
+    speedup = results["files"]["elapsed"] / results["stream-gz"]["elapsed"]
+    print(f"\nstreaming gzip speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark GitHub MCP relay throughput against a mocked GitHub API.
+
+Queues a burst of tool-call requests on an in-memory issue and runs one
+relay poll over them. The serial path handles one request at a time and
+posts one comment per response (the relay's previous behaviour); the
+batched path uses the relay defaults (concurrent tool calls, several
+responses per comment). Both obey the same write interval, so the
+comparison shows the cost of GitHub's write pacing under bursty load.
+
+Usage:
+    python scripts/benchmark_github_relay.py
+    python scripts/benchmark_github_relay.py --requests 40 --tool-ms 300 --api-ms 80
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from src.mcp_gateway.config import MCPGatewayConfig
+from src.mcp_gateway.github_relay import (
+    MAX_CONCURRENCY,
+    MAX_RESPONSES_PER_COMMENT,
+    REQUEST_MARKER,
+    WRITE_INTERVAL,
+    GitHubMCPRelay,
+    _encode_message,
+)
+
+
+class MockIssue:
+    """In-memory issue comments API with ETag support and fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.comments: list[dict] = []
+        self.writes = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """Serve GET (list comments) and POST (create comment)."""
+        await asyncio.sleep(self.latency)
+        etag = f'"{len(self.comments)}"'
+        if request.method == "GET":
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304)
+            return httpx.Response(200, json=self.comments[-50:], headers={"ETag": etag})
+
+        self.writes += 1
+        self.comments.append({"body": json.loads(request.content)["body"]})
+        return httpx.Response(201, json={"id": len(self.comments)})
+
+    def add_requests(self, count: int) -> None:
+        """Queue tool-call request comments."""
+        for i in range(count):
+            payload = _encode_message(
+                {"method": "tools/call", "params": {"name": "bench", "arguments": {}}}
+            )
+            self.comments.append({"body": f"{REQUEST_MARKER}bench-{i}:{payload} -->"})
+
+
+async def run_relay(args: argparse.Namespace, concurrency: int, per_comment: int) -> dict:
+    """Process one burst and return elapsed seconds and write count."""
+    issue = MockIssue(args.api_ms / 1000)
+    issue.add_requests(args.requests)
+
+    client = httpx.AsyncClient(
+        base_url="https://api.github.com", transport=httpx.MockTransport(issue.handler)
+    )
+    config = MCPGatewayConfig(
+        railway_token="",
+        railway_service_id="",
+        railway_environment_id="",
+        railway_project_id="",
+        n8n_base_url="",
+        n8n_api_key="",
+        gateway_token="",
+        production_url="",
+        github_relay_repo="bench/relay",
+        github_relay_issue=1,
+    )
+    relay = GitHubMCPRelay(
+        config,
+        github_client=client,
+        max_concurrency=concurrency,
+        max_responses_per_comment=per_comment,
+        write_interval=args.write_interval,
+    )
+    relay._github_token = "bench-token"  # noqa: S105
+
+    async def bench_tool(tool_name: str, arguments: dict) -> dict:
+        await asyncio.sleep(args.tool_ms / 1000)
+        return {"result": {"ok": True}}
+
+    relay._execute_tool = bench_tool  # type: ignore[method-assign]
+
+    start = time.perf_counter()
+    processed = await relay.poll_once()
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+
+    if processed != args.requests:
+        raise RuntimeError(f"Processed {processed} of {args.requests} requests")
+    return {"elapsed": elapsed, "writes": issue.writes}
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, dict]:
+    """Time the serial and batched paths."""
+    return {
+        "serial": await run_relay(args, concurrency=1, per_comment=1),
+        "batched": await run_relay(
+            args, concurrency=args.concurrency, per_comment=MAX_RESPONSES_PER_COMMENT
+        ),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark GitHub MCP relay throughput")
+    parser.add_argument("--requests", type=int, default=20, help="Requests in the burst")
+    parser.add_argument("--tool-ms", type=float, default=200, help="Simulated tool latency")
+    parser.add_argument("--api-ms", type=float, default=50, help="Simulated GitHub latency")
+    parser.add_argument(
+        "--write-interval",
+        type=float,
+        default=WRITE_INTERVAL,
+        help="Minimum seconds between comment writes",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=MAX_CONCURRENCY, help="Batched tool concurrency"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table.
+
+    Returns:
+        Exit code.
+    """
+    args = parse_args()
+    results = asyncio.run(run_benchmark(args))
+
+    print(f"{'path':>8} | {'seconds':>8} | {'req/s':>7} | {'comments':>8}")
+    print("-" * 42)
+    for name, result in results.items():
+        print(
+            f"{name:>8} | {result['elapsed']:>8.2f} | "
+            f"{args.requests / result['elapsed']:>7.1f} | {result['writes']:>8}"
+        )
+    speedup = results["serial"]["elapsed"] / results["batched"]["elapsed"]
+    print(f"\nbatched relay speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-run overhead of harness agent execution.
+
+Compares the cold path (write a temp file and start a fresh python3 for
+every run) against the warm worker pool (fork from a worker that has
+already imported the preload modules). The agent does no work, so the
+timings are pure execution overhead.
+
+Usage:
+    python scripts/benchmark_harness_executor.py
+    python scripts/benchmark_harness_executor.py --runs 50 --imports httpx json
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.harness.executor import execute_agent_code
+from src.harness.worker_pool import WarmWorkerPool
+
+
+def build_agent(imports: list[str]) -> str:
+    """Return a no-op agent that imports the given modules."""
+    header = "\n".join(f"import {name}" for name in imports)
+    return f"""
+{header}
+
+class Agent:
+    def __init__(self, config):
+        self.config = config
+
+    async def execute(self):
+        return {{"status": "success"}}
+"""
+
+
+async def time_runs(agent_code: str, runs: int, pool: WarmWorkerPool | None) -> list[float]:
+    """Return wall-clock milliseconds for each sequential run."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = await execute_agent_code(agent_code, config={}, pool=pool)
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.status != "success":
+            raise RuntimeError(f"Agent run failed: {result.error}")
+    return timings
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, list[float]]:
+    """Time the cold and warm paths."""
+    agent_code = build_agent(args.imports)
+    cold = await time_runs(agent_code, args.runs, pool=None)
+    async with WarmWorkerPool(size=1, max_runs_per_worker=args.runs + 1) as pool:
+        warm = await time_runs(agent_code, args.runs, pool=pool)
+    return {"cold": cold, "warm": warm}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark harness execution overhead")
+    parser.add_argument("--runs", type=int, default=30, help="Sequential runs per path")
+    parser.add_argument(
+        "--imports",
+        nargs="*",
+        default=["json", "httpx"],
+        help="Modules the benchmark agent imports",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table.
+
+    Returns:
+        Exit code.
+    """
+    args = parse_args()
+    results = asyncio.run(run_benchmark(args))
+
+    print(f"{'path':>6} | {'mean ms':>9} | {'p50 ms':>9} | {'p95 ms':>9} | {'runs/s':>8}")
+    print("-" * 54)
+    for name, timings in results.items():
+        ordered = sorted(timings)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        mean = statistics.fmean(timings)
+        print(
+            f"{name:>6} | {mean:>9.1f} | {statistics.median(timings):>9.1f} | "
+            f"{p95:>9.1f} | {1000 / mean:>8.1f}"
+        )
+    speedup = statistics.fmean(results["cold"]) / statistics.fmean(results["warm"])
+    print(f"\nwarm pool speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
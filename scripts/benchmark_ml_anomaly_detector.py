@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark MLAnomalyDetector ingest throughput.
+
+Compares the streaming statistics engine (ring buffer + Welford + sorted
+window) against the previous implementation, which copied, sorted and
+rescanned the whole window on every add_data_point.
+
+Both paths are measured in steady state: the window is pre-filled to
+window_size before timing so every timed point also evicts one.
+
+Usage:
+    python scripts/benchmark_ml_anomaly_detector.py
+    python scripts/benchmark_ml_anomaly_detector.py --windows 100 1000 100000 --points 2000
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ml_anomaly_detector import DataPoint, MLAnomalyDetector
+
+
+class LegacyIngest:
+    """Previous add_data_point/_update_stats path, kept for comparison."""
+
+    def __init__(self, window_size: int, ema_alpha: float = 0.3):
+        self.window_size = window_size
+        self.ema_alpha = ema_alpha
+        self.points: list[DataPoint] = []
+        self.ema: float | None = None
+        self.ema_std = 0.0
+
+    def add_data_point(self, value: float, timestamp: datetime) -> None:
+        self.points.append(DataPoint(value=value, timestamp=timestamp))
+        if len(self.points) > self.window_size * 2:
+            self.points = self.points[-self.window_size :]
+        self._update_stats()
+
+    def _update_stats(self) -> None:
+        if len(self.points) < 2:
+            return
+        values = [p.value for p in self.points[-self.window_size :]]
+        mean = sum(values) / len(values)
+        sorted_vals = sorted(values)
+        n = len(sorted_vals)
+        _median = sorted_vals[n // 2]
+        variance = sum((x - mean) ** 2 for x in values) / len(values)
+        stddev = math.sqrt(variance) if variance > 0 else 0.001
+        _percentiles = (
+            sorted_vals[int(n * 0.25)],
+            sorted_vals[int(n * 0.75)],
+            sorted_vals[int(n * 0.95)],
+            sorted_vals[int(n * 0.99)],
+            min(values),
+            max(values),
+        )
+        if self.ema is None:
+            self.ema, self.ema_std = mean, stddev
+        else:
+            old = self.ema
+            self.ema = self.ema_alpha * values[-1] + (1 - self.ema_alpha) * old
+            diff = abs(values[-1] - old)
+            self.ema_std = self.ema_alpha * diff + (1 - self.ema_alpha) * self.ema_std
+
+
+def bench_legacy(window_size: int, points: int, rng: random.Random) -> float:
+    """Return steady-state points/sec for the legacy path."""
+    now = datetime.now(UTC)
+    legacy = LegacyIngest(window_size)
+    legacy.points = [DataPoint(value=rng.gauss(100, 15), timestamp=now) for _ in range(window_size)]
+
+    start = time.perf_counter()
+    for _ in range(points):
+        legacy.add_data_point(rng.gauss(100, 15), now)
+    return points / (time.perf_counter() - start)
+
+
+def bench_streaming(window_size: int, points: int, rng: random.Random) -> float:
+    """Return steady-state points/sec for the streaming path."""
+    now = datetime.now(UTC)
+    detector = MLAnomalyDetector(window_size=window_size)
+    detector.add_batch("latency", [(rng.gauss(100, 15), now) for _ in range(window_size)])
+
+    start = time.perf_counter()
+    for _ in range(points):
+        detector.add_data_point("latency", rng.gauss(100, 15), now)
+    return points / (time.perf_counter() - start)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark MLAnomalyDetector ingest")
+    parser.add_argument(
+        "--windows",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000, 100_000],
+        help="Window sizes to benchmark",
+    )
+    parser.add_argument(
+        "--points",
+        type=int,
+        default=2_000,
+        help="Timed points per window size (legacy is capped for large windows)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table.
+
+    Returns:
+        Exit code.
+    """
+    args = parse_args()
+    rng = random.Random(args.seed)  # noqa: S311
+
+    print(f"{'window':>8} | {'legacy pts/s':>14} | {'streaming pts/s':>16} | {'speedup':>8}")
+    print("-" * 56)
+    for window_size in args.windows:
+        # Legacy cost grows with the window; keep its run to a few seconds
+        legacy_points = max(20, min(args.points, 20_000_000 // (window_size * 20)))
+        legacy = bench_legacy(window_size, legacy_points, rng)
+        streaming = bench_streaming(window_size, args.points, rng)
+        print(
+            f"{window_size:>8} | {legacy:>14,.0f} | {streaming:>16,.0f} | "
+            f"{streaming / legacy:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -142,6 +142,39 @@ SELECT add_continuous_aggregate_policy(
     if_not_exists => TRUE
 );
 
+-- Per-minute agent status: everything GET /metrics/agents needs in one row
+-- per (minute, agent), so the rolling hour is exact to the minute.
+-- Real-time aggregation (materialized_only = false) fills in the
+-- not-yet-materialized tail from raw rows.
+CREATE MATERIALIZED VIEW IF NOT EXISTS agent_status_minutely
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('1 minute', time) AS bucket,
+    agent_id,
+    MAX(time) AS last_seen,
+    SUM(value) FILTER (WHERE metric_name = 'error_count') AS errors,
+    SUM(value) FILTER (WHERE metric_name IN ('success_count', 'error_count')) AS total_requests,
+    SUM(value) FILTER (WHERE metric_name = 'latency_ms') AS latency_sum,
+    COUNT(*) FILTER (WHERE metric_name = 'latency_ms') AS latency_count,
+    SUM(value) FILTER (
+        WHERE metric_name IN ('tokens_input', 'tokens_output', 'tokens_reasoning')
+    ) AS total_tokens
+FROM agent_metrics
+GROUP BY bucket, agent_id
+WITH NO DATA;
+
+-- Refresh policy: Keep the last two hours current every 5 minutes
+SELECT add_continuous_aggregate_policy(
+    'agent_status_minutely',
+    start_offset => INTERVAL '2 hours',
+    end_offset => INTERVAL '1 minute',
+    schedule_interval => INTERVAL '5 minutes',
+    if_not_exists => TRUE
+);
+
+-- Only the last hour is ever read
+SELECT add_retention_policy('agent_status_minutely', INTERVAL '1 day', if_not_exists => TRUE);
+
 -- =============================================================================
 -- HELPER FUNCTIONS
 -- =============================================================================
@@ -249,5 +282,6 @@ LIMIT 10;
 
 COMMENT ON TABLE agent_metrics IS 'High-frequency time-series metrics for AI agent observability';
 COMMENT ON TABLE agent_traces IS 'Detailed trace data for debugging and analysis';
+COMMENT ON MATERIALIZED VIEW agent_status_minutely IS 'Per-minute agent status rollup backing GET /metrics/agents';
 COMMENT ON FUNCTION get_agent_error_rate IS 'Calculate error rate percentage for an agent over a time interval';
 COMMENT ON FUNCTION get_agent_p95_latency IS 'Calculate P95 latency for an agent over a time interval';
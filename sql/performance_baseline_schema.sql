@@ -0,0 +1,57 @@
+/*
+ * Performance Baseline Schema for Project38-OR
+ *
+ * Tables used by src/performance_baseline.py:
+ * 1. performance_snapshots: one row per collect_metrics() call
+ * 2. performance_baseline_rollups: hourly per-metric rollups, so
+ *    get_baseline_stats() reads O(hours) rows instead of O(snapshots)
+ *
+ * Prerequisites:
+ *   - PostgreSQL 14+
+ *
+ * Usage:
+ *   psql -d project38_db -f sql/performance_baseline_schema.sql
+ *
+ * On a deployment that already has snapshots, backfill the rollups once
+ * with PerformanceBaseline.rebuild_rollups(); until they reach back to the
+ * oldest snapshot in the window, baselines keep using raw snapshots.
+ */
+
+-- =============================================================================
+-- RAW SNAPSHOTS
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS performance_snapshots (
+    id SERIAL PRIMARY KEY,
+    timestamp TIMESTAMPTZ NOT NULL,
+    latency_ms DOUBLE PRECISION NOT NULL,
+    p95_latency_ms DOUBLE PRECISION NOT NULL,
+    error_rate_pct DOUBLE PRECISION NOT NULL,
+    throughput_rph INTEGER NOT NULL,
+    active_agents INTEGER NOT NULL,
+    total_tokens_1h INTEGER NOT NULL,
+    cpu_percent DOUBLE PRECISION NOT NULL,
+    memory_percent DOUBLE PRECISION NOT NULL,
+    UNIQUE(timestamp)
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp
+    ON performance_snapshots(timestamp DESC);
+
+-- =============================================================================
+-- HOURLY ROLLUPS
+-- =============================================================================
+
+-- Maintained by collect_metrics() (one upsert per snapshot) and read by
+-- get_baseline_stats() unless PERFORMANCE_BASELINE_ROLLUPS=false
+CREATE TABLE IF NOT EXISTS performance_baseline_rollups (
+    bucket TIMESTAMPTZ NOT NULL,            -- hour start
+    metric_name TEXT NOT NULL,
+    sample_count BIGINT NOT NULL,
+    value_sum DOUBLE PRECISION NOT NULL,
+    value_sum_sq DOUBLE PRECISION NOT NULL,
+    min_value DOUBLE PRECISION NOT NULL,
+    max_value DOUBLE PRECISION NOT NULL,
+    sketch JSONB NOT NULL,                  -- QuantileSketch bin counts
+    PRIMARY KEY (bucket, metric_name)
+);
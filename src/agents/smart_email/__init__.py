@@ -14,6 +14,7 @@ Architecture (Phase 4):
 Components:
     - graph.py: LangGraph state machine
     - state.py: State definitions (EmailItem, ResearchResult, VerificationResult)
+    - concurrency.py: Bounded-parallel fan-out with per-provider limits
     - nodes/classify.py: LLM-based classification
     - nodes/research.py: Web research for P1/P2 emails
     - nodes/history.py: Sender history lookup
@@ -0,0 +1,139 @@
+"""Bounded-parallel fan-out for Smart Email nodes.
+
+Nodes process emails concurrently instead of one at a time. Each call
+goes through two limits:
+    - a per-node concurrency limit (state["max_concurrency"])
+    - a per-provider limiter (LLM gateway, Gmail API) capping
+      in-flight requests and requests per second
+
+Results keep input order, and a failure in one item is logged and
+replaced with a default instead of failing the whole node.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default number of emails a node processes at once
+DEFAULT_CONCURRENCY = int(os.environ.get("SMART_EMAIL_CONCURRENCY", "10"))
+
+# Provider → (max in-flight requests, max requests per second; 0 = unlimited)
+PROVIDER_LIMITS: dict[str, tuple[int, float]] = {
+    "llm": (
+        int(os.environ.get("SMART_EMAIL_LLM_CONCURRENCY", "5")),
+        float(os.environ.get("SMART_EMAIL_LLM_RPS", "10")),
+    ),
+    "gmail": (
+        int(os.environ.get("SMART_EMAIL_GMAIL_CONCURRENCY", "4")),
+        float(os.environ.get("SMART_EMAIL_GMAIL_RPS", "10")),
+    ),
+}
+
+
+class ProviderLimiter:
+    """Caps in-flight requests and request rate for one provider.
+
+    Usage:
+        limiter = ProviderLimiter(max_concurrent=5, rate_per_second=10)
+        async with limiter:
+            await call_provider()
+    """
+
+    def __init__(self, max_concurrent: int, rate_per_second: float = 0.0):
+        """Initialize limiter.
+
+        Args:
+            max_concurrent: Maximum concurrent requests
+            rate_per_second: Maximum request starts per second (0 = unlimited)
+        """
+        self.max_concurrent = max_concurrent
+        self.rate_per_second = rate_per_second
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        if self.rate_per_second > 0:
+            # Reserve the next start slot, then sleep until it arrives
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate_per_second
+            if slot > now:
+                try:
+                    await asyncio.sleep(slot - now)
+                except BaseException:
+                    self._semaphore.release()
+                    raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._semaphore.release()
+
+
+# Limiters are per event loop: asyncio primitives can't be shared across loops
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, ProviderLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_provider_limiter(provider: str) -> ProviderLimiter:
+    """Get the shared limiter for a provider in the running event loop.
+
+    Args:
+        provider: Provider name (key of PROVIDER_LIMITS)
+
+    Returns:
+        ProviderLimiter shared by all nodes in this loop
+    """
+    loop = asyncio.get_running_loop()
+    limiters = _limiters.setdefault(loop, {})
+    if provider not in limiters:
+        max_concurrent, rate = PROVIDER_LIMITS.get(provider, (DEFAULT_CONCURRENCY, 0.0))
+        limiters[provider] = ProviderLimiter(max_concurrent, rate)
+    return limiters[provider]
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    provider: str | None = None,
+    concurrency: int | None = None,
+    default: Any = None,
+) -> list[R | Any]:
+    """Run worker over items concurrently, keeping input order.
+
+    Args:
+        items: Items to process
+        worker: Async function called once per item
+        provider: Provider limiter to apply (e.g. "llm", "gmail")
+        concurrency: Maximum items in flight (default: DEFAULT_CONCURRENCY)
+        default: Result used for items whose worker raised
+
+    Returns:
+        Results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency or DEFAULT_CONCURRENCY))
+    limiter = get_provider_limiter(provider) if provider else None
+    name = getattr(worker, "__name__", "worker")
+
+    async def run(index: int, item: T) -> R | Any:
+        async with semaphore:
+            try:
+                if limiter is None:
+                    return await worker(item)
+                async with limiter:
+                    return await worker(item)
+            except Exception as e:
+                logger.warning(f"{name} failed for item {index}: {e}")
+                return default
+
+    return await asyncio.gather(*(run(i, item) for i, item in enumerate(items)))
@@ -30,7 +30,6 @@ from typing import Any
 import httpx
 from langgraph.graph import END, StateGraph
 
-from src.agents.gmail_client import GmailClient
 from src.agents.smart_email.nodes.classify import classify_emails_node
 from src.agents.smart_email.nodes.draft import draft_node
 from src.agents.smart_email.nodes.format_rtl import format_telegram_node
@@ -42,6 +41,11 @@ from src.agents.smart_email.state import EmailState, create_initial_state
 
 logger = logging.getLogger(__name__)
 
+try:
+    from src.agents.gmail_client import GmailClient
+except ImportError:  # Gmail client not bundled; fetch node reports the error
+    GmailClient = None
+
 
 # === Node Functions ===
 
@@ -60,6 +64,8 @@ async def fetch_emails_node(state: EmailState) -> EmailState:
     logger.info(f"Fetching emails from last {hours} hours")
 
     try:
+        if GmailClient is None:
+            raise ImportError("src.agents.gmail_client is not available")
         gmail = GmailClient()
         messages = gmail.get_unread_emails(hours=hours, max_results=50)
 
@@ -279,15 +285,23 @@ class SmartEmailGraph:
         # Sender profiles enriched, interactions recorded
     """
 
-    def __init__(self, enable_phase2: bool = True, enable_memory: bool = True):
+    def __init__(
+        self,
+        enable_phase2: bool = True,
+        enable_memory: bool = True,
+        max_concurrency: int | None = None,
+    ):
         """Initialize the graph.
 
         Args:
             enable_phase2: Enable Phase 2 intelligence nodes
             enable_memory: Enable Phase 4 sender intelligence memory
+            max_concurrency: Emails processed at once per node
+                (default: SMART_EMAIL_CONCURRENCY)
         """
         self.enable_phase2 = enable_phase2
         self.enable_memory = enable_memory
+        self.max_concurrency = max_concurrency
         self.graph = create_email_graph(
             enable_phase2=enable_phase2,
             enable_memory=enable_memory,
@@ -322,6 +336,7 @@ class SmartEmailGraph:
             enable_research=enable_research if self.enable_phase2 else False,
             enable_history=enable_history if self.enable_phase2 else False,
             enable_drafts=enable_drafts if self.enable_phase2 else False,
+            max_concurrency=self.max_concurrency,
         )
 
         logger.info(f"Starting SmartEmailGraph run {state['run_id']}")
@@ -377,6 +392,7 @@ async def run_smart_email_agent(
     enable_research: bool = True,
     enable_history: bool = True,
     enable_drafts: bool = True,
+    max_concurrency: int | None = None,
 ) -> dict[str, Any]:
     """Run the Smart Email Agent.
 
@@ -390,6 +406,7 @@ async def run_smart_email_agent(
         enable_research: Enable web research for P1/P2 emails
         enable_history: Enable sender history lookup
         enable_drafts: Enable draft reply generation
+        max_concurrency: Emails processed at once per node
 
     Returns:
         Execution result dict
@@ -412,7 +429,11 @@ async def run_smart_email_agent(
         print(f"Memory enabled: {result.get('memory_enabled', False)}")
         print(f"Interactions recorded: {result.get('interactions_recorded', 0)}")
     """
-    agent = SmartEmailGraph(enable_phase2=enable_phase2, enable_memory=enable_memory)
+    agent = SmartEmailGraph(
+        enable_phase2=enable_phase2,
+        enable_memory=enable_memory,
+        max_concurrency=max_concurrency,
+    )
     return await agent.run(
         hours=hours,
         send_telegram=send_telegram,
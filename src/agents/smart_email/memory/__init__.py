@@ -24,6 +24,7 @@ from src.agents.smart_email.memory.types import (
     MemoryType,
     RelationshipType,
 )
+from src.agents.smart_email.memory.cache import TTLCache
 from src.agents.smart_email.memory.store import MemoryStore
 
 __all__ = [
@@ -36,4 +37,5 @@ __all__ = [
     "RelationshipType",
     # Store
     "MemoryStore",
+    "TTLCache",
 ]
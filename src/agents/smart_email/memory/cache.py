@@ -0,0 +1,111 @@
+"""In-process LRU cache with TTL for the memory layer.
+
+Used by MemoryStore to avoid rebuilding sender profiles and LLM context
+strings from PostgreSQL for frequent senders. Entries expire after a TTL
+and the least recently used entry is evicted once maxsize is reached.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    Not thread-safe; intended for use from a single event loop.
+
+    Example:
+        cache = TTLCache(maxsize=1024, ttl=300)
+        cache.set("danny@example.com", profile)
+        profile = cache.get("danny@example.com")
+        cache.invalidate("danny@example.com")
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum entries (0 disables caching)
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a live entry, counting the hit or miss.
+
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop an entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._data.clear()
+
+    def __contains__(self, key: str) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict with size, maxsize, ttl, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
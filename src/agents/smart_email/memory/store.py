@@ -11,11 +11,17 @@ Uses Railway PostgreSQL (already deployed).
 import json
 import logging
 import os
+import weakref
 from datetime import datetime, timedelta
 from typing import Any
 
+from src.agents.smart_email.memory.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Live stores, for cache stats in the monitoring routes
+_stores: "weakref.WeakSet[MemoryStore]" = weakref.WeakSet()
+
 # SQL Schema for memory tables
 SCHEMA_SQL = """
 -- Sender Profiles (Semantic Memory)
@@ -137,6 +143,18 @@ CREATE INDEX IF NOT EXISTS idx_sender_last_contact ON sender_profiles(last_conta
 CREATE INDEX IF NOT EXISTS idx_sender_vip ON sender_profiles(is_vip) WHERE is_vip = TRUE;
 """
 
+# Latest interactions per sender for a batch of senders
+SENDER_HISTORIES_SQL = """
+SELECT r.*
+FROM unnest($1::text[]) AS s(email)
+CROSS JOIN LATERAL (
+    SELECT * FROM interaction_records
+    WHERE sender_email = s.email
+    ORDER BY timestamp DESC
+    LIMIT $2
+) r
+"""
+
 
 class MemoryStore:
     """PostgreSQL-backed memory store for email agent.
@@ -162,17 +180,36 @@ class MemoryStore:
 
         # Get context for LLM
         context = await store.get_sender_context("danny@example.com")
+
+    Sender profiles and LLM context strings are kept in TTL-bounded LRU
+    caches. Profile writes go through the cache; updates and new
+    interactions invalidate the sender's entries once the write completes.
+    Invalidation also bumps a per-sender generation, and reads only cache
+    what they fetched if the generation is unchanged, so a read that raced
+    a write can't put the old row back.
     """
 
-    def __init__(self, database_url: str | None = None):
+    def __init__(
+        self,
+        database_url: str | None = None,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+    ):
         """Initialize memory store.
 
         Args:
             database_url: PostgreSQL connection URL.
                          If None, uses DATABASE_URL env var.
+            cache_size: Max cached senders per cache (0 disables caching)
+            cache_ttl: Seconds a cached profile/context stays valid
         """
         self.database_url = database_url or os.environ.get("DATABASE_URL")
         self._pool = None
+        self._profile_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._context_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # email -> number of invalidations, compared before caching a read
+        self._generations: dict[str, int] = {}
+        _stores.add(self)
 
     async def initialize(self) -> bool:
         """Initialize database connection and create schema.
@@ -207,6 +244,36 @@ class MemoryStore:
         if self._pool:
             await self._pool.close()
             self._pool = None
+        self._profile_cache.clear()
+        self._context_cache.clear()
+
+    # === Cache ===
+
+    def invalidate_sender(self, email: str) -> None:
+        """Drop cached profile and context for a sender.
+
+        Args:
+            email: Sender email address
+        """
+        key = email.lower()
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._profile_cache.invalidate(key)
+        self._context_cache.invalidate(key)
+
+    def _generation(self, key: str) -> int:
+        """Get a sender's invalidation count, to snapshot before a read."""
+        return self._generations.get(key, 0)
+
+    def get_cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Get hit/miss counters for the profile and context caches.
+
+        Returns:
+            Dict with "profiles" and "contexts" cache stats
+        """
+        return {
+            "profiles": self._profile_cache.stats(),
+            "contexts": self._context_cache.stats(),
+        }
 
     # === Sender Profile Operations ===
 
@@ -222,19 +289,71 @@ class MemoryStore:
         if not self._pool:
             return None
 
+        key = email.lower()
+        cached = self._profile_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        generation = self._generation(key)
         try:
             async with self._pool.acquire() as conn:
                 row = await conn.fetchrow(
                     "SELECT * FROM sender_profiles WHERE email = $1",
-                    email.lower()
+                    key
                 )
                 if row:
-                    return dict(row)
+                    profile = dict(row)
+                    if self._generation(key) == generation:
+                        self._profile_cache.set(key, profile)
+                    return dict(profile)
                 return None
         except Exception as e:
             logger.error(f"Error getting sender profile: {e}")
             return None
 
+    async def get_sender_profiles(self, emails: list[str]) -> dict[str, dict]:
+        """Get sender profiles for many senders in one query.
+
+        Args:
+            emails: Sender email addresses
+
+        Returns:
+            Dict of lowercased email -> profile (missing senders omitted)
+        """
+        keys = sorted({e.lower() for e in emails if e})
+        if not self._pool or not keys:
+            return {}
+
+        profiles: dict[str, dict] = {}
+        misses = []
+        for key in keys:
+            cached = self._profile_cache.get(key)
+            if cached is not None:
+                profiles[key] = dict(cached)
+            else:
+                misses.append(key)
+        if not misses:
+            return profiles
+
+        generations = {key: self._generation(key) for key in misses}
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT * FROM sender_profiles WHERE email = ANY($1::text[])",
+                    misses
+                )
+        except Exception as e:
+            logger.error(f"Error getting sender profiles: {e}")
+            return profiles
+
+        for row in rows:
+            profile = dict(row)
+            key = profile["email"]
+            if self._generation(key) == generations.get(key):
+                self._profile_cache.set(key, profile)
+            profiles[key] = dict(profile)
+        return profiles
+
     async def create_sender_profile(
         self,
         email: str,
@@ -288,12 +407,56 @@ class MemoryStore:
                     RETURNING *
                 """
                 row = await conn.fetchrow(sql, *values)
-                return dict(row)
+                profile = dict(row)
+                self.invalidate_sender(profile["email"])
+                self._profile_cache.set(profile["email"], profile)
+                return dict(profile)
 
         except Exception as e:
+            self.invalidate_sender(email)
             logger.error(f"Error creating sender profile: {e}")
             return {"email": email.lower(), "name": name, "error": str(e)}
 
+    async def create_sender_profiles(self, senders: dict[str, str]) -> int:
+        """Create profiles for many new senders in one statement.
+
+        Args:
+            senders: Dict of sender email -> sender name
+
+        Returns:
+            Number of profiles written
+        """
+        names: dict[str, str] = {}
+        for email, name in senders.items():
+            if email:
+                names.setdefault(email.lower(), name or "")
+        if not self._pool or not names:
+            return 0
+
+        try:
+            async with self._pool.acquire() as conn:
+                now = datetime.now()
+                rows = await conn.fetch("""
+                    INSERT INTO sender_profiles (email, name, first_contact, created_at)
+                    SELECT email, name, $3, $3
+                    FROM unnest($1::text[], $2::text[]) AS s(email, name)
+                    ON CONFLICT (email) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING *
+                """, list(names), list(names.values()), now)
+        except Exception as e:
+            for email in names:
+                self.invalidate_sender(email)
+            logger.error(f"Error creating sender profiles: {e}")
+            return 0
+
+        for row in rows:
+            profile = dict(row)
+            self.invalidate_sender(profile["email"])
+            self._profile_cache.set(profile["email"], profile)
+        return len(rows)
+
     async def update_sender_profile(self, email: str, **updates) -> bool:
         """Update sender profile fields.
 
@@ -335,6 +498,10 @@ class MemoryStore:
         except Exception as e:
             logger.error(f"Error updating sender profile: {e}")
             return False
+        finally:
+            # Invalidate once the write is done; the generation bump stops
+            # a read that fetched the old row from caching it
+            self.invalidate_sender(email)
 
     async def increment_interaction(self, email: str) -> None:
         """Increment interaction count and update last_contact.
@@ -356,6 +523,8 @@ class MemoryStore:
                 """, email.lower())
         except Exception as e:
             logger.error(f"Error incrementing interaction: {e}")
+        finally:
+            self.invalidate_sender(email)
 
     async def get_frequent_senders(self, limit: int = 20) -> list[dict]:
         """Get most frequent senders.
@@ -462,6 +631,10 @@ class MemoryStore:
             logger.error(f"Error recording interaction: {e}")
             return interaction_id
 
+        finally:
+            # New interaction changes the sender's history and context
+            self.invalidate_sender(sender_email)
+
     async def _update_sender_patterns(
         self,
         email: str,
@@ -517,6 +690,8 @@ class MemoryStore:
 
         except Exception as e:
             logger.error(f"Error updating sender patterns: {e}")
+        finally:
+            self.invalidate_sender(email)
 
     async def get_sender_history(
         self,
@@ -548,6 +723,61 @@ class MemoryStore:
             logger.error(f"Error getting sender history: {e}")
             return []
 
+    async def get_sender_histories(
+        self,
+        emails: list[str],
+        limit: int = 20
+    ) -> dict[str, list[dict]]:
+        """Get recent interactions for many senders in one query.
+
+        Args:
+            emails: Sender email addresses
+            limit: Max interactions per sender
+
+        Returns:
+            Dict of lowercased email -> interaction records (newest first)
+        """
+        keys = sorted({e.lower() for e in emails if e})
+        if not self._pool or not keys:
+            return {}
+
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(SENDER_HISTORIES_SQL, keys, limit)
+        except Exception as e:
+            logger.error(f"Error getting sender histories: {e}")
+            return {}
+
+        histories: dict[str, list[dict]] = {}
+        for row in rows:
+            histories.setdefault(row["sender_email"], []).append(dict(row))
+        return histories
+
+    async def get_sender_memories(
+        self,
+        emails: list[str],
+        history_limit: int = 5
+    ) -> dict[str, dict]:
+        """Resolve profiles and recent interactions for many senders.
+
+        Two queries in total, regardless of the number of senders.
+
+        Args:
+            emails: Sender email addresses
+            history_limit: Max interactions per sender
+
+        Returns:
+            Dict of lowercased email -> {"profile": dict | None, "history": list}
+        """
+        keys = sorted({e.lower() for e in emails if e})
+        profiles = await self.get_sender_profiles(keys)
+        # Senders without a profile have no interactions (FK), skip them
+        histories = await self.get_sender_histories(list(profiles), limit=history_limit)
+        return {
+            key: {"profile": profiles.get(key), "history": histories.get(key, [])}
+            for key in keys
+        }
+
     # === Conversation Context ===
 
     async def get_conversation_context(self, user_id: str) -> dict | None:
@@ -725,10 +955,66 @@ class MemoryStore:
         Returns:
             Context string for LLM prompt
         """
-        parts = []
+        key = email.lower()
+        cached = self._context_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # Get profile
+        generation = self._generation(key)
         profile = await self.get_sender_profile(email)
+        history = await self.get_sender_history(email, limit=5)
+        context = self.format_sender_context(email, profile, history)
+        if self._pool and self._generation(key) == generation:
+            self._context_cache.set(key, context)
+        return context
+
+    async def get_sender_contexts_for_llm(self, emails: list[str]) -> dict[str, str]:
+        """Get LLM context for many senders with two queries.
+
+        Args:
+            emails: Sender email addresses
+
+        Returns:
+            Dict of lowercased email -> context string
+        """
+        contexts: dict[str, str] = {}
+        misses = []
+        for key in sorted({e.lower() for e in emails if e}):
+            cached = self._context_cache.get(key)
+            if cached is not None:
+                contexts[key] = cached
+            else:
+                misses.append(key)
+        if not misses:
+            return contexts
+
+        generations = {key: self._generation(key) for key in misses}
+        memories = await self.get_sender_memories(misses, history_limit=5)
+        for key, memory in memories.items():
+            context = self.format_sender_context(key, memory["profile"], memory["history"])
+            if self._pool and self._generation(key) == generations.get(key):
+                self._context_cache.set(key, context)
+            contexts[key] = context
+        return contexts
+
+    @staticmethod
+    def format_sender_context(
+        email: str,
+        profile: dict | None,
+        history: list[dict],
+    ) -> str:
+        """Build the LLM context string from a profile and recent history.
+
+        Args:
+            email: Sender email address
+            profile: Sender profile or None
+            history: Recent interaction records, newest first
+
+        Returns:
+            Context string for LLM prompt
+        """
+        parts = []
+
         if profile:
             # Identity
             name = profile.get("name") or email
@@ -766,8 +1052,7 @@ class MemoryStore:
             if summary:
                 parts.append(f"סיכום: {summary}")
 
-        # Get recent history
-        history = await self.get_sender_history(email, limit=5)
+        # Recent history
         if history:
             recent = []
             for h in history[:3]:
@@ -808,3 +1093,26 @@ class MemoryStore:
         # (Would need thread_id to look up)
 
         return "\n\n".join(parts)
+
+
+def get_cache_stats() -> dict[str, Any]:
+    """Aggregate cache counters across live MemoryStore instances.
+
+    Returns:
+        Dict with store count and summed "profiles"/"contexts" counters
+    """
+    totals: dict[str, dict[str, Any]] = {}
+    stores = list(_stores)
+    for store in stores:
+        for name, stats in store.get_cache_stats().items():
+            agg = totals.setdefault(
+                name, {"size": 0, "hits": 0, "misses": 0, "evictions": 0}
+            )
+            for field in agg:
+                agg[field] += stats[field]
+
+    for agg in totals.values():
+        lookups = agg["hits"] + agg["misses"]
+        agg["hit_rate"] = agg["hits"] / lookups if lookups else 0.0
+
+    return {"stores": len(stores), **totals}
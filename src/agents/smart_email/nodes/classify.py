@@ -9,6 +9,7 @@ import logging
 import re
 from typing import Any
 
+from src.agents.smart_email.concurrency import gather_bounded
 from src.agents.smart_email.persona import CLASSIFICATION_PROMPT
 from src.agents.smart_email.state import (
     EmailCategory,
@@ -211,26 +212,37 @@ async def classify_emails_node(state: EmailState) -> EmailState:
     classified_emails: list[EmailItem] = []
     system_count = 0
 
+    # Filter system emails
+    candidates = []
     for raw in raw_emails:
+        if is_system_email(raw.get("sender", ""), raw.get("sender_email", "")):
+            system_count += 1
+        else:
+            candidates.append(raw)
+
+    async def classify_one(raw: dict) -> dict[str, Any] | None:
+        return await classify_with_llm(
+            subject=raw.get("subject", ""),
+            sender=raw.get("sender", ""),
+            sender_email=raw.get("sender_email", ""),
+            snippet=raw.get("snippet", ""),
+            litellm_url=litellm_url,
+        )
+
+    # Try LLM classification (concurrently, in input order)
+    llm_results = await gather_bounded(
+        candidates,
+        classify_one,
+        provider="llm",
+        concurrency=state.get("max_concurrency"),
+    )
+
+    for raw, llm_result in zip(candidates, llm_results, strict=True):
         sender = raw.get("sender", "")
         sender_email = raw.get("sender_email", "")
         subject = raw.get("subject", "")
         snippet = raw.get("snippet", "")
 
-        # Filter system emails
-        if is_system_email(sender, sender_email):
-            system_count += 1
-            continue
-
-        # Try LLM classification
-        llm_result = await classify_with_llm(
-            subject=subject,
-            sender=sender,
-            sender_email=sender_email,
-            snippet=snippet,
-            litellm_url=litellm_url,
-        )
-
         if llm_result:
             result = parse_classification_result(llm_result)
             category, priority, reason, deadline, amount, action = result
@@ -6,7 +6,9 @@ matching the appropriate tone and including relevant information.
 
 import json
 import logging
+import os
 
+from src.agents.smart_email.concurrency import gather_bounded
 from src.agents.smart_email.state import (
     DraftReply,
     EmailCategory,
@@ -114,6 +116,7 @@ DRAFT_PROMPT = """אתה עוזר כתיבה בעברית. צריך לכתוב 
 - תוכן: {snippet}
 
 {history_context}
+{memory_context}
 {research_context}
 
 הנחיות:
@@ -133,12 +136,14 @@ DRAFT_PROMPT = """אתה עוזר כתיבה בעברית. צריך לכתוב 
 async def generate_draft_with_llm(
     email: EmailItem,
     litellm_url: str,
+    sender_context: str = "",
 ) -> DraftReply | None:
     """Generate draft reply using LLM.
 
     Args:
         email: Email to reply to
         litellm_url: LiteLLM Gateway URL
+        sender_context: Sender memory context (from MemoryStore)
 
     Returns:
         Draft reply or None if failed
@@ -159,6 +164,12 @@ async def generate_draft_with_llm(
 - נושאים נפוצים: {', '.join(h.common_topics) if h.common_topics else 'אין'}
 - סוג קשר: {h.relationship_type}"""
 
+        memory_context = ""
+        if sender_context:
+            memory_context = f"""
+מה ידוע על השולח:
+{sender_context}"""
+
         research_context = ""
         if email.research:
             r = email.research
@@ -172,6 +183,7 @@ async def generate_draft_with_llm(
             subject=email.subject,
             snippet=email.snippet[:500],
             history_context=history_context,
+            memory_context=memory_context,
             research_context=research_context,
             tone=tone,
             action_type=action_type,
@@ -210,6 +222,43 @@ async def generate_draft_with_llm(
         return None
 
 
+async def load_sender_contexts(
+    state: EmailState,
+    emails: list[EmailItem],
+) -> dict[str, str]:
+    """Get sender memory context for the emails being drafted.
+
+    Uses the context memory_enrich_node already attached to raw_emails;
+    senders without one are resolved with a single bulk MemoryStore lookup.
+
+    Args:
+        state: Current graph state
+        emails: Emails that will get drafts
+
+    Returns:
+        Dict of lowercased sender email -> context string
+    """
+    contexts: dict[str, str] = {}
+    for raw in state.get("raw_emails", []):
+        sender_email = raw.get("sender_email", "").lower()
+        if sender_email and raw.get("sender_context"):
+            contexts.setdefault(sender_email, raw["sender_context"])
+
+    missing = {e.sender_email.lower() for e in emails if e.sender_email} - contexts.keys()
+    if not missing or not os.environ.get("DATABASE_URL"):
+        return contexts
+
+    try:
+        from src.agents.smart_email.nodes.memory import get_memory_store
+
+        store = await get_memory_store()
+        contexts.update(await store.get_sender_contexts_for_llm(sorted(missing)))
+    except Exception as e:
+        logger.warning(f"Sender memory unavailable for drafts: {e}")
+
+    return contexts
+
+
 async def draft_node(state: EmailState) -> EmailState:
     """Generate draft replies for action items via LangGraph node.
 
@@ -233,13 +282,25 @@ async def draft_node(state: EmailState) -> EmailState:
     draft_replies: list[DraftReply] = []
     drafts_count = 0
 
-    for email in emails:
-        if should_generate_draft(email):
-            draft = await generate_draft_with_llm(email, litellm_url)
-            if draft:
-                draft_replies.append(draft)
-                email.draft_reply = draft
-                drafts_count += 1
+    to_draft = [email for email in emails if should_generate_draft(email)]
+    sender_contexts = await load_sender_contexts(state, to_draft)
+
+    async def draft_one(email: EmailItem) -> DraftReply | None:
+        context = sender_contexts.get(email.sender_email.lower(), "")
+        return await generate_draft_with_llm(email, litellm_url, sender_context=context)
+
+    drafts = await gather_bounded(
+        to_draft,
+        draft_one,
+        provider="llm",
+        concurrency=state.get("max_concurrency"),
+    )
+
+    for email, draft in zip(to_draft, drafts, strict=True):
+        if draft:
+            draft_replies.append(draft)
+            email.draft_reply = draft
+            drafts_count += 1
 
     logger.info(f"Generated {drafts_count} draft replies")
 
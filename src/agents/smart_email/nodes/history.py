@@ -4,11 +4,13 @@ Looks up past email history with each sender to provide
 context about the relationship and previous conversations.
 """
 
+import asyncio
 import logging
 from collections import Counter
 from datetime import UTC
 from typing import Any
 
+from src.agents.smart_email.concurrency import gather_bounded
 from src.agents.smart_email.state import (
     EmailItem,
     EmailState,
@@ -86,7 +88,10 @@ async def lookup_sender_history(
     try:
         # Search for emails from this sender
         query = f"from:{sender_email}"
-        messages = gmail_client.search_emails(query=query, max_results=max_results)
+        # Gmail client is synchronous; keep it off the event loop
+        messages = await asyncio.to_thread(
+            gmail_client.search_emails, query=query, max_results=max_results
+        )
 
         if not messages:
             return SenderHistory(
@@ -181,26 +186,30 @@ async def history_node(state: EmailState) -> EmailState:
         return state
 
     sender_histories: list[SenderHistory] = []
-    processed_senders: set[str] = set()
 
+    # One lookup per sender, in order of their first qualifying email
+    senders: list[str] = []
     for email in emails:
-        # Skip if we already looked up this sender
-        if email.sender_email in processed_senders:
-            continue
-
-        if should_lookup_history(email):
-            history = await lookup_sender_history(
-                sender_email=email.sender_email,
-                gmail_client=gmail,
-            )
-            if history:
-                sender_histories.append(history)
-                # Attach to all emails from this sender
-                for e in emails:
-                    if e.sender_email == email.sender_email:
-                        e.sender_history = history
-
-            processed_senders.add(email.sender_email)
+        if email.sender_email not in senders and should_lookup_history(email):
+            senders.append(email.sender_email)
+
+    async def lookup_one(sender_email: str) -> SenderHistory | None:
+        return await lookup_sender_history(sender_email=sender_email, gmail_client=gmail)
+
+    histories = await gather_bounded(
+        senders,
+        lookup_one,
+        provider="gmail",
+        concurrency=state.get("max_concurrency"),
+    )
+
+    for sender_email, history in zip(senders, histories, strict=True):
+        if history:
+            sender_histories.append(history)
+            # Attach to all emails from this sender
+            for e in emails:
+                if e.sender_email == sender_email:
+                    e.sender_history = history
 
     logger.info(f"Looked up history for {len(sender_histories)} senders")
 
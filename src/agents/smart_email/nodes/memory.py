@@ -60,15 +60,12 @@ def classify_relationship(total_interactions: int, is_vip: bool = False) -> str:
         return RelationshipType.FREQUENT.value
 
 
-async def enrich_email_with_memory(
-    email_data: dict,
-    store: MemoryStore,
-) -> dict:
-    """Enrich a single email with sender memory context.
+def apply_sender_memory(email_data: dict, memory: dict | None) -> dict:
+    """Enrich a single email with already-loaded sender memory.
 
     Args:
         email_data: Raw email data dict
-        store: Memory store instance
+        memory: {"profile": dict | None, "history": list} for the sender
 
     Returns:
         Enriched email data with sender context
@@ -77,8 +74,8 @@ async def enrich_email_with_memory(
     if not sender_email:
         return email_data
 
-    # Get or create sender profile
-    profile = await store.get_sender_profile(sender_email)
+    profile = memory.get("profile") if memory else None
+    history = memory.get("history", []) if memory else []
 
     if profile:
         # Existing sender - enrich with history
@@ -93,20 +90,19 @@ async def enrich_email_with_memory(
         email_data["sender_role"] = profile.get("role", "")
         email_data["sender_notes"] = profile.get("notes", "")
 
-        # Get recent interactions for context
-        history = await store.get_sender_history(sender_email, limit=3)
+        # Recent interactions for context
         if history:
             recent_subjects = [h.get("subject", "")[:40] for h in history[:3]]
             email_data["sender_recent_subjects"] = recent_subjects
 
         # Build context string for LLM
-        email_data["sender_context"] = await store.get_sender_context_for_llm(sender_email)
+        email_data["sender_context"] = MemoryStore.format_sender_context(
+            sender_email, profile, history
+        )
 
     else:
-        # New sender - create profile
+        # New sender - profile is created by the caller
         sender_name = email_data.get("sender", "")
-        await store.create_sender_profile(sender_email, sender_name)
-
         email_data["sender_relationship"] = RelationshipType.NEW.value
         email_data["sender_total_interactions"] = 0
         email_data["sender_is_vip"] = False
@@ -115,6 +111,31 @@ async def enrich_email_with_memory(
     return email_data
 
 
+async def enrich_email_with_memory(
+    email_data: dict,
+    store: MemoryStore,
+) -> dict:
+    """Enrich a single email with sender memory context.
+
+    Args:
+        email_data: Raw email data dict
+        store: Memory store instance
+
+    Returns:
+        Enriched email data with sender context
+    """
+    sender_email = email_data.get("sender_email", "").lower()
+    if not sender_email:
+        return email_data
+
+    memory = (await store.get_sender_memories([sender_email])).get(sender_email)
+    if not memory or not memory["profile"]:
+        # New sender - create profile
+        await store.create_sender_profile(sender_email, email_data.get("sender", ""))
+
+    return apply_sender_memory(email_data, memory)
+
+
 async def record_email_interaction(
     email: EmailItem,
     store: MemoryStore,
@@ -177,11 +198,26 @@ async def memory_enrich_node(state: EmailState) -> dict[str, Any]:
     try:
         store = await get_memory_store()
 
+        # Load profiles and recent history for all senders at once
+        memories = await store.get_sender_memories(
+            [e.get("sender_email", "") for e in raw_emails],
+            history_limit=5,
+        )
+
+        # Create profiles for new senders in one statement
+        new_senders: dict[str, str] = {}
+        for email_data in raw_emails:
+            sender_email = email_data.get("sender_email", "").lower()
+            memory = memories.get(sender_email)
+            if sender_email and not (memory and memory["profile"]):
+                new_senders.setdefault(sender_email, email_data.get("sender", ""))
+        await store.create_sender_profiles(new_senders)
+
         # Enrich each email with sender context
         enriched_emails = []
         for email_data in raw_emails:
-            enriched = await enrich_email_with_memory(email_data, store)
-            enriched_emails.append(enriched)
+            memory = memories.get(email_data.get("sender_email", "").lower())
+            enriched_emails.append(apply_sender_memory(email_data, memory))
 
         logger.info(f"Enriched {len(enriched_emails)} emails with sender memory")
 
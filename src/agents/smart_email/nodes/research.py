@@ -7,6 +7,7 @@ find deadlines, and locate relevant forms or documents.
 import logging
 import re
 
+from src.agents.smart_email.concurrency import gather_bounded
 from src.agents.smart_email.state import (
     EmailItem,
     EmailState,
@@ -208,18 +209,28 @@ async def research_node(state: EmailState) -> EmailState:
     research_results: list[ResearchResult] = []
     research_count = 0
 
-    for email in emails:
-        if should_research(email):
-            result = await research_with_llm(email, litellm_url)
-            if result:
-                research_results.append(result)
-                # Attach to email
-                email.research = result
-                research_count += 1
-
-                # Update AI suggestion with research findings
-                if result.summary:
-                    email.ai_action_suggestion = result.summary
+    to_research = [email for email in emails if should_research(email)]
+
+    async def research_one(email: EmailItem) -> ResearchResult | None:
+        return await research_with_llm(email, litellm_url)
+
+    results = await gather_bounded(
+        to_research,
+        research_one,
+        provider="llm",
+        concurrency=state.get("max_concurrency"),
+    )
+
+    for email, result in zip(to_research, results, strict=True):
+        if result:
+            research_results.append(result)
+            # Attach to email
+            email.research = result
+            research_count += 1
+
+            # Update AI suggestion with research findings
+            if result.summary:
+                email.ai_action_suggestion = result.summary
 
     logger.info(f"Researched {research_count} emails")
 
@@ -180,6 +180,9 @@ class EmailState(TypedDict, total=False):
     all_fetched_ids: list[str]     # All email IDs from Gmail API
     all_processed_ids: list[str]   # All email IDs that were processed
 
+    # Concurrency (emails processed at once per node)
+    max_concurrency: int
+
     # Metadata
     run_id: str
     start_time: float
@@ -193,6 +196,7 @@ def create_initial_state(
     enable_research: bool = True,
     enable_history: bool = True,
     enable_drafts: bool = True,
+    max_concurrency: int | None = None,
 ) -> EmailState:
     """Create initial state for the graph.
 
@@ -202,12 +206,16 @@ def create_initial_state(
         enable_research: Enable web research for P1/P2 emails
         enable_history: Enable sender history lookup
         enable_drafts: Enable draft reply generation
+        max_concurrency: Emails processed at once per node
+            (default: SMART_EMAIL_CONCURRENCY)
 
     Returns:
         Initial EmailState
     """
     import time
 
+    from src.agents.smart_email.concurrency import DEFAULT_CONCURRENCY
+
     return EmailState(
         user_id=user_id,
         hours_lookback=hours_lookback,
@@ -234,6 +242,7 @@ def create_initial_state(
         verification=None,
         all_fetched_ids=[],
         all_processed_ids=[],
+        max_concurrency=max_concurrency or DEFAULT_CONCURRENCY,
         run_id=f"smart_email_{int(time.time())}",
         start_time=time.time(),
         duration_ms=0,
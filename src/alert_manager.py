@@ -503,7 +503,7 @@ class AlertManager:
 
         Example:
             >>> from src.performance_baseline import PerformanceBaseline
-            >>> baseline = PerformanceBaseline(database_url="...")
+            >>> baseline = PerformanceBaseline(pool=await get_pg_pool())
             >>> anomalies = await baseline.detect_anomalies()
             >>> for anomaly in anomalies:
             ...     result = await manager.send_performance_alert(
@@ -4,10 +4,12 @@ This module handles PostgreSQL connection pooling and session management
 using SQLModel and asyncpg.
 """
 
+import asyncio
 import logging
 import os
 from collections.abc import AsyncGenerator
 
+import asyncpg
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -46,6 +48,13 @@ engine = create_async_engine(
 # Create async session factory
 async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Raw asyncpg pool for hand-written SQL (metrics, baselines); asyncpg wants a
+# plain postgresql:// DSN, so strip the SQLAlchemy driver suffix
+ASYNCPG_DATABASE_URL = DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+_pg_pool: asyncpg.Pool | None = None
+_pg_pool_lock = asyncio.Lock()
+
 
 async def create_db_and_tables() -> None:
     """Create database tables if they don't exist.
@@ -58,6 +67,9 @@ async def create_db_and_tables() -> None:
         ActionRecord,
         ActivityLog,
         Agent,
+        AgentSchedule,
+        HandoffRecord,
+        HandoffStateEntry,
         Task,
     )
 
@@ -82,12 +94,54 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_pg_pool() -> asyncpg.Pool:
+    """Get the shared asyncpg connection pool, creating it on first use.
+
+    Returns:
+        asyncpg.Pool: Application-wide pool for raw SQL queries
+
+    Example:
+        >>> pool = await get_pg_pool()
+        >>> baseline = PerformanceBaseline(pool=pool)
+    """
+    global _pg_pool
+    if _pg_pool is None:
+        async with _pg_pool_lock:
+            if _pg_pool is None:
+                _pg_pool = await asyncpg.create_pool(
+                    ASYNCPG_DATABASE_URL,
+                    min_size=1,
+                    max_size=10,
+                )
+    return _pg_pool
+
+
+async def get_pg_connection() -> AsyncGenerator[asyncpg.Connection, None]:
+    """Dependency for FastAPI to get a pooled asyncpg connection.
+
+    Yields:
+        asyncpg.Connection: Connection acquired from the shared pool
+
+    Example:
+        >>> @router.get("/summary")
+        >>> async def summary(conn: asyncpg.Connection = Depends(get_pg_connection)):
+        >>>     return await conn.fetchval("SELECT 1")
+    """
+    pool = await get_pg_pool()
+    async with pool.acquire() as conn:
+        yield conn
+
+
 async def close_db_connection() -> None:
-    """Close database connection pool.
+    """Close database connection pools.
 
     Should be called on application shutdown.
     """
+    global _pg_pool
     await engine.dispose()
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
 
 
 # Health check function
@@ -60,6 +60,12 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    # Persist agent handoff state in the database instead of process memory
+    from src.api.database import async_session_maker
+    from src.harness.handoff import SQLHandoffStore, set_handoff_store
+
+    set_handoff_store(SQLHandoffStore(async_session_maker))
+
     # Start GCS relay polling if enabled
     if os.getenv("GCS_RELAY_ENABLED", "false").lower() == "true":
         try:
@@ -103,9 +109,12 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Shutdown: Close database connection pool
+    # Shutdown: Close database connection pools
     try:
+        from src.api.routes.learning import close_learning_service
+
         await close_db_connection()
+        await close_learning_service()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Failed to close database connections: {e}")
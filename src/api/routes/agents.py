@@ -16,6 +16,7 @@ from sqlmodel import select
 from src.api.database import get_session
 from src.factory.generator import estimate_cost, generate_agent_code
 from src.factory.ralph_loop import get_loop_summary, ralph_wiggum_loop
+from src.harness.code_cache import get_code_cache
 from src.models.agent import Agent
 
 logger = logging.getLogger(__name__)
@@ -403,7 +404,9 @@ async def update_agent(
         agent.name = request.name
     if request.description is not None:
         agent.description = request.description
-    if request.code is not None:
+    if request.code is not None and request.code != agent.code:
+        # Drop the compiled/validated artifact of the replaced code
+        get_code_cache().invalidate(agent.code)
         agent.code = request.code
     if request.status is not None:
         agent.status = request.status
@@ -463,6 +466,7 @@ async def delete_agent(
     # Delete from database
     await session.delete(agent)
     await session.commit()
+    get_code_cache().invalidate(agent.code)
 
 
 @router.post(
@@ -77,6 +77,10 @@ class CostReportResponse(BaseModel):
 # =============================================================================
 
 
+# Shared Railway client so cost requests reuse pooled connections
+_railway_client = None
+
+
 def get_cost_monitor():
     """Get or create CostMonitor instance.
 
@@ -97,8 +101,10 @@ def get_cost_monitor():
     from src.cost_monitor import CostMonitor, RailwayPricing
     from src.railway_client import RailwayClient
 
-    client = RailwayClient(api_token=railway_api_token)
-    return CostMonitor(railway_client=client, pricing=RailwayPricing.hobby())
+    global _railway_client
+    if _railway_client is None or _railway_client.api_token != railway_api_token:
+        _railway_client = RailwayClient(api_token=railway_api_token)
+    return CostMonitor(railway_client=_railway_client, pricing=RailwayPricing.hobby())
 
 
 def get_mock_estimate() -> CostEstimateResponse:
@@ -341,4 +341,6 @@ async def relay_status() -> dict:
         "issue": relay.issue_number,
         "processed_requests": len(relay._processed_requests),
         "has_token": relay._github_token is not None,
+        "poll_interval": relay._poll_interval,
+        "stats": relay.stats,
     }
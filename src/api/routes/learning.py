@@ -32,6 +32,14 @@ def get_learning_service() -> LearningService:
     return _learning_service
 
 
+async def close_learning_service() -> None:
+    """Dispose of the learning service's database engine on shutdown."""
+    global _learning_service
+    if _learning_service is not None:
+        await _learning_service.close()
+        _learning_service = None
+
+
 async def ensure_initialized() -> LearningService:
     """Ensure the learning service is initialized.
 
@@ -8,16 +8,73 @@ Phase 1: Basic metrics without SSE streaming.
 Phase 2: Add Server-Sent Events (SSE) for real-time updates.
 """
 
+import asyncio
+import functools
+import logging
+import os
 from datetime import UTC, datetime
+from typing import Any
 
 import asyncpg
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 
-from src.api.database import get_session
+from src.alert_manager import AlertManager, create_alert_manager
+from src.api.database import get_pg_connection, get_pg_pool
+from src.performance_baseline import PerformanceBaseline, fetch_hourly_aggregates
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/metrics", tags=["Metrics"])
 
+# Read /metrics/agents from the agent_status_minutely continuous aggregate when
+# it exists (see sql/observability_schema.sql). Figures cover the last hour to
+# the minute; set to "false" to scan the raw hypertable instead.
+USE_STATUS_AGGREGATE = os.environ.get("METRICS_USE_STATUS_AGGREGATE", "true").lower() == "true"
+
+# Per-agent last-hour statistics from raw rows, one grouped scan
+AGENT_STATUS_QUERY = """
+SELECT
+    agent_id,
+    MAX(time) AS last_seen,
+    COALESCE(SUM(value) FILTER (WHERE metric_name = 'error_count'), 0) AS errors,
+    COALESCE(
+        SUM(value) FILTER (WHERE metric_name IN ('success_count', 'error_count')), 0
+    )::BIGINT AS total_requests,
+    COALESCE(AVG(value) FILTER (WHERE metric_name = 'latency_ms'), 0) AS avg_latency_ms,
+    COALESCE(
+        SUM(value) FILTER (
+            WHERE metric_name IN ('tokens_input', 'tokens_output', 'tokens_reasoning')
+        ),
+        0
+    )::BIGINT AS total_tokens
+FROM agent_metrics
+WHERE time >= NOW() - INTERVAL '1 hour'
+GROUP BY agent_id
+ORDER BY last_seen DESC
+LIMIT $1
+"""
+
+# Same statistics from the per-minute continuous aggregate: reads at most 60
+# buckets per agent instead of every raw row
+AGENT_STATUS_AGGREGATE_QUERY = """
+SELECT
+    agent_id,
+    MAX(last_seen) AS last_seen,
+    COALESCE(SUM(errors), 0) AS errors,
+    COALESCE(SUM(total_requests), 0)::BIGINT AS total_requests,
+    COALESCE(SUM(latency_sum) / NULLIF(SUM(latency_count), 0), 0) AS avg_latency_ms,
+    COALESCE(SUM(total_tokens), 0)::BIGINT AS total_tokens
+FROM agent_status_minutely
+WHERE bucket >= NOW() - INTERVAL '1 hour'
+GROUP BY agent_id
+ORDER BY last_seen DESC
+LIMIT $1
+"""
+
+# Whether agent_status_minutely exists; None until first checked
+_status_aggregate_available: bool | None = None
+
 
 # =============================================================================
 # Pydantic Models
@@ -57,6 +114,14 @@ class AgentStatus(BaseModel):
     total_tokens_1h: int
 
 
+class BaselineCheckResult(BaseModel):
+    """Result of a baseline collection and anomaly check."""
+
+    timestamp: datetime
+    anomalies: list[dict[str, Any]] = Field(description="Detected anomalies")
+    alerts_sent: int = Field(description="Alerts delivered (not suppressed)")
+
+
 class SystemMetrics(BaseModel):
     """System resource metrics."""
 
@@ -162,6 +227,50 @@ async def get_total_tokens(conn: asyncpg.Connection, interval: str = "1 hour") -
     return result or 0
 
 
+async def has_status_aggregate(conn: asyncpg.Connection) -> bool:
+    """Check (once per process) whether the agent_status_minutely aggregate exists."""
+    global _status_aggregate_available
+    if _status_aggregate_available is None:
+        exists = await conn.fetchval("SELECT to_regclass('agent_status_minutely') IS NOT NULL")
+        _status_aggregate_available = bool(exists)
+    return _status_aggregate_available
+
+
+async def fetch_agent_statuses(conn: asyncpg.Connection, limit: int) -> list[asyncpg.Record]:
+    """Fetch per-agent last-hour statistics in a single grouped query.
+
+    Uses the per-minute continuous aggregate when available, falling back to
+    the raw hypertable.
+
+    Args:
+        conn: asyncpg connection
+        limit: Maximum agents, most recently seen first
+
+    Returns:
+        Rows with agent_id, last_seen, errors, total_requests,
+        avg_latency_ms and total_tokens
+    """
+    global _status_aggregate_available
+    if USE_STATUS_AGGREGATE and await has_status_aggregate(conn):
+        try:
+            return await conn.fetch(AGENT_STATUS_AGGREGATE_QUERY, limit)
+        except asyncpg.UndefinedTableError:
+            logger.warning("agent_status_minutely missing, using raw agent_metrics")
+            _status_aggregate_available = False
+    return await conn.fetch(AGENT_STATUS_QUERY, limit)
+
+
+async def get_performance_baseline() -> PerformanceBaseline:
+    """Dependency providing a PerformanceBaseline on the shared asyncpg pool."""
+    return PerformanceBaseline(pool=await get_pg_pool())
+
+
+@functools.cache
+def get_alert_manager() -> AlertManager:
+    """Process-wide AlertManager, so suppression and rate limits persist."""
+    return create_alert_manager()
+
+
 def estimate_cost(total_tokens: int, model_id: str = "claude-sonnet-4.5") -> float:
     """
     Estimate cost based on token usage.
@@ -182,7 +291,9 @@ def estimate_cost(total_tokens: int, model_id: str = "claude-sonnet-4.5") -> flo
 
 
 @router.get("/summary", response_model=MetricSummary)
-async def get_metrics_summary(conn: asyncpg.Connection = Depends(get_session)) -> MetricSummary:
+async def get_metrics_summary(
+    conn: asyncpg.Connection = Depends(get_pg_connection),
+) -> MetricSummary:
     """
     Get summary metrics for the dashboard.
 
@@ -193,34 +304,35 @@ async def get_metrics_summary(conn: asyncpg.Connection = Depends(get_session)) -
     - Latency metrics (avg, P95)
     - Token usage and estimated cost
 
+    All aggregates are computed in a single query over a pooled connection.
+
     Example:
         GET /metrics/summary
 
     Returns:
         MetricSummary with all statistics
     """
-    active_agents = await get_active_agent_count(conn)
-    total_requests = await get_total_requests(conn)
-    error_rate = await get_error_rate(conn)
-    avg_latency = await get_avg_latency(conn)
-    p95_latency = await get_p95_latency(conn)
-    total_tokens = await get_total_tokens(conn)
-    estimated_cost = estimate_cost(total_tokens)
+    agg = await fetch_hourly_aggregates(conn)
+
+    errors = agg.get("errors") or 0
+    total_requests = int(agg.get("total_requests") or 0)
+    error_rate = round((errors / total_requests) * 100, 2) if total_requests > 0 else 0.0
+    total_tokens = int(agg.get("total_tokens") or 0)
 
     return MetricSummary(
-        active_agents=active_agents,
+        active_agents=int(agg.get("active_agents") or 0),
         total_requests_1h=total_requests,
         error_rate_pct=error_rate,
-        avg_latency_ms=avg_latency,
-        p95_latency_ms=p95_latency,
+        avg_latency_ms=round(agg.get("avg_latency_ms") or 0, 2),
+        p95_latency_ms=round(agg.get("p95_latency_ms") or 0, 2),
         total_tokens_1h=total_tokens,
-        estimated_cost_1h=estimated_cost,
+        estimated_cost_1h=estimate_cost(total_tokens),
     )
 
 
 @router.get("/agents", response_model=list[AgentStatus])
 async def get_agent_statuses(
-    conn: asyncpg.Connection = Depends(get_session),
+    conn: asyncpg.Connection = Depends(get_pg_connection),
     limit: int = Query(10, ge=1, le=100, description="Max agents to return"),
 ) -> list[AgentStatus]:
     """
@@ -233,79 +345,31 @@ async def get_agent_statuses(
     - Average latency
     - Token usage
 
+    All agents are aggregated in one grouped query, so the cost doesn't
+    grow with the number of agents returned.
+
     Example:
         GET /metrics/agents?limit=10
 
     Returns:
         List of AgentStatus objects
     """
-    # Get list of active agents
-    agent_ids = await conn.fetch(
-        """
-        SELECT DISTINCT agent_id, MAX(time) as last_seen
-        FROM agent_metrics
-        WHERE time >= NOW() - INTERVAL '1 hour'
-        GROUP BY agent_id
-        ORDER BY last_seen DESC
-        LIMIT $1
-        """,
-        limit,
-    )
+    rows = await fetch_agent_statuses(conn, limit)
 
     statuses = []
-    for row in agent_ids:
-        agent_id = row["agent_id"]
-        last_seen = row["last_seen"]
-
-        # Get agent-specific metrics
-        error_rate = await conn.fetchval(
-            """
-            SELECT get_agent_error_rate($1, '1 hour')
-            """,
-            agent_id,
-        )
-
-        total_requests = await conn.fetchval(
-            """
-            SELECT COALESCE(SUM(value), 0)::INT
-            FROM agent_metrics
-            WHERE agent_id = $1
-              AND metric_name IN ('success_count', 'error_count')
-              AND time >= NOW() - INTERVAL '1 hour'
-            """,
-            agent_id,
-        )
-
-        avg_latency = await conn.fetchval(
-            """
-            SELECT COALESCE(AVG(value), 0)
-            FROM agent_metrics
-            WHERE agent_id = $1
-              AND metric_name = 'latency_ms'
-              AND time >= NOW() - INTERVAL '1 hour'
-            """,
-            agent_id,
-        )
-
-        total_tokens = await conn.fetchval(
-            """
-            SELECT COALESCE(SUM(value), 0)::INT
-            FROM agent_metrics
-            WHERE agent_id = $1
-              AND metric_name IN ('tokens_input', 'tokens_output', 'tokens_reasoning')
-              AND time >= NOW() - INTERVAL '1 hour'
-            """,
-            agent_id,
-        )
+    for row in rows:
+        errors = row["errors"] or 0
+        total_requests = int(row["total_requests"] or 0)
+        error_rate = (errors / total_requests) * 100 if total_requests > 0 else 0.0
 
         statuses.append(
             AgentStatus(
-                agent_id=agent_id,
-                last_seen=last_seen,
-                error_rate_pct=round(error_rate or 0, 2),
-                total_requests_1h=total_requests or 0,
-                avg_latency_ms=round(avg_latency or 0, 2),
-                total_tokens_1h=total_tokens or 0,
+                agent_id=row["agent_id"],
+                last_seen=row["last_seen"],
+                error_rate_pct=round(error_rate, 2),
+                total_requests_1h=total_requests,
+                avg_latency_ms=round(row["avg_latency_ms"] or 0, 2),
+                total_tokens_1h=int(row["total_tokens"] or 0),
             )
         )
 
@@ -318,7 +382,7 @@ async def get_metric_timeseries(
     agent_id: str | None = Query(None, description="Filter by agent ID"),
     interval: str = Query("1 hour", description="Time interval (e.g., '1 hour', '24 hours')"),
     bucket_size: str = Query("5 minutes", description="Bucket size for aggregation"),
-    conn: asyncpg.Connection = Depends(get_session),
+    conn: asyncpg.Connection = Depends(get_pg_connection),
 ) -> list[AgentMetricPoint]:
     """
     Get time-series data for a specific metric.
@@ -368,6 +432,60 @@ async def get_metric_timeseries(
     ]
 
 
+@router.get("/baseline")
+async def get_baseline_dashboard(
+    baseline: PerformanceBaseline = Depends(get_performance_baseline),
+) -> dict[str, Any]:
+    """
+    Get performance baseline dashboard data.
+
+    Collects a snapshot and returns it with baseline statistics, anomalies
+    and trends. Every query runs on the shared connection pool.
+
+    Example:
+        GET /metrics/baseline
+
+    Returns:
+        Dashboard data from PerformanceBaseline.get_dashboard_data()
+    """
+    return await baseline.get_dashboard_data()
+
+
+@router.post("/baseline/check", response_model=BaselineCheckResult)
+async def check_baseline(
+    baseline: PerformanceBaseline = Depends(get_performance_baseline),
+    alert_manager: AlertManager = Depends(get_alert_manager),
+) -> BaselineCheckResult:
+    """
+    Collect a baseline snapshot and alert on anomalies.
+
+    Meant to be called on the collection interval (e.g. every 5 minutes by
+    a scheduled workflow). Each anomaly is sent through the AlertManager,
+    which handles deduplication and rate limiting.
+
+    Example:
+        POST /metrics/baseline/check
+
+    Returns:
+        BaselineCheckResult with detected anomalies and alerts sent
+    """
+    snapshot = await baseline.collect_metrics()
+    baselines = await baseline.get_baseline_stats()
+    anomalies = await baseline.detect_anomalies(snapshot, baselines)
+
+    alerts_sent = 0
+    for anomaly in anomalies:
+        result = await alert_manager.send_performance_alert(anomaly, baselines)
+        if result.success and not result.suppressed:
+            alerts_sent += 1
+
+    return BaselineCheckResult(
+        timestamp=snapshot.timestamp,
+        anomalies=[a.to_dict() for a in anomalies],
+        alerts_sent=alerts_sent,
+    )
+
+
 @router.get("/system", response_model=SystemMetrics)
 async def get_system_metrics() -> SystemMetrics:
     """
@@ -397,9 +515,12 @@ async def get_system_metrics() -> SystemMetrics:
     disk = psutil.disk_usage("/")
     disk_available_gb = disk.free / (1024 * 1024 * 1024)
 
+    # cpu_percent blocks for the sampling interval; keep it off the event loop
+    cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=0.1)
+
     return SystemMetrics(
         timestamp=datetime.now(UTC),
-        cpu_percent=round(psutil.cpu_percent(interval=0.1), 2),
+        cpu_percent=round(cpu_percent, 2),
         memory_percent=round(memory.percent, 2),
         memory_available_mb=round(memory_available_mb, 2),
         disk_percent=round(disk.percent, 2),
@@ -381,6 +381,23 @@ async def get_config() -> dict[str, Any]:
     }
 
 
+@router.get("/api/monitoring/memory-cache")
+async def get_memory_cache_stats() -> dict[str, Any]:
+    """
+    Get Smart Email memory cache statistics.
+
+    Returns hit/miss counters for the sender profile and
+    LLM context caches across live memory stores.
+    """
+    try:
+        from src.agents.smart_email.memory.store import get_cache_stats
+    except ImportError as e:
+        logger.warning(f"Memory store unavailable: {e}")
+        return {"available": False, "stores": 0}
+
+    return {"available": True, **get_cache_stats()}
+
+
 @router.post("/api/monitoring/collect-now")
 async def collect_now() -> dict[str, Any]:
     """
@@ -156,7 +156,7 @@ async def retry_task(
     # Execute immediately in background
     # Note: In production, use asyncio.create_task() or background task queue
     try:
-        await execute_scheduled_task(original_task.agent_id, session)
+        await execute_scheduled_task(original_task.agent_id, session, task=new_task)
         logger.info("Retry task %d executed successfully", new_task.id)
     except Exception as e:
         logger.error("Failed to execute retry task %d: %s", new_task.id, e)
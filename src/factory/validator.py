@@ -12,6 +12,8 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+from src.harness.code_cache import get_code_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +49,8 @@ async def validate_code(code: str, strict: bool = True) -> dict[str, list[str]]:
     4. Security pattern detection
     5. Pydocstyle (Google style) - optional based on strict flag
 
+    Results are cached by code hash, so unchanged code is not re-checked.
+
     Args:
         code: Python code to validate
         strict: If True, enforce pydocstyle checks (default: True)
@@ -68,6 +72,12 @@ async def validate_code(code: str, strict: bool = True) -> dict[str, list[str]]:
     if not code or not code.strip():
         raise ValueError("Code cannot be empty")
 
+    cache = get_code_cache()
+    cached = cache.get_validation(code, strict)
+    if cached is not None:
+        logger.debug("Validation cache hit, skipping checks")
+        return cached
+
     errors = []
     warnings = []
 
@@ -79,7 +89,9 @@ async def validate_code(code: str, strict: bool = True) -> dict[str, list[str]]:
         logger.debug("Syntax check passed")
     except SyntaxError as e:
         errors.append(f"Syntax error at line {e.lineno}: {e.msg}")
-        return {"errors": errors, "warnings": warnings, "passed": False}
+        result = {"errors": errors, "warnings": warnings, "passed": False}
+        cache.set_validation(code, strict, result)
+        return result
 
     # Create temporary file for validation tools
     with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as tmp_file:
@@ -122,7 +134,11 @@ async def validate_code(code: str, strict: bool = True) -> dict[str, list[str]]:
             len(warnings),
         )
 
-        return {"errors": errors, "warnings": warnings, "passed": passed}
+        result = {"errors": errors, "warnings": warnings, "passed": passed}
+        # A tool timeout says nothing about the code; check again next time
+        if not any("timed out" in msg for msg in errors + warnings):
+            cache.set_validation(code, strict, result)
+        return result
 
     finally:
         # Cleanup temporary file
@@ -26,6 +26,7 @@ Example:
     ... )
 """
 
+import asyncio
 import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -39,6 +40,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.http_session import ETagCache, PooledHTTPClient
+
 # ============================================================================
 # EXCEPTION CLASSES
 # ============================================================================
@@ -68,12 +71,19 @@ class GitHubAppNotFoundError(GitHubAppError):
     pass
 
 
+# Headers sent with every GitHub API request
+GITHUB_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+
 # ============================================================================
 # GITHUB APP CLIENT
 # ============================================================================
 
 
-class GitHubAppClient:
+class GitHubAppClient(PooledHTTPClient):
     """Client for GitHub App authentication and API operations.
 
     Implements JWT-based authentication with automatic token refresh.
@@ -82,8 +92,15 @@ class GitHubAppClient:
     - JWT generation with RS256 signing
     - Automatic IAT refresh (5 minutes before expiration)
     - Exponential backoff retry logic
+    - Pooled keep-alive connections shared by all requests
+    - ETag conditional requests for GETs (304s don't count against the quota)
+    - Request pacing driven by X-RateLimit-* and Retry-After headers
     - Full API operations (workflows, issues, PRs, commits)
 
+    Usage:
+        async with GitHubAppClient(app_id, private_key, installation_id) as client:
+            await client.get_workflow_runs(owner, repo)
+
     Attributes:
         app_id: GitHub App ID (e.g., "2497877")
         private_key: PEM-formatted RSA private key
@@ -97,6 +114,12 @@ class GitHubAppClient:
         private_key: str,
         installation_id: str,
         base_url: str = "https://api.github.com",
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        etag_cache_size: int = 256,
+        rate_limit_threshold: int = 100,
+        max_rate_limit_wait: float = 300.0,
     ):
         """Initialize GitHub App client.
 
@@ -105,16 +128,41 @@ class GitHubAppClient:
             private_key: PEM-formatted RSA private key (from GCP Secret Manager)
             installation_id: Installation ID for the repository (e.g., "100231961")
             base_url: GitHub API base URL (default: https://api.github.com)
+            timeout: Request timeout in seconds
+            max_connections: Maximum pooled connections
+            max_keepalive_connections: Maximum idle connections kept open
+            etag_cache_size: Maximum cached GET responses (0 disables ETag caching)
+            rate_limit_threshold: Remaining-request count below which requests
+                are spread evenly until the rate limit window resets
+            max_rate_limit_wait: Longest pacing sleep before failing fast with
+                GitHubAppRateLimitError
         """
         self.app_id = app_id
         self.private_key = private_key
         self.installation_id = installation_id
         self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.etag_cache_size = etag_cache_size
+        self.rate_limit_threshold = rate_limit_threshold
+        self.max_rate_limit_wait = max_rate_limit_wait
 
         # Token cache
         self._installation_token: str | None = None
         self._token_expires_at: datetime | None = None
 
+        # Shared connection pool (created lazily, closed by aclose())
+        self._client: httpx.AsyncClient | None = None
+
+        # Conditional GET cache (url+params → ETag, body)
+        self._etag_cache = ETagCache(maxsize=etag_cache_size)
+
+        # Rate limit state from the latest response headers
+        self.rate_limit_remaining: int | None = None
+        self.rate_limit_reset: float | None = None
+        self._retry_after_until = 0.0
+
     def __del__(self):
         """Clear sensitive data from memory on cleanup."""
         if hasattr(self, "private_key"):
@@ -122,6 +170,75 @@ class GitHubAppClient:
         if hasattr(self, "_installation_token"):
             self._installation_token = None
 
+    # ========================================================================
+    # RATE LIMITING & CONDITIONAL REQUESTS
+    # ========================================================================
+
+    @staticmethod
+    def _header_number(headers: httpx.Headers, name: str) -> float | None:
+        """Parse a numeric response header, or None if absent or malformed."""
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    def _update_rate_limit(self, headers: httpx.Headers) -> None:
+        """Record rate limit state from response headers.
+
+        Args:
+            headers: Response headers
+        """
+        remaining = self._header_number(headers, "X-RateLimit-Remaining")
+        reset = self._header_number(headers, "X-RateLimit-Reset")
+        retry_after = self._header_number(headers, "Retry-After")
+        if remaining is not None:
+            self.rate_limit_remaining = int(remaining)
+        if reset is not None:
+            self.rate_limit_reset = reset
+        if retry_after is not None:
+            self._retry_after_until = time.time() + retry_after
+
+    def _pacing_delay(self) -> float:
+        """Compute how long to wait before the next request.
+
+        - Retry-After from a secondary rate limit: wait it out
+        - Quota exhausted: wait until X-RateLimit-Reset
+        - Quota below rate_limit_threshold: spread the remaining requests
+          evenly over the rest of the window
+
+        Returns:
+            Seconds to sleep (0 when no pacing is needed)
+        """
+        now = time.time()
+        delay = max(0.0, self._retry_after_until - now)
+
+        if self.rate_limit_remaining is not None and self.rate_limit_reset is not None:
+            window = max(0.0, self.rate_limit_reset - now)
+            if self.rate_limit_remaining <= 0:
+                delay = max(delay, window)
+            elif self.rate_limit_remaining < self.rate_limit_threshold:
+                delay = max(delay, window / self.rate_limit_remaining)
+
+        return delay
+
+    async def _pace(self) -> None:
+        """Sleep according to the current rate limit state.
+
+        Raises:
+            GitHubAppRateLimitError: If the required wait exceeds max_rate_limit_wait
+        """
+        delay = self._pacing_delay()
+        if delay <= 0:
+            return
+        if delay > self.max_rate_limit_wait:
+            raise GitHubAppRateLimitError(
+                f"Rate limit exceeded. Resets at {int(self.rate_limit_reset or 0)}"
+            )
+        await asyncio.sleep(delay)
+
     # ========================================================================
     # AUTHENTICATION
     # ========================================================================
@@ -191,26 +308,21 @@ class GitHubAppClient:
         jwt_token = self.generate_jwt()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/app/installations/{self.installation_id}/access_tokens",
-                    headers={
-                        "Authorization": f"Bearer {jwt_token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                self._installation_token = data["token"]
-
-                # Parse expiration (ISO 8601 format: 2026-01-12T21:45:00Z)
-                expires_at_str = data["expires_at"].replace("Z", "+00:00")
-                self._token_expires_at = datetime.fromisoformat(expires_at_str)
+            response = await self._get_client().post(
+                f"{self.base_url}/app/installations/{self.installation_id}/access_tokens",
+                headers={"Authorization": f"Bearer {jwt_token}", **GITHUB_HEADERS},
+                timeout=10.0,
+            )
+            response.raise_for_status()
 
-                return self._installation_token
+            data = response.json()
+            self._installation_token = data["token"]
+
+            # Parse expiration (ISO 8601 format: 2026-01-12T21:45:00Z)
+            expires_at_str = data["expires_at"].replace("Z", "+00:00")
+            self._token_expires_at = datetime.fromisoformat(expires_at_str)
+
+            return self._installation_token
         except httpx.HTTPStatusError as e:
             raise GitHubAppAuthenticationError(
                 f"Failed to get installation token: HTTP {e.response.status_code}"
@@ -235,6 +347,10 @@ class GitHubAppClient:
     ) -> dict[str, Any]:
         """Make authenticated GitHub API request with retry logic.
 
+        Requests share one pooled connection and are paced by the rate limit
+        headers of earlier responses. GETs send If-None-Match for previously
+        seen ETags and return the cached body on 304 Not Modified.
+
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE, PUT)
             endpoint: API endpoint (e.g., "/repos/owner/repo/issues")
@@ -250,38 +366,57 @@ class GitHubAppClient:
             GitHubAppError: For other API errors
         """
         token = await self.get_installation_token()
+        await self._pace()
+
+        url = f"{self.base_url}{endpoint}"
+        headers = {"Authorization": f"Bearer {token}", **GITHUB_HEADERS}
+
+        cache_key = None
+        cached = None
+        if method.upper() == "GET" and self._etag_cache.enabled:
+            cache_key = ETagCache.key(url, params)
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method,
-                    url=f"{self.base_url}{endpoint}",
-                    json=json_data,
-                    params=params,
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    timeout=30.0,
-                )
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                    raise GitHubAppRateLimitError(f"Rate limit exceeded. Resets at {reset_time}")
-
-                # Handle not found
-                if response.status_code == 404:
-                    raise GitHubAppNotFoundError(f"Resource not found: {endpoint}")
-
-                response.raise_for_status()
-
-                # Handle 204 No Content
-                if response.status_code == 204:
-                    return {}
-
-                return response.json()
+            response = await self._get_client().request(
+                method=method,
+                url=url,
+                json=json_data,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
+            self._update_rate_limit(response.headers)
+
+            # Unchanged since the cached ETag
+            if response.status_code == 304 and cached is not None:
+                return self._etag_cache.not_modified(cache_key, cached)
+
+            # Handle rate limiting (secondary limits return 403 with Retry-After
+            # or an exhausted quota)
+            if response.status_code == 429 or (
+                response.status_code == 403
+                and (self.rate_limit_remaining == 0 or self._retry_after_until > time.time())
+            ):
+                reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+                raise GitHubAppRateLimitError(f"Rate limit exceeded. Resets at {reset_time}")
+
+            # Handle not found
+            if response.status_code == 404:
+                raise GitHubAppNotFoundError(f"Resource not found: {endpoint}")
+
+            response.raise_for_status()
+
+            # Handle 204 No Content
+            if response.status_code == 204:
+                return {}
+
+            body = response.json()
+            if cache_key is not None:
+                self._etag_cache.store(cache_key, response.headers.get("ETag"), body)
+            return body
         except httpx.HTTPStatusError as e:
             raise GitHubAppError(f"GitHub API error: HTTP {e.response.status_code}") from e
         except httpx.TimeoutException as e:
@@ -0,0 +1,310 @@
+"""Shared Google OAuth access-token provider.
+
+Workspace tools call get_access_token() on every request. Without
+coordination, an expired token makes every concurrent caller reload the
+OAuth secrets and post to the token endpoint at the same time. The provider
+here caches the secrets and the token, and refreshes with a single flight:
+one refresh is in progress at a time and every caller awaits it. This also
+holds across threads running their own event loops (as in the Flask-based
+routers, which call asyncio.run per request).
+
+Tokens close to expiry are refreshed in the background on access, so
+callers keep using the current token instead of blocking on a refresh. The
+background refresh runs on its own thread and event loop, so it survives
+the per-request loop of the caller that started it.
+
+Example:
+    >>> provider = get_token_provider("google-workspace", load_credentials)
+    >>> token = await provider.get_access_token()
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"  # noqa: S105
+
+
+@dataclass(frozen=True)
+class OAuthClientCredentials:
+    """OAuth client credentials used to mint access tokens.
+
+    Attributes:
+        client_id: Google OAuth client ID
+        client_secret: Google OAuth client secret
+        refresh_token: Long-lived refresh token
+    """
+
+    client_id: str
+    client_secret: str
+    refresh_token: str
+
+
+class _RefreshCancelled(Exception):
+    """Set on a shared refresh whose leader was cancelled; waiters retry."""
+
+
+class TokenRefreshError(ValueError):
+    """Raised when the token endpoint rejects a refresh.
+
+    Attributes:
+        status_code: HTTP status returned by the token endpoint
+    """
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class GoogleTokenProvider:
+    """Caches a Google OAuth access token and refreshes it with a single flight.
+
+    Attributes:
+        expiry_buffer: Seconds before expiry at which the token is no longer used
+        refresh_ahead: Seconds before expiry_buffer at which a background
+            refresh starts
+        timeout: Token endpoint request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        load_credentials: Callable[[], OAuthClientCredentials],
+        token_url: str = OAUTH_TOKEN_URL,
+        expiry_buffer: float = 60.0,
+        refresh_ahead: float = 300.0,
+        timeout: float = 30.0,
+    ):
+        """Initialize the provider.
+
+        Args:
+            load_credentials: Returns the OAuth client credentials. Called once
+                and cached until the token endpoint rejects them.
+            token_url: OAuth token endpoint
+            expiry_buffer: Seconds before expiry at which the token is stale
+            refresh_ahead: Extra seconds before that to refresh in the background
+            timeout: Token endpoint request timeout in seconds
+        """
+        self._load_credentials = load_credentials
+        self.token_url = token_url
+        self.expiry_buffer = expiry_buffer
+        self.refresh_ahead = refresh_ahead
+        self.timeout = timeout
+
+        self._credentials: OAuthClientCredentials | None = None
+        self._access_token: str | None = None
+        self._expires_at: float = 0.0
+
+        self._lock = threading.Lock()
+        self._inflight: concurrent.futures.Future[str] | None = None
+        self._background: threading.Thread | None = None
+
+        self.refresh_count = 0
+
+    @property
+    def access_token(self) -> str | None:
+        """Currently cached access token, if any."""
+        return self._access_token
+
+    @property
+    def expires_at(self) -> float:
+        """Epoch time at which the cached token expires."""
+        return self._expires_at
+
+    def is_valid(self) -> bool:
+        """Check whether the cached token can still be used.
+
+        Returns:
+            True if a token is cached and not within expiry_buffer of expiry
+        """
+        return bool(self._access_token) and time.time() < self._expires_at - self.expiry_buffer
+
+    async def get_access_token(self) -> str:
+        """Get a valid access token, refreshing if needed.
+
+        Concurrent callers share one refresh. A token within refresh_ahead of
+        going stale is returned as-is while a refresh runs in the background.
+
+        Returns:
+            Valid access token
+
+        Raises:
+            TokenRefreshError: If the token endpoint rejects the refresh
+            ValueError: If the credentials cannot be loaded
+        """
+        if self.is_valid():
+            if time.time() >= self._expires_at - self.expiry_buffer - self.refresh_ahead:
+                self._refresh_in_background()
+            return self._access_token  # type: ignore[return-value]
+
+        return await self.refresh()
+
+    async def refresh(self) -> str:
+        """Refresh the access token, joining a refresh already in progress.
+
+        If the refresh being joined is cancelled (its caller's event loop
+        went away), the waiters start a new one instead of failing.
+
+        Returns:
+            New access token
+        """
+        while True:
+            with self._lock:
+                future = self._inflight
+                leader = future is None
+                if leader:
+                    future = self._inflight = concurrent.futures.Future()
+
+            if leader:
+                return await self._lead_refresh(future)
+            try:
+                return await asyncio.wrap_future(future)
+            except _RefreshCancelled:
+                continue
+
+    async def _lead_refresh(self, future: concurrent.futures.Future[str]) -> str:
+        """Fetch a token and publish the outcome to every waiter."""
+        try:
+            token = await self._fetch_token()
+        except asyncio.CancelledError:
+            self._settle(future, error=_RefreshCancelled())
+            raise
+        except Exception as e:
+            self._settle(future, error=e)
+            raise
+        self._settle(future, token=token)
+        return token
+
+    def _settle(
+        self,
+        future: concurrent.futures.Future[str],
+        token: str | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Clear the in-flight refresh, then resolve it.
+
+        Clearing first means a waiter retrying after a cancelled refresh
+        starts a new one rather than joining the finished one again.
+        """
+        with self._lock:
+            if self._inflight is future:
+                self._inflight = None
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(token)  # type: ignore[arg-type]
+
+    def invalidate(self, credentials: bool = False) -> None:
+        """Drop the cached token so the next call refreshes.
+
+        Args:
+            credentials: Also drop cached credentials so they are reloaded
+        """
+        self._access_token = None
+        self._expires_at = 0.0
+        if credentials:
+            self._credentials = None
+
+    def _refresh_in_background(self) -> None:
+        """Start a refresh without waiting for it, unless one is running.
+
+        The refresh runs on a daemon thread with its own event loop rather
+        than as a task on the caller's loop: Flask routers call asyncio.run
+        per request, which would cancel the task when the request returns.
+        """
+        with self._lock:
+            if self._inflight is not None or self._background is not None:
+                return
+            self._background = threading.Thread(
+                target=self._run_background_refresh,
+                name="google-token-refresh",
+                daemon=True,
+            )
+        self._background.start()
+
+    def _run_background_refresh(self) -> None:
+        """Run one refresh; on failure the current token stays in use."""
+        try:
+            asyncio.run(self.refresh())
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._background = None
+
+    async def _fetch_token(self) -> str:
+        """Post the refresh token to the token endpoint and cache the result."""
+        if self._credentials is None:
+            self._credentials = self._load_credentials()
+        credentials = self._credentials
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(
+                self.token_url,
+                data={
+                    "client_id": credentials.client_id,
+                    "client_secret": credentials.client_secret,
+                    "refresh_token": credentials.refresh_token,
+                    "grant_type": "refresh_token",
+                },
+            )
+
+        if response.status_code != 200:
+            if response.status_code in (400, 401):
+                # Rejected credentials may have been rotated - reload next time
+                self._credentials = None
+            raise TokenRefreshError(
+                f"Token refresh failed: {response.text}", response.status_code
+            )
+
+        data = response.json()
+        self._access_token = data["access_token"]
+        self._expires_at = time.time() + data.get("expires_in", 3600)
+        self.refresh_count += 1
+
+        logger.info("Google OAuth access token refreshed")
+        return self._access_token
+
+
+_providers: dict[str, GoogleTokenProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(
+    name: str,
+    load_credentials: Callable[[], OAuthClientCredentials],
+    **kwargs: Any,
+) -> GoogleTokenProvider:
+    """Get the process-wide token provider registered under a name.
+
+    The first call creates the provider; later calls return it and ignore
+    their arguments, so every client of the same credentials shares one
+    token cache.
+
+    Args:
+        name: Registry key, e.g. "google-workspace"
+        load_credentials: Credential loader for a newly created provider
+        **kwargs: Extra GoogleTokenProvider arguments for a new provider
+
+    Returns:
+        Shared GoogleTokenProvider
+    """
+    with _providers_lock:
+        provider = _providers.get(name)
+        if provider is None:
+            provider = _providers[name] = GoogleTokenProvider(load_credentials, **kwargs)
+        return provider
+
+
+def reset_token_providers() -> None:
+    """Forget all registered providers (used by tests)."""
+    with _providers_lock:
+        _providers.clear()
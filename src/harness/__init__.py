@@ -5,9 +5,12 @@ continuously with scheduling, resource management, and state persistence.
 
 Main components:
 - executor: Executes agent code in isolated subprocesses
-- scheduler: Orchestrates scheduled execution with APScheduler
+- scheduler: Orchestrates scheduled execution from a run queue heap
+- run_queue: Keyed min-heap of upcoming runs
 - resources: Manages memory/CPU limits and concurrency
 - handoff: Preserves state between agent runs
+- worker_pool: Warm pre-forked workers for low-overhead agent runs
+- code_cache: Content-addressed cache of prepared agent code
 
 Example:
     >>> from src.harness import AgentScheduler, execute_agent_code
@@ -20,15 +23,26 @@ Example:
     >>> await scheduler.start()
 """
 
+from .code_cache import AgentCodeCache, CompiledAgent, get_code_cache
 from .executor import ExecutionError, ExecutionResult, execute_agent_code
-from .handoff import HandoffArtifact, HandoffManager, get_handoff_manager
+from .handoff import (
+    HandoffArtifact,
+    HandoffError,
+    HandoffManager,
+    LazyState,
+    SQLHandoffStore,
+    get_handoff_manager,
+    set_handoff_store,
+)
 from .resources import (
     ResourceLimits,
     ResourceMonitor,
     get_resource_monitor,
     set_resource_limits,
 )
+from .run_queue import RunQueue
 from .scheduler import AgentScheduler, SchedulerError, execute_scheduled_task
+from .worker_pool import WarmWorkerPool, WorkerPoolError
 
 __all__ = [
     # Executor
@@ -39,6 +53,7 @@ __all__ = [
     "AgentScheduler",
     "execute_scheduled_task",
     "SchedulerError",
+    "RunQueue",
     # Resources
     "ResourceMonitor",
     "ResourceLimits",
@@ -47,5 +62,16 @@ __all__ = [
     # Handoff
     "HandoffArtifact",
     "HandoffManager",
+    "HandoffError",
+    "LazyState",
+    "SQLHandoffStore",
     "get_handoff_manager",
+    "set_handoff_store",
+    # Code cache
+    "AgentCodeCache",
+    "CompiledAgent",
+    "get_code_cache",
+    # Worker pool
+    "WarmWorkerPool",
+    "WorkerPoolError",
 ]
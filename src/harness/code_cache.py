@@ -0,0 +1,250 @@
+"""Agent Code Cache - Content-addressed cache of prepared agent code.
+
+AgentScheduler re-runs the same stored Agent.code on every tick. Entries
+are keyed by the SHA-256 of the agent source, so an unchanged agent
+reuses its wrapper, syntax check and validation results, and warm
+workers reuse their compiled bytecode (they cache code objects under the
+same hash). Any edit to the source produces a new key; the agents API
+also invalidates the old entry when code is updated or deleted.
+"""
+
+import hashlib
+import logging
+import os
+import traceback
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = int(os.environ.get("HARNESS_CODE_CACHE_SIZE", "256"))
+
+# Filename agent code is compiled under (shows up in tracebacks)
+AGENT_FILENAME = "agent.py"
+
+
+def hash_code(agent_code: str) -> str:
+    """Return the content hash used as cache key.
+
+    Args:
+        agent_code: Agent source code
+
+    Returns:
+        Hex SHA-256 digest of the source
+    """
+    return hashlib.sha256(agent_code.encode("utf-8")).hexdigest()
+
+
+def build_wrapper_code(agent_code: str) -> str:
+    """Wrap agent code in a script that runs the Agent and prints its result.
+
+    The config is read from the AGENT_CONFIG environment variable, so the
+    wrapper depends only on the agent source and can be cached by hash.
+
+    Args:
+        agent_code: Python code containing Agent class
+
+    Returns:
+        Python source runnable as __main__
+    """
+    return f"""
+import asyncio
+import json
+import os
+import sys
+import traceback
+
+# Agent code
+{agent_code}
+
+async def main():
+    \"\"\"Main execution wrapper.\"\"\"
+    try:
+        # Load config
+        config = json.loads(os.environ.get("AGENT_CONFIG") or "{{}}")
+
+        # Create and execute agent
+        agent = Agent(config)
+        result = await agent.execute()
+
+        # Print result as JSON for parsing
+        print("__RESULT_START__")
+        print(json.dumps(result))
+        print("__RESULT_END__")
+
+        # Cleanup if method exists
+        if hasattr(agent, 'cleanup'):
+            await agent.cleanup()
+
+        return 0
+    except Exception as e:
+        print("__ERROR_START__", file=sys.stderr)
+        print(str(e), file=sys.stderr)
+        print(traceback.format_exc(), file=sys.stderr)
+        print("__ERROR_END__", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
+"""
+
+
+@dataclass
+class CompiledAgent:
+    """Prepared artifact for one version of agent source.
+
+    Attributes:
+        code_hash: SHA-256 of the agent source
+        wrapper_code: Runnable wrapper around the agent source
+        syntax_error: Formatted SyntaxError if the wrapper doesn't compile
+        validations: validate_code() results keyed by strict flag
+    """
+
+    code_hash: str
+    wrapper_code: str
+    syntax_error: str | None = None
+    validations: dict[bool, dict[str, Any]] = field(default_factory=dict)
+
+
+def _compile_agent(agent_code: str, code_hash: str) -> CompiledAgent:
+    wrapper_code = build_wrapper_code(agent_code)
+    syntax_error = None
+    try:
+        compile(wrapper_code, AGENT_FILENAME, "exec")
+    except SyntaxError as e:
+        syntax_error = "".join(traceback.format_exception_only(type(e), e))
+    return CompiledAgent(code_hash=code_hash, wrapper_code=wrapper_code, syntax_error=syntax_error)
+
+
+class AgentCodeCache:
+    """Bounded LRU cache of CompiledAgent artifacts keyed by source hash.
+
+    Example:
+        >>> cache = get_code_cache()
+        >>> artifact = cache.get(agent.code)
+        >>> artifact.syntax_error is None
+        True
+        >>> cache.invalidate(agent.code)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum artifacts kept (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, CompiledAgent] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, agent_code: str) -> CompiledAgent:
+        """Get the artifact for agent code, preparing it on a miss.
+
+        Args:
+            agent_code: Agent source code
+
+        Returns:
+            CompiledAgent for this exact source
+        """
+        code_hash = hash_code(agent_code)
+        artifact = self._data.get(code_hash)
+        if artifact is not None:
+            self._data.move_to_end(code_hash)
+            self.hits += 1
+            return artifact
+
+        self.misses += 1
+        artifact = _compile_agent(agent_code, code_hash)
+        if self.maxsize > 0:
+            self._data[code_hash] = artifact
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return artifact
+
+    def get_validation(self, agent_code: str, strict: bool) -> dict[str, Any] | None:
+        """Get a cached validate_code() result for unchanged code.
+
+        Args:
+            agent_code: Agent source code
+            strict: Strict flag the validation ran with
+
+        Returns:
+            Copy of the cached result, or None if not validated yet
+        """
+        artifact = self._data.get(hash_code(agent_code))
+        if artifact is None or strict not in artifact.validations:
+            return None
+        return _copy_validation(artifact.validations[strict])
+
+    def set_validation(self, agent_code: str, strict: bool, result: dict[str, Any]) -> None:
+        """Store a validate_code() result on the code's artifact.
+
+        Args:
+            agent_code: Agent source code
+            strict: Strict flag the validation ran with
+            result: Validation result
+        """
+        self.get(agent_code).validations[strict] = _copy_validation(result)
+
+    def invalidate(self, agent_code: str) -> bool:
+        """Drop the artifact for agent code.
+
+        Args:
+            agent_code: Agent source code
+
+        Returns:
+            True if an artifact was removed
+        """
+        return self._data.pop(hash_code(agent_code), None) is not None
+
+    def clear(self) -> None:
+        """Drop all artifacts (counters are kept)."""
+        self._data.clear()
+
+    def __contains__(self, agent_code: str) -> bool:
+        return hash_code(agent_code) in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict with size, maxsize, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _copy_validation(result: dict[str, Any]) -> dict[str, Any]:
+    # Callers get their own lists so they can't mutate the cached result
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+
+# Global code cache instance
+_global_cache: AgentCodeCache | None = None
+
+
+def get_code_cache() -> AgentCodeCache:
+    """Get global AgentCodeCache singleton.
+
+    Returns:
+        Global AgentCodeCache instance
+
+    Example:
+        >>> artifact = get_code_cache().get(agent_code)
+    """
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = AgentCodeCache()
+    return _global_cache
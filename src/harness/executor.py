@@ -7,8 +7,15 @@ subprocesses with resource limits and timeout protection.
 import asyncio
 import json
 import logging
+import os
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .code_cache import get_code_cache
+
+if TYPE_CHECKING:
+    from .worker_pool import WarmWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -73,10 +80,66 @@ class ExecutionResult:
         }
 
 
+def _build_result(stdout: str, stderr: str, exit_code: int, duration: float) -> ExecutionResult:
+    """Parse wrapper output into an ExecutionResult.
+
+    Args:
+        stdout: Captured standard output
+        stderr: Captured standard error
+        exit_code: Process exit code
+        duration: Execution duration in seconds
+
+    Returns:
+        ExecutionResult with status 'success' or 'error'
+    """
+    # Parse result from stdout
+    result_data = None
+    if "__RESULT_START__" in stdout and "__RESULT_END__" in stdout:
+        try:
+            result_start = stdout.index("__RESULT_START__") + len("__RESULT_START__")
+            result_end = stdout.index("__RESULT_END__")
+            result_json = stdout[result_start:result_end].strip()
+            result_data = json.loads(result_json)
+        except (ValueError, json.JSONDecodeError) as parse_error:
+            logger.warning("Failed to parse result JSON: %s", parse_error)
+
+    # Check for errors
+    if exit_code != 0 or "__ERROR_START__" in stderr:
+        error_msg = stderr
+        if "__ERROR_START__" in stderr and "__ERROR_END__" in stderr:
+            error_start = stderr.index("__ERROR_START__") + len("__ERROR_START__")
+            error_end = stderr.index("__ERROR_END__")
+            error_msg = stderr[error_start:error_end].strip()
+
+        logger.error("Agent execution failed: %s", error_msg)
+
+        return ExecutionResult(
+            status="error",
+            error=error_msg,
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=exit_code,
+            duration=duration,
+        )
+
+    # Success
+    logger.info("Agent execution completed successfully (%.2fs)", duration)
+
+    return ExecutionResult(
+        status="success",
+        result=result_data or {},
+        stdout=stdout,
+        stderr=stderr,
+        exit_code=exit_code,
+        duration=duration,
+    )
+
+
 async def execute_agent_code(
     agent_code: str,
     config: dict | None = None,
     timeout: int = 300,
+    pool: "WarmWorkerPool | None" = None,
 ) -> ExecutionResult:
     """Execute agent code in isolated subprocess.
 
@@ -84,10 +147,16 @@ async def execute_agent_code(
     in a subprocess with timeout and resource limits. The agent must
     define an Agent class with an async execute() method.
 
+    The wrapper and syntax check come from the code cache, so unchanged
+    agents skip both. When a WarmWorkerPool is given, the run is forked
+    from one of its pre-started workers instead of cold-starting a new
+    interpreter. Result semantics are the same on both paths.
+
     Args:
         agent_code: Python code containing Agent class
         config: Configuration dict to pass to agent (default: {})
         timeout: Maximum execution time in seconds (default: 300/5min)
+        pool: Warm worker pool to run on (default: cold subprocess)
 
     Returns:
         ExecutionResult with status, output, and error information
@@ -111,6 +180,20 @@ async def execute_agent_code(
 
     config = config or {}
 
+    # Unchanged agents reuse their wrapper and syntax check
+    artifact = get_code_cache().get(agent_code)
+    if artifact.syntax_error:
+        logger.error("Agent execution failed: %s", artifact.syntax_error.strip())
+        return ExecutionResult(
+            status="error",
+            error=artifact.syntax_error.strip(),
+            stderr=artifact.syntax_error,
+            exit_code=1,
+        )
+
+    if pool is not None:
+        return await pool.execute(agent_code, config=config, timeout=timeout)
+
     logger.info("Starting agent execution (timeout: %ds)", timeout)
 
     # Create temporary file for agent code
@@ -123,47 +206,7 @@ async def execute_agent_code(
         temp_path = Path(temp_file.name)
 
         # Write wrapper code that runs the agent
-        wrapper_code = f"""
-import asyncio
-import json
-import sys
-import traceback
-
-# Agent code
-{agent_code}
-
-async def main():
-    \"\"\"Main execution wrapper.\"\"\"
-    try:
-        # Load config
-        config = {json.dumps(config)}
-
-        # Create and execute agent
-        agent = Agent(config)
-        result = await agent.execute()
-
-        # Print result as JSON for parsing
-        print("__RESULT_START__")
-        print(json.dumps(result))
-        print("__RESULT_END__")
-
-        # Cleanup if method exists
-        if hasattr(agent, 'cleanup'):
-            await agent.cleanup()
-
-        return 0
-    except Exception as e:
-        print("__ERROR_START__", file=sys.stderr)
-        print(str(e), file=sys.stderr)
-        print(traceback.format_exc(), file=sys.stderr)
-        print("__ERROR_END__", file=sys.stderr)
-        return 1
-
-if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
-"""
-        temp_file.write(wrapper_code)
+        temp_file.write(artifact.wrapper_code)
         temp_file.flush()
 
     try:
@@ -175,6 +218,7 @@ if __name__ == "__main__":
             str(temp_path),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, "AGENT_CONFIG": json.dumps(config)},
         )
 
         # Wait for completion with timeout
@@ -206,47 +250,7 @@ if __name__ == "__main__":
 
         duration = asyncio.get_event_loop().time() - start_time
 
-        # Parse result from stdout
-        result_data = None
-        if "__RESULT_START__" in stdout and "__RESULT_END__" in stdout:
-            try:
-                result_start = stdout.index("__RESULT_START__") + len("__RESULT_START__")
-                result_end = stdout.index("__RESULT_END__")
-                result_json = stdout[result_start:result_end].strip()
-                result_data = json.loads(result_json)
-            except (ValueError, json.JSONDecodeError) as parse_error:
-                logger.warning("Failed to parse result JSON: %s", parse_error)
-
-        # Check for errors
-        if exit_code != 0 or "__ERROR_START__" in stderr:
-            error_msg = stderr
-            if "__ERROR_START__" in stderr and "__ERROR_END__" in stderr:
-                error_start = stderr.index("__ERROR_START__") + len("__ERROR_START__")
-                error_end = stderr.index("__ERROR_END__")
-                error_msg = stderr[error_start:error_end].strip()
-
-            logger.error("Agent execution failed: %s", error_msg)
-
-            return ExecutionResult(
-                status="error",
-                error=error_msg,
-                stdout=stdout,
-                stderr=stderr,
-                exit_code=exit_code,
-                duration=duration,
-            )
-
-        # Success
-        logger.info("Agent execution completed successfully (%.2fs)", duration)
-
-        return ExecutionResult(
-            status="success",
-            result=result_data or {},
-            stdout=stdout,
-            stderr=stderr,
-            exit_code=exit_code,
-            duration=duration,
-        )
+        return _build_result(stdout, stderr, exit_code, duration)
 
     finally:
         # Clean up temporary file
@@ -2,16 +2,267 @@
 
 Implements state persistence and context handoff to enable long-running
 agents that maintain memory across multiple executions.
+
+With a SQLHandoffStore, artifacts survive restarts and are shared between
+scheduler replicas. State is stored per top-level key as a compact binary
+blob (msgpack, zstd-compressed when large), and a save only writes the
+keys whose encoded value changed since the previous run. Loaded state is
+a LazyState: blobs are decoded on first access, so an agent that never
+reads its history never pays to deserialize it.
 """
 
 import json
 import logging
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import delete, or_, true
+from sqlmodel import select
+
+from src.models.handoff import HandoffRecord, HandoffStateEntry
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# Values whose serialized form is at least this many bytes get zstd-compressed
+COMPRESS_THRESHOLD = 512
+
+# Blob layout: <compression flag><format flag><payload>
+_RAW = b"-"
+_ZSTD = b"z"
+_MSGPACK = b"m"
+_JSON = b"j"
+_NESTED = b"s"  # msgpack map of key -> [blob, size] (a LazyState kept encoded)
+
+Encoded = tuple[bytes, int]  # (blob, serialized size before compression)
+
+
+class HandoffError(Exception):
+    """Raised when handoff state cannot be encoded, decoded or stored."""
+
+    pass
+
+
+def _to_builtin(obj: Any) -> Any:
+    if isinstance(obj, LazyState):
+        return obj.to_dict()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
+
+
+def _pack(value: Any) -> bytes:
+    if ormsgpack is not None:
+        return _MSGPACK + ormsgpack.packb(
+            value, default=_to_builtin, option=ormsgpack.OPT_NON_STR_KEYS
+        )
+    return _JSON + json.dumps(value, default=_to_builtin, separators=(",", ":")).encode("utf-8")
+
+
+def encode_value(value: Any) -> Encoded:
+    """Encode one state value to a compact blob.
+
+    Args:
+        value: JSON-compatible value (nested LazyState is kept lazy)
+
+    Returns:
+        Tuple of (blob, serialized size in bytes before compression)
+
+    Raises:
+        HandoffError: If the value cannot be serialized
+    """
+    try:
+        if isinstance(value, LazyState) and ormsgpack is not None:
+            # Nested state keeps its per-key blobs; nothing is decoded
+            encoded = value.encoded()
+            packed = _NESTED + ormsgpack.packb({k: list(e) for k, e in encoded.items()})
+            size = sum(size for _, size in encoded.values())
+        else:
+            packed = _pack(value)
+            size = len(packed) - 1
+    except (TypeError, ValueError) as e:
+        raise HandoffError(f"Cannot encode handoff state value: {e}") from e
+
+    if zstandard is not None and len(packed) - 1 >= COMPRESS_THRESHOLD:
+        return _ZSTD + packed[:1] + zstandard.ZstdCompressor().compress(packed[1:]), size
+    return _RAW + packed, size
+
+
+def decode_value(blob: bytes) -> Any:
+    """Decode a blob produced by encode_value.
+
+    Args:
+        blob: Encoded value
+
+    Returns:
+        Decoded value (LazyState for nested state)
+
+    Raises:
+        HandoffError: If the blob needs a codec that isn't installed
+    """
+    flag, fmt, payload = blob[:1], blob[1:2], blob[2:]
+    if flag == _ZSTD:
+        if zstandard is None:
+            raise HandoffError("zstandard is required to decode compressed handoff state")
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+    if fmt == _JSON:
+        return json.loads(payload)
+    if ormsgpack is None:
+        raise HandoffError("ormsgpack is required to decode msgpack handoff state")
+    if fmt == _NESTED:
+        entries = ormsgpack.unpackb(payload)
+        return LazyState(encoded={key: (blob, size) for key, (blob, size) in entries.items()})
+    return ormsgpack.unpackb(payload, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+class LazyState(MutableMapping):
+    """Handoff state whose values are decoded on first access.
+
+    Holds the encoded blob of every top-level key. Reading a key decodes
+    it once; keys that are never read stay encoded and are written back
+    unchanged. Sizes are tracked per key, so size() only re-measures keys
+    that were read or assigned.
+
+    Example:
+        >>> state = LazyState(encoded={"history": encode_value(big_list)})
+        >>> state["count"] = 3          # history is still not decoded
+        >>> state.size()
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, Any] | None = None,
+        encoded: Mapping[str, Encoded] | None = None,
+    ):
+        """Initialize state.
+
+        Args:
+            data: Decoded values to start with
+            encoded: Encoded (blob, size) per key, decoded lazily
+        """
+        self._encoded: dict[str, Encoded] = dict(encoded or {})
+        self._values: dict[str, Any] = {}
+        self._keys: dict[str, None] = dict.fromkeys(self._encoded)
+        if data:
+            self.update(data)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key not in self._encoded:
+            raise KeyError(key)
+        value = decode_value(self._encoded[key][0])
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+        self._keys[key] = None
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._keys:
+            raise KeyError(key)
+        del self._keys[key]
+        self._values.pop(key, None)
+        self._encoded.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        # Mapping's default would decode the value just to test membership
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        decoded = sum(1 for key in self._keys if key in self._values)
+        return f"LazyState({len(self._keys)} keys, {decoded} decoded)"
+
+    def is_decoded(self, key: str) -> bool:
+        """Check whether a key has been decoded (or assigned)."""
+        return key in self._values
+
+    def adopt(self, key: str, source: "LazyState") -> None:
+        """Copy a key from another LazyState without decoding it.
+
+        Args:
+            key: Key to copy
+            source: State to copy from
+        """
+        if key in source._values:
+            self[key] = source._values[key]
+        else:
+            self._encoded[key] = source._encoded[key]
+            self._values.pop(key, None)
+            self._keys[key] = None
+
+    def encoded(self) -> dict[str, Encoded]:
+        """Encode the state, re-encoding only keys that were read or assigned.
+
+        Read values are re-encoded too, since they may have been mutated
+        in place.
+
+        Returns:
+            (blob, size) per key
+        """
+        for key, value in self._values.items():
+            self._encoded[key] = encode_value(value)
+        return {key: self._encoded[key] for key in self._keys}
+
+    def size(self) -> int:
+        """Return serialized state size in bytes (before compression)."""
+        return sum(size for _, size in self.encoded().values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decode every key into a plain dict (nested state included)."""
+        return {
+            key: value.to_dict() if isinstance(value, LazyState) else value
+            for key, value in self.items()
+        }
+
+
+def encode_state(state: Mapping[str, Any]) -> dict[str, Encoded]:
+    """Encode state per top-level key.
+
+    Args:
+        state: Plain dict or LazyState
+
+    Returns:
+        (blob, size) per key
+    """
+    if isinstance(state, LazyState):
+        return state.encoded()
+    return {key: encode_value(value) for key, value in state.items()}
+
+
+def state_size(state: Mapping[str, Any]) -> int:
+    """Return serialized state size in bytes (before compression).
+
+    Args:
+        state: Plain dict or LazyState
+
+    Returns:
+        Sum of per-key serialized sizes
+    """
+    if isinstance(state, LazyState):
+        return state.size()
+    return sum(size for _, size in encode_state(state).values())
+
 
 @dataclass
 class HandoffArtifact:
@@ -23,7 +274,8 @@ class HandoffArtifact:
     Attributes:
         agent_id: ID of the agent this artifact belongs to
         run_number: Sequential execution count
-        state: Arbitrary state data (JSON-serializable dict)
+        state: Arbitrary state data (JSON-serializable dict, or LazyState
+            when loaded from a durable store)
         metadata: Execution metadata (timestamps, durations, etc.)
         created_at: Timestamp of artifact creation
         compressed: Whether state has been compressed
@@ -50,10 +302,11 @@ class HandoffArtifact:
             >>> print(data['state']['count'])
             5
         """
+        state = self.state.to_dict() if isinstance(self.state, LazyState) else self.state
         return {
             "agent_id": self.agent_id,
             "run_number": self.run_number,
-            "state": self.state,
+            "state": state,
             "metadata": self.metadata,
             "created_at": self.created_at.isoformat(),
             "compressed": self.compressed,
@@ -122,22 +375,152 @@ class HandoffArtifact:
         return cls.from_dict(data)
 
 
+class SQLHandoffStore:
+    """Durable handoff storage in the handoff_artifacts/handoff_state tables.
+
+    One header row per agent plus one row per top-level state key. Saves
+    write the header and only the changed keys; loads return encoded
+    blobs that HandoffManager wraps in a LazyState.
+
+    Example:
+        >>> from src.api.database import async_session_maker
+        >>> manager = HandoffManager(store=SQLHandoffStore(async_session_maker))
+    """
+
+    def __init__(self, session_factory):
+        """Initialize store.
+
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+        """
+        self.session_factory = session_factory
+
+    async def load_header(self, agent_id: int) -> HandoffRecord | None:
+        """Load the artifact header without any state.
+
+        Args:
+            agent_id: ID of agent
+
+        Returns:
+            HandoffRecord or None if the agent has no artifact
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(HandoffRecord).where(HandoffRecord.agent_id == agent_id)
+            )
+            return result.scalar_one_or_none()
+
+    async def load(self, agent_id: int) -> tuple[HandoffRecord, dict[str, Encoded]] | None:
+        """Load the artifact header and encoded state.
+
+        Args:
+            agent_id: ID of agent
+
+        Returns:
+            (header, (blob, size) per key) or None if the agent has no artifact
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(HandoffRecord).where(HandoffRecord.agent_id == agent_id)
+            )
+            header = result.scalar_one_or_none()
+            if header is None:
+                return None
+            rows = await session.execute(
+                select(HandoffStateEntry.key, HandoffStateEntry.value, HandoffStateEntry.size)
+                .where(HandoffStateEntry.agent_id == agent_id)
+                .order_by(HandoffStateEntry.key)
+            )
+            return header, {key: (value, size) for key, value, size in rows.all()}
+
+    async def save(
+        self,
+        header: HandoffRecord,
+        changed: dict[str, Encoded],
+        keys: list[str],
+    ) -> None:
+        """Write the header and changed keys, dropping keys no longer present.
+
+        Args:
+            header: Artifact header to upsert
+            changed: (blob, size) for keys that changed since the stored state
+            keys: All keys of the new state
+        """
+        async with self.session_factory() as session:
+            stale = HandoffStateEntry.key.not_in(keys) if keys else true()
+            if changed:
+                stale = or_(stale, HandoffStateEntry.key.in_(list(changed)))
+            await session.execute(
+                delete(HandoffStateEntry).where(
+                    HandoffStateEntry.agent_id == header.agent_id, stale
+                )
+            )
+            session.add_all(
+                HandoffStateEntry(
+                    agent_id=header.agent_id,
+                    key=key,
+                    value=blob,
+                    size=size,
+                    run_number=header.run_number,
+                )
+                for key, (blob, size) in changed.items()
+            )
+            await session.merge(header)
+            await session.commit()
+
+    async def delete(self, agent_id: int) -> None:
+        """Delete an agent's artifact and state.
+
+        Args:
+            agent_id: ID of agent
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(HandoffStateEntry).where(HandoffStateEntry.agent_id == agent_id)
+            )
+            await session.execute(delete(HandoffRecord).where(HandoffRecord.agent_id == agent_id))
+            await session.commit()
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _version(header: HandoffRecord | None) -> tuple[int, datetime] | None:
+    if header is None:
+        return None
+    return header.run_number, _naive_utc(header.created_at)
+
+
 class HandoffManager:
     """Manages handoff artifacts for agent state persistence.
 
     Coordinates state preservation between agent executions, enabling
     long-running agents to maintain context across multiple runs.
+
+    Without a store, artifacts live in this process only. With a
+    SQLHandoffStore they are durable and shared between replicas; the
+    latest artifact per agent is still kept in memory and reused while
+    the stored version hasn't moved on.
     """
 
-    def __init__(self):
+    def __init__(self, store: SQLHandoffStore | None = None):
         """Initialize handoff manager.
 
+        Args:
+            store: Durable store (default: in-process only)
+
         Example:
             >>> manager = HandoffManager()
             >>> await manager.save_artifact(artifact)
         """
+        self.store = store
         self._artifacts: dict[int, HandoffArtifact] = {}
-        logger.info("HandoffManager initialized")
+        # Per agent: stored version and the encoded state written/loaded with it
+        self._stored: dict[int, tuple[tuple[int, datetime], dict[str, Encoded]]] = {}
+        logger.info("HandoffManager initialized (durable: %s)", store is not None)
 
     async def save_artifact(
         self,
@@ -145,16 +528,45 @@ class HandoffManager:
     ) -> None:
         """Save handoff artifact for agent.
 
-        Stores artifact in memory. In production, this should persist
-        to database (agent.config JSON field or separate table).
+        With a store, only top-level state keys whose encoded value
+        changed since the stored artifact are written.
 
         Args:
             artifact: HandoffArtifact to save
 
+        Raises:
+            HandoffError: If the state cannot be encoded
+
         Example:
             >>> artifact = HandoffArtifact(agent_id=1, state={'count': 10})
             >>> await manager.save_artifact(artifact)
         """
+        if self.store is not None:
+            encoded = encode_state(artifact.state)
+            previous = await self._stored_state(artifact.agent_id)
+            changed = {
+                key: value
+                for key, value in encoded.items()
+                if previous.get(key, (None,))[0] != value[0]
+            }
+            header = HandoffRecord(
+                agent_id=artifact.agent_id,
+                run_number=artifact.run_number,
+                meta=json.dumps(artifact.metadata, default=str),
+                summary=artifact.summary,
+                compressed=artifact.compressed,
+                state_size=sum(size for _, size in encoded.values()),
+                created_at=_naive_utc(artifact.created_at),
+            )
+            await self.store.save(header, changed, list(encoded))
+            self._stored[artifact.agent_id] = (_version(header), encoded)
+            logger.debug(
+                "Wrote %d/%d state keys for agent %d",
+                len(changed),
+                len(encoded),
+                artifact.agent_id,
+            )
+
         self._artifacts[artifact.agent_id] = artifact
         logger.info(
             "Saved handoff artifact for agent %d (run %d)",
@@ -168,6 +580,9 @@ class HandoffManager:
     ) -> HandoffArtifact | None:
         """Load previous handoff artifact for agent.
 
+        With a store, state comes back as a LazyState: values are decoded
+        only when read.
+
         Args:
             agent_id: ID of agent to load artifact for
 
@@ -179,7 +594,10 @@ class HandoffManager:
             >>> if artifact:
             ...     print(artifact.state)
         """
-        artifact = self._artifacts.get(agent_id)
+        if self.store is not None:
+            artifact = await self._load_from_store(agent_id)
+        else:
+            artifact = self._artifacts.get(agent_id)
 
         if artifact:
             logger.info(
@@ -195,6 +613,46 @@ class HandoffManager:
 
         return artifact
 
+    async def _stored_state(self, agent_id: int) -> dict[str, Encoded]:
+        """Encoded state currently in the store (from memory when still current)."""
+        header = await self.store.load_header(agent_id)
+        if header is None:
+            return {}
+        cached = self._stored.get(agent_id)
+        if cached and cached[0] == _version(header):
+            return cached[1]
+        # Another replica wrote since; diff against what is actually stored
+        loaded = await self.store.load(agent_id)
+        return loaded[1] if loaded else {}
+
+    async def _load_from_store(self, agent_id: int) -> HandoffArtifact | None:
+        header = await self.store.load_header(agent_id)
+        if header is None:
+            self._artifacts.pop(agent_id, None)
+            self._stored.pop(agent_id, None)
+            return None
+
+        cached = self._stored.get(agent_id)
+        if cached and cached[0] == _version(header) and agent_id in self._artifacts:
+            return self._artifacts[agent_id]
+
+        loaded = await self.store.load(agent_id)
+        if loaded is None:
+            return None
+        header, encoded = loaded
+        artifact = HandoffArtifact(
+            agent_id=agent_id,
+            run_number=header.run_number,
+            state=LazyState(encoded=encoded),
+            metadata=json.loads(header.meta or "{}"),
+            created_at=header.created_at.replace(tzinfo=UTC),
+            compressed=header.compressed,
+            summary=header.summary,
+        )
+        self._artifacts[agent_id] = artifact
+        self._stored[agent_id] = (_version(header), encoded)
+        return artifact
+
     async def create_next_artifact(
         self,
         agent_id: int,
@@ -204,7 +662,9 @@ class HandoffManager:
         """Create handoff artifact for next run based on current results.
 
         Loads previous artifact, increments run number, preserves relevant
-        state, and adds new results.
+        state, and adds new results. The previous run's state is carried
+        one level deep (its own previous_run is dropped) so history does
+        not nest without bound. Carried values are not decoded.
 
         Args:
             agent_id: ID of agent
@@ -225,20 +685,29 @@ class HandoffManager:
 
         # Determine run number
         run_number = 1
-        previous_state = {}
+        previous_state = LazyState()
         if previous:
             run_number = previous.run_number + 1
-            previous_state = previous.state.copy()
+            source = previous.state
+            if not isinstance(source, LazyState):
+                source = LazyState(data=source)
+            for key in source:
+                if key != "previous_run":
+                    previous_state.adopt(key, source)
+
+        state = LazyState(
+            data={"previous_run": previous_state, "current_result": result},
+        )
+        if "cumulative_data" in previous_state:
+            state.adopt("cumulative_data", previous_state)
+        else:
+            state["cumulative_data"] = []
 
         # Create new artifact
         artifact = HandoffArtifact(
             agent_id=agent_id,
             run_number=run_number,
-            state={
-                "previous_run": previous_state,
-                "current_result": result,
-                "cumulative_data": previous_state.get("cumulative_data", []),
-            },
+            state=state,
             metadata=execution_metadata or {},
         )
 
@@ -264,6 +733,9 @@ class HandoffManager:
         Example:
             >>> await manager.clear_artifact(agent_id=1)
         """
+        if self.store is not None:
+            await self.store.delete(agent_id)
+            self._stored.pop(agent_id, None)
         if agent_id in self._artifacts:
             del self._artifacts[agent_id]
             logger.info("Cleared handoff artifact for agent %d", agent_id)
@@ -280,7 +752,7 @@ class HandoffManager:
 
         Args:
             state: State dictionary to compress
-            max_size: Maximum estimated size in characters
+            max_size: Maximum serialized size in bytes
 
         Returns:
             Compressed state dictionary
@@ -291,8 +763,8 @@ class HandoffManager:
             >>> print(len(compressed['logs']))
             100
         """
-        # Estimate size
-        size_estimate = len(json.dumps(state))
+        # Serialized size; a LazyState only re-measures keys read or assigned
+        size_estimate = state_size(state)
 
         if size_estimate <= max_size:
             return state
@@ -343,3 +815,16 @@ def get_handoff_manager() -> HandoffManager:
     if _global_manager is None:
         _global_manager = HandoffManager()
     return _global_manager
+
+
+def set_handoff_store(store: SQLHandoffStore | None) -> None:
+    """Replace the global HandoffManager with one using the given store.
+
+    Args:
+        store: Durable store (None for in-process only)
+
+    Example:
+        >>> set_handoff_store(SQLHandoffStore(async_session_maker))
+    """
+    global _global_manager
+    _global_manager = HandoffManager(store=store)
@@ -0,0 +1,107 @@
+"""Run Queue - Min-heap of upcoming agent runs.
+
+AgentScheduler keeps every upcoming run (cron fires and queued retries)
+in one heap ordered by due time. Peeking at the next due run is O(1) and
+popping k due runs is O(k log n), so the cost of a scheduler tick does
+not depend on how many agents are registered. Pushing an existing key
+reschedules it; superseded heap entries are dropped lazily when they
+reach the top.
+"""
+
+import heapq
+import itertools
+from collections.abc import Hashable, Iterator
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+_COMPACT_RATIO = 2
+_COMPACT_MIN = 64
+
+
+class RunQueue:
+    """Keyed min-heap of due times (seconds since the epoch).
+
+    Example:
+        >>> queue = RunQueue()
+        >>> queue.push(("agent", 1), time.time() + 60)
+        >>> queue.push(("retry", 7), time.time())
+        >>> queue.pop_due(time.time())
+        [('retry', 7)]
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._due: dict[Hashable, float] = {}
+        self._counter = itertools.count()
+
+    def push(self, key: Hashable, due: float) -> None:
+        """Schedule key at due, replacing any earlier schedule for it.
+
+        Args:
+            key: Run identifier
+            due: Due time in seconds since the epoch
+        """
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, next(self._counter), key))
+        if len(self._heap) > max(_COMPACT_MIN, _COMPACT_RATIO * len(self._due)):
+            self._compact()
+
+    def remove(self, key: Hashable) -> bool:
+        """Unschedule key.
+
+        Args:
+            key: Run identifier
+
+        Returns:
+            True if key was scheduled
+        """
+        return self._due.pop(key, None) is not None
+
+    def next_due(self) -> float | None:
+        """Get the earliest due time.
+
+        Returns:
+            Due time of the next run, or None if the queue is empty
+        """
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list[Hashable]:
+        """Remove and return every key due at or before now.
+
+        Args:
+            now: Current time in seconds since the epoch
+
+        Returns:
+            Due keys, earliest first
+        """
+        due = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            _, _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due.append(key)
+
+    def due_at(self, key: Hashable) -> float | None:
+        """Get the due time of key, or None if it isn't scheduled."""
+        return self._due.get(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._due))
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._due.get(entry[2]) == entry[0]]
+        heapq.heapify(self._heap)
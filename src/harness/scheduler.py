@@ -1,29 +1,69 @@
 """Task Scheduler - Orchestrates 24/7 agent execution.
 
-Uses APScheduler with PostgreSQL Advisory Locks to ensure idempotent
-task execution across multiple replicas.
+AgentScheduler keeps every upcoming run (cron fires and queued retries)
+in one in-memory RunQueue heap and sleeps until the earliest is due.
+Each tick loads all due agents with one query and claims their runs with
+one conditional UPDATE, so scheduling overhead stays flat as the number
+of registered agents grows and replicas never run the same fire twice.
+The claim also takes a per-agent run lease, so an agent never runs on two
+replicas at once.
+
+Next fire times are persisted in agent_schedules: fires missed while no
+replica was running are coalesced into a single run on startup. Failed
+runs are retried with exponential backoff through pending Task rows,
+which form a persistent retry queue that survives restarts.
 """
 
+import asyncio
+import contextlib
 import json
 import logging
+import os
+import time
+import uuid
 import zlib
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import text
+from sqlalchemy import and_, case, or_, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from src.models.agent import Agent
+from src.models.schedule import AgentSchedule
 from src.models.task import Task
 
 from .executor import execute_agent_code
+from .run_queue import RunQueue
+from .worker_pool import WarmWorkerPool
 
 logger = logging.getLogger(__name__)
 
+# Run scheduled agents on pre-forked warm workers (needs os.fork)
+USE_WARM_POOL = hasattr(os, "fork") and (
+    os.environ.get("HARNESS_WARM_POOL", "true").lower() == "true"
+)
+
+# Retry backoff is 2, 4, 8, ... seconds, capped at this delay
+MAX_RETRY_DELAY = 3600
+
+# How often pending retries queued elsewhere (other replicas, the tasks
+# API) are picked up from the database
+RETRY_SYNC_INTERVAL = float(os.environ.get("HARNESS_RETRY_SYNC_INTERVAL", "60"))
+
+# Delay before re-checking a due retry whose agent is still running, or
+# due runs whose claim failed
+DEFER_SECONDS = 5.0
+
+# Run leases outlast the agent's timeout by this much, so a replica that
+# dies mid-run only blocks the agent until its lease lapses
+LEASE_GRACE_SECONDS = 60
+
+# How long stop() lets in-flight runs finish before closing the worker pool
+STOP_TIMEOUT = float(os.environ.get("HARNESS_STOP_TIMEOUT", "30"))
+
 
 class SchedulerError(Exception):
     """Raised when scheduler operations fail."""
@@ -77,18 +117,184 @@ async def advisory_lock(
             )
 
 
+def retry_delay(attempt: int) -> int:
+    """Get the backoff delay before a retry.
+
+    Args:
+        attempt: Retry number (1 for the first retry)
+
+    Returns:
+        Delay in seconds (2, 4, 8, ... capped at MAX_RETRY_DELAY)
+    """
+    return min(2**attempt, MAX_RETRY_DELAY)
+
+
+def _utcnow() -> datetime:
+    # agent_schedules stores naive UTC
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _timestamp(value: datetime) -> float:
+    # Naive datetimes read back from the database are UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _next_fire(trigger: CronTrigger, after: datetime) -> datetime | None:
+    # get_next_fire_time is inclusive, so step past a fire time we just ran
+    fire = trigger.get_next_fire_time(None, after.replace(tzinfo=UTC) + timedelta(microseconds=1))
+    return fire.astimezone(UTC).replace(tzinfo=None) if fire else None
+
+
+def _load_config(agent: Agent) -> dict:
+    config = {}
+    if agent.config:
+        try:
+            config = json.loads(agent.config)
+        except json.JSONDecodeError as e:
+            logger.warning("Failed to parse agent config: %s", e)
+    return config
+
+
+async def _claim_tasks(session: AsyncSession, task_ids: Iterable[int]) -> set[int]:
+    """Atomically move pending tasks to running.
+
+    A task is claimed by exactly one caller, so a retry queued in the
+    database runs once even if several replicas see it due.
+
+    Args:
+        session: Database session (caller commits)
+        task_ids: IDs of pending tasks to claim
+
+    Returns:
+        IDs of the tasks this caller claimed
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return set()
+    result = await session.execute(
+        update(Task)
+        .where(Task.id.in_(task_ids), Task.status == "pending")
+        .values(status="running", started_at=datetime.now(UTC))
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    return set(result.scalars().all())
+
+
+def _enqueue_retry(session: AsyncSession, task: Task, config: dict) -> Task | None:
+    """Queue a pending retry Task for a failed run.
+
+    Args:
+        session: Database session (caller commits)
+        task: Failed task
+        config: Agent config (max_retries, default 3)
+
+    Returns:
+        The pending retry Task, or None if retries are exhausted
+    """
+    max_retries = config.get("max_retries", 3)
+    if task.retry_count >= max_retries:
+        return None
+
+    attempt = task.retry_count + 1
+    delay = retry_delay(attempt)
+    retry = Task(
+        agent_id=task.agent_id,
+        status="pending",
+        scheduled_at=datetime.now(UTC) + timedelta(seconds=delay),
+        retry_count=attempt,
+    )
+    session.add(retry)
+    logger.info("Scheduling retry %d/%d in %ds", attempt, max_retries, delay)
+    return retry
+
+
+async def run_agent_task(
+    session: AsyncSession,
+    agent: Agent,
+    task: Task,
+    pool: WarmWorkerPool | None = None,
+) -> Task | None:
+    """Execute an agent for a running Task and record the outcome.
+
+    Failed runs (not timeouts) queue a pending retry Task with
+    exponential backoff until the agent's max_retries is reached.
+
+    Args:
+        session: Database session the task belongs to
+        agent: Agent to execute
+        task: Task record already marked running
+        pool: Warm worker pool to run the agent on (default: cold subprocess)
+
+    Returns:
+        The queued retry Task, or None
+    """
+    config = _load_config(agent)
+    retry = None
+
+    try:
+        # Execute agent code
+        result = await execute_agent_code(
+            agent_code=agent.code,
+            config=config,
+            timeout=config.get("timeout", 300),  # Default 5min
+            pool=pool,
+        )
+
+        # Update task with results
+        task.completed_at = datetime.now(UTC)
+
+        if result.status == "success":
+            task.status = "completed"
+            task.result = json.dumps(result.result)
+            logger.info("Task %d completed successfully", task.id)
+
+        elif result.status == "timeout":
+            task.status = "failed"
+            task.error = result.error
+            logger.error("Task %d timed out: %s", task.id, result.error)
+
+        else:  # error
+            task.status = "failed"
+            task.error = result.error
+            logger.error("Task %d failed: %s", task.id, result.error)
+            retry = _enqueue_retry(session, task, config)
+
+        await session.commit()
+        if retry is not None:
+            await session.refresh(retry)
+
+    except Exception as execution_error:
+        # Catch unexpected errors
+        logger.exception("Unexpected error during task execution")
+        task.status = "failed"
+        task.error = f"Unexpected error: {execution_error}"
+        task.completed_at = datetime.now(UTC)
+        await session.commit()
+
+    return retry
+
+
 async def execute_scheduled_task(
     agent_id: int,
     session: AsyncSession,
+    pool: WarmWorkerPool | None = None,
+    task: Task | None = None,
 ) -> None:
-    """Execute a scheduled agent task with idempotency protection.
+    """Execute an agent task with idempotency protection.
 
-    Loads agent from database, acquires advisory lock, creates Task record,
-    executes agent code, and updates task with results.
+    Loads agent from database, acquires advisory lock, creates (or claims)
+    the Task record, executes agent code, and updates task with results.
+    Used for runs outside the scheduler loop, such as retries from the
+    tasks API.
 
     Args:
         agent_id: ID of the agent to execute
         session: Database session
+        pool: Warm worker pool to run the agent on (default: cold subprocess)
+        task: Pending Task to run (default: create a new one)
 
     Raises:
         SchedulerError: If agent not found or execution fails critically
@@ -123,111 +329,95 @@ async def execute_scheduled_task(
             )
             return
 
-        # Parse config
-        config = {}
-        if agent.config:
-            try:
-                config = json.loads(agent.config)
-            except json.JSONDecodeError as e:
-                logger.warning("Failed to parse agent config: %s", e)
-
-        # Create Task record
-        task = Task(
-            agent_id=agent.id,
-            status="running",
-            scheduled_at=datetime.now(UTC),
-            started_at=datetime.now(UTC),
-        )
-        session.add(task)
-        await session.commit()
-        await session.refresh(task)
-
-        logger.info(
-            "Created task %d for agent %d (%s)",
-            task.id,
-            agent.id,
-            agent.name,
-        )
-
-        try:
-            # Execute agent code
-            result = await execute_agent_code(
-                agent_code=agent.code,
-                config=config,
-                timeout=config.get("timeout", 300),  # Default 5min
+        if task is None:
+            # Create Task record
+            task = Task(
+                agent_id=agent.id,
+                status="running",
+                scheduled_at=datetime.now(UTC),
+                started_at=datetime.now(UTC),
             )
-
-            # Update task with results
-            task.completed_at = datetime.now(UTC)
-
-            if result.status == "success":
-                task.status = "completed"
-                task.result = json.dumps(result.result)
-                logger.info("Task %d completed successfully", task.id)
-
-            elif result.status == "timeout":
-                task.status = "failed"
-                task.error = result.error
-                logger.error("Task %d timed out: %s", task.id, result.error)
-
-            else:  # error
-                task.status = "failed"
-                task.error = result.error
-                logger.error("Task %d failed: %s", task.id, result.error)
-
-                # Check if retry is needed
-                max_retries = config.get("max_retries", 3)
-                if task.retry_count < max_retries:
-                    # Schedule retry with exponential backoff
-                    task.retry_count += 1
-                    retry_delay = 2**task.retry_count  # 2, 4, 8 seconds
-                    logger.info(
-                        "Scheduling retry %d/%d in %ds",
-                        task.retry_count,
-                        max_retries,
-                        retry_delay,
-                    )
-                    # TODO: Schedule retry using APScheduler.add_job()
-
+            session.add(task)
             await session.commit()
+            await session.refresh(task)
 
-        except Exception as execution_error:
-            # Catch unexpected errors
-            logger.exception("Unexpected error during task execution")
-            task.status = "failed"
-            task.error = f"Unexpected error: {execution_error}"
-            task.completed_at = datetime.now(UTC)
+            logger.info(
+                "Created task %d for agent %d (%s)",
+                task.id,
+                agent.id,
+                agent.name,
+            )
+        else:
+            # The scheduler may already have picked up this pending task
+            if not await _claim_tasks(session, [task.id]):
+                logger.info("Task %d already claimed, skipping", task.id)
+                return
             await session.commit()
+            await session.refresh(task)
+
+        await run_agent_task(session, agent, task, pool=pool)
 
 
 class AgentScheduler:
     """24/7 orchestration of agent execution.
 
-    Manages scheduled execution of agents using APScheduler. Loads agent
-    schedules from database and ensures idempotent execution using
-    PostgreSQL advisory locks.
+    Keeps cron fires and retries in a RunQueue heap and wakes only when
+    the earliest run is due. Due agents are loaded with one query per
+    tick and claimed with one conditional UPDATE on agent_schedules, so
+    each fire runs on exactly one replica. The UPDATE also takes a run
+    lease (running_until/running_by) that is cleared when the run ends,
+    so an agent runs at most once at a time across replicas: fires that
+    come due while it is still running are coalesced into that run, and
+    retries wait for it.
 
     Attributes:
-        scheduler: APScheduler AsyncIOScheduler instance
-        session: Database session factory
+        queue: RunQueue of upcoming runs, keyed ("agent", agent_id) for
+            cron fires and ("retry", task_id) for queued retries
+        session_factory: Database session factory
         running: Whether scheduler is currently running
+        worker_pool: Warm worker pool for agent runs (None = cold subprocess)
+        retry_sync_interval: Seconds between scans for pending retries
+        worker_id: ID recorded on the run leases this scheduler holds
     """
 
-    def __init__(self, session_factory):
+    def __init__(
+        self,
+        session_factory,
+        worker_pool: WarmWorkerPool | None = None,
+        retry_sync_interval: float = RETRY_SYNC_INTERVAL,
+    ):
         """Initialize scheduler.
 
         Args:
             session_factory: Callable that returns AsyncSession
+            worker_pool: Warm worker pool (default: one is created when
+                HARNESS_WARM_POOL is enabled)
+            retry_sync_interval: Seconds between scans for pending retries
+                queued outside this scheduler
         """
-        self.scheduler = AsyncIOScheduler()
+        self.queue = RunQueue()
         self.session_factory = session_factory
         self.running = False
+        if worker_pool is None and USE_WARM_POOL:
+            worker_pool = WarmWorkerPool()
+        self.worker_pool = worker_pool
+        self.retry_sync_interval = retry_sync_interval
+        self.worker_id = uuid.uuid4().hex[:12]
+        self._triggers: dict[int, tuple[str, CronTrigger]] = {}
+        self._retries: dict[int, int] = {}  # retry task id -> agent id
+        self._running_agents: set[int] = set()
+        self._inflight: set[asyncio.Task] = set()
+        self._loop_task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._next_sync = 0.0
 
     async def start(self) -> None:
         """Start the scheduler and load agent schedules.
 
-        Loads all active agents from database and schedules their
-        execution based on cron expressions in config.
+        Loads all active agents and their stored next run times, schedules
+        them from the cron expressions in config, coalesces fires missed
+        while the scheduler was down into one immediate run per agent, and
+        loads pending retries.
 
         Raises:
             SchedulerError: If scheduler is already running
@@ -241,25 +431,48 @@ class AgentScheduler:
 
         logger.info("Starting AgentScheduler")
 
-        # Load agents and create schedules
+        # Load agents and stored schedules, then create schedules
         async with self.session_factory() as session:
             result = await session.execute(select(Agent).where(Agent.status == "active"))
             agents = result.scalars().all()
+            result = await session.execute(select(AgentSchedule))
+            stored = {row.agent_id: row for row in result.scalars().all()}
 
             for agent in agents:
-                await self._schedule_agent(agent)
+                row = stored.get(agent.id)
+                due = await self._schedule_agent(agent, row.next_run_at if row else None)
+                if due is None:
+                    continue
+                if row is None:
+                    session.add(AgentSchedule(agent_id=agent.id, next_run_at=due))
+                else:
+                    row.next_run_at = due
+            await session.commit()
+
+        await self._sync_retries()
+
+        if self.worker_pool is not None:
+            await self.worker_pool.start()
 
-        # Start APScheduler
-        self.scheduler.start()
         self.running = True
+        self._next_sync = time.time() + self.retry_sync_interval
+        self._loop_task = asyncio.create_task(self._run_loop())
 
         logger.info(
             "AgentScheduler started with %d scheduled agents",
-            len(self.scheduler.get_jobs()),
+            len(self._triggers),
         )
 
-    async def stop(self) -> None:
-        """Stop the scheduler and cancel all jobs.
+    async def stop(self, timeout: float = STOP_TIMEOUT) -> None:
+        """Stop the scheduler loop and wait for in-flight runs.
+
+        No new runs start once the loop is cancelled. In-flight runs get up
+        to ``timeout`` seconds to finish before the worker pool closes;
+        runs still going after that are interrupted by the close and get
+        queued for retry like any other failed run.
+
+        Args:
+            timeout: Seconds to wait for in-flight runs before closing the pool
 
         Example:
             >>> await scheduler.stop()
@@ -268,52 +481,69 @@ class AgentScheduler:
             return
 
         logger.info("Stopping AgentScheduler")
-        self.scheduler.shutdown(wait=True)
         self.running = False
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._loop_task
+            self._loop_task = None
+        if self._inflight:
+            _, pending = await asyncio.wait(set(self._inflight), timeout=timeout)
+            if pending:
+                logger.warning(
+                    "%d run(s) still in flight after %.0fs, interrupting", len(pending), timeout
+                )
+        if self.worker_pool is not None:
+            await self.worker_pool.close()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
         logger.info("AgentScheduler stopped")
 
-    async def _schedule_agent(self, agent: Agent) -> None:
-        """Add agent to scheduler based on config.
+    def _parse_schedule(self, agent: Agent) -> CronTrigger | None:
+        """Get the cron trigger for an agent's config.schedule.
 
-        Parses agent.config JSON for schedule settings and creates
-        APScheduler job with cron trigger.
+        Triggers are cached per agent and rebuilt only when the schedule
+        string changes.
 
         Args:
             agent: Agent model instance
 
-        Example config:
-            {
-                "schedule": "0 */6 * * *",  # Every 6 hours
-                "timeout": 300,
-                "max_retries": 3
-            }
+        Returns:
+            CronTrigger, or None if the agent has no valid schedule
         """
         if not agent.config:
             logger.warning("Agent %d has no config, skipping schedule", agent.id)
-            return
+            return None
 
         try:
-            config = json.loads(agent.config)
-            schedule = config.get("schedule")
-
-            if not schedule:
-                logger.info(
-                    "Agent %d has no schedule configured, skipping",
-                    agent.id,
-                )
-                return
+            schedule = json.loads(agent.config).get("schedule")
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse config for agent %d: %s", agent.id, e)
+            return None
 
-            # Parse cron expression
-            # Format: "minute hour day month day_of_week"
-            parts = schedule.split()
-            if len(parts) != 5:
-                logger.error(
-                    "Invalid cron schedule for agent %d: %s",
-                    agent.id,
-                    schedule,
-                )
-                return
+        if not schedule:
+            logger.info(
+                "Agent %d has no schedule configured, skipping",
+                agent.id,
+            )
+            return None
+
+        cached = self._triggers.get(agent.id)
+        if cached is not None and cached[0] == schedule:
+            return cached[1]
+
+        # Parse cron expression
+        # Format: "minute hour day month day_of_week"
+        parts = schedule.split()
+        if len(parts) != 5:
+            logger.error(
+                "Invalid cron schedule for agent %d: %s",
+                agent.id,
+                schedule,
+            )
+            return None
 
+        try:
             trigger = CronTrigger(
                 minute=parts[0],
                 hour=parts[1],
@@ -321,43 +551,369 @@ class AgentScheduler:
                 month=parts[3],
                 day_of_week=parts[4],
             )
+        except ValueError as e:
+            logger.error("Invalid cron schedule for agent %d: %s", agent.id, e)
+            return None
 
-            # Add job to scheduler
-            self.scheduler.add_job(
-                func=self._execute_agent_wrapper,
-                trigger=trigger,
-                args=[agent.id],
-                id=f"agent_{agent.id}",
-                name=f"Agent: {agent.name}",
-                replace_existing=True,
-            )
+        self._triggers[agent.id] = (schedule, trigger)
+        return trigger
+
+    async def _schedule_agent(
+        self,
+        agent: Agent,
+        previous_run_at: datetime | None = None,
+    ) -> datetime | None:
+        """Add agent to the run queue based on config.
+
+        Args:
+            agent: Agent model instance
+            previous_run_at: Next run time stored before the scheduler
+                (re)started. If it has passed, the agent missed one or more
+                fires and runs once now, unless config.catch_up is false.
+
+        Returns:
+            Due time of the agent's next run (naive UTC), or None if the
+            agent isn't scheduled
 
+        Example config:
+            {
+                "schedule": "0 */6 * * *",  # Every 6 hours
+                "timeout": 300,
+                "max_retries": 3,
+                "catch_up": true  # Run once after downtime (default)
+            }
+        """
+        trigger = self._parse_schedule(agent)
+        if trigger is None:
+            self._unschedule(agent.id)
+            return None
+
+        now = _utcnow()
+        if (
+            previous_run_at is not None
+            and previous_run_at <= now
+            and _load_config(agent).get("catch_up", True)
+        ):
+            # Every fire missed while down collapses into this one run
             logger.info(
-                "Scheduled agent %d (%s) with cron: %s",
+                "Agent %d missed runs since %s, running once now",
                 agent.id,
-                agent.name,
-                schedule,
+                previous_run_at.isoformat(),
             )
+            due = now
+        else:
+            due = _next_fire(trigger, now)
+            if due is None:
+                self._unschedule(agent.id)
+                return None
 
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse config for agent %d: %s", agent.id, e)
-        except Exception:
-            logger.exception("Failed to schedule agent %d", agent.id)
+        self.queue.push(("agent", agent.id), _timestamp(due))
+        self._wakeup.set()
+        logger.info(
+            "Scheduled agent %d (%s) with cron: %s",
+            agent.id,
+            agent.name,
+            self._triggers[agent.id][0],
+        )
+        return due
+
+    def _unschedule(self, agent_id: int) -> bool:
+        self._triggers.pop(agent_id, None)
+        return self.queue.remove(("agent", agent_id))
+
+    def _push_retry(self, task_id: int, agent_id: int, due: float) -> None:
+        self._retries[task_id] = agent_id
+        self.queue.push(("retry", task_id), due)
+        self._wakeup.set()
+
+    async def _sync_retries(self) -> int:
+        """Queue pending retries for active agents found in the database.
+
+        Returns:
+            Number of newly queued retries
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Task)
+                .join(Agent, Agent.id == Task.agent_id)
+                .where(
+                    Task.status == "pending",
+                    Task.retry_count > 0,
+                    Agent.status == "active",
+                )
+            )
+            tasks = result.scalars().all()
+
+        added = 0
+        for task in tasks:
+            if task.id not in self._retries:
+                self._push_retry(task.id, task.agent_id, _timestamp(task.scheduled_at))
+                added += 1
+        return added
+
+    async def _run_loop(self) -> None:
+        """Sleep until the next run is due, then dispatch due runs."""
+        while True:
+            if time.time() >= self._next_sync:
+                self._next_sync = time.time() + self.retry_sync_interval
+                try:
+                    await self._sync_retries()
+                except Exception:
+                    logger.exception("Failed to load pending retries")
+
+            await self.run_due()
+
+            # Clear before peeking, so a push during the wait wakes us
+            self._wakeup.clear()
+            next_due = self.queue.next_due()
+            wake_at = self._next_sync if next_due is None else min(next_due, self._next_sync)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, wake_at - time.time()))
+
+    async def run_due(self, now: float | None = None) -> int:
+        """Claim and start every run that is due.
+
+        Loads all due agents in one query and claims their cron fires and
+        retries with one UPDATE each, regardless of how many are due.
+
+        Args:
+            now: Current time in seconds since the epoch (default: now)
 
-    async def _execute_agent_wrapper(self, agent_id: int) -> None:
-        """Wrapper to execute agent with database session.
+        Returns:
+            Number of runs started
+        """
+        now = time.time() if now is None else now
+        fires: set[int] = set()
+        retries: dict[int, int] = {}  # agent id -> retry task id
+        for kind, key in self.queue.pop_due(now):
+            if kind == "agent":
+                fires.add(key)
+                continue
+            agent_id = self._retries.pop(key, None)
+            if agent_id is None:
+                continue
+            if agent_id in self._running_agents or agent_id in retries:
+                # One run per agent at a time; check back shortly
+                self._push_retry(key, agent_id, now + DEFER_SECONDS)
+            else:
+                retries[agent_id] = key
+
+        if not fires and not retries:
+            return 0
 
-        APScheduler jobs must be async functions, so this wrapper
-        creates a database session and calls execute_scheduled_task.
+        try:
+            runs = await self._claim_runs(fires, retries, now)
+        except Exception:
+            logger.exception("Failed to claim %d due runs", len(fires) + len(retries))
+            for agent_id in fires:
+                if agent_id in self._triggers:
+                    self.queue.push(("agent", agent_id), now + DEFER_SECONDS)
+            for agent_id, task_id in retries.items():
+                self._push_retry(task_id, agent_id, now + DEFER_SECONDS)
+            return 0
+
+        started = 0
+        for agent, task_id in runs:
+            if agent.id in self._running_agents:
+                logger.info("Agent %d still running, coalescing due run", agent.id)
+                continue
+            self._dispatch(agent, task_id)
+            started += 1
+        return started
+
+    async def _claim_runs(
+        self,
+        fires: set[int],
+        retries: dict[int, int],
+        now: float,
+    ) -> list[tuple[Agent, int | None]]:
+        """Load due agents, reschedule them and claim their runs.
+
+        Retry tasks are claimed first; then one UPDATE on agent_schedules
+        claims the due fires and takes the run lease for every agent about
+        to run. Agents leased by another replica are skipped: their fire is
+        coalesced into the run in progress and their retry is handed back.
 
         Args:
-            agent_id: ID of agent to execute
+            fires: IDs of agents with a due cron fire
+            retries: Due retry task IDs keyed by agent ID
+            now: Current time in seconds since the epoch
+
+        Returns:
+            (agent, retry task id or None) for each claimed run
         """
+        claim_at = datetime.fromtimestamp(now, UTC).replace(tzinfo=None)
+
         async with self.session_factory() as session:
-            try:
-                await execute_scheduled_task(agent_id, session)
-            except Exception:
-                logger.exception("Failed to execute agent %d", agent_id)
+            result = await session.execute(
+                select(Agent, AgentSchedule.agent_id)
+                .outerjoin(AgentSchedule, AgentSchedule.agent_id == Agent.id)
+                .where(Agent.id.in_(fires | set(retries)))
+            )
+            rows = result.all()
+            agents = {agent.id: agent for agent, _ in rows}
+            scheduled = {agent.id for agent, row_id in rows if row_id is not None}
+            active = {agent_id for agent_id, agent in agents.items() if agent.status == "active"}
+
+            # Reschedule from the current config; drop agents that were
+            # paused, deleted or lost their schedule
+            next_runs = {}
+            for agent_id in fires:
+                trigger = self._parse_schedule(agents[agent_id]) if agent_id in active else None
+                due = _next_fire(trigger, claim_at) if trigger is not None else None
+                if due is None:
+                    logger.info("Agent %d is no longer scheduled, removing", agent_id)
+                    self._unschedule(agent_id)
+                    continue
+                self.queue.push(("agent", agent_id), _timestamp(due))
+                next_runs[agent_id] = due
+
+            claimed_retries = await _claim_tasks(
+                session,
+                [task_id for agent_id, task_id in retries.items() if agent_id in active],
+            )
+            retry_agents = {
+                agent_id for agent_id, task_id in retries.items() if task_id in claimed_retries
+            }
+
+            leased: set[int] = set()
+            lease_ids = (set(next_runs) | retry_agents) & scheduled
+            if lease_ids:
+                leases = {
+                    agent_id: claim_at
+                    + timedelta(
+                        seconds=_load_config(agents[agent_id]).get("timeout", 300)
+                        + LEASE_GRACE_SECONDS
+                    )
+                    for agent_id in lease_ids
+                }
+                # A fire is claimed by moving a still-due next_run_at forward;
+                # another replica that got there first has already done so.
+                # Either way the agent is only leased if no live lease exists.
+                fire_due = and_(
+                    AgentSchedule.agent_id.in_(next_runs),
+                    AgentSchedule.next_run_at <= claim_at,
+                )
+                values = {
+                    "running_until": case(leases, value=AgentSchedule.agent_id),
+                    "running_by": self.worker_id,
+                }
+                if next_runs:
+                    values["next_run_at"] = case(
+                        (fire_due, case(next_runs, value=AgentSchedule.agent_id)),
+                        else_=AgentSchedule.next_run_at,
+                    )
+                    values["last_run_at"] = case(
+                        (fire_due, claim_at), else_=AgentSchedule.last_run_at
+                    )
+                result = await session.execute(
+                    update(AgentSchedule)
+                    .where(
+                        AgentSchedule.agent_id.in_(lease_ids),
+                        or_(AgentSchedule.agent_id.in_(retry_agents), fire_due),
+                        or_(
+                            AgentSchedule.running_until.is_(None),
+                            AgentSchedule.running_until < claim_at,
+                        ),
+                    )
+                    .values(values)
+                    .returning(AgentSchedule.agent_id)
+                    .execution_options(synchronize_session=False)
+                )
+                leased = set(result.scalars().all())
+
+            # Retries of agents running on another replica go back to pending
+            blocked = (retry_agents & scheduled) - leased
+            if blocked:
+                await session.execute(
+                    update(Task)
+                    .where(Task.id.in_([retries[agent_id] for agent_id in blocked]))
+                    .values(status="pending", started_at=None)
+                    .execution_options(synchronize_session=False)
+                )
+
+            # Runs use their own sessions; keep the loaded agents usable
+            session.expunge_all()
+            await session.commit()
+
+        runs = []
+        for agent_id in active:
+            if agent_id in blocked:
+                logger.info("Agent %d running on another replica, deferring retry", agent_id)
+                self._push_retry(retries[agent_id], agent_id, now + DEFER_SECONDS)
+                continue
+            # Retries of agents without a schedule row have no fire to overlap
+            task_id = retries[agent_id] if agent_id in retry_agents else None
+            if task_id is not None or agent_id in leased:
+                # A cron fire due together with a retry is coalesced into it
+                runs.append((agents[agent_id], task_id))
+        return runs
+
+    def _dispatch(self, agent: Agent, task_id: int | None) -> None:
+        self._running_agents.add(agent.id)
+        run = asyncio.create_task(self._execute_agent_wrapper(agent, task_id))
+        self._inflight.add(run)
+        run.add_done_callback(self._inflight.discard)
+
+    async def _execute_agent_wrapper(self, agent: Agent, task_id: int | None = None) -> None:
+        """Run one claimed agent run in its own database session.
+
+        Args:
+            agent: Agent to execute
+            task_id: Claimed retry task to run (default: create a new task)
+        """
+        try:
+            async with self.session_factory() as session:
+                if task_id is None:
+                    task = Task(
+                        agent_id=agent.id,
+                        status="running",
+                        scheduled_at=datetime.now(UTC),
+                        started_at=datetime.now(UTC),
+                    )
+                    session.add(task)
+                    await session.commit()
+                    await session.refresh(task)
+                    logger.info(
+                        "Created task %d for agent %d (%s)",
+                        task.id,
+                        agent.id,
+                        agent.name,
+                    )
+                else:
+                    task = await session.get(Task, task_id)
+
+                retry = await run_agent_task(session, agent, task, pool=self.worker_pool)
+
+            if retry is not None and self.running:
+                self._push_retry(retry.id, agent.id, _timestamp(retry.scheduled_at))
+        except Exception:
+            logger.exception("Failed to execute agent %d", agent.id)
+        finally:
+            await self._release_lease(agent.id)
+            self._running_agents.discard(agent.id)
+
+    async def _release_lease(self, agent_id: int) -> None:
+        """Clear this scheduler's run lease on an agent.
+
+        Args:
+            agent_id: Agent whose run finished
+        """
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(AgentSchedule)
+                    .where(
+                        AgentSchedule.agent_id == agent_id,
+                        AgentSchedule.running_by == self.worker_id,
+                    )
+                    .values(running_until=None, running_by=None)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+        except Exception:
+            # The lease lapses on its own after the agent's timeout
+            logger.exception("Failed to release run lease for agent %d", agent_id)
 
     async def add_agent(self, agent: Agent) -> None:
         """Dynamically add agent to scheduler without restart.
@@ -368,21 +924,52 @@ class AgentScheduler:
         Example:
             >>> await scheduler.add_agent(new_agent)
         """
-        await self._schedule_agent(agent)
+        due = await self._schedule_agent(agent)
+        if due is None:
+            return
+
+        async with self.session_factory() as session:
+            row = await session.get(AgentSchedule, agent.id)
+            if row is None:
+                session.add(AgentSchedule(agent_id=agent.id, next_run_at=due))
+            else:
+                row.next_run_at = due
+            await session.commit()
         logger.info("Dynamically added agent %d to scheduler", agent.id)
 
     async def remove_agent(self, agent_id: int) -> None:
         """Remove agent from scheduler.
 
+        Its stored schedule is deleted too, so re-adding the agent later
+        doesn't count the gap as missed runs.
+
         Args:
             agent_id: ID of agent to remove
 
         Example:
             >>> await scheduler.remove_agent(1)
         """
-        job_id = f"agent_{agent_id}"
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
-            logger.info("Removed agent %d from scheduler", agent_id)
-        else:
+        if not self._unschedule(agent_id):
             logger.warning("Agent %d not found in scheduler", agent_id)
+            return
+
+        async with self.session_factory() as session:
+            row = await session.get(AgentSchedule, agent_id)
+            if row is not None:
+                await session.delete(row)
+                await session.commit()
+        logger.info("Removed agent %d from scheduler", agent_id)
+
+    def get_status(self) -> dict:
+        """Get scheduler counters.
+
+        Returns:
+            Dict with running, scheduled agents, queued retries and
+            in-flight runs
+        """
+        return {
+            "running": self.running,
+            "scheduled_agents": len(self._triggers),
+            "queued_retries": len(self._retries),
+            "inflight_runs": len(self._inflight),
+        }
@@ -0,0 +1,216 @@
+"""Warm worker process for the harness worker pool.
+
+Runs as a standalone script (stdlib only) started by WarmWorkerPool. It
+imports the preload modules once, then serves jobs read from stdin as
+JSON lines. Each job is executed in a child forked from this warm
+process, so agent code never runs in (or pollutes) the worker itself and
+every run keeps the isolation of a separate process.
+
+Compiled wrapper code is cached per worker by source hash, so a worker
+only receives and compiles an agent's source the first time it runs it.
+
+Protocol (one JSON object per line):
+    worker -> pool: {"event": "ready", "pid": ...}
+    pool -> worker: {"hash": "<sha256>", "config": "<json>", "filename": "agent.py"}
+    worker -> pool: {"event": "need_code"}             (only on a cache miss)
+    pool -> worker: {"code": "<wrapper source>"}
+    worker -> pool: {"event": "started", "pid": <child pid>}
+    worker -> pool: {"event": "done", "stdout": ..., "stderr": ..., "exit_code": ...}
+
+Usage:
+    python3 src/harness/warm_worker.py asyncio json httpx
+"""
+
+import importlib
+import json
+import linecache
+import os
+import signal
+import sys
+import tempfile
+import traceback
+from collections import OrderedDict
+from types import CodeType
+
+# Compiled wrappers kept per worker, keyed by source hash
+MAX_CACHED_CODE = 128
+
+_compiled: OrderedDict[str, tuple[CodeType | None, str]] = OrderedDict()
+
+
+def preload(modules: list[str]) -> list[str]:
+    """Import modules so forked children inherit them already loaded.
+
+    Args:
+        modules: Module names to import
+
+    Returns:
+        Names of modules that imported successfully
+    """
+    loaded = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception:  # noqa: S112 - optional preloads may be missing
+            continue
+    return loaded
+
+
+def _run_child(
+    compiled: CodeType | None,
+    code: str,
+    filename: str,
+    config: str,
+    stdout_fd: int,
+    stderr_fd: int,
+    channel_fd: int,
+) -> None:
+    """Execute wrapper code in the forked child and exit (never returns)."""
+    exit_code = 1
+    try:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        os.close(devnull)
+        os.close(channel_fd)
+        os.environ["AGENT_CONFIG"] = config
+
+        # Let tracebacks show agent source lines like a file on disk would
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+        namespace = {"__name__": "__main__", "__file__": filename, "__builtins__": __builtins__}
+        try:
+            if compiled is None:
+                compiled = compile(code, filename, "exec")
+            exec(compiled, namespace)  # noqa: S102 - sandboxed child
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException as e:
+            # Drop this module's frame so the traceback starts in agent code
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+            exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def _get_compiled(code_hash: str, code: str | None, filename: str) -> tuple[CodeType | None, str]:
+    """Get cached bytecode for a hash, compiling the source on a miss."""
+    if code_hash in _compiled:
+        _compiled.move_to_end(code_hash)
+        return _compiled[code_hash]
+    try:
+        compiled = compile(code, filename, "exec")
+    except SyntaxError:
+        # The child recompiles and reports it like a cold run would
+        return None, code
+    _compiled[code_hash] = (compiled, code)
+    while len(_compiled) > MAX_CACHED_CODE:
+        _compiled.popitem(last=False)
+    return compiled, code
+
+
+def _read_output(fd: int) -> str:
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+
+def run_job(job: dict, channel, requests) -> None:
+    """Fork a child for one job and report its output on the channel.
+
+    Args:
+        job: Decoded job line ({"hash": ..., "config": ..., "filename": ...})
+        channel: Binary file the pool reads events from
+        requests: Iterator over lines from the pool (for the code reply)
+    """
+    filename = job.get("filename", "agent.py")
+    code = job.get("code")
+    if job["hash"] not in _compiled and code is None:
+        send(channel, {"event": "need_code"})
+        code = json.loads(next(requests))["code"]
+    compiled, code = _get_compiled(job["hash"], code, filename)
+
+    # Output goes to unlinked temp files so a chatty agent can't fill a pipe
+    out_fd, out_path = tempfile.mkstemp(prefix="agent_out_")
+    err_fd, err_path = tempfile.mkstemp(prefix="agent_err_")
+    os.unlink(out_path)
+    os.unlink(err_path)
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(
+                compiled,
+                code,
+                filename,
+                job.get("config", "{}"),
+                out_fd,
+                err_fd,
+                channel.fileno(),
+            )
+
+        send(channel, {"event": "started", "pid": pid})
+        _, status = os.waitpid(pid, 0)
+        send(
+            channel,
+            {
+                "event": "done",
+                "stdout": _read_output(out_fd),
+                "stderr": _read_output(err_fd),
+                "exit_code": os.waitstatus_to_exitcode(status),
+            },
+        )
+    finally:
+        os.close(out_fd)
+        os.close(err_fd)
+
+
+def send(channel, message: dict) -> None:
+    """Write one protocol line to the pool."""
+    channel.write(json.dumps(message).encode("utf-8") + b"\n")
+    channel.flush()
+
+
+def serve(modules: list[str]) -> int:
+    """Preload modules and serve jobs until stdin closes.
+
+    Args:
+        modules: Module names to preload
+
+    Returns:
+        Exit code
+    """
+    # The protocol owns the real stdout; stray prints go to stderr instead
+    channel = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+
+    loaded = preload(modules)
+    send(channel, {"event": "ready", "pid": os.getpid(), "preloaded": loaded})
+
+    requests = iter(sys.stdin.buffer)
+    for line in requests:
+        if not line.strip():
+            continue
+        run_job(json.loads(line), channel, requests)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(serve(sys.argv[1:]))
@@ -0,0 +1,331 @@
+"""Warm Worker Pool - Pre-forked interpreters for agent execution.
+
+Cold-starting python3 for every run spends most of a short agent's
+runtime on interpreter start and imports. The pool keeps warm worker
+processes (src/harness/warm_worker.py) that have already imported common
+modules; each run is forked from a worker, so agents still execute in a
+separate process that is discarded afterwards.
+
+Workers are recycled after max_runs_per_worker runs or when their RSS
+grows by more than max_memory_growth_mb. Pool size and concurrency follow
+the ResourceMonitor limits (max_concurrent_agents).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+from pathlib import Path
+
+import psutil
+
+from .code_cache import AGENT_FILENAME, get_code_cache
+from .executor import ExecutionResult, _build_result
+from .resources import ResourceLimits, get_resource_monitor
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("warm_worker.py")
+
+# Imported once per worker so forked runs don't pay for them
+DEFAULT_PRELOAD = (
+    "asyncio",
+    "json",
+    "logging",
+    "traceback",
+    "datetime",
+    "pathlib",
+    "re",
+    "typing",
+    "dataclasses",
+    "httpx",
+)
+
+DEFAULT_MAX_RUNS = int(os.environ.get("HARNESS_WORKER_MAX_RUNS", "100"))
+DEFAULT_MAX_MEMORY_GROWTH_MB = float(os.environ.get("HARNESS_WORKER_MAX_GROWTH_MB", "64"))
+
+# Results can carry large stdout/stderr; lift the 64 KiB readline default
+_STREAM_LIMIT = 64 * 1024 * 1024
+
+
+class WorkerPoolError(Exception):
+    """Raised when the worker pool cannot start or talk to a worker."""
+
+    pass
+
+
+class _Worker:
+    """One warm worker process and its run bookkeeping."""
+
+    def __init__(self, process: asyncio.subprocess.Process, baseline_mb: float):
+        self.process = process
+        self.pid = process.pid
+        self.baseline_mb = baseline_mb
+        self.runs = 0
+
+    async def send(self, message: dict) -> None:
+        self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        await self.process.stdin.drain()
+
+    async def receive(self) -> dict:
+        line = await self.process.stdout.readline()
+        if not line:
+            raise WorkerPoolError(f"Worker {self.pid} exited unexpectedly")
+        return json.loads(line)
+
+    def memory_mb(self) -> float:
+        try:
+            return psutil.Process(self.pid).memory_info().rss / (1024 * 1024)
+        except psutil.NoSuchProcess:
+            return 0.0
+
+    def kill(self) -> None:
+        # Workers lead their own session, so this also takes down a running child
+        try:
+            os.killpg(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+class WarmWorkerPool:
+    """Pool of pre-forked warm workers that run agent code.
+
+    Attributes:
+        size: Number of workers kept warm (also the run concurrency)
+        max_runs_per_worker: Runs before a worker is replaced
+        max_memory_growth_mb: RSS growth that triggers recycling
+        preload: Modules each worker imports at start
+
+    Example:
+        >>> pool = WarmWorkerPool()
+        >>> await pool.start()
+        >>> result = await execute_agent_code(code, config={}, pool=pool)
+        >>> await pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_runs_per_worker: int = DEFAULT_MAX_RUNS,
+        max_memory_growth_mb: float = DEFAULT_MAX_MEMORY_GROWTH_MB,
+        preload: tuple[str, ...] = DEFAULT_PRELOAD,
+        limits: ResourceLimits | None = None,
+    ):
+        """Initialize pool (no processes are started until start()).
+
+        Args:
+            size: Worker count (default: limits.max_concurrent_agents)
+            max_runs_per_worker: Runs before a worker is recycled
+            max_memory_growth_mb: Worker RSS growth before it is recycled
+            preload: Modules to import in each worker
+            limits: Resource limits (default: global ResourceMonitor limits)
+        """
+        limits = limits or get_resource_monitor().limits
+        self.size = max(1, size or limits.max_concurrent_agents)
+        self.max_runs_per_worker = max_runs_per_worker
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self.preload = preload
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._replacements: set[asyncio.Task] = set()
+        self._closed = False
+        self.spawned = 0
+        self.recycled = 0
+
+    async def start(self) -> None:
+        """Pre-fork all workers so the first runs start warm.
+
+        Raises:
+            WorkerPoolError: If a worker fails to start
+        """
+        self._closed = False
+        self._semaphore = self._semaphore or asyncio.Semaphore(self.size)
+        missing = self.size - len(self._idle) - len(self._busy)
+        workers = await asyncio.gather(*(self._spawn() for _ in range(missing)))
+        self._idle.extend(workers)
+        logger.info("Warm worker pool started with %d workers", len(self._idle))
+
+    async def close(self) -> None:
+        """Stop all workers. Runs in progress are killed."""
+        self._closed = True
+        for task in list(self._replacements):
+            task.cancel()
+        await asyncio.gather(*self._replacements, return_exceptions=True)
+        idle, busy = self._idle, list(self._busy)
+        self._idle = []
+        self._busy.clear()
+        await asyncio.gather(
+            *(self._stop(worker) for worker in idle),
+            *(self._stop(worker, force=True) for worker in busy),
+        )
+        logger.info("Warm worker pool closed")
+
+    async def __aenter__(self) -> "WarmWorkerPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def execute(
+        self,
+        agent_code: str,
+        config: dict | None = None,
+        timeout: int = 300,
+    ) -> ExecutionResult:
+        """Run agent code in a process forked from a warm worker.
+
+        Args:
+            agent_code: Python code containing Agent class
+            config: Configuration dict to pass to agent
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            ExecutionResult with the same semantics as the cold path
+
+        Raises:
+            WorkerPoolError: If the pool is closed
+        """
+        if self._closed:
+            raise WorkerPoolError("Worker pool is closed")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+
+        artifact = get_code_cache().get(agent_code)
+        job = {
+            "hash": artifact.code_hash,
+            "config": json.dumps(config or {}),
+            "filename": AGENT_FILENAME,
+        }
+        logger.info("Starting pooled agent execution (timeout: %ds)", timeout)
+
+        async with self._semaphore:
+            worker = self._idle.pop() if self._idle else await self._spawn()
+            self._busy.add(worker)
+            healthy = False
+            start_time = asyncio.get_event_loop().time()
+            try:
+                try:
+                    done = await asyncio.wait_for(
+                        self._run(worker, job, artifact.wrapper_code), timeout
+                    )
+                except WorkerPoolError as e:
+                    logger.error("Agent execution failed: %s", e)
+                    return ExecutionResult(
+                        status="error",
+                        error=str(e),
+                        exit_code=-1,
+                        duration=asyncio.get_event_loop().time() - start_time,
+                    )
+                except TimeoutError:
+                    duration = asyncio.get_event_loop().time() - start_time
+                    logger.error("Agent execution timed out after %ds", timeout)
+                    return ExecutionResult(
+                        status="timeout",
+                        error=f"Execution exceeded {timeout} seconds timeout",
+                        duration=duration,
+                    )
+
+                healthy = True
+                duration = asyncio.get_event_loop().time() - start_time
+                return _build_result(done["stdout"], done["stderr"], done["exit_code"], duration)
+            finally:
+                self._busy.discard(worker)
+                if not healthy or self._closed or self._should_recycle(worker):
+                    await self._stop(worker, force=not healthy)
+                    if not self._closed:
+                        self.recycled += 1
+                        self._replace_in_background()
+                elif len(self._idle) + len(self._busy) >= self.size:
+                    # A replacement already refilled the pool; drop the surplus
+                    await self._stop(worker)
+                else:
+                    self._idle.append(worker)
+
+    def get_status(self) -> dict:
+        """Get pool counters.
+
+        Returns:
+            Dict with size, idle, busy, spawned and recycled
+        """
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "busy": len(self._busy),
+            "spawned": self.spawned,
+            "recycled": self.recycled,
+        }
+
+    async def _run(self, worker: _Worker, job: dict, wrapper_code: str) -> dict:
+        worker.runs += 1
+        await worker.send(job)
+        started = await worker.receive()
+        if started.get("event") == "need_code":
+            # First run of this source on this worker
+            await worker.send({"code": wrapper_code})
+            started = await worker.receive()
+        logger.debug("Worker %d forked run in pid %s", worker.pid, started.get("pid"))
+        return await worker.receive()
+
+    def _should_recycle(self, worker: _Worker) -> bool:
+        if worker.runs >= self.max_runs_per_worker:
+            logger.debug("Recycling worker %d after %d runs", worker.pid, worker.runs)
+            return True
+        growth = worker.memory_mb() - worker.baseline_mb
+        if growth > self.max_memory_growth_mb:
+            logger.info("Recycling worker %d after %.1fMB memory growth", worker.pid, growth)
+            return True
+        return False
+
+    def _replace_in_background(self) -> None:
+        """Start a replacement worker so the next run doesn't start cold."""
+        task = asyncio.create_task(self._replace())
+        self._replacements.add(task)
+        task.add_done_callback(self._replacements.discard)
+
+    async def _replace(self) -> None:
+        try:
+            worker = await self._spawn()
+        except WorkerPoolError as e:
+            logger.warning("Failed to replace recycled worker: %s", e)
+            return
+        if self._closed or len(self._idle) + len(self._busy) >= self.size:
+            await self._stop(worker)
+        else:
+            self._idle.append(worker)
+
+    async def _spawn(self) -> _Worker:
+        process = await asyncio.create_subprocess_exec(
+            "python3",
+            str(WORKER_SCRIPT),
+            *self.preload,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            limit=_STREAM_LIMIT,
+        )
+        worker = _Worker(process, baseline_mb=0.0)
+        try:
+            ready = await worker.receive()
+        except Exception as e:
+            worker.kill()
+            await process.wait()
+            raise WorkerPoolError(f"Failed to start warm worker: {e}") from e
+        worker.baseline_mb = worker.memory_mb()
+        self.spawned += 1
+        logger.debug("Warm worker %d ready (preloaded: %s)", worker.pid, ready.get("preloaded"))
+        return worker
+
+    async def _stop(self, worker: _Worker, force: bool = False) -> None:
+        if worker.process.returncode is None and not force:
+            # Idle worker: closing stdin lets it exit cleanly
+            worker.process.stdin.close()
+            try:
+                await asyncio.wait_for(worker.process.wait(), timeout=5)
+                return
+            except TimeoutError:
+                pass
+        worker.kill()
+        await worker.process.wait()
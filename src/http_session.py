@@ -0,0 +1,120 @@
+"""Pooled HTTP session and ETag cache shared by the REST API clients.
+
+GitHubAppClient and N8nClient keep one keep-alive connection pool per
+client and revalidate GET responses with If-None-Match. Both pieces live
+here so the clients only add their own auth, error mapping and pacing.
+
+Example:
+    >>> class MyClient(PooledHTTPClient):
+    ...     def __init__(self):
+    ...         self.timeout = 30.0
+    ...         self.max_connections = 10
+    ...         self.max_keepalive_connections = 5
+    ...         self._client = None
+    ...         self._etag_cache = ETagCache(maxsize=256)
+"""
+
+import copy
+from collections import OrderedDict
+from typing import Any, Self
+
+import httpx
+
+
+class PooledHTTPClient:
+    """Mixin owning a lazily created, pooled httpx.AsyncClient.
+
+    Subclasses set ``timeout``, ``max_connections`` and
+    ``max_keepalive_connections`` and initialise ``_client`` to None.
+    """
+
+    timeout: float
+    max_connections: int
+    max_keepalive_connections: int
+    _client: httpx.AsyncClient | None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use.
+
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+class ETagCache:
+    """LRU cache of GET response bodies keyed by URL and query params.
+
+    Bodies handed out on 304 Not Modified are deep copies, so a caller
+    mutating its result doesn't change what later callers get.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum cached responses (0 disables caching)
+        """
+        self.maxsize = maxsize
+        # key → (ETag, parsed body), least recently used first
+        self._entries: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.maxsize > 0
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None) -> str:
+        """Build the cache key for a GET request."""
+        if not params:
+            return url
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{url}?{query}"
+
+    def get(self, key: str) -> tuple[str, Any] | None:
+        """Look up the cached (ETag, body) entry for a request.
+
+        Pass the entry to not_modified() on a 304 rather than using the
+        body directly; it is shared with the cache.
+        """
+        return self._entries.get(key)
+
+    def not_modified(self, key: str, entry: tuple[str, Any]) -> Any:
+        """Mark an entry as revalidated and return a copy of its body."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def store(self, key: str, etag: str | None, body: Any) -> None:
+        """Cache a GET response body under its ETag."""
+        if not self.enabled or etag is None:
+            return
+        self._entries[key] = (etag, copy.deepcopy(body))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
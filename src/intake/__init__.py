@@ -30,6 +30,7 @@ from src.intake.product_detector import (
     ProductDetector,
 )
 from src.intake.queue import (
+    IntakeConsumer,
     IntakeEvent,
     IntakeQueue,
 )
@@ -89,6 +90,7 @@ __all__ = [
     # Queue
     "IntakeEvent",
     "IntakeQueue",
+    "IntakeConsumer",
     # Outbox
     "OutboxEntry",
     "TransactionalOutbox",
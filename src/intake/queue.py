@@ -10,10 +10,20 @@ Why Redis Streams over Kafka (for single-user systems):
 - Lower operational cost (single binary vs cluster management)
 - Memory-based for superior latency
 - Sufficient durability with AOF persistence
+
+IntakeConsumer drains the stream in batches: one pipelined round trip
+acknowledges the previous batch and reads the next, events are
+handled concurrently, and entries left pending by dead consumers are
+reclaimed with XAUTOCLAIM.
 """
 
+import asyncio
+import inspect
 import json
 import logging
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
@@ -80,7 +90,9 @@ class IntakeEvent:
         data["event_type"] = self.event_type.value
         data["product_signals"] = json.dumps(self.product_signals)
         data["metadata"] = json.dumps(self.metadata)
-        return data
+        data["processed"] = str(self.processed).lower()
+        # Redis rejects None; unset fields fall back to their defaults
+        return {key: value for key, value in data.items() if value is not None}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "IntakeEvent":
@@ -120,6 +132,7 @@ class IntakeQueue:
     STREAM_KEY = "intake:events"
     CONSUMER_GROUP = "intake_processors"
     MAX_STREAM_LENGTH = 10000  # Trim old events to prevent unbounded growth
+    THROUGHPUT_WINDOW_SECONDS = 60.0  # Window for acknowledged events/sec
 
     def __init__(self, redis_client: Optional[Any] = None):
         """Initialize queue with optional Redis client.
@@ -130,6 +143,8 @@ class IntakeQueue:
         self._redis = redis_client
         self._memory_queue: list[IntakeEvent] = []  # Fallback
         self._initialized = False
+        self._counters = {"pushed": 0, "read": 0, "acknowledged": 0, "claimed": 0}
+        self._ack_log: deque[tuple[float, int]] = deque()  # (time, count) per ack
 
     async def initialize(self) -> None:
         """Initialize consumer group if using Redis."""
@@ -171,6 +186,7 @@ class IntakeQueue:
         if self._redis is None:
             # In-memory fallback
             self._memory_queue.append(event)
+            self._counters["pushed"] += 1
             logger.debug(f"IntakeQueue: Stored event {event.event_id} (memory)")
             return event.event_id
 
@@ -181,6 +197,7 @@ class IntakeQueue:
                 event.to_dict(),
                 maxlen=self.MAX_STREAM_LENGTH
             )
+            self._counters["pushed"] += 1
             logger.info(f"IntakeQueue: Stored event {event.event_id} as {stream_id}")
             return stream_id
         except Exception as e:
@@ -189,11 +206,41 @@ class IntakeQueue:
             self._memory_queue.append(event)
             return event.event_id
 
+    async def push_many(self, events: Sequence[IntakeEvent]) -> list[str]:
+        """Add a burst of events to the intake stream in one round trip.
+
+        Args:
+            events: The intake events to store, in order
+
+        Returns:
+            Event IDs (Redis stream IDs or UUIDs), in the same order
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        if self._redis is None or not events:
+            return [await self.push(event) for event in events]
+
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for event in events:
+                pipe.xadd(self.STREAM_KEY, event.to_dict(), maxlen=self.MAX_STREAM_LENGTH)
+            stream_ids = await pipe.execute()
+            self._counters["pushed"] += len(stream_ids)
+            logger.info(f"IntakeQueue: Stored {len(stream_ids)} events")
+            return stream_ids
+        except Exception as e:
+            logger.error(f"IntakeQueue: Redis batch push failed: {e}")
+            # Fallback to memory
+            self._memory_queue.extend(events)
+            return [event.event_id for event in events]
+
     async def read_pending(
         self,
         consumer_name: str = "default",
         count: int = 10,
-        block_ms: int = 0
+        block_ms: int = 0,
+        ack_ids: Sequence[str] = ()
     ) -> list[tuple[str, IntakeEvent]]:
         """Read pending events from the stream.
 
@@ -201,14 +248,23 @@ class IntakeQueue:
             consumer_name: Name of this consumer instance
             count: Maximum events to read
             block_ms: Block timeout (0 = no block)
+            ack_ids: Stream IDs to acknowledge first, pipelined with the
+                read so both take one round trip
 
         Returns:
             List of (stream_id, event) tuples
+
+        Raises:
+            Exception: If the pipelined acknowledge + read fails, so the
+                caller keeps ack_ids and retries them. Plain reads log
+                errors and return an empty list.
         """
         if not self._initialized:
             await self.initialize()
 
         if self._redis is None:
+            if ack_ids:
+                await self.acknowledge_many(ack_ids)
             # In-memory: return unprocessed events
             results = []
             for event in self._memory_queue:
@@ -219,14 +275,28 @@ class IntakeQueue:
             return results
 
         try:
-            # Redis XREADGROUP
-            messages = await self._redis.xreadgroup(
-                self.CONSUMER_GROUP,
-                consumer_name,
-                {self.STREAM_KEY: ">"},
-                count=count,
-                block=block_ms if block_ms > 0 else None
-            )
+            if ack_ids:
+                # Redis XACK + XREADGROUP in one round trip
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.xack(self.STREAM_KEY, self.CONSUMER_GROUP, *ack_ids)
+                pipe.xreadgroup(
+                    self.CONSUMER_GROUP,
+                    consumer_name,
+                    {self.STREAM_KEY: ">"},
+                    count=count,
+                    block=block_ms if block_ms > 0 else None
+                )
+                acked, messages = await pipe.execute()
+                self._record_acks(acked)
+            else:
+                # Redis XREADGROUP
+                messages = await self._redis.xreadgroup(
+                    self.CONSUMER_GROUP,
+                    consumer_name,
+                    {self.STREAM_KEY: ">"},
+                    count=count,
+                    block=block_ms if block_ms > 0 else None
+                )
 
             results = []
             for stream_name, stream_messages in messages or []:
@@ -234,11 +304,68 @@ class IntakeQueue:
                     event = IntakeEvent.from_dict(msg_data)
                     results.append((msg_id, event))
 
+            self._counters["read"] += len(results)
             return results
         except Exception as e:
             logger.error(f"IntakeQueue: Redis read failed: {e}")
+            if ack_ids:
+                # The acks may not have gone through; let the caller keep them
+                raise
             return []
 
+    async def claim_stale(
+        self,
+        consumer_name: str = "default",
+        min_idle_ms: int = 60000,
+        count: int = 100
+    ) -> list[tuple[str, IntakeEvent]]:
+        """Take over entries another consumer read but never acknowledged.
+
+        Uses XAUTOCLAIM, so entries left pending by a crashed consumer (or
+        a failed handler) are redelivered once they have been idle for
+        min_idle_ms.
+
+        Args:
+            consumer_name: Name of the consumer taking the entries
+            min_idle_ms: Minimum time since last delivery
+            count: Maximum entries to claim
+
+        Returns:
+            List of (stream_id, event) tuples
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        if self._redis is None:
+            # In-memory reads redeliver unprocessed events anyway
+            return []
+
+        results = []
+        start_id = "0-0"
+        try:
+            while len(results) < count:
+                reply = await self._redis.xautoclaim(
+                    self.STREAM_KEY,
+                    self.CONSUMER_GROUP,
+                    consumer_name,
+                    min_idle_time=min_idle_ms,
+                    start_id=start_id,
+                    count=count - len(results)
+                )
+                start_id, messages = reply[0], reply[1]
+                for msg_id, msg_data in messages:
+                    if msg_data:  # Trimmed entries come back empty
+                        results.append((msg_id, IntakeEvent.from_dict(msg_data)))
+                if start_id in ("0-0", b"0-0"):
+                    break
+        except Exception as e:
+            logger.error(f"IntakeQueue: Claim failed: {e}")
+
+        if results:
+            self._counters["claimed"] += len(results)
+            logger.info(f"IntakeQueue: {consumer_name} claimed {len(results)} stale entries")
+        return results
+
     async def acknowledge(self, stream_id: str) -> bool:
         """Mark event as processed (acknowledge).
 
@@ -253,20 +380,85 @@ class IntakeQueue:
             for event in self._memory_queue:
                 if event.event_id == stream_id:
                     event.processed = True
+                    self._record_acks(1)
                     return True
             return False
 
         try:
-            await self._redis.xack(
+            acked = await self._redis.xack(
                 self.STREAM_KEY,
                 self.CONSUMER_GROUP,
                 stream_id
             )
+            self._record_acks(acked)
             return True
         except Exception as e:
             logger.error(f"IntakeQueue: Acknowledge failed: {e}")
             return False
 
+    async def acknowledge_many(
+        self, stream_ids: Sequence[str], raise_errors: bool = False
+    ) -> int:
+        """Acknowledge a batch of events with a single XACK.
+
+        Args:
+            stream_ids: The stream IDs to acknowledge
+            raise_errors: Re-raise a failed XACK instead of logging it and
+                returning 0, so the caller can keep the IDs for a retry
+
+        Returns:
+            Number of events acknowledged
+        """
+        if not stream_ids:
+            return 0
+
+        if self._redis is None:
+            wanted = set(stream_ids)
+            acked = 0
+            for event in self._memory_queue:
+                if event.event_id in wanted and not event.processed:
+                    event.processed = True
+                    acked += 1
+            self._record_acks(acked)
+            return acked
+
+        try:
+            acked = await self._redis.xack(
+                self.STREAM_KEY,
+                self.CONSUMER_GROUP,
+                *stream_ids
+            )
+            self._record_acks(acked)
+            return acked
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.error(f"IntakeQueue: Batch acknowledge failed: {e}")
+            return 0
+
+    def _record_acks(self, count: int) -> None:
+        """Count acknowledgements for the throughput window."""
+        if not count:
+            return
+        now = time.monotonic()
+        self._counters["acknowledged"] += count
+        self._ack_log.append((now, count))
+        self._trim_ack_log(now)
+
+    def _trim_ack_log(self, now: float) -> None:
+        cutoff = now - self.THROUGHPUT_WINDOW_SECONDS
+        while self._ack_log and self._ack_log[0][0] < cutoff:
+            self._ack_log.popleft()
+
+    def _counter_stats(self) -> dict[str, Any]:
+        """Counters shared by both backends."""
+        self._trim_ack_log(time.monotonic())
+        recent = sum(count for _, count in self._ack_log)
+        return {
+            **self._counters,
+            "throughput_per_sec": round(recent / self.THROUGHPUT_WINDOW_SECONDS, 3),
+        }
+
     async def get_stats(self) -> dict[str, Any]:
         """Get queue statistics."""
         if self._redis is None:
@@ -276,17 +468,197 @@ class IntakeQueue:
                 "backend": "memory",
                 "total_events": total,
                 "processed": processed,
-                "pending": total - processed
+                "pending": total - processed,
+                "lag": total - processed,
+                **self._counter_stats()
             }
 
         try:
-            info = await self._redis.xinfo_stream(self.STREAM_KEY)
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.xinfo_stream(self.STREAM_KEY)
+            pipe.xinfo_groups(self.STREAM_KEY)
+            info, groups = await pipe.execute()
+            names = (self.CONSUMER_GROUP, self.CONSUMER_GROUP.encode())
+            group = next((g for g in groups if g.get("name") in names), {})
             return {
                 "backend": "redis",
                 "total_events": info.get("length", 0),
                 "first_entry": info.get("first-entry"),
                 "last_entry": info.get("last-entry"),
-                "consumer_groups": info.get("groups", 0)
+                "consumer_groups": info.get("groups", 0),
+                # Delivered but not yet acknowledged
+                "pending": group.get("pending", 0),
+                # Not yet delivered to the group (None if Redis can't tell)
+                "lag": group.get("lag"),
+                "consumers": group.get("consumers", 0),
+                **self._counter_stats()
             }
         except Exception as e:
             return {"backend": "redis", "error": str(e)}
+
+
+class IntakeConsumer:
+    """Consumer-group worker that drains the intake stream in batches.
+
+    Each cycle acknowledges the previous batch and reads the next one in a
+    single pipelined round trip, then runs the handler on the batch
+    concurrently. Every claim_interval_seconds it also claims entries that
+    other (dead) consumers left pending. Events whose handler fails are
+    not acknowledged, so they are redelivered through the claim path.
+
+    Typical deployment:
+    - Telegram/email webhooks: queue.push() / queue.push_many()
+    - One or more consumers (unique names): await consumer.run()
+
+    Example:
+        >>> consumer = IntakeConsumer(queue, handle_event, consumer_name="worker-1")
+        >>> asyncio.create_task(consumer.run())
+        >>> ...
+        >>> consumer.stop()
+    """
+
+    def __init__(
+        self,
+        queue: IntakeQueue,
+        handler: Callable[[IntakeEvent], Any],
+        consumer_name: str = "default",
+        batch_size: int = 50,
+        concurrency: int = 10,
+        block_ms: int = 1000,
+        claim_idle_ms: int = 60000,
+        claim_interval_seconds: float = 30.0
+    ):
+        """Initialize the consumer.
+
+        Args:
+            queue: Intake queue to consume
+            handler: Called with each event; may be sync or async. Sync
+                handlers run in worker threads so a batch still overlaps.
+                The event is acknowledged once the handler returns, so the
+                handler must persist or forward whatever it produces.
+            consumer_name: Unique name of this consumer in the group
+            batch_size: Maximum events read per cycle
+            concurrency: Maximum events handled at once
+            block_ms: How long a read waits for new events
+            claim_idle_ms: Idle time after which another consumer's pending
+                entry is claimed
+            claim_interval_seconds: How often to look for stale entries
+        """
+        self.queue = queue
+        self.handler = handler
+        self.consumer_name = consumer_name
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.claim_interval = claim_interval_seconds
+        self._is_async = inspect.iscoroutinefunction(handler)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._unacked: list[str] = []
+        self._next_claim = 0.0
+        self._running = False
+        self._counters = {"batches": 0, "processed": 0, "failed": 0}
+
+    async def run(self) -> None:
+        """Consume until stop() is called, then flush acknowledgements."""
+        self._running = True
+        logger.info(f"IntakeConsumer: {self.consumer_name} starting")
+
+        try:
+            while self._running:
+                try:
+                    await self.run_once()
+                except Exception as e:
+                    logger.error(f"IntakeConsumer: Error in loop: {e}")
+                    await asyncio.sleep(self.block_ms / 1000)
+        finally:
+            await self.flush()
+            logger.info(f"IntakeConsumer: {self.consumer_name} stopped")
+
+    async def run_once(self) -> int:
+        """Run one cycle: ack the last batch, read, claim and handle.
+
+        Acknowledgements of this cycle's events are held back and sent
+        with the next read; call flush() when not calling run_once again.
+        If that acknowledge + read fails, the error propagates and the
+        acknowledgements stay queued for the next cycle.
+
+        Returns:
+            Number of events handled in this cycle
+        """
+        batch = await self.queue.read_pending(
+            consumer_name=self.consumer_name,
+            count=self.batch_size,
+            block_ms=self.block_ms,
+            ack_ids=self._unacked
+        )
+        self._unacked = []
+
+        now = time.monotonic()
+        if now >= self._next_claim:
+            self._next_claim = now + self.claim_interval
+            batch += await self.queue.claim_stale(
+                consumer_name=self.consumer_name,
+                min_idle_ms=self.claim_idle_ms,
+                count=self.batch_size
+            )
+
+        if not batch:
+            return 0
+
+        results = await asyncio.gather(*(self._handle(sid, event) for sid, event in batch))
+        self._unacked = [sid for sid in results if sid is not None]
+        self._counters["batches"] += 1
+        return len(batch)
+
+    async def flush(self) -> int:
+        """Acknowledge events handled since the last read.
+
+        IDs whose XACK fails are kept for the next flush or read.
+
+        Returns:
+            Number of events acknowledged
+        """
+        try:
+            acked = await self.queue.acknowledge_many(self._unacked, raise_errors=True)
+        except Exception as e:
+            logger.error(
+                f"IntakeConsumer: Acknowledge failed, keeping {len(self._unacked)} events: {e}"
+            )
+            return 0
+        self._unacked = []
+        return acked
+
+    def stop(self) -> None:
+        """Stop the consumer loop after the current cycle."""
+        self._running = False
+        logger.info(f"IntakeConsumer: {self.consumer_name} stopping")
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get consumer counters plus queue lag and throughput."""
+        return {
+            "consumer": self.consumer_name,
+            **self._counters,
+            "unacked": len(self._unacked),
+            "queue": await self.queue.get_stats()
+        }
+
+    async def _handle(self, stream_id: str, event: IntakeEvent) -> str | None:
+        """Run the handler on one event.
+
+        Returns:
+            stream_id if the event should be acknowledged, else None
+        """
+        async with self._semaphore:
+            try:
+                if self._is_async:
+                    await self.handler(event)
+                else:
+                    await asyncio.to_thread(self.handler, event)
+            except Exception as e:
+                self._counters["failed"] += 1
+                logger.error(f"IntakeConsumer: Handler failed for {stream_id}: {e}")
+                return None
+
+        self._counters["processed"] += 1
+        return stream_id
@@ -55,12 +55,15 @@ Example:
 """
 
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlmodel import Session, create_engine, select
+from sqlalchemy import case, func
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.models.action_record import (
     ActionRecord,
@@ -110,6 +113,111 @@ BASE_CONFIDENCE_SCORES = {
 }
 
 
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Treat naive timestamps (e.g. from SQLite) as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+@dataclass
+class _StatsAccumulator:
+    """Running totals behind one cached ActionStats.
+
+    Built from a SQL aggregate and updated in place by record_action, so
+    the cache stays valid under steady write traffic. The trend compares
+    success rates in the older and newer half of the time window, split at
+    ``midpoint``.
+    """
+
+    action_type: str
+    agent_type: str
+    computed_at: datetime
+    midpoint: datetime
+    total: int = 0
+    successes: int = 0
+    confidence_sum: float = 0.0
+    execution_time_sum: float = 0.0
+    last_executed: datetime | None = None
+    first_total: int = 0
+    first_successes: int = 0
+    second_total: int = 0
+    second_successes: int = 0
+
+    def add(self, success: bool, confidence: float, execution_time_ms: int, at: datetime) -> None:
+        """Fold one new action into the totals."""
+        self.total += 1
+        self.successes += int(success)
+        self.confidence_sum += confidence
+        self.execution_time_sum += execution_time_ms
+        if self.last_executed is None or at > self.last_executed:
+            self.last_executed = at
+        if at < self.midpoint:
+            self.first_total += 1
+            self.first_successes += int(success)
+        else:
+            self.second_total += 1
+            self.second_successes += int(success)
+
+    def trend(self) -> str:
+        """Compare success rates of the two half windows.
+
+        Returns:
+            "improving", "stable", or "declining"
+        """
+        if self.total < 5 or not self.first_total or not self.second_total:
+            return "stable"
+
+        first_rate = self.first_successes / self.first_total
+        second_rate = self.second_successes / self.second_total
+
+        diff = second_rate - first_rate
+        if diff > 0.1:
+            return "improving"
+        elif diff < -0.1:
+            return "declining"
+        return "stable"
+
+    def to_stats(self) -> ActionStats:
+        """Build the ActionStats view of the totals."""
+        if not self.total:
+            return ActionStats(action_type=self.action_type, agent_type=self.agent_type)
+        return ActionStats(
+            action_type=self.action_type,
+            agent_type=self.agent_type,
+            total_count=self.total,
+            success_count=self.successes,
+            failure_count=self.total - self.successes,
+            success_rate=self.successes / self.total,
+            avg_confidence=self.confidence_sum / self.total,
+            avg_execution_time_ms=self.execution_time_sum / self.total,
+            last_executed=self.last_executed,
+            confidence_trend=self.trend(),
+        )
+
+
+def to_async_database_url(database_url: str) -> str:
+    """Convert a database URL to its async driver form.
+
+    Railway provides postgres:// and the sync default is sqlite://, but the
+    async engine needs postgresql+asyncpg:// and sqlite+aiosqlite://.
+
+    Args:
+        database_url: Database connection string
+
+    Returns:
+        Connection string with an async driver
+    """
+    for prefix, async_prefix in (
+        ("postgres://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if database_url.startswith(prefix):
+            return async_prefix + database_url[len(prefix) :]
+    return database_url
+
+
 # ============================================================================
 # LEARNING SERVICE
 # ============================================================================
@@ -123,8 +231,11 @@ class LearningService:
     - Trend analysis and insights
     - Cross-agent learning
 
+    All queries run on an async engine (asyncpg / aiosqlite), so they never
+    block the event loop shared with the API routes and monitoring loop.
+
     Attributes:
-        engine: SQLAlchemy database engine
+        engine: SQLAlchemy async database engine
         config: Learning configuration
         initialized: Whether service is ready
     """
@@ -142,12 +253,14 @@ class LearningService:
         """
         self.database_url = database_url or "sqlite:///:memory:"
         self.config = config or LearningConfig()
-        self.engine = None
+        self.engine: AsyncEngine | None = None
         self.initialized = False
 
-        # In-memory cache for performance
-        self._stats_cache: dict[str, ActionStats] = {}
-        self._cache_timestamp: datetime | None = None
+        # In-memory stats cache, updated incrementally by record_action.
+        # (action_type, agent_type, days) → totals for get_action_stats;
+        # days → per-action totals for get_all_stats.
+        self._stats_cache: dict[tuple[str | None, str | None, int], _StatsAccumulator] = {}
+        self._all_stats_cache: dict[int, dict[str, _StatsAccumulator]] = {}
         self._cache_ttl_seconds = 60
 
     async def initialize(self) -> None:
@@ -159,30 +272,43 @@ class LearningService:
             return
 
         try:
-            self.engine = create_engine(self.database_url, echo=False)
+            url = to_async_database_url(self.database_url)
+            engine_kwargs: dict[str, Any] = {"echo": False}
+            if url.startswith("sqlite") and ":memory:" in url:
+                # One shared connection, otherwise each connection gets its own database
+                engine_kwargs["poolclass"] = StaticPool
+                engine_kwargs["connect_args"] = {"check_same_thread": False}
+            self.engine = create_async_engine(url, **engine_kwargs)
+
             # Note: In production, use Alembic for migrations
             # For now, SQLModel can create tables
-            from sqlmodel import SQLModel
-
-            SQLModel.metadata.create_all(self.engine)
+            async with self.engine.begin() as conn:
+                await conn.run_sync(SQLModel.metadata.create_all)
             self.initialized = True
             logger.info("LearningService initialized with database: %s", self.database_url[:50])
         except Exception as e:
             logger.error("Failed to initialize LearningService: %s", e)
             raise
 
-    def _get_session(self) -> Session:
-        """Get a database session.
+    async def close(self) -> None:
+        """Dispose of the engine's connection pool."""
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+        self.initialized = False
+
+    def _get_session(self) -> AsyncSession:
+        """Get an async database session.
 
         Returns:
-            SQLModel Session
+            SQLModel AsyncSession
 
         Raises:
             RuntimeError: If service not initialized
         """
         if not self.initialized or self.engine is None:
             raise RuntimeError("LearningService not initialized. Call initialize() first.")
-        return Session(self.engine)
+        return AsyncSession(self.engine, expire_on_commit=False)
 
     # ========================================================================
     # ACTION RECORDING
@@ -234,14 +360,12 @@ class LearningService:
             timestamp=datetime.now(UTC),
         )
 
-        with self._get_session() as session:
+        async with self._get_session() as session:
             session.add(record)
-            session.commit()
-            session.refresh(record)
+            await session.commit()
+            await session.refresh(record)
 
-        # Invalidate cache
-        self._stats_cache.clear()
-        self._cache_timestamp = None
+        self._update_cached_stats(record)
 
         logger.info(
             "Recorded action: %s by %s - %s (confidence: %.2f)",
@@ -273,7 +397,7 @@ class LearningService:
         """
         cutoff = datetime.now(UTC) - timedelta(hours=hours)
 
-        with self._get_session() as session:
+        async with self._get_session() as session:
             statement = select(ActionRecord).where(ActionRecord.timestamp >= cutoff)
 
             if action_type:
@@ -282,13 +406,127 @@ class LearningService:
                 statement = statement.where(ActionRecord.agent_type == agent_type)
 
             statement = statement.order_by(ActionRecord.timestamp.desc()).limit(limit)
-            results = session.exec(statement).all()
+            results = (await session.exec(statement)).all()
 
         return list(results)
 
     # ========================================================================
     # STATISTICS CALCULATION
     # ========================================================================
+    def _is_fresh(self, accumulator: _StatsAccumulator) -> bool:
+        """Check whether cached totals are within the cache TTL."""
+        age = (datetime.now(UTC) - accumulator.computed_at).total_seconds()
+        return age < self._cache_ttl_seconds
+
+    def _update_cached_stats(self, record: ActionRecord) -> None:
+        """Fold a newly recorded action into every matching cached entry.
+
+        Args:
+            record: The persisted action record
+        """
+        at = _as_utc(record.timestamp)
+        values = (record.success, record.confidence_score, record.execution_time_ms, at)
+
+        for (action_type, agent_type, _days), accumulator in self._stats_cache.items():
+            if action_type not in (None, record.action_type):
+                continue
+            if agent_type not in (None, record.agent_type):
+                continue
+            accumulator.add(*values)
+
+        for by_action in self._all_stats_cache.values():
+            accumulator = by_action.get(record.action_type)
+            if accumulator is None:
+                template = next(iter(by_action.values()), None)
+                if template is None:
+                    continue
+                accumulator = by_action[record.action_type] = _StatsAccumulator(
+                    action_type=record.action_type,
+                    agent_type="all",
+                    computed_at=template.computed_at,
+                    midpoint=template.midpoint,
+                )
+            accumulator.add(*values)
+
+    async def _aggregate_stats(
+        self,
+        days: int,
+        action_type: str | None = None,
+        agent_type: str | None = None,
+        group_by_action: bool = False,
+    ) -> list[_StatsAccumulator]:
+        """Aggregate action records in SQL.
+
+        Counts, averages, last execution and the two half-window success
+        counts used for the trend are computed in one GROUP BY query, so no
+        ActionRecord rows are loaded into Python.
+
+        Args:
+            days: Number of days to analyze
+            action_type: Filter by action type
+            agent_type: Filter by agent type
+            group_by_action: One result per action type instead of one overall
+
+        Returns:
+            Accumulators (empty list if no matching records)
+        """
+        now = datetime.now(UTC)
+        cutoff = now - timedelta(days=days)
+        midpoint = now - timedelta(days=days) / 2
+        first_half = ActionRecord.timestamp < midpoint
+        success = ActionRecord.success == True  # noqa: E712
+
+        columns = [
+            func.count(ActionRecord.id),
+            func.sum(case((success, 1), else_=0)),
+            func.sum(ActionRecord.confidence_score),
+            func.sum(ActionRecord.execution_time_ms),
+            func.max(ActionRecord.timestamp),
+            func.sum(case((first_half, 1), else_=0)),
+            func.sum(case((first_half & success, 1), else_=0)),
+        ]
+        if group_by_action:
+            columns.insert(0, ActionRecord.action_type)
+
+        statement = select(*columns).where(ActionRecord.timestamp >= cutoff)
+        if action_type:
+            statement = statement.where(ActionRecord.action_type == action_type)
+        if agent_type:
+            statement = statement.where(ActionRecord.agent_type == agent_type)
+        if group_by_action:
+            statement = statement.group_by(ActionRecord.action_type)
+
+        async with self._get_session() as session:
+            rows = (await session.exec(statement)).all()
+
+        results = []
+        for row in rows:
+            if group_by_action:
+                group_action, *row = row
+            else:
+                group_action = action_type or "all"
+            total, successes, conf_sum, time_sum, last, first_total, first_successes = row
+            if not total:
+                continue
+            results.append(
+                _StatsAccumulator(
+                    action_type=group_action,
+                    agent_type=agent_type or "all",
+                    computed_at=now,
+                    midpoint=midpoint,
+                    total=total,
+                    successes=successes or 0,
+                    confidence_sum=conf_sum or 0.0,
+                    execution_time_sum=time_sum or 0,
+                    last_executed=_as_utc(last),
+                    first_total=first_total or 0,
+                    first_successes=first_successes or 0,
+                    second_total=total - (first_total or 0),
+                    second_successes=(successes or 0) - (first_successes or 0),
+                )
+            )
+        return results
+
     async def get_action_stats(
         self,
         action_type: str | None = None,
@@ -305,65 +543,26 @@ class LearningService:
         Returns:
             ActionStats with success rates and timing
         """
-        cache_key = f"{action_type or 'all'}:{agent_type or 'all'}:{days}"
-
-        # Check cache
-        if (
-            self._cache_timestamp
-            and (datetime.now(UTC) - self._cache_timestamp).total_seconds()
-            < self._cache_ttl_seconds
-            and cache_key in self._stats_cache
-        ):
-            return self._stats_cache[cache_key]
-
-        cutoff = datetime.now(UTC) - timedelta(days=days)
-
-        with self._get_session() as session:
-            statement = select(ActionRecord).where(ActionRecord.timestamp >= cutoff)
-
-            if action_type:
-                statement = statement.where(ActionRecord.action_type == action_type)
-            if agent_type:
-                statement = statement.where(ActionRecord.agent_type == agent_type)
+        cache_key = (action_type, agent_type, days)
 
-            records = session.exec(statement).all()
+        cached = self._stats_cache.get(cache_key)
+        if cached is not None and self._is_fresh(cached):
+            return cached.to_stats()
 
-        if not records:
-            return ActionStats(
+        results = await self._aggregate_stats(days, action_type, agent_type)
+        if results:
+            accumulator = results[0]
+        else:
+            now = datetime.now(UTC)
+            accumulator = _StatsAccumulator(
                 action_type=action_type or "all",
                 agent_type=agent_type or "all",
+                computed_at=now,
+                midpoint=now - timedelta(days=days) / 2,
             )
 
-        total = len(records)
-        successes = sum(1 for r in records if r.success)
-        failures = total - successes
-
-        avg_confidence = sum(r.confidence_score for r in records) / total
-        avg_execution_time = sum(r.execution_time_ms for r in records) / total
-
-        last_executed = max(r.timestamp for r in records) if records else None
-
-        # Calculate trend
-        trend = self._calculate_trend(records)
-
-        stats = ActionStats(
-            action_type=action_type or "all",
-            agent_type=agent_type or "all",
-            total_count=total,
-            success_count=successes,
-            failure_count=failures,
-            success_rate=successes / total if total > 0 else 0.0,
-            avg_confidence=avg_confidence,
-            avg_execution_time_ms=avg_execution_time,
-            last_executed=last_executed,
-            confidence_trend=trend,
-        )
-
-        # Update cache
-        self._stats_cache[cache_key] = stats
-        self._cache_timestamp = datetime.now(UTC)
-
-        return stats
+        self._stats_cache[cache_key] = accumulator
+        return accumulator.to_stats()
 
     async def get_all_stats(self, days: int = 7) -> list[ActionStats]:
         """Get statistics for all action types.
@@ -374,70 +573,18 @@ class LearningService:
         Returns:
             List of ActionStats for each action type
         """
-        cutoff = datetime.now(UTC) - timedelta(days=days)
-
-        with self._get_session() as session:
-            statement = select(ActionRecord).where(ActionRecord.timestamp >= cutoff)
-            records = session.exec(statement).all()
-
-        if not records:
-            return []
-
-        # Group by action type
-        by_action: dict[str, list[ActionRecord]] = defaultdict(list)
-        for record in records:
-            by_action[record.action_type].append(record)
-
-        stats_list = []
-        for action_type, action_records in by_action.items():
-            total = len(action_records)
-            successes = sum(1 for r in action_records if r.success)
-
-            stats = ActionStats(
-                action_type=action_type,
-                total_count=total,
-                success_count=successes,
-                failure_count=total - successes,
-                success_rate=successes / total if total > 0 else 0.0,
-                avg_confidence=sum(r.confidence_score for r in action_records) / total,
-                avg_execution_time_ms=sum(r.execution_time_ms for r in action_records) / total,
-                last_executed=max(r.timestamp for r in action_records),
-                confidence_trend=self._calculate_trend(action_records),
-            )
-            stats_list.append(stats)
-
+        by_action = self._all_stats_cache.get(days)
+        if not by_action or not self._is_fresh(next(iter(by_action.values()))):
+            results = await self._aggregate_stats(days, group_by_action=True)
+            by_action = {acc.action_type: acc for acc in results}
+            if by_action:
+                self._all_stats_cache[days] = by_action
+            else:
+                self._all_stats_cache.pop(days, None)
+
+        stats_list = [acc.to_stats() for acc in by_action.values()]
         return sorted(stats_list, key=lambda s: s.total_count, reverse=True)
 
-    def _calculate_trend(self, records: list[ActionRecord]) -> str:
-        """Calculate confidence trend from records.
-
-        Args:
-            records: List of action records
-
-        Returns:
-            "improving", "stable", or "declining"
-        """
-        if len(records) < 5:
-            return "stable"
-
-        # Sort by timestamp
-        sorted_records = sorted(records, key=lambda r: r.timestamp)
-
-        # Compare first half vs second half success rates
-        mid = len(sorted_records) // 2
-        first_half = sorted_records[:mid]
-        second_half = sorted_records[mid:]
-
-        first_rate = sum(1 for r in first_half if r.success) / len(first_half)
-        second_rate = sum(1 for r in second_half if r.success) / len(second_half)
-
-        diff = second_rate - first_rate
-        if diff > 0.1:
-            return "improving"
-        elif diff < -0.1:
-            return "declining"
-        return "stable"
-
     # ========================================================================
     # CONFIDENCE ADJUSTMENTS
     # ========================================================================
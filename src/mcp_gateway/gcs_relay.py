@@ -10,9 +10,15 @@ Architecture:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,11 @@ logger = logging.getLogger(__name__)
 GCS_BUCKET = os.environ.get("GCS_BUCKET", "project38-mcp-relay")
 GCS_PREFIX = os.environ.get("GCS_PREFIX", "mcp-relay")
 POLL_INTERVAL = int(os.environ.get("GCS_POLL_INTERVAL", "2"))
+# Requests processed at once, and threads for blocking storage calls
+RELAY_CONCURRENCY = int(os.environ.get("GCS_RELAY_CONCURRENCY", "8"))
+RELAY_IO_WORKERS = int(os.environ.get("GCS_RELAY_IO_WORKERS", "16"))
+# Claims older than this are assumed abandoned by a dead replica
+CLAIM_TIMEOUT = int(os.environ.get("GCS_CLAIM_TIMEOUT", "300"))
 
 # GCS client (lazy loaded)
 _storage_client = None
@@ -72,8 +83,6 @@ async def process_gcs_request(blob_name: str, request_data: dict) -> dict | None
     Returns:
         Response dict or None if processing failed
     """
-    from .server import create_mcp_server
-
     try:
         # Extract MCP request
         method = request_data.get("method")
@@ -82,8 +91,8 @@ async def process_gcs_request(blob_name: str, request_data: dict) -> dict | None
 
         logger.info(f"Processing GCS request: {method} (id={request_id})")
 
-        # Get MCP server instance
-        mcp = create_mcp_server()
+        # Shared MCP server instance
+        mcp = _get_mcp_server()
         if mcp is None:
             return {
                 "jsonrpc": "2.0",
@@ -140,12 +149,20 @@ async def process_gcs_request(blob_name: str, request_data: dict) -> dict | None
         }
 
 
-async def _call_mcp_tool(tool_name: str, args: dict) -> dict:
-    """Call an MCP tool by name."""
+@functools.cache
+def _get_mcp_server() -> Any:
+    """Create the MCP server once and reuse it for every request."""
+    from .server import create_mcp_server
+
+    return create_mcp_server()
+
+
+@functools.cache
+def _get_tool_map() -> dict[str, Callable]:
+    """Map tool names to functions (built once)."""
     from .tools import monitoring, n8n, railway, workspace
 
-    # Map tool names to functions
-    tool_map = {
+    return {
         # Railway
         "railway_deploy": railway.trigger_deployment,
         "railway_status": railway.get_deployment_status,
@@ -175,6 +192,11 @@ async def _call_mcp_tool(tool_name: str, args: dict) -> dict:
         "docs_append": workspace.docs_append,
     }
 
+
+async def _call_mcp_tool(tool_name: str, args: dict) -> dict:
+    """Call an MCP tool by name."""
+    tool_map = _get_tool_map()
+
     if tool_name not in tool_map:
         raise ValueError(f"Unknown tool: {tool_name}")
 
@@ -189,30 +211,147 @@ async def _call_mcp_tool(tool_name: str, args: dict) -> dict:
     return result
 
 
-async def poll_gcs_once() -> int:
-    """
-    Poll GCS for requests once.
+def _is_http_error(exc: Exception, code: int) -> bool:
+    """Check a google-api-core error's HTTP status without importing it."""
+    return getattr(exc, "code", None) == code
 
-    Returns:
-        Number of requests processed
+
+class GCSRelayWorker:
+    """Processes relay requests from a GCS prefix concurrently.
+
+    Blocking google-cloud-storage calls run in a bounded thread pool, and up
+    to max_concurrency requests are handled at once. Several replicas can
+    poll the same prefix: a request is claimed by creating a claim object
+    with if_generation_match=0, which only one replica can win. Request
+    reads and deletes are pinned to the listed generation, so a request
+    re-uploaded under the same name is never deleted unprocessed.
     """
-    bucket = _get_bucket()
-    if bucket is None:
-        return 0
 
-    processed = 0
-    requests_prefix = f"{GCS_PREFIX}/requests/"
+    def __init__(
+        self,
+        bucket: Any,
+        prefix: str = GCS_PREFIX,
+        max_concurrency: int = RELAY_CONCURRENCY,
+        io_workers: int = RELAY_IO_WORKERS,
+        claim_timeout: float = CLAIM_TIMEOUT,
+    ):
+        """Initialize the relay worker.
+
+        Args:
+            bucket: google.cloud.storage Bucket (or compatible)
+            prefix: Relay prefix holding requests/ and claims/
+            max_concurrency: Requests processed at the same time
+            io_workers: Threads for blocking storage calls
+            claim_timeout: Seconds after which another replica's claim is stale
+        """
+        self.bucket = bucket
+        self.prefix = prefix
+        self.claim_timeout = claim_timeout
+        self.worker_id = uuid.uuid4().hex[:12]
+        self._executor = ThreadPoolExecutor(
+            max_workers=io_workers, thread_name_prefix="gcs-relay"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _io(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking storage call in the I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def _claim_name(self, blob_name: str) -> str:
+        """Claim object name for a request blob."""
+        return f"{self.prefix}/claims/{blob_name.rsplit('/', 1)[-1]}"
+
+    async def _claim(self, blob_name: str) -> Any | None:
+        """Claim a request for this replica.
+
+        Returns:
+            The claim blob (with its generation) or None if another replica
+            holds a live claim
+        """
+        claim = self.bucket.blob(self._claim_name(blob_name))
+        lease = json.dumps({"owner": self.worker_id, "claimed_at": time.time()})
 
-    try:
-        blobs = list(bucket.list_blobs(prefix=requests_prefix))
+        try:
+            await self._io(
+                claim.upload_from_string,
+                lease,
+                content_type="application/json",
+                if_generation_match=0,
+            )
+            return claim
+        except Exception as e:
+            if not _is_http_error(e, 412):
+                raise
+
+        # Claimed already - take it over only if the holder looks dead
+        try:
+            await self._io(claim.reload)
+            existing = json.loads(await self._io(claim.download_as_text))
+        except Exception as e:
+            if _is_http_error(e, 404):
+                return None  # Released meanwhile; retry on the next poll
+            raise
+
+        if time.time() - existing.get("claimed_at", 0) < self.claim_timeout:
+            return None
+
+        try:
+            await self._io(
+                claim.upload_from_string,
+                lease,
+                content_type="application/json",
+                if_generation_match=claim.generation,
+            )
+            logger.warning(f"Took over stale claim for {blob_name}")
+            return claim
+        except Exception as e:
+            if _is_http_error(e, 412) or _is_http_error(e, 404):
+                return None
+            raise
 
-        for blob in blobs:
-            if not blob.name.endswith(".json"):
-                continue
+    async def _release(self, claim: Any) -> None:
+        """Delete a claim, unless another replica has since taken it over."""
+        try:
+            await self._io(claim.delete, if_generation_match=claim.generation)
+        except Exception as e:
+            if not (_is_http_error(e, 412) or _is_http_error(e, 404)):
+                logger.warning(f"Failed to release claim {claim.name}: {e}")
+
+    async def _delete_request(self, blob: Any) -> None:
+        """Delete a processed request at the generation that was processed."""
+        try:
+            await self._io(blob.delete, if_generation_match=blob.generation)
+        except Exception as e:
+            if not (_is_http_error(e, 412) or _is_http_error(e, 404)):
+                raise
+
+    async def handle_request(self, blob: Any) -> bool:
+        """Claim, process, answer and delete one request blob.
+
+        Args:
+            blob: Listed request blob
+
+        Returns:
+            True if this replica processed the request
+        """
+        async with self._semaphore:
+            claim = await self._claim(blob.name)
+            if claim is None:
+                return False
 
             try:
-                # Download request
-                content = blob.download_as_text()
+                try:
+                    content = await self._io(
+                        blob.download_as_text, if_generation_match=blob.generation
+                    )
+                except Exception as e:
+                    if _is_http_error(e, 404) or _is_http_error(e, 412):
+                        return False  # Already handled by another replica
+                    raise
+
                 request_data = json.loads(content)
 
                 # Get response path from request metadata
@@ -221,31 +360,84 @@ async def poll_gcs_once() -> int:
 
                 if not response_path:
                     logger.warning(f"No response path in {blob.name}")
-                    blob.delete()
-                    continue
+                    await self._delete_request(blob)
+                    return False
 
-                # Process request
                 response = await process_gcs_request(blob.name, request_data)
 
                 if response:
-                    # Upload response
-                    response_blob = bucket.blob(response_path)
-                    response_blob.upload_from_string(
-                        json.dumps(response), content_type="application/json"
+                    response_blob = self.bucket.blob(response_path)
+                    await self._io(
+                        response_blob.upload_from_string,
+                        json.dumps(response),
+                        content_type="application/json",
                     )
                     logger.info(f"Response written to {response_path}")
 
-                # Delete processed request
-                blob.delete()
-                processed += 1
+                await self._delete_request(blob)
+                return True
 
             except Exception as e:
                 logger.error(f"Error processing {blob.name}: {e}")
+                return False
 
-    except Exception as e:
-        logger.error(f"GCS poll error: {e}")
+            finally:
+                await self._release(claim)
+
+    async def poll_once(self) -> int:
+        """List pending requests and process them concurrently.
+
+        Returns:
+            Number of requests processed by this replica
+        """
+        requests_prefix = f"{self.prefix}/requests/"
+
+        try:
+            blobs = await self._io(
+                lambda: list(self.bucket.list_blobs(prefix=requests_prefix))
+            )
+        except Exception as e:
+            logger.error(f"GCS poll error: {e}")
+            return 0
+
+        results = await asyncio.gather(
+            *(self.handle_request(blob) for blob in blobs if blob.name.endswith(".json"))
+        )
+        return sum(results)
+
+    def close(self) -> None:
+        """Shut down the I/O thread pool."""
+        self._executor.shutdown(wait=False)
+
+
+# Relay worker for the configured bucket (lazy loaded)
+_worker: GCSRelayWorker | None = None
+
+
+def _get_worker() -> GCSRelayWorker | None:
+    """Get the relay worker for the configured bucket."""
+    global _worker
+
+    if _worker is None:
+        bucket = _get_bucket()
+        if bucket is None:
+            return None
+        _worker = GCSRelayWorker(bucket)
+    return _worker
+
+
+async def poll_gcs_once() -> int:
+    """
+    Poll GCS for requests once.
+
+    Returns:
+        Number of requests processed
+    """
+    worker = _get_worker()
+    if worker is None:
+        return 0
 
-    return processed
+    return await worker.poll_once()
 
 
 async def start_polling_loop():
@@ -16,9 +16,16 @@ Architecture:
 This service runs as a background task alongside the MCP Gateway on Railway.
 
 Rate Limits (enforced):
-    - Polling: Every 3 seconds with ETag (free if 304)
+    - Polling: Adaptive with ETag (free if 304) - every second while
+      requests arrive, backing off to 30 seconds when idle
     - Writing: >1.5 seconds between POSTs
     - Max writes: 500/hour (~8 msg/min sustained)
+
+Read-only requests run concurrently, while calls to tools that change
+external state (deploys, rollbacks, workflow triggers) run one at a time,
+oldest comment first. Responses that finish while the relay waits for its
+next write slot are posted together in one comment, so a burst of
+requests costs a few writes instead of one each.
 """
 
 import asyncio
@@ -38,9 +45,19 @@ RESPONSE_MARKER = "<!-- MCP_RESPONSE:"
 END_MARKER = " -->"
 
 # Timing constants
-POLL_INTERVAL = 3.0  # seconds between polls
+POLL_INTERVAL = 3.0  # seconds between polls at startup
+MIN_POLL_INTERVAL = 1.0  # seconds between polls while requests arrive
+MAX_POLL_INTERVAL = 30.0  # seconds between polls when idle
 WRITE_INTERVAL = 1.5  # minimum seconds between writes
 
+# Batching constants
+MAX_CONCURRENCY = 4  # tool calls executed at once
+MAX_RESPONSES_PER_COMMENT = 10
+MAX_COMMENT_LENGTH = 60000  # GitHub rejects comment bodies over 65536 chars
+
+# Tools whose calls must not overlap or reorder
+MUTATING_TOOLS = frozenset({"railway_deploy", "railway_rollback", "n8n_trigger"})
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,20 +78,37 @@ class GitHubMCPRelay:
         self,
         config: MCPGatewayConfig,
         github_client: httpx.AsyncClient | None = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_responses_per_comment: int = MAX_RESPONSES_PER_COMMENT,
+        write_interval: float = WRITE_INTERVAL,
     ):
         """Initialize the GitHub MCP Relay.
 
         Args:
             config: MCP Gateway configuration
             github_client: Optional httpx client for GitHub API
+            max_concurrency: Tool calls executed at the same time
+            max_responses_per_comment: Responses aggregated into one comment
+            write_interval: Minimum seconds between comment writes
         """
         self.config = config
         self.repo = config.github_relay_repo
         self.issue_number = config.github_relay_issue
+        self.max_concurrency = max_concurrency
+        self.max_responses_per_comment = max_responses_per_comment
+        self.write_interval = write_interval
         self._last_write_time = 0.0
         self._etag: str | None = None
         self._processed_requests: set[str] = set()
         self._running = False
+        self._poll_interval = POLL_INTERVAL
+        self.stats = {
+            "polls": 0,
+            "not_modified": 0,
+            "requests": 0,
+            "responses_posted": 0,
+            "comments_posted": 0,
+        }
 
         # Initialize GitHub client
         if github_client:
@@ -114,11 +148,15 @@ class GitHubMCPRelay:
             logger.error(f"Failed to get GitHub token: {e}")
             raise
 
+    def _write_delay(self) -> float:
+        """Seconds until the next write is allowed."""
+        return max(0.0, self.write_interval - (time.time() - self._last_write_time))
+
     async def _enforce_write_interval(self) -> None:
         """Enforce minimum interval between writes."""
-        elapsed = time.time() - self._last_write_time
-        if elapsed < WRITE_INTERVAL:
-            await asyncio.sleep(WRITE_INTERVAL - elapsed)
+        delay = self._write_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
         self._last_write_time = time.time()
 
     async def _get_comments(self) -> tuple[list[dict], str | None]:
@@ -134,7 +172,9 @@ class GitHubMCPRelay:
             params={"per_page": 50, "sort": "created", "direction": "desc"},
         )
 
+        self.stats["polls"] += 1
         if resp.status_code == 304:
+            self.stats["not_modified"] += 1
             return [], self._etag
 
         if resp.status_code != 200:
@@ -144,15 +184,9 @@ class GitHubMCPRelay:
         new_etag = resp.headers.get("ETag")
         return resp.json(), new_etag
 
-    async def _post_response(
-        self,
-        request_id: str,
-        response_data: dict,
-    ) -> bool:
-        """Post a response comment to the relay issue."""
-        await self._enforce_write_interval()
-
-        token = await self._get_github_token()
+    @staticmethod
+    def _format_response(request_id: str, response_data: dict) -> str:
+        """Format one response as a comment section."""
         encoded = _encode_message(response_data)
 
         # Truncate result preview for readability
@@ -160,24 +194,68 @@ class GitHubMCPRelay:
         if len(result_preview) > 400:
             result_preview = result_preview[:400] + "..."
 
-        body = (
+        return (
             f"{RESPONSE_MARKER}{request_id}:{encoded}{END_MARKER}\n\n"
             f"**MCP Response** for `{request_id}`\n\n"
             f"```json\n{result_preview}\n```"
         )
 
-        resp = await self._github_client.post(
-            f"/repos/{self.repo}/issues/{self.issue_number}/comments",
-            headers={"Authorization": f"token {token}"},
-            json={"body": body},
-        )
+    async def _post_response(
+        self,
+        request_id: str,
+        response_data: dict,
+    ) -> bool:
+        """Post a response comment to the relay issue."""
+        return await self._post_responses([(request_id, response_data)])
 
-        if resp.status_code != 201:
-            logger.error(f"Failed to post response: {resp.status_code}")
-            return False
+    async def _post_responses(self, responses: list[tuple[str, dict]]) -> bool:
+        """Post responses, several per comment.
+
+        Each response keeps its own marker line, so clients find it by
+        request ID whether or not it shares a comment. Comments are split
+        at max_responses_per_comment responses or MAX_COMMENT_LENGTH chars.
+
+        Returns:
+            True if every comment was posted
+        """
+        sections = [self._format_response(rid, data) for rid, data in responses]
+        separator = "\n\n---\n\n"
+
+        comments: list[list[str]] = []
+        for section in sections:
+            current = comments[-1] if comments else None
+            if (
+                current is None
+                or len(current) >= self.max_responses_per_comment
+                or len(separator.join([*current, section])) > MAX_COMMENT_LENGTH
+            ):
+                comments.append([section])
+            else:
+                current.append(section)
+
+        ok = True
+        for comment_sections in comments:
+            await self._enforce_write_interval()
+            token = await self._get_github_token()
+
+            resp = await self._github_client.post(
+                f"/repos/{self.repo}/issues/{self.issue_number}/comments",
+                headers={"Authorization": f"token {token}"},
+                json={"body": separator.join(comment_sections)},
+            )
+
+            if resp.status_code != 201:
+                logger.error(f"Failed to post response: {resp.status_code}")
+                ok = False
+                continue
 
-        logger.info(f"Posted response for {request_id}")
-        return True
+            self.stats["comments_posted"] += 1
+            self.stats["responses_posted"] += len(comment_sections)
+
+        ids = ", ".join(rid for rid, _ in responses)
+        if ok:
+            logger.info(f"Posted responses for {ids}")
+        return ok
 
     async def _execute_tool(
         self,
@@ -244,39 +322,64 @@ class GitHubMCPRelay:
                 }
             }
 
-    async def _process_request(self, comment: dict) -> None:
-        """Process a single MCP request from a comment."""
+    def _parse_request(self, comment: dict) -> tuple[str, dict] | None:
+        """Extract a new MCP request from a comment.
+
+        Returns:
+            (request_id, request_data), or None if the comment holds no new
+            request
+        """
         body = comment.get("body", "")
 
         # Check if this is a request
         if REQUEST_MARKER not in body:
-            return
+            return None
 
         # Extract request data
         start = body.find(REQUEST_MARKER) + len(REQUEST_MARKER)
         end = body.find(END_MARKER, start)
         if end <= start:
-            return
+            return None
 
         encoded_str = body[start:end].strip()
         if ":" not in encoded_str:
-            return
+            return None
 
         request_id, payload = encoded_str.split(":", 1)
 
         # Skip if already processed
         if request_id in self._processed_requests:
-            return
+            return None
 
         self._processed_requests.add(request_id)
         logger.info(f"Processing request: {request_id}")
 
         try:
-            request_data = _decode_message(payload)
+            return request_id, _decode_message(payload)
         except Exception as e:
             logger.error(f"Failed to decode request {request_id}: {e}")
+            return None
+
+    async def _process_request(self, comment: dict) -> None:
+        """Process a single MCP request from a comment."""
+        parsed = self._parse_request(comment)
+        if parsed is None:
             return
 
+        request_id, request_data = parsed
+        response = await self._handle_request(request_id, request_data)
+        await self._post_response(request_id, response)
+
+    @staticmethod
+    def _is_mutating(request_data: Any) -> bool:
+        """Check whether a request calls a tool that changes external state."""
+        if not isinstance(request_data, dict) or request_data.get("method") != "tools/call":
+            return False
+        params = request_data.get("params")
+        return isinstance(params, dict) and params.get("name") in MUTATING_TOOLS
+
+    async def _handle_request(self, request_id: str, request_data: dict) -> dict:
+        """Build the JSON-RPC response for a decoded request."""
         # Handle different methods
         method = request_data.get("method", "")
 
@@ -355,37 +458,103 @@ class GitHubMCPRelay:
                 },
             }
 
-        await self._post_response(request_id, response)
+        return response
 
     async def poll_once(self) -> int:
         """Poll for and process new requests.
 
+        Read-only requests run concurrently (up to max_concurrency); calls
+        to MUTATING_TOOLS run one at a time, oldest comment first. A request
+        that raises is answered with a JSON-RPC internal error. Responses
+        are posted as they finish: whatever completes while the relay waits
+        for its next write slot goes into the same comment.
+
         Returns:
-            Number of requests processed
+            Number of new requests processed
         """
         comments, new_etag = await self._get_comments()
         self._etag = new_etag
 
-        processed = 0
-        for comment in comments:
-            if REQUEST_MARKER in comment.get("body", ""):
-                await self._process_request(comment)
-                processed += 1
+        # Comments arrive newest first; comment IDs increase with age
+        parsed = [
+            (comment.get("id") or 0, request)
+            for comment in comments
+            if (request := self._parse_request(comment))
+        ]
+        requests = [request for _, request in sorted(parsed, key=lambda item: item[0])]
+        if not requests:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def handle(
+            request_id: str, request_data: dict, after: asyncio.Task | None = None
+        ) -> tuple[str, dict]:
+            if after is not None:
+                await asyncio.wait([after])
+            async with semaphore:
+                try:
+                    response = await self._handle_request(request_id, request_data)
+                except Exception as e:
+                    logger.exception(f"Request {request_id} failed")
+                    response = {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "error": {"code": -32603, "message": f"Internal error: {e}"},
+                    }
+            return request_id, response
+
+        pending = set()
+        last_mutation: asyncio.Task | None = None
+        for request_id, request_data in requests:
+            if self._is_mutating(request_data):
+                # Chained after the previous mutating call
+                last_mutation = asyncio.create_task(
+                    handle(request_id, request_data, after=last_mutation)
+                )
+                pending.add(last_mutation)
+            else:
+                pending.add(asyncio.create_task(handle(request_id, request_data)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            # Let more responses finish while the write slot is still closed
+            delay = self._write_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            finished = {task for task in pending if task.done()}
+            pending -= finished
+
+            await self._post_responses([task.result() for task in done | finished])
 
-        return processed
+        self.stats["requests"] += len(requests)
+        return len(requests)
 
     async def run(self) -> None:
-        """Run the relay service continuously."""
+        """Run the relay service continuously.
+
+        Polls every MIN_POLL_INTERVAL seconds while requests arrive and
+        doubles the interval on each idle poll, up to MAX_POLL_INTERVAL.
+        Idle polls are conditional (ETag), so they do not use rate limit.
+        """
         logger.info(f"Starting GitHub MCP Relay for {self.repo}#{self.issue_number}")
         self._running = True
 
         while self._running:
+            processed = 0
             try:
-                await self.poll_once()
+                processed = await self.poll_once()
             except Exception as e:
                 logger.exception(f"Poll error: {e}")
 
-            await asyncio.sleep(POLL_INTERVAL)
+            self._poll_interval = self._next_poll_interval(processed)
+            await asyncio.sleep(self._poll_interval)
+
+    def _next_poll_interval(self, processed: int) -> float:
+        """Poll fast while requests arrive, back off while idle."""
+        if processed:
+            return MIN_POLL_INTERVAL
+        return min(self._poll_interval * 2, MAX_POLL_INTERVAL)
 
     def stop(self) -> None:
         """Stop the relay service."""
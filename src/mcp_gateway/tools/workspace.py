@@ -8,13 +8,23 @@ Usage:
     They work autonomously without any local setup.
 """
 
+import asyncio
 import base64
+import json
 import logging
+import uuid
 from email.mime.text import MIMEText
 from typing import Any
+from urllib.parse import urlencode
 
 import httpx
 
+from src.google_token_provider import (
+    GoogleTokenProvider,
+    OAuthClientCredentials,
+    get_token_provider,
+)
+
 from .oauth import get_secret
 
 logger = logging.getLogger(__name__)
@@ -28,12 +38,37 @@ DOCS_API = "https://docs.googleapis.com/v1"
 OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"  # noqa: S105
 
 
+def _load_oauth_credentials() -> OAuthClientCredentials:
+    """Load the Workspace OAuth client credentials from Secret Manager.
+
+    Raises:
+        ValueError: If any of the secrets is missing
+    """
+    client_id = get_secret("GOOGLE-OAUTH-CLIENT-ID")
+    client_secret = get_secret("GOOGLE-OAUTH-CLIENT-SECRET")
+    refresh_token = get_secret("GOOGLE-OAUTH-REFRESH-TOKEN")
+
+    if not all([client_id, client_secret, refresh_token]):
+        missing = []
+        if not client_id:
+            missing.append("GOOGLE-OAUTH-CLIENT-ID")
+        if not client_secret:
+            missing.append("GOOGLE-OAUTH-CLIENT-SECRET")
+        if not refresh_token:
+            missing.append("GOOGLE-OAUTH-REFRESH-TOKEN")
+        raise ValueError(f"Missing OAuth secrets: {missing}")
+
+    return OAuthClientCredentials(client_id, client_secret, refresh_token)
+
+
 class WorkspaceAuth:
-    """Handles Google Workspace OAuth authentication."""
+    """Handles Google Workspace OAuth authentication.
+
+    Tokens and secrets live in the shared "google-workspace" token provider,
+    so a burst of tool calls on an expired token triggers a single refresh.
+    """
 
     _instance = None
-    _access_token: str | None = None
-    _token_expiry: float = 0
 
     def __new__(cls) -> "WorkspaceAuth":
         """Singleton pattern for token management."""
@@ -41,6 +76,13 @@ class WorkspaceAuth:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    @property
+    def provider(self) -> GoogleTokenProvider:
+        """Shared token provider for the Workspace credentials."""
+        return get_token_provider(
+            "google-workspace", _load_oauth_credentials, token_url=OAUTH_TOKEN_URL
+        )
+
     async def get_access_token(self) -> str:
         """Get a valid access token, refreshing if needed.
 
@@ -50,48 +92,7 @@ class WorkspaceAuth:
         Raises:
             Exception: If unable to get token
         """
-        import time
-
-        # Check if current token is still valid (with 60s buffer)
-        if self._access_token and time.time() < self._token_expiry - 60:
-            return self._access_token
-
-        # Get credentials from Secret Manager
-        client_id = get_secret("GOOGLE-OAUTH-CLIENT-ID")
-        client_secret = get_secret("GOOGLE-OAUTH-CLIENT-SECRET")
-        refresh_token = get_secret("GOOGLE-OAUTH-REFRESH-TOKEN")
-
-        if not all([client_id, client_secret, refresh_token]):
-            missing = []
-            if not client_id:
-                missing.append("GOOGLE-OAUTH-CLIENT-ID")
-            if not client_secret:
-                missing.append("GOOGLE-OAUTH-CLIENT-SECRET")
-            if not refresh_token:
-                missing.append("GOOGLE-OAUTH-REFRESH-TOKEN")
-            raise ValueError(f"Missing OAuth secrets: {missing}")
-
-        # Refresh the token
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                OAUTH_TOKEN_URL,
-                data={
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "refresh_token": refresh_token,
-                    "grant_type": "refresh_token",
-                },
-            )
-
-            if response.status_code != 200:
-                raise ValueError(f"Token refresh failed: {response.text}")
-
-            data = response.json()
-            self._access_token = data["access_token"]
-            self._token_expiry = time.time() + data.get("expires_in", 3600)
-
-            logger.info("Google Workspace access token refreshed")
-            return self._access_token
+        return await self.provider.get_access_token()
 
 
 # Global auth instance
@@ -104,6 +105,176 @@ async def _get_headers() -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+# =============================================================================
+# Gmail Batch Fetch Layer
+# =============================================================================
+
+# Gmail's multipart batch endpoint accepts up to 100 calls per request, but
+# Google recommends at most 50 to avoid per-item rate limiting.
+GMAIL_BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+GMAIL_BATCH_SIZE = 50
+GMAIL_BATCH_CONCURRENCY = 4
+
+# Field mask for metadata fetches - only what the summaries use
+GMAIL_METADATA_FIELDS = "id,threadId,snippet,payload/headers"
+
+
+def _build_batch_body(requests: list[tuple[str, str]], boundary: str) -> bytes:
+    """Encode (method, path) pairs as a multipart/mixed batch body.
+
+    Each part's Content-ID is its index so responses can be matched back.
+    """
+    lines: list[str] = []
+    for index, (method, path) in enumerate(requests):
+        lines.extend(
+            [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <item{index}>",
+                "",
+                f"{method} {path}",
+                "",
+            ]
+        )
+    lines.append(f"--{boundary}--")
+    return "\r\n".join(lines).encode()
+
+
+def _parse_batch_response(
+    content: bytes, content_type: str, count: int
+) -> list[tuple[int, Any]]:
+    """Split a multipart/mixed batch response into (status, body) pairs.
+
+    Results are returned in request order. Parts missing from the response
+    come back as (0, None).
+    """
+    boundary = ""
+    for param in content_type.split(";"):
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        raise ValueError(f"Batch response has no boundary: {content_type}")
+
+    results: list[tuple[int, Any]] = [(0, None)] * count
+    for part in content.decode("utf-8", "replace").split(f"--{boundary}"):
+        part = part.strip()
+        if not part or part == "--":
+            continue
+
+        part_headers, _, http_message = part.replace("\r\n", "\n").partition("\n\n")
+        index = None
+        for line in part_headers.split("\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                # Responses echo the ID as <response-itemN>
+                index = int(value.strip().strip("<>").rsplit("item", 1)[-1])
+        if index is None or not 0 <= index < count:
+            continue
+
+        status_line, _, rest = http_message.partition("\n")
+        status = int(status_line.split()[1])
+        _, _, body = rest.partition("\n\n")
+        body = body.strip()
+        try:
+            results[index] = (status, json.loads(body) if body else {})
+        except json.JSONDecodeError:
+            results[index] = (status, body)
+
+    return results
+
+
+async def _gmail_batch(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    requests: list[tuple[str, str]],
+) -> list[tuple[int, Any]]:
+    """Run Gmail API calls through the multipart batch endpoint.
+
+    Calls are split into chunks of GMAIL_BATCH_SIZE and the chunks are sent
+    concurrently (at most GMAIL_BATCH_CONCURRENCY at a time), so 100 calls
+    cost about one round trip instead of 100.
+
+    Args:
+        client: HTTP client shared by the calling tool
+        headers: Authorization headers, applied to every call in the batch
+        requests: (method, path) pairs, e.g. ("GET", "/gmail/v1/users/me/...")
+
+    Returns:
+        (status_code, parsed_body) for each request, in request order
+
+    Raises:
+        ValueError: If a batch request itself is rejected
+    """
+    semaphore = asyncio.Semaphore(GMAIL_BATCH_CONCURRENCY)
+
+    async def send_chunk(chunk: list[tuple[str, str]]) -> list[tuple[int, Any]]:
+        boundary = f"batch_{uuid.uuid4().hex}"
+        async with semaphore:
+            response = await client.post(
+                GMAIL_BATCH_URL,
+                headers={
+                    **headers,
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+                content=_build_batch_body(chunk, boundary),
+            )
+        if response.status_code != 200:
+            raise ValueError(f"Gmail batch request failed: {response.text}")
+        return _parse_batch_response(
+            response.content, response.headers.get("content-type", ""), len(chunk)
+        )
+
+    chunks = [
+        requests[i : i + GMAIL_BATCH_SIZE]
+        for i in range(0, len(requests), GMAIL_BATCH_SIZE)
+    ]
+    chunk_results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+    return [result for chunk_result in chunk_results for result in chunk_result]
+
+
+async def _gmail_fetch_metadata(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    message_ids: list[str],
+    metadata_headers: list[str],
+) -> list[dict[str, Any]]:
+    """Fetch metadata for many messages in batched calls.
+
+    Args:
+        client: HTTP client shared by the calling tool
+        headers: Authorization headers
+        message_ids: Gmail message IDs to fetch
+        metadata_headers: Header names to include (e.g. ["Subject", "From"])
+
+    Returns:
+        Message resources in input order; messages that failed are omitted
+    """
+    query = urlencode(
+        [("format", "metadata")]
+        + [("metadataHeaders", name) for name in metadata_headers]
+        + [("fields", GMAIL_METADATA_FIELDS)]
+    )
+    results = await _gmail_batch(
+        client,
+        headers,
+        [("GET", f"/gmail/v1/users/me/messages/{mid}?{query}") for mid in message_ids],
+    )
+
+    messages = []
+    for message_id, (status, body) in zip(message_ids, results, strict=True):
+        if status == 200 and isinstance(body, dict):
+            messages.append(body)
+        else:
+            logger.warning(f"Gmail metadata fetch for {message_id} failed: {status}")
+    return messages
+
+
+def _message_headers(message: dict[str, Any]) -> dict[str, str]:
+    """Map a message resource's payload headers by name."""
+    return {h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])}
+
+
 # =============================================================================
 # Gmail Tools
 # =============================================================================
@@ -180,42 +351,37 @@ async def gmail_search(query: str, max_results: int = 10) -> dict[str, Any]:
             response = await client.get(
                 f"{GMAIL_API}/users/me/messages",
                 headers=headers,
-                params={"q": query, "maxResults": max_results},
+                params={
+                    "q": query,
+                    "maxResults": max_results,
+                    "fields": "messages/id",
+                },
             )
 
             if response.status_code != 200:
                 return {"success": False, "error": response.text}
 
             data = response.json()
-            messages = data.get("messages", [])
+            message_ids = [msg["id"] for msg in data.get("messages", [])[:max_results]]
+
+            fetched = await _gmail_fetch_metadata(
+                client, headers, message_ids, ["Subject", "From", "To", "Date"]
+            )
 
             results = []
-            for msg in messages[:max_results]:
-                msg_response = await client.get(
-                    f"{GMAIL_API}/users/me/messages/{msg['id']}",
-                    headers=headers,
-                    params={
-                        "format": "metadata",
-                        "metadataHeaders": ["Subject", "From", "To", "Date"],
-                    },
-                )
-                if msg_response.status_code == 200:
-                    msg_data = msg_response.json()
-                    hdrs = {
-                        h["name"]: h["value"]
-                        for h in msg_data.get("payload", {}).get("headers", [])
+            for msg_data in fetched:
+                hdrs = _message_headers(msg_data)
+                results.append(
+                    {
+                        "id": msg_data.get("id"),
+                        "thread_id": msg_data.get("threadId"),
+                        "subject": hdrs.get("Subject", ""),
+                        "from": hdrs.get("From", ""),
+                        "to": hdrs.get("To", ""),
+                        "date": hdrs.get("Date", ""),
+                        "snippet": msg_data.get("snippet", ""),
                     }
-                    results.append(
-                        {
-                            "id": msg["id"],
-                            "thread_id": msg_data.get("threadId"),
-                            "subject": hdrs.get("Subject", ""),
-                            "from": hdrs.get("From", ""),
-                            "to": hdrs.get("To", ""),
-                            "date": hdrs.get("Date", ""),
-                            "snippet": msg_data.get("snippet", ""),
-                        }
-                    )
+                )
 
             return {"success": True, "count": len(results), "messages": results}
 
@@ -243,7 +409,11 @@ async def gmail_list(
         headers = await _get_headers()
 
         # Build params - add UNREAD label if filtering for unread
-        params: dict[str, Any] = {"labelIds": label, "maxResults": max_results}
+        params: dict[str, Any] = {
+            "labelIds": label,
+            "maxResults": max_results,
+            "fields": "messages/id",
+        }
         if unread_only:
             # Add UNREAD to labels filter
             params["labelIds"] = [label, "UNREAD"]
@@ -259,33 +429,24 @@ async def gmail_list(
                 return {"success": False, "error": response.text}
 
             data = response.json()
-            messages = data.get("messages", [])
+            message_ids = [msg["id"] for msg in data.get("messages", [])]
+
+            fetched = await _gmail_fetch_metadata(
+                client, headers, message_ids, ["Subject", "From", "Date"]
+            )
 
             results = []
-            for msg in messages:
-                msg_response = await client.get(
-                    f"{GMAIL_API}/users/me/messages/{msg['id']}",
-                    headers=headers,
-                    params={
-                        "format": "metadata",
-                        "metadataHeaders": ["Subject", "From", "Date"],
-                    },
-                )
-                if msg_response.status_code == 200:
-                    msg_data = msg_response.json()
-                    hdrs = {
-                        h["name"]: h["value"]
-                        for h in msg_data.get("payload", {}).get("headers", [])
+            for msg_data in fetched:
+                hdrs = _message_headers(msg_data)
+                results.append(
+                    {
+                        "id": msg_data.get("id"),
+                        "subject": hdrs.get("Subject", ""),
+                        "from": hdrs.get("From", ""),
+                        "date": hdrs.get("Date", ""),
+                        "snippet": msg_data.get("snippet", ""),
                     }
-                    results.append(
-                        {
-                            "id": msg["id"],
-                            "subject": hdrs.get("Subject", ""),
-                            "from": hdrs.get("From", ""),
-                            "date": hdrs.get("Date", ""),
-                            "snippet": msg_data.get("snippet", ""),
-                        }
-                    )
+                )
 
             return {
                 "success": True,
@@ -355,7 +516,11 @@ async def gmail_batch_trash(query: str, max_results: int = 100) -> dict[str, Any
             response = await client.get(
                 f"{GMAIL_API}/users/me/messages",
                 headers=headers,
-                params={"q": query, "maxResults": max_results},
+                params={
+                    "q": query,
+                    "maxResults": max_results,
+                    "fields": "messages/id",
+                },
             )
 
             if response.status_code != 200:
@@ -371,19 +536,21 @@ async def gmail_batch_trash(query: str, max_results: int = 100) -> dict[str, Any
                     "message": "No messages found matching query",
                 }
 
-            # Trash each message
-            for msg in messages:
-                trash_response = await client.post(
-                    f"{GMAIL_API}/users/me/messages/{msg['id']}/trash",
-                    headers=headers,
-                )
+            # Trash all messages in batched calls
+            statuses = await _gmail_batch(
+                client,
+                headers,
+                [
+                    ("POST", f"/gmail/v1/users/me/messages/{msg['id']}/trash")
+                    for msg in messages
+                ],
+            )
 
-                if trash_response.status_code == 200:
+            for msg, (status, _) in zip(messages, statuses, strict=True):
+                if status == 200:
                     trashed_count += 1
                 else:
-                    errors.append(
-                        {"id": msg["id"], "error": trash_response.status_code}
-                    )
+                    errors.append({"id": msg["id"], "error": status})
 
             result = {
                 "success": True,
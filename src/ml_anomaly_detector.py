@@ -12,6 +12,12 @@ Algorithms Implemented:
 4. Seasonal Decomposition - Detect seasonal pattern deviations
 5. Ensemble Voting - Combine multiple methods for higher accuracy
 
+Batch Mode:
+    When NumPy is installed, detect_all_anomalies screens every metric in one
+    vectorized pass over columnar arrays (z-score, EMA deviation, IQR and
+    rolling stats), then re-runs the scalar ensemble only for metrics that
+    could be anomalous. Output is identical to the scalar path.
+
 Architecture:
     ┌─────────────────────────────────────────────────┐
     │           MLAnomalyDetector                      │
@@ -53,12 +59,21 @@ Example:
 
 import logging
 import math
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import islice
 from typing import Any
 
+from sortedcontainers import SortedList
+
+# NumPy is optional: it enables the vectorized batch path in detect_all_anomalies
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 
 # ============================================================================
 # ENUMS AND CONSTANTS
@@ -162,6 +177,231 @@ class SeasonalPattern:
     hourly_stddev: dict[int, float]  # hour -> expected stddev
 
 
+# ============================================================================
+# STREAMING STATISTICS
+# ============================================================================
+class StreamingWindowStats:
+    """Sliding-window statistics maintained in O(log n) per update.
+
+    Keeps the last ``window_size`` values in a ring buffer, a running
+    mean/variance (Welford, with add/replace updates) and a sorted multiset
+    for order statistics. Percentiles use the same nearest-rank indexing as
+    a full sort of the window, so results match a batch recomputation.
+
+    Floating-point drift in the running variance is bounded by an exact
+    recomputation once every ``window_size`` evictions (amortized O(1)).
+
+    Attributes:
+        window_size: Maximum number of values in the window
+        ema: Exponential moving average (None until two values are seen)
+        ema_stddev: EMA of absolute deviation from the EMA
+    """
+
+    def __init__(self, window_size: int):
+        """Initialize an empty window.
+
+        Args:
+            window_size: Maximum number of values kept in the window
+        """
+        self.window_size = max(1, window_size)
+        self._values: deque[float] = deque(maxlen=self.window_size)
+        self._sorted = SortedList()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
+        self.ema: float | None = None
+        self.ema_stddev = 0.0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def push(self, value: float) -> None:
+        """Add a value, evicting the oldest one when the window is full.
+
+        Args:
+            value: New observation
+        """
+        if len(self._values) == self.window_size:
+            old = self._values[0]
+            self._values.append(value)
+            self._sorted.remove(old)
+            self._sorted.add(value)
+
+            n = len(self._values)
+            old_mean = self._mean
+            self._mean = old_mean + (value - old) / n
+            self._m2 += (value - old) * (value - self._mean + old - old_mean)
+
+            self._evictions += 1
+            if self._evictions >= self.window_size:
+                self._resync()
+        else:
+            self._values.append(value)
+            self._sorted.add(value)
+
+            n = len(self._values)
+            delta = value - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean)
+
+    def _resync(self) -> None:
+        """Recompute mean and M2 exactly to discard accumulated rounding error."""
+        n = len(self._values)
+        self._mean = math.fsum(self._values) / n
+        self._m2 = math.fsum((x - self._mean) ** 2 for x in self._values)
+        self._evictions = 0
+
+    @property
+    def mean(self) -> float:
+        """Mean of the values in the window."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values in the window."""
+        n = len(self._values)
+        if n == 0:
+            return 0.0
+        return max(0.0, self._m2 / n)
+
+    def quantile(self, q: float) -> float:
+        """Return the nearest-rank quantile ``sorted[int(n * q)]``.
+
+        Args:
+            q: Quantile in [0.0, 1.0)
+
+        Returns:
+            The order statistic at rank ``int(n * q)``
+        """
+        return self._sorted[int(len(self._sorted) * q)]
+
+    def median(self) -> float:
+        """Return the median of the window."""
+        n = len(self._sorted)
+        if n % 2:
+            return self._sorted[n // 2]
+        return (self._sorted[n // 2 - 1] + self._sorted[n // 2]) / 2
+
+    def min(self) -> float:
+        """Return the smallest value in the window."""
+        return self._sorted[0]
+
+    def max(self) -> float:
+        """Return the largest value in the window."""
+        return self._sorted[-1]
+
+
+# ============================================================================
+# COLUMNAR BATCH STORE
+# ============================================================================
+ROLLING_WINDOW = 20  # Points used by rolling-stats detection
+ZSCORE_RECENT_WINDOW = 10  # Points used for adaptive z-score stability
+HISTORY_FACTOR = 2  # Raw points kept per metric, in multiples of window_size
+
+# Relative slack for vectorized screening. Screening only selects candidates
+# for the scalar ensemble, so it must never reject a value the scalar path
+# would flag; NumPy sums in a different order than Python, hence the margin.
+_SCREEN_RTOL = 1e-9
+
+
+class ColumnarMetricStore:
+    """Per-metric detection inputs laid out as NumPy columns.
+
+    Each metric owns one row. Rows hold the statistics snapshot fields used
+    by the detectors plus the most recent ``ROLLING_WINDOW`` values
+    (right-aligned, NaN-padded) in a 2-D array. Rows are refreshed lazily:
+    the detector marks metrics dirty on ingest and ``sync`` rewrites only
+    those rows before a batch pass.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Initialize an empty store.
+
+        Args:
+            capacity: Initial number of rows to allocate
+        """
+        self.rows: dict[str, int] = {}
+        self._capacity = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        """Grow all columns to ``capacity`` rows, preserving existing data."""
+
+        def grow(old: "np.ndarray | None", shape: tuple[int, ...], fill: float) -> "np.ndarray":
+            new = np.full(shape, fill, dtype=np.float64)
+            if old is not None:
+                new[: old.shape[0]] = old
+            return new
+
+        existing = self._capacity > 0
+        self.count = grow(self.count if existing else None, (capacity,), 0.0)
+        self.has_stats = grow(self.has_stats if existing else None, (capacity,), 0.0)
+        self.mean = grow(self.mean if existing else None, (capacity,), 0.0)
+        self.stddev = grow(self.stddev if existing else None, (capacity,), 0.0)
+        self.ema = grow(self.ema if existing else None, (capacity,), 0.0)
+        self.ema_stddev = grow(self.ema_stddev if existing else None, (capacity,), 0.0)
+        self.p25 = grow(self.p25 if existing else None, (capacity,), 0.0)
+        self.p75 = grow(self.p75 if existing else None, (capacity,), 0.0)
+        self.recent = grow(self.recent if existing else None, (capacity, ROLLING_WINDOW), np.nan)
+        self._capacity = capacity
+
+    def row_for(self, metric: str) -> int:
+        """Return the row index for a metric, allocating one if needed."""
+        row = self.rows.get(metric)
+        if row is None:
+            row = len(self.rows)
+            if row >= self._capacity:
+                self._allocate(self._capacity * 2)
+            self.rows[metric] = row
+        return row
+
+    def sync(
+        self,
+        metrics: set[str],
+        data: dict[str, deque[DataPoint]],
+        stats: dict[str, MetricStats],
+    ) -> None:
+        """Rewrite rows for the given metrics from the detector state.
+
+        Args:
+            metrics: Metrics whose rows are stale
+            data: Detector ring buffers
+            stats: Detector statistics snapshots
+        """
+        for metric in metrics:
+            row = self.row_for(metric)
+            points = data.get(metric, ())
+            self.count[row] = len(points)
+
+            tail = self.recent[row]
+            tail.fill(np.nan)
+            k = min(len(points), ROLLING_WINDOW)
+            if k:
+                tail[ROLLING_WINDOW - k :] = [p.value for p in islice(reversed(points), k)][::-1]
+
+            metric_stats = stats.get(metric)
+            if metric_stats is None:
+                self.has_stats[row] = 0.0
+                continue
+            self.has_stats[row] = 1.0
+            self.mean[row] = metric_stats.mean
+            self.stddev[row] = metric_stats.stddev
+            self.ema[row] = metric_stats.ema
+            self.ema_stddev[row] = metric_stats.ema_stddev
+            self.p25[row] = metric_stats.p25
+            self.p75[row] = metric_stats.p75
+
+
+def _masked_mean_std(values: "np.ndarray") -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Row-wise count, mean and population stddev ignoring NaN padding."""
+    mask = ~np.isnan(values)
+    n = mask.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    mean = np.where(mask, values, 0.0).sum(axis=1) / safe_n
+    sq = np.where(mask, (values - mean[:, None]) ** 2, 0.0).sum(axis=1)
+    return n, mean, np.sqrt(sq / safe_n)
+
+
 # ============================================================================
 # ML ANOMALY DETECTOR
 # ============================================================================
@@ -201,9 +441,16 @@ class MLAnomalyDetector:
         self.ema_alpha = ema_alpha
         self.enable_seasonal = enable_seasonal
 
-        # Data storage
-        self.data: dict[str, list[DataPoint]] = defaultdict(list)
+        # Data storage (ring buffers of the last HISTORY_FACTOR * window_size
+        # points per metric; statistics use only the last window_size of them,
+        # the longer history feeds seasonal learning)
+        self.data: dict[str, deque[DataPoint]] = defaultdict(self._new_buffer)
         self.stats: dict[str, MetricStats] = {}
+        self._windows: dict[str, StreamingWindowStats] = {}
+
+        # Columnar mirror for vectorized batch detection (synced lazily)
+        self._columnar: ColumnarMetricStore | None = None
+        self._columnar_dirty: set[str] = set()
         self.seasonal_patterns: dict[str, SeasonalPattern] = {}
 
         # Learning state
@@ -239,30 +486,22 @@ class MLAnomalyDetector:
         if timestamp is None:
             timestamp = datetime.now(UTC)
 
-        point = DataPoint(
-            value=value,
-            timestamp=timestamp,
-            metadata=metadata or {},
-        )
-
-        self.data[metric].append(point)
-
-        # Trim to window size
-        if len(self.data[metric]) > self.window_size * 2:
-            self.data[metric] = self.data[metric][-self.window_size :]
-
-        # Update statistics incrementally
+        self._ingest(metric, DataPoint(value=value, timestamp=timestamp, metadata=metadata or {}))
         self._update_stats(metric)
 
     def add_batch(self, metric: str, values: list[tuple[float, datetime]]) -> None:
         """Add multiple data points at once.
 
+        The streaming window and EMA are updated per point; the statistics
+        snapshot is materialized once at the end of the batch.
+
         Args:
             metric: Metric name
             values: List of (value, timestamp) tuples
         """
         for value, timestamp in values:
-            self.add_data_point(metric, value, timestamp)
+            self._ingest(metric, DataPoint(value=value, timestamp=timestamp))
+        self._update_stats(metric)
 
     def clear_data(self, metric: str | None = None) -> None:
         """Clear stored data.
@@ -271,64 +510,99 @@ class MLAnomalyDetector:
             metric: Specific metric to clear, or None for all
         """
         if metric:
-            self.data[metric] = []
-            if metric in self.stats:
-                del self.stats[metric]
+            self.data.pop(metric, None)
+            self.stats.pop(metric, None)
+            self._windows.pop(metric, None)
+            self._columnar_dirty.add(metric)
         else:
             self.data.clear()
             self.stats.clear()
+            self._windows.clear()
+            self._columnar = None
+            self._columnar_dirty.clear()
 
-    def _update_stats(self, metric: str) -> None:
-        """Update statistics for a metric incrementally."""
+    def _new_buffer(self) -> deque[DataPoint]:
+        """Create a ring buffer sized to the current history length."""
+        return deque(maxlen=self.window_size * HISTORY_FACTOR)
+
+    def _ingest(self, metric: str, point: DataPoint) -> None:
+        """Append a point to the ring buffer and update streaming state.
+
+        If ``window_size`` changed since the metric was first seen, the buffer
+        and streaming window are rebuilt from the retained points.
+        """
         points = self.data[metric]
-        if len(points) < 2:
-            return
+        window = self._windows.get(metric)
 
-        values = [p.value for p in points[-self.window_size :]]
+        if points.maxlen != self.window_size * HISTORY_FACTOR:
+            points = deque(points, maxlen=self.window_size * HISTORY_FACTOR)
+            self.data[metric] = points
+            window = None
 
-        # Basic statistics
-        mean = sum(values) / len(values)
-        sorted_vals = sorted(values)
-        n = len(sorted_vals)
+        if window is None:
+            window = StreamingWindowStats(self.window_size)
+            for existing in islice(points, max(0, len(points) - self.window_size), None):
+                window.push(existing.value)
+            self._windows[metric] = window
 
-        if n % 2:
-            median = sorted_vals[n // 2]
-        else:
-            median = (sorted_vals[n // 2 - 1] + sorted_vals[n // 2]) / 2
+        points.append(point)
+        window.push(point.value)
+        self._columnar_dirty.add(metric)
 
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        stddev = math.sqrt(variance) if variance > 0 else 0.001
-
-        # Percentiles
-        p25 = sorted_vals[int(n * 0.25)]
-        p75 = sorted_vals[int(n * 0.75)]
-        p95 = sorted_vals[int(n * 0.95)] if n >= 20 else sorted_vals[-1]
-        p99 = sorted_vals[int(n * 0.99)] if n >= 100 else sorted_vals[-1]
-
-        # EMA calculation
-        if metric in self.stats:
-            old_ema = self.stats[metric].ema
-            old_ema_std = self.stats[metric].ema_stddev
-            new_ema = self.ema_alpha * values[-1] + (1 - self.ema_alpha) * old_ema
-            ema_diff = abs(values[-1] - old_ema)
-            new_ema_std = self.ema_alpha * ema_diff + (1 - self.ema_alpha) * old_ema_std
+        if len(window) < 2:
+            return
+
+        # EMA is seeded from the window on the first update, then smoothed
+        if window.ema is None:
+            window.ema = window.mean
+            window.ema_stddev = self._window_stddev(window)
         else:
-            new_ema = mean
-            new_ema_std = stddev
+            old_ema = window.ema
+            window.ema = self.ema_alpha * point.value + (1 - self.ema_alpha) * old_ema
+            window.ema_stddev = (
+                self.ema_alpha * abs(point.value - old_ema)
+                + (1 - self.ema_alpha) * window.ema_stddev
+            )
+
+    @staticmethod
+    def _window_stddev(window: StreamingWindowStats) -> float:
+        """Return the window stddev, with a small floor for constant data."""
+        variance = window.variance
+        return math.sqrt(variance) if variance > 0 else 0.001
+
+    def _recent_values(self, metric: str, count: int) -> list[float]:
+        """Return the values of the last ``count`` points, oldest first."""
+        points = self.data.get(metric)
+        if not points:
+            return []
+        recent = [p.value for p in islice(reversed(points), count)]
+        recent.reverse()
+        return recent
+
+    def _update_stats(self, metric: str) -> None:
+        """Materialize the statistics snapshot from the streaming window.
+
+        Runs in O(log n): mean and variance are maintained incrementally and
+        percentiles are read from the sorted window by rank.
+        """
+        window = self._windows.get(metric)
+        if window is None or len(window) < 2:
+            return
 
+        n = len(window)
         self.stats[metric] = MetricStats(
-            mean=mean,
-            median=median,
-            stddev=stddev,
-            min_val=min(values),
-            max_val=max(values),
-            p25=p25,
-            p75=p75,
-            p95=p95,
-            p99=p99,
-            count=len(values),
-            ema=new_ema,
-            ema_stddev=new_ema_std,
+            mean=window.mean,
+            median=window.median(),
+            stddev=self._window_stddev(window),
+            min_val=window.min(),
+            max_val=window.max(),
+            p25=window.quantile(0.25),
+            p75=window.quantile(0.75),
+            p95=window.quantile(0.95) if n >= 20 else window.max(),
+            p99=window.quantile(0.99) if n >= 100 else window.max(),
+            count=n,
+            ema=window.ema if window.ema is not None else window.mean,
+            ema_stddev=window.ema_stddev,
         )
 
     # ========================================================================
@@ -358,7 +632,7 @@ class MLAnomalyDetector:
         zscore = abs(value - stats.mean) / stats.stddev
 
         # Adaptive threshold based on data stability
-        recent_values = [p.value for p in self.data[metric][-10:]]
+        recent_values = self._recent_values(metric, 10)
         if len(recent_values) >= 5:
             recent_std = self._calculate_stddev(recent_values)
             stability_factor = min(1.5, stats.stddev / (recent_std + 0.001))
@@ -498,12 +772,11 @@ class MLAnomalyDetector:
         Returns:
             Tuple of (is_anomaly, deviation, reason)
         """
-        points = self.data.get(metric, [])
-        if len(points) < 10:
+        if len(self.data.get(metric, ())) < 10:
             return False, 0.0, "Insufficient rolling data"
 
         # Use last 20 points for rolling stats
-        recent_values = [p.value for p in points[-20:]]
+        recent_values = self._recent_values(metric, 20)
         rolling_mean = sum(recent_values) / len(recent_values)
         rolling_std = self._calculate_stddev(recent_values)
 
@@ -622,35 +895,138 @@ class MLAnomalyDetector:
         )
 
     def detect_all_anomalies(
-        self, current_values: dict[str, float] | None = None
+        self,
+        current_values: dict[str, float] | None = None,
+        vectorized: bool | None = None,
     ) -> list[MLAnomaly]:
         """Detect anomalies across all metrics.
 
         Args:
             current_values: Dict of metric -> current value.
                           If None, uses latest data point for each metric.
+            vectorized: Use the NumPy batch path. None (default) uses it
+                        whenever NumPy is installed.
 
         Returns:
             List of detected anomalies
         """
-        anomalies: list[MLAnomaly] = []
         timestamp = datetime.now(UTC)
 
         if current_values:
-            for metric, value in current_values.items():
-                anomaly = self.detect_anomaly(metric, value, timestamp)
-                if anomaly:
-                    anomalies.append(anomaly)
+            items = [(metric, value, timestamp) for metric, value in current_values.items()]
         else:
-            for metric, points in self.data.items():
-                if points:
-                    latest = points[-1]
-                    anomaly = self.detect_anomaly(metric, latest.value, latest.timestamp)
-                    if anomaly:
-                        anomalies.append(anomaly)
+            items = [
+                (metric, points[-1].value, points[-1].timestamp)
+                for metric, points in self.data.items()
+                if points
+            ]
+
+        if vectorized is None:
+            vectorized = np is not None
+        elif vectorized and np is None:
+            raise RuntimeError("Vectorized detection requires numpy")
+
+        if vectorized and items:
+            items = self._screen_candidates(items)
+
+        anomalies: list[MLAnomaly] = []
+        for metric, value, ts in items:
+            anomaly = self.detect_anomaly(metric, value, ts)
+            if anomaly:
+                anomalies.append(anomaly)
 
         return anomalies
 
+    def _screen_candidates(
+        self, items: list[tuple[str, float, datetime]]
+    ) -> list[tuple[str, float, datetime]]:
+        """Vectorized pre-pass returning only items the ensemble could flag.
+
+        Computes z-score, EMA deviation, IQR and rolling-stats verdicts for all
+        metrics at once over the columnar store. Seasonal verdicts use the
+        scalar detector (a per-hour lookup). Screening is conservative, so the
+        scalar ensemble run on the survivors yields exactly the same anomalies
+        as running it on every item.
+
+        Args:
+            items: (metric, value, timestamp) tuples, in output order
+
+        Returns:
+            The subset of items that need a full scalar evaluation
+        """
+        if self._columnar is None:
+            self._columnar = ColumnarMetricStore(capacity=len(self.data))
+            self._columnar_dirty.update(self.data.keys())
+        store = self._columnar
+        if self._columnar_dirty:
+            store.sync(self._columnar_dirty, self.data, self.stats)
+            self._columnar_dirty.clear()
+
+        known = [i for i, (metric, _, _) in enumerate(items) if metric in store.rows]
+        if not known:
+            return []
+        rows = np.fromiter(
+            (store.rows[items[i][0]] for i in known), dtype=np.intp, count=len(known)
+        )
+        values = np.fromiter((items[i][1] for i in known), dtype=np.float64, count=len(known))
+
+        count = store.count[rows]
+        eligible = count >= self.min_data_points
+        has_stats = store.has_stats[rows] > 0
+        lo = 1.0 - _SCREEN_RTOL
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Adaptive Z-score
+            stddev = store.stddev[rows]
+            zscore = np.abs(values - store.mean[rows]) / stddev
+            recent = store.recent[rows]
+            n10, _, std10 = _masked_mean_std(recent[:, -ZSCORE_RECENT_WINDOW:])
+            stability = np.minimum(1.5, stddev / (std10 + 0.001))
+            z_threshold = np.where(
+                n10 >= 5, self.zscore_threshold * stability, self.zscore_threshold
+            )
+            votes = (has_stats & (stddev >= 0.001 * lo) & (zscore > z_threshold * lo)).astype(
+                np.int8
+            )
+
+            # EMA deviation
+            ema_std = store.ema_stddev[rows]
+            ema_dev = np.abs(values - store.ema[rows]) / ema_std
+            votes += (
+                has_stats & (ema_std >= 0.001 * lo) & (ema_dev > self.ema_deviation_threshold * lo)
+            )
+
+            # IQR outlier
+            p25 = store.p25[rows]
+            p75 = store.p75[rows]
+            iqr = p75 - p25
+            lower = p25 - self.iqr_multiplier * iqr
+            upper = p75 + self.iqr_multiplier * iqr
+            votes += (
+                has_stats
+                & (iqr >= 0.001 * lo)
+                & (
+                    (values < lower + np.abs(lower) * _SCREEN_RTOL)
+                    | (values > upper - np.abs(upper) * _SCREEN_RTOL)
+                )
+            )
+
+            # Rolling statistics
+            _, mean20, std20 = _masked_mean_std(recent)
+            roll_dev = np.abs(values - mean20) / std20
+            votes += (count >= 10) & (std20 >= 0.001 * lo) & (roll_dev > self.zscore_threshold * lo)
+
+        # Seasonal (scalar lookup; also preserves lazy pattern learning)
+        if self.enable_seasonal:
+            for j in np.flatnonzero(eligible):
+                metric, value, ts = items[known[j]]
+                if self._detect_seasonal_anomaly(metric, value, ts)[0]:
+                    votes[j] += 1
+
+        min_votes = max(1, int(2 - self.sensitivity))
+        keep = np.flatnonzero(eligible & (votes >= min_votes))
+        return [items[known[j]] for j in keep]
+
     # ========================================================================
     # LEARNING AND ADAPTATION
     # ========================================================================
@@ -17,11 +17,16 @@ from src.models.activity_log import (
     NightWatchSummary,
 )
 from src.models.agent import Agent
+from src.models.handoff import HandoffRecord, HandoffStateEntry
+from src.models.schedule import AgentSchedule
 from src.models.task import Task
 
 __all__ = [
     "Agent",
     "Task",
+    "AgentSchedule",
+    "HandoffRecord",
+    "HandoffStateEntry",
     "ActionRecord",
     "ActionStats",
     "LearningInsight",
@@ -0,0 +1,56 @@
+"""Handoff models for durable agent state between runs.
+
+This module defines the handoff storage schema using SQLModel. The
+artifact header and its state are stored separately: one row per agent
+for run metadata and one row per top-level state key, so a run only
+rewrites the keys whose values changed.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, LargeBinary, Text
+from sqlmodel import Field, SQLModel
+
+
+class HandoffRecord(SQLModel, table=True):
+    """Latest handoff artifact header for an agent.
+
+    Attributes:
+        agent_id: Agent the artifact belongs to (one row per agent)
+        run_number: Sequential execution count
+        meta: Execution metadata (JSON)
+        summary: Human-readable summary of the run
+        compressed: Whether state has been compressed
+        state_size: Serialized state size in bytes (before compression)
+        created_at: Timestamp of artifact creation
+    """
+
+    __tablename__ = "handoff_artifacts"
+
+    agent_id: int = Field(primary_key=True)
+    run_number: int = Field(default=1)
+    meta: str = Field(default="{}", sa_column=Column(Text, nullable=False))
+    summary: str = Field(default="", sa_column=Column(Text, nullable=False))
+    compressed: bool = Field(default=False)
+    state_size: int = Field(default=0)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class HandoffStateEntry(SQLModel, table=True):
+    """One encoded top-level state key of an agent's handoff artifact.
+
+    Attributes:
+        agent_id: Agent the state belongs to
+        key: Top-level state key
+        value: Encoded value (see src/harness/handoff.py encode_value)
+        size: Serialized value size in bytes (before compression)
+        run_number: Run that last changed this key
+    """
+
+    __tablename__ = "handoff_state"
+
+    agent_id: int = Field(primary_key=True)
+    key: str = Field(primary_key=True, max_length=255)
+    value: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    size: int = Field(default=0)
+    run_number: int = Field(default=1)
@@ -0,0 +1,34 @@
+"""Schedule model for durable agent run times.
+
+This module defines the AgentSchedule entity schema using SQLModel. The
+scheduler persists each agent's next cron fire here so runs missed while
+no replica was up can be detected (and coalesced) on startup, and so
+replicas can claim due runs with one conditional UPDATE instead of a
+lock per agent. The same UPDATE takes a run lease, so an agent never runs
+on two replicas at once.
+"""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class AgentSchedule(SQLModel, table=True):
+    """Next scheduled run of a cron-scheduled agent.
+
+    Attributes:
+        agent_id: Agent the schedule belongs to (one row per agent)
+        next_run_at: Next cron fire time (naive UTC)
+        last_run_at: When a replica last claimed a fire (naive UTC)
+        running_until: Lease expiry while a replica runs the agent (naive
+            UTC); None when idle, and a crashed replica's lease lapses
+        running_by: Worker ID of the scheduler holding the lease
+    """
+
+    __tablename__ = "agent_schedules"
+
+    agent_id: int = Field(primary_key=True)
+    next_run_at: datetime = Field(index=True)
+    last_run_at: datetime | None = Field(default=None)
+    running_until: datetime | None = Field(default=None)
+    running_by: str | None = Field(default=None)
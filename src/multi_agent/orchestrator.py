@@ -16,11 +16,12 @@ Architecture:
     │  ┌──────────────────────────────────────────────────────────┐ │
     │  │                   Task Queue                              │ │
     │  │    [Priority 1] → [Priority 2] → ... → [Priority 5]      │ │
+    │  │    Weighted fair pick across priorities                   │ │
     │  └──────────────────────────────────────────────────────────┘ │
     │                              ↓                                 │
     │  ┌──────────────────────────────────────────────────────────┐ │
-    │  │                   Task Router                             │ │
-    │  │    Domain-based routing to specialized agents             │ │
+    │  │            Task Router + N Dispatch Workers               │ │
+    │  │    Domain-based routing, per-agent/per-domain caps        │ │
     │  └──────────────────────────────────────────────────────────┘ │
     │                              ↓                                 │
     │  ┌─────────────┐ ┌─────────────┐ ┌─────────────────────────┐ │
@@ -48,6 +49,8 @@ Example:
 
 import asyncio
 import logging
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -58,6 +61,7 @@ from src.multi_agent.base import (
     AgentResult,
     AgentTask,
     SpecializedAgent,
+    TaskPriority,
     TaskStatus,
 )
 
@@ -71,15 +75,35 @@ class OrchestratorConfig:
 
     Attributes:
         max_concurrent_tasks: Maximum tasks processing simultaneously
+            (also the number of dispatch workers)
         task_timeout_seconds: Timeout for individual task execution
         enable_safety_guardrails: Whether to use AutonomousController
         message_retention_count: How many messages to retain in history
+        result_retention_count: How many task results to retain
+        max_tasks_per_agent: Maximum tasks running on one agent at once
+        max_tasks_per_domain: Default maximum tasks running in one domain
+        domain_concurrency_limits: Per-domain overrides of max_tasks_per_domain
+        priority_weights: Relative share of dispatches each priority gets
+            while higher priorities are also waiting
     """
 
     max_concurrent_tasks: int = 10
     task_timeout_seconds: int = 300
     enable_safety_guardrails: bool = True
     message_retention_count: int = 1000
+    result_retention_count: int = 1000
+    max_tasks_per_agent: int = 5
+    max_tasks_per_domain: int = 5
+    domain_concurrency_limits: dict[AgentDomain, int] = field(default_factory=dict)
+    priority_weights: dict[TaskPriority, int] = field(
+        default_factory=lambda: {
+            TaskPriority.CRITICAL: 16,
+            TaskPriority.HIGH: 8,
+            TaskPriority.MEDIUM: 4,
+            TaskPriority.LOW: 2,
+            TaskPriority.INFO: 1,
+        }
+    )
 
 
 @dataclass
@@ -101,6 +125,141 @@ class TaskQueueItem:
         return self.task.priority.value < other.task.priority.value
 
 
+class FairTaskQueue:
+    """Task queue with weighted fair scheduling across priorities.
+
+    Each priority level has its own FIFO. Levels are picked by stride
+    scheduling: a level's virtual time advances by 1/weight per dispatch,
+    and the waiting level with the lowest virtual time goes next (ties go
+    to the higher priority). Higher priorities get proportionally more
+    dispatches, and lower priorities are never starved.
+
+    ``get`` takes a selector that decides whether an item can run now
+    (e.g. its agent and domain are below their caps). Items that can't run
+    are skipped without blocking the items behind them.
+    """
+
+    def __init__(self, weights: dict[TaskPriority, int] | None = None):
+        """Initialize queue.
+
+        Args:
+            weights: Relative dispatch share per priority (default 1 each)
+        """
+        self._weights = weights or {}
+        self._levels: dict[TaskPriority, deque[TaskQueueItem]] = {p: deque() for p in TaskPriority}
+        self._vtime: dict[TaskPriority, float] = dict.fromkeys(TaskPriority, 0.0)
+        self._clock = 0.0
+        self._size = 0
+        self._unfinished = 0
+        self._changed = asyncio.Condition()
+
+    def qsize(self) -> int:
+        """Number of queued items."""
+        return self._size
+
+    def empty(self) -> bool:
+        """Whether the queue is empty."""
+        return self._size == 0
+
+    def put_nowait(self, item: TaskQueueItem) -> None:
+        """Queue an item without waking waiters (use ``put`` from async code)."""
+        level = self._levels[item.task.priority]
+        if not level:
+            # A level that was idle rejoins at the current virtual time
+            # instead of cashing in credit from while it was empty
+            self._vtime[item.task.priority] = max(self._vtime[item.task.priority], self._clock)
+        level.append(item)
+        self._size += 1
+        self._unfinished += 1
+
+    async def put(self, item: TaskQueueItem) -> None:
+        """Queue an item and wake waiting workers."""
+        self.put_nowait(item)
+        await self.notify()
+
+    async def notify(self) -> None:
+        """Wake waiting workers to re-check eligibility (e.g. after a cap frees up)."""
+        async with self._changed:
+            self._changed.notify_all()
+
+    def discard(self, task_id: str) -> bool:
+        """Remove a queued task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if the task was queued and removed
+        """
+        for level in self._levels.values():
+            for item in level:
+                if item.task.task_id == task_id:
+                    level.remove(item)
+                    self._size -= 1
+                    self.task_done()
+                    return True
+        return False
+
+    def _pop(
+        self, select: Callable[[TaskQueueItem], Any] | None
+    ) -> tuple[TaskQueueItem | None, Any]:
+        """Pop the next eligible item, or return (None, None)."""
+        order = sorted(
+            (p for p, level in self._levels.items() if level),
+            key=lambda p: (self._vtime[p], p.value),
+        )
+        for priority in order:
+            level = self._levels[priority]
+            for item in level:
+                assignment = select(item) if select else True
+                if not assignment:
+                    continue
+                level.remove(item)
+                self._size -= 1
+                self._clock = self._vtime[priority]
+                self._vtime[priority] += 1.0 / max(1, self._weights.get(priority, 1))
+                return item, assignment
+        return None, None
+
+    def get_nowait(self) -> TaskQueueItem:
+        """Pop the next item without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If no item is queued
+        """
+        item, _ = self._pop(None)
+        if item is None:
+            raise asyncio.QueueEmpty
+        return item
+
+    async def get(self) -> TaskQueueItem:
+        """Wait for and pop the next item in fair priority order."""
+        item, _ = await self.get_eligible(None)
+        return item
+
+    async def get_eligible(
+        self, select: Callable[[TaskQueueItem], Any] | None
+    ) -> tuple[TaskQueueItem, Any]:
+        """Wait for and pop the next item the selector accepts.
+
+        Args:
+            select: Returns a truthy assignment for items that can run now
+
+        Returns:
+            Tuple of (item, assignment)
+        """
+        async with self._changed:
+            while True:
+                item, assignment = self._pop(select)
+                if item is not None:
+                    return item, assignment
+                await self._changed.wait()
+
+    def task_done(self) -> None:
+        """Mark a popped item as processed."""
+        self._unfinished = max(0, self._unfinished - 1)
+
+
 class AgentOrchestrator:
     """Central coordinator for multi-agent system.
 
@@ -134,17 +293,25 @@ class AgentOrchestrator:
         self._domain_agents: dict[AgentDomain, list[str]] = {}
 
         # Task management
-        self._task_queue: asyncio.PriorityQueue[TaskQueueItem] = asyncio.PriorityQueue()
+        self._task_queue = FairTaskQueue(self.config.priority_weights)
         self._active_tasks: dict[str, AgentTask] = {}
-        self._task_results: dict[str, AgentResult] = {}
+        self._task_results: OrderedDict[str, AgentResult] = OrderedDict()
+        self._result_futures: dict[str, asyncio.Future[AgentResult]] = {}
+
+        # Dispatch accounting for concurrency caps
+        self._agent_inflight: Counter[str] = Counter()
+        self._agent_type_inflight: Counter[tuple[str, str]] = Counter()
+        self._domain_inflight: Counter[AgentDomain] = Counter()
 
         # Message bus
-        self._message_history: list[AgentMessage] = []
+        self._message_history: deque[AgentMessage] = deque(
+            maxlen=self.config.message_retention_count
+        )
         self._broadcast_handlers: list[Any] = []
 
         # State
         self.is_running = False
-        self._processing_task: asyncio.Task | None = None
+        self._workers: list[asyncio.Task] = []
         self._semaphore = asyncio.Semaphore(self.config.max_concurrent_tasks)
 
         # Statistics
@@ -213,19 +380,16 @@ class AgentOrchestrator:
         agent_ids = self._domain_agents.get(domain, [])
         return [self._agents[aid] for aid in agent_ids if aid in self._agents]
 
-    def _select_agent_for_task(self, task: AgentTask) -> SpecializedAgent | None:
-        """Select the best agent to handle a task.
+    def _capable_agents(self, task: AgentTask) -> list[SpecializedAgent]:
+        """Get the agents a task may be routed to.
 
-        Selection criteria:
-        1. Domain match
-        2. Capability match
-        3. Lowest current load
+        Domain agents first, then general agents, then any capable agent.
 
         Args:
             task: Task to route
 
         Returns:
-            Selected agent or None
+            Capable agents (empty if none)
         """
         # Get domain-specific agents first
         candidate_agents = self.get_agents_for_domain(task.domain)
@@ -241,12 +405,103 @@ class AgentOrchestrator:
             # Try all agents as fallback
             capable_agents = [a for a in self._agents.values() if a.can_handle(task)]
 
+        return capable_agents
+
+    def _select_agent_for_task(self, task: AgentTask) -> SpecializedAgent | None:
+        """Select the best agent to handle a task.
+
+        Selection criteria:
+        1. Domain match
+        2. Capability match
+        3. Lowest current load
+
+        Args:
+            task: Task to route
+
+        Returns:
+            Selected agent or None
+        """
+        capable_agents = self._capable_agents(task)
         if not capable_agents:
             return None
 
         # Select agent with lowest active task count
         return min(capable_agents, key=lambda a: len(a._active_tasks))
 
+    def _domain_limit(self, domain: AgentDomain) -> int:
+        """Get the concurrency cap for a domain."""
+        return self.config.domain_concurrency_limits.get(domain, self.config.max_tasks_per_domain)
+
+    def _has_capacity(self, agent: SpecializedAgent, task: AgentTask) -> bool:
+        """Check an agent's per-agent and per-capability caps for a task."""
+        if self._agent_inflight[agent.agent_id] >= self.config.max_tasks_per_agent:
+            return False
+        capability = agent.get_capability(task.task_type)
+        if capability:
+            inflight = self._agent_type_inflight[(agent.agent_id, task.task_type)]
+            if inflight >= capability.max_concurrent:
+                return False
+        return True
+
+    def _select_dispatch(self, item: TaskQueueItem) -> SpecializedAgent | bool:
+        """Decide whether a queued task can be dispatched now.
+
+        Args:
+            item: Queued task
+
+        Returns:
+            Agent to run it on, True to dispatch it for failure reporting
+            (no agent can ever handle it), or False to leave it queued
+        """
+        task = item.task
+        if self._domain_inflight[task.domain] >= self._domain_limit(task.domain):
+            return False
+
+        capable_agents = self._capable_agents(task)
+        if not capable_agents:
+            return True
+
+        available = [a for a in capable_agents if self._has_capacity(a, task)]
+        if not available:
+            return False
+        return min(available, key=lambda a: self._agent_inflight[a.agent_id])
+
+    def _reserve(self, agent: SpecializedAgent, task: AgentTask) -> None:
+        """Count a dispatched task against its caps."""
+        self._agent_inflight[agent.agent_id] += 1
+        self._agent_type_inflight[(agent.agent_id, task.task_type)] += 1
+        self._domain_inflight[task.domain] += 1
+
+    def _release(self, agent: SpecializedAgent, task: AgentTask) -> None:
+        """Release a finished task's caps."""
+        for counter, key in (
+            (self._agent_inflight, agent.agent_id),
+            (self._agent_type_inflight, (agent.agent_id, task.task_type)),
+            (self._domain_inflight, task.domain),
+        ):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+
+    def _record_result(self, task_id: str, result: AgentResult) -> None:
+        """Store a result (bounded) and resolve anyone waiting on it."""
+        self._task_results[task_id] = result
+        self._task_results.move_to_end(task_id)
+        while len(self._task_results) > self.config.result_retention_count:
+            self._task_results.popitem(last=False)
+
+        future = self._result_futures.pop(task_id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    def _result_future(self, task_id: str) -> "asyncio.Future[AgentResult]":
+        """Get (or create) the future resolved with a task's result."""
+        future = self._result_futures.get(task_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._result_futures[task_id] = future
+        return future
+
     async def submit_task(self, task: AgentTask) -> str:
         """Submit a task for execution.
 
@@ -264,10 +519,13 @@ class AgentOrchestrator:
             if self.autonomous_controller.kill_switch_enabled:
                 self.logger.warning(f"Task {task.task_id} blocked by kill switch")
                 task.status = TaskStatus.CANCELLED
-                self._task_results[task.task_id] = AgentResult(
-                    task_id=task.task_id,
-                    success=False,
-                    error="Kill switch is active",
+                self._record_result(
+                    task.task_id,
+                    AgentResult(
+                        task_id=task.task_id,
+                        success=False,
+                        error="Kill switch is active",
+                    ),
                 )
                 return task.task_id
 
@@ -291,29 +549,35 @@ class AgentOrchestrator:
         Returns:
             Task result
         """
+        future = self._result_future(task.task_id)
         task_id = await self.submit_task(task)
 
+        if future.done():
+            # Rejected at submission (e.g. kill switch)
+            return future.result()
+
         # If not running continuous loop, execute directly
         if not self.is_running:
+            self._task_queue.discard(task_id)
             return await self._execute_task(task)
 
-        # Wait for result
-        while task_id not in self._task_results:
-            await asyncio.sleep(0.1)
-
-        return self._task_results[task_id]
+        # Shield so a cancelled waiter doesn't cancel the shared future
+        return await asyncio.shield(future)
 
-    async def _execute_task(self, task: AgentTask) -> AgentResult:
+    async def _execute_task(
+        self, task: AgentTask, agent: SpecializedAgent | None = None
+    ) -> AgentResult:
         """Execute a single task.
 
         Args:
             task: Task to execute
+            agent: Agent chosen by the dispatcher (selected here if None)
 
         Returns:
             Execution result
         """
         # Select agent
-        agent = self._select_agent_for_task(task)
+        agent = agent or self._select_agent_for_task(task)
         if not agent:
             result = AgentResult(
                 task_id=task.task_id,
@@ -321,6 +585,7 @@ class AgentOrchestrator:
                 error=f"No agent available for task type: {task.task_type}",
             )
             self._tasks_failed += 1
+            self._record_result(task.task_id, result)
             return result
 
         # Execute with timeout
@@ -358,29 +623,35 @@ class AgentOrchestrator:
         finally:
             del self._active_tasks[task.task_id]
 
-        self._task_results[task.task_id] = result
+        self._record_result(task.task_id, result)
         return result
 
-    async def _process_queue(self) -> None:
-        """Process tasks from the queue continuously."""
-        while self.is_running:
-            try:
-                # Wait for task with timeout
-                item = await asyncio.wait_for(
-                    self._task_queue.get(),
-                    timeout=1.0,
-                )
-                item.attempts += 1
+    async def _process_queue(self, worker_id: int = 0) -> None:
+        """Dispatch worker: run queued tasks until stopped.
 
-                # Execute task
-                await self._execute_task(item.task)
-                self._task_queue.task_done()
+        ``max_concurrent_tasks`` workers run this loop. Each pulls the next
+        task whose domain and agent are below their caps, in fair priority
+        order, and runs it; capacity freed on completion wakes the others.
+
+        Args:
+            worker_id: Worker index (for logging)
+        """
+        while self.is_running:
+            item, assignment = await self._task_queue.get_eligible(self._select_dispatch)
+            agent = assignment if isinstance(assignment, SpecializedAgent) else None
+            item.attempts += 1
 
-            except TimeoutError:
-                # No tasks in queue, continue loop
-                continue
+            if agent is not None:
+                self._reserve(agent, item.task)
+            try:
+                await self._execute_task(item.task, agent)
             except Exception as e:
-                self.logger.error(f"Error processing task: {e}")
+                self.logger.error(f"Worker {worker_id} error processing task: {e}")
+            finally:
+                if agent is not None:
+                    self._release(agent, item.task)
+                self._task_queue.task_done()
+                await self._task_queue.notify()
 
     async def route_message(self, message: AgentMessage) -> AgentMessage | None:
         """Route a message between agents.
@@ -391,12 +662,9 @@ class AgentOrchestrator:
         Returns:
             Response message if any
         """
+        # Bounded: the deque drops the oldest beyond message_retention_count
         self._message_history.append(message)
 
-        # Trim history if needed
-        if len(self._message_history) > self.config.message_retention_count:
-            self._message_history = self._message_history[-self.config.message_retention_count :]
-
         if message.to_agent:
             # Direct message to specific agent
             target = self._agents.get(message.to_agent)
@@ -447,8 +715,11 @@ class AgentOrchestrator:
         for agent in self._agents.values():
             await agent.start()
 
-        # Start processing loop
-        self._processing_task = asyncio.create_task(self._process_queue())
+        # Start dispatch workers
+        self._workers = [
+            asyncio.create_task(self._process_queue(i))
+            for i in range(max(1, self.config.max_concurrent_tasks))
+        ]
 
     async def stop(self) -> None:
         """Stop the orchestrator and all agents."""
@@ -458,13 +729,11 @@ class AgentOrchestrator:
         self.is_running = False
         self.logger.info("Stopping AgentOrchestrator")
 
-        # Cancel processing task
-        if self._processing_task:
-            self._processing_task.cancel()
-            try:
-                await self._processing_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel dispatch workers
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
 
         # Stop all agents
         for agent in self._agents.values():
@@ -496,6 +765,10 @@ class AgentOrchestrator:
             },
             "queue_size": self._task_queue.qsize(),
             "active_tasks": len(self._active_tasks),
+            "workers": len(self._workers),
+            "domain_inflight": {
+                domain.value: count for domain, count in self._domain_inflight.items()
+            },
             "statistics": {
                 "tasks_submitted": self._tasks_submitted,
                 "tasks_completed": self._tasks_completed,
@@ -40,6 +40,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.http_session import ETagCache, PooledHTTPClient
+
 # ============================================================================
 # EXCEPTION CLASSES
 # ============================================================================
@@ -74,7 +76,7 @@ class N8nValidationError(N8nError):
 # ============================================================================
 
 
-class N8nClient:
+class N8nClient(PooledHTTPClient):
     """Client for n8n REST API - workflow automation orchestration.
 
     Implements n8n REST API for programmatic workflow management, enabling
@@ -86,18 +88,36 @@ class N8nClient:
     - Monitor execution status and results
     - Import/export workflows (version control)
     - Exponential backoff retry logic
+    - Pooled keep-alive connections shared by all requests
+    - ETag conditional requests for GETs
+
+    Usage:
+        async with N8nClient(base_url, api_key) as client:
+            await client.list_workflows()
 
     Attributes:
         base_url: n8n instance URL (e.g., "https://n8n.railway.app")
         api_key: n8n API key (X-N8N-API-KEY header)
     """
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        etag_cache_size: int = 256,
+    ):
         """Initialize n8n client.
 
         Args:
             base_url: n8n instance URL (e.g., "https://n8n.railway.app")
             api_key: n8n API key (from GCP Secret Manager: N8N-API)
+            timeout: Request timeout in seconds
+            max_connections: Maximum pooled connections
+            max_keepalive_connections: Maximum idle connections kept open
+            etag_cache_size: Maximum cached GET responses (0 disables ETag caching)
 
         Example:
             >>> client = N8nClient(
@@ -107,6 +127,16 @@ class N8nClient:
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.etag_cache_size = etag_cache_size
+
+        # Shared connection pool (created lazily, closed by aclose())
+        self._client: httpx.AsyncClient | None = None
+
+        # Conditional GET cache (url+params → ETag, body)
+        self._etag_cache = ETagCache(maxsize=etag_cache_size)
 
     def __del__(self):
         """Clear sensitive API key from memory on cleanup."""
@@ -128,6 +158,9 @@ class N8nClient:
     ) -> dict[str, Any]:
         """Make authenticated n8n API request with retry logic.
 
+        Requests share one pooled connection. GETs send If-None-Match for
+        previously seen ETags and return the cached body on 304 Not Modified.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (e.g., "/workflows")
@@ -143,40 +176,57 @@ class N8nClient:
             N8nValidationError: If workflow validation fails (400)
             N8nError: For other API errors
         """
+        url = f"{self.base_url}/api/v1{endpoint}"
+        headers = {
+            "X-N8N-API-KEY": self.api_key,
+            "Content-Type": "application/json",
+        }
+
+        cache_key = None
+        cached = None
+        if method.upper() == "GET" and self._etag_cache.enabled:
+            cache_key = ETagCache.key(url, params)
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method,
-                    url=f"{self.base_url}/api/v1{endpoint}",
-                    json=json_data,
-                    params=params,
-                    headers={
-                        "X-N8N-API-KEY": self.api_key,
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-
-                # Handle authentication errors
-                if response.status_code == 401:
-                    raise N8nAuthenticationError("Invalid n8n API key")
-
-                # Handle not found
-                if response.status_code == 404:
-                    raise N8nNotFoundError(f"Resource not found: {endpoint}")
-
-                # Handle validation errors
-                if response.status_code == 400:
-                    error_detail = response.text
-                    raise N8nValidationError(f"Workflow validation failed: {error_detail}")
-
-                response.raise_for_status()
-
-                # Handle 204 No Content
-                if response.status_code == 204:
-                    return {}
-
-                return response.json()
+            response = await self._get_client().request(
+                method=method,
+                url=url,
+                json=json_data,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
+
+            # Unchanged since the cached ETag
+            if response.status_code == 304 and cached is not None:
+                return self._etag_cache.not_modified(cache_key, cached)
+
+            # Handle authentication errors
+            if response.status_code == 401:
+                raise N8nAuthenticationError("Invalid n8n API key")
+
+            # Handle not found
+            if response.status_code == 404:
+                raise N8nNotFoundError(f"Resource not found: {endpoint}")
+
+            # Handle validation errors
+            if response.status_code == 400:
+                error_detail = response.text
+                raise N8nValidationError(f"Workflow validation failed: {error_detail}")
+
+            response.raise_for_status()
+
+            # Handle 204 No Content
+            if response.status_code == 204:
+                return {}
+
+            body = response.json()
+            if cache_key is not None:
+                self._etag_cache.store(cache_key, response.headers.get("ETag"), body)
+            return body
         except httpx.HTTPStatusError as e:
             raise N8nError(f"n8n API error: HTTP {e.response.status_code}") from e
         except httpx.TimeoutException as e:
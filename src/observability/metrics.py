@@ -7,14 +7,24 @@ Implements the 3-layer metrics taxonomy from Research Paper #08:
 3. Cognitive (success rate, confidence)
 
 Phase 1: Basic metrics without Trust Score integration.
+
+Writes are buffered: record_* calls enqueue metrics and a background task
+flushes them in batches with COPY, so callers don't wait on the database.
 """
 
+import asyncio
+import json
+import logging
 import time
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 
 import asyncpg
 
+logger = logging.getLogger(__name__)
+
+AGENT_METRICS_COLUMNS = ["time", "agent_id", "model_id", "metric_name", "value", "labels"]
+
 
 @dataclass
 class AgentMetric:
@@ -44,22 +54,57 @@ class MetricsCollector:
 
     Based on Research Paper #08, Section 5.2 (Storage & Ingestion).
 
+    With a database pool, metrics go into a bounded write-behind buffer that
+    is flushed with ``copy_records_to_table`` when ``batch_size`` metrics are
+    pending or every ``flush_interval`` seconds. Recording never waits on the
+    database: when ``max_buffer`` metrics are pending (e.g. the database is
+    down), the oldest ones are dropped and counted. Failed batches are
+    re-queued under the same bound. Call ``close()`` on shutdown to flush
+    what is left.
+
     Usage:
         collector = MetricsCollector(db_connection)
         await collector.record_latency("agent-123", 1.5, {"environment": "prod"})
         await collector.record_tokens("agent-123", 500, 200, "claude-sonnet-4.5")
+        await collector.close()
     """
 
-    def __init__(self, db_pool: asyncpg.Pool | None = None):
+    def __init__(
+        self,
+        db_pool: asyncpg.Pool | None = None,
+        buffered: bool = True,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10_000,
+    ):
         """
         Initialize metrics collector.
 
         Args:
             db_pool: AsyncPG connection pool (optional for Phase 1)
+            buffered: Use the write-behind buffer (False = one INSERT per metric)
+            batch_size: Pending metrics that trigger an immediate flush
+            flush_interval: Maximum seconds a metric waits before being flushed
+            max_buffer: Maximum pending metrics; beyond it the oldest are dropped
         """
         self.db_pool = db_pool
         self._in_memory_buffer = []  # Fallback for Phase 1
 
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max(max_buffer, batch_size)
+
+        self._pending: list[AgentMetric] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_needed = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._closed = False
+
+        self.flushed_count = 0
+        self.dropped_count = 0
+        self.flush_errors = 0
+
     async def record_metric(self, metric: AgentMetric):
         """
         Record a single metric.
@@ -68,11 +113,48 @@ class MetricsCollector:
             metric: AgentMetric instance
 
         Returns:
-            True if successfully stored
+            True if successfully stored (or queued for storage)
         """
-        if self.db_pool:
-            # Store in TimescaleDB
-            async with self.db_pool.acquire() as conn:
+        await self.record_metrics([metric])
+        return True
+
+    async def record_metrics(self, metrics: list[AgentMetric]) -> None:
+        """
+        Record several metrics at once.
+
+        Args:
+            metrics: AgentMetric instances to store
+        """
+        if not self.db_pool:
+            # Phase 1 fallback: in-memory buffer
+            self._in_memory_buffer.extend(metrics)
+            # Keep only last 1000 metrics
+            if len(self._in_memory_buffer) > 1000:
+                self._in_memory_buffer = self._in_memory_buffer[-1000:]
+            return
+
+        if not self.buffered or self._closed:
+            await self._write_direct(metrics)
+            return
+
+        self._ensure_flush_task()
+        self._pending.extend(metrics)
+        self._drop_overflow()
+
+        if len(self._pending) >= self.batch_size:
+            self._flush_needed.set()
+
+    def _drop_overflow(self) -> None:
+        """Drop the oldest pending metrics beyond max_buffer."""
+        overflow = len(self._pending) - self.max_buffer
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.dropped_count += overflow
+
+    async def _write_direct(self, metrics: list[AgentMetric]) -> None:
+        """Insert metrics one statement at a time (unbuffered mode)."""
+        async with self.db_pool.acquire() as conn:
+            for metric in metrics:
                 await conn.execute(
                     """
                     INSERT INTO agent_metrics (time, agent_id, model_id, metric_name, value, labels)
@@ -85,14 +167,102 @@ class MetricsCollector:
                     metric.value,
                     metric.labels,
                 )
-            return True
-        else:
-            # Phase 1 fallback: in-memory buffer
-            self._in_memory_buffer.append(metric)
-            # Keep only last 1000 metrics
-            if len(self._in_memory_buffer) > 1000:
-                self._in_memory_buffer = self._in_memory_buffer[-1000:]
-            return True
+
+    async def _write_batch(self, batch: list[AgentMetric]) -> None:
+        """Write a batch of metrics with a single COPY."""
+        records = [
+            (
+                m.timestamp,
+                m.agent_id,
+                m.model_id,
+                m.metric_name,
+                m.value,
+                json.dumps(m.labels),
+            )
+            for m in batch
+        ]
+        async with self.db_pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "agent_metrics", records=records, columns=AGENT_METRICS_COLUMNS
+            )
+
+    def _ensure_flush_task(self) -> None:
+        """Start the background flusher if it isn't running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush on size threshold or every flush_interval seconds until closed."""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._flush_needed.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._flush_needed.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending metrics to the database now.
+
+        Returns:
+            Number of metrics written
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = self._pending[: self.batch_size]
+                del self._pending[: len(batch)]
+                try:
+                    await self._write_batch(batch)
+                except asyncio.CancelledError:
+                    # Put the batch back so a later flush still writes it
+                    self._pending[:0] = batch
+                    raise
+                except Exception as e:
+                    self.flush_errors += 1
+                    logger.error(f"Failed to flush {len(batch)} metrics: {e}")
+                    # Re-queue for the next attempt, keeping memory bounded
+                    self._pending[:0] = batch
+                    self._drop_overflow()
+                    break
+                written += len(batch)
+                self.flushed_count += len(batch)
+        return written
+
+    async def close(self) -> None:
+        """Stop the background flusher and flush remaining metrics.
+
+        The flusher is woken and allowed to finish its current batch rather
+        than cancelled mid-write, so no batch is lost on shutdown.
+        """
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_needed.set()
+            await self._flush_task
+            self._flush_task = None
+        if self.db_pool:
+            await self.flush()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def get_buffer_stats(self) -> dict[str, int]:
+        """
+        Get write-behind buffer counters.
+
+        Returns:
+            Dictionary with pending, flushed, dropped and flush_errors counts
+        """
+        return {
+            "pending": len(self._pending),
+            "flushed": self.flushed_count,
+            "dropped": self.dropped_count,
+            "flush_errors": self.flush_errors,
+        }
 
     async def record_latency(
         self, agent_id: str, latency_seconds: float, labels: dict[str, str] | None = None
@@ -148,43 +318,25 @@ class MetricsCollector:
             >>> )
         """
         timestamp = datetime.now(UTC)
-
-        # Input tokens
-        await self.record_metric(
-            AgentMetric(
-                agent_id=agent_id,
-                model_id=model_id,
-                metric_name="tokens_input",
-                value=float(input_tokens),
-                labels=labels or {},
-                timestamp=timestamp,
-            )
-        )
-
-        # Output tokens
-        await self.record_metric(
-            AgentMetric(
-                agent_id=agent_id,
-                model_id=model_id,
-                metric_name="tokens_output",
-                value=float(output_tokens),
-                labels=labels or {},
-                timestamp=timestamp,
-            )
-        )
+        token_counts = [("tokens_input", input_tokens), ("tokens_output", output_tokens)]
 
         # Reasoning tokens (new in 2026)
         if reasoning_tokens:
-            await self.record_metric(
+            token_counts.append(("tokens_reasoning", reasoning_tokens))
+
+        await self.record_metrics(
+            [
                 AgentMetric(
                     agent_id=agent_id,
                     model_id=model_id,
-                    metric_name="tokens_reasoning",
-                    value=float(reasoning_tokens),
+                    metric_name=metric_name,
+                    value=float(count),
                     labels=labels or {},
                     timestamp=timestamp,
                 )
-            )
+                for metric_name, count in token_counts
+            ]
+        )
 
     async def record_error(
         self,
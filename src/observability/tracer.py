@@ -7,9 +7,17 @@ Usage:
     @instrument_tool("search_knowledge_base")
     async def search(query: str):
         return results
+
+Sampling:
+    TRACE_SAMPLE_RATE (env, default 1.0) sets the head-based trace sampling
+    ratio. Chatty tools can also pass ``sample_rate`` to instrument_tool.
+    Args and results are only serialized for spans that are recording.
 """
 
+import inspect
 import json
+import os
+import random
 import re
 from collections.abc import Callable
 from functools import wraps
@@ -19,11 +27,20 @@ from opentelemetry import trace
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.trace import Status, StatusCode
 
+# Maximum characters of a tool result stored on the span
+RESULT_PREVIEW_LIMIT = 1000
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+
 # Initialize tracer provider
 resource = Resource.create({SERVICE_NAME: "project38-agent"})
-provider = TracerProvider(resource=resource)
+provider = TracerProvider(
+    resource=resource,
+    sampler=ParentBased(TraceIdRatioBased(TRACE_SAMPLE_RATE)),
+)
 
 # For Phase 1: Console exporter (development)
 # For Phase 2: OTLP exporter to Collector
@@ -39,6 +56,20 @@ def get_tracer():
     return tracer
 
 
+# Email, phone (US), SSN and credit card patterns in a single pass.
+# Alternatives are ordered so earlier patterns take precedence.
+_PII_PATTERN = re.compile(
+    r"(?P<EMAIL>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)"
+    r"|(?P<PHONE>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)"
+    r"|(?P<SSN>\b\d{3}-\d{2}-\d{4}\b)"
+    r"|(?P<CC>\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b)"
+)
+
+
+def _redact(match: re.Match) -> str:
+    return f"[{match.lastgroup}_REDACTED]"
+
+
 def sanitize_pii(data: Any) -> Any:
     """Simple PII redaction helper.
 
@@ -57,24 +88,117 @@ def sanitize_pii(data: Any) -> Any:
     if isinstance(data, dict):
         return {k: sanitize_pii(v) for k, v in data.items()}
     elif isinstance(data, str):
-        # Email pattern
-        data = re.sub(
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[EMAIL_REDACTED]", data
-        )
-        # Phone pattern (US)
-        data = re.sub(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b", "[PHONE_REDACTED]", data)
-        # SSN pattern
-        data = re.sub(r"\b\d{3}-\d{2}-\d{4}\b", "[SSN_REDACTED]", data)
-        # Credit card pattern (simple)
-        data = re.sub(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b", "[CC_REDACTED]", data)
-        return data
+        return _PII_PATTERN.sub(_redact, data)
     elif isinstance(data, (list, tuple)):
         return type(data)(sanitize_pii(item) for item in data)
     else:
         return data
 
 
-def instrument_tool(tool_name: str):
+class _PreviewBudgetExceeded(Exception):
+    """Raised internally once a preview has produced enough characters."""
+
+
+def _bounded_repr(value: Any, limit: int) -> str:
+    """Render ``repr(value)`` but stop soon after ``limit`` characters.
+
+    Containers (including subclasses such as OrderedDict) are walked
+    element by element, so a huge result costs O(limit) instead of being
+    rendered in full. Subclasses are rendered like their base type; for
+    built-in containers the output equals ``repr(value)`` whenever that
+    is at most ``limit`` characters.
+    """
+    parts: list[str] = []
+    size = 0
+
+    def emit(text: str) -> None:
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        if size > limit:
+            raise _PreviewBudgetExceeded
+
+    def items(open_: str, values: Any, close: str) -> None:
+        emit(open_)
+        for i, item in enumerate(values):
+            if i:
+                emit(", ")
+            walk(item)
+        emit(close)
+
+    def walk(obj: Any) -> None:
+        if isinstance(obj, dict):
+            emit("{")
+            for i, (key, item) in enumerate(obj.items()):
+                if i:
+                    emit(", ")
+                walk(key)
+                emit(": ")
+                walk(item)
+            emit("}")
+        elif isinstance(obj, list):
+            items("[", obj, "]")
+        elif isinstance(obj, tuple):
+            items("(", obj, ",)" if len(obj) == 1 else ")")
+        elif isinstance(obj, set | frozenset) and obj:
+            prefix = "frozenset(" if isinstance(obj, frozenset) else ""
+            items(prefix + "{", obj, "})" if prefix else "}")
+        elif isinstance(obj, str | bytes):
+            emit(repr(obj[: limit + 1]) if len(obj) > limit else repr(obj))
+        else:
+            emit(repr(obj))
+
+    try:
+        walk(value)
+    except (_PreviewBudgetExceeded, RecursionError):
+        pass
+    return "".join(parts)
+
+
+def result_preview(result: Any, limit: int = RESULT_PREVIEW_LIMIT) -> str:
+    """Bounded-size string preview of a tool result.
+
+    Strings are sliced directly and other scalars and objects use
+    ``str()``. Containers are rendered like ``str()`` but only up to the
+    limit, so large ones aren't fully rendered before truncation.
+
+    Args:
+        result: Tool return value
+        limit: Maximum characters kept before the truncation marker
+
+    Returns:
+        Preview string, suffixed with "... [TRUNCATED]" when cut
+    """
+    if isinstance(result, str):
+        text = result
+    elif isinstance(result, dict | list | tuple | set | frozenset):
+        text = _bounded_repr(result, limit)
+    else:
+        text = str(result)
+    if len(text) > limit:
+        return text[:limit] + "... [TRUNCATED]"
+    return text
+
+
+def _start_attributes(span: trace.Span, tool_name: str, kwargs: dict) -> None:
+    """Set GenAI attributes (v1.37) and sanitized args on a recording span."""
+    span.set_attribute("gen_ai.system", "project38-agent")
+    span.set_attribute("gen_ai.tool.name", tool_name)
+    span.set_attribute("gen_ai.tool.args", json.dumps(sanitize_pii(kwargs), default=str))
+
+
+def _record_success(span: trace.Span, result: Any) -> None:
+    span.set_status(Status(StatusCode.OK))
+    span.set_attribute("gen_ai.tool.response", result_preview(result))
+
+
+def _record_failure(span: trace.Span, e: Exception) -> None:
+    span.set_status(Status(StatusCode.ERROR, str(e)))
+    span.set_attribute("error.type", type(e).__name__)
+    span.set_attribute("error.message", str(e))
+
+
+def instrument_tool(tool_name: str, sample_rate: float = 1.0):
     """Decorator to instrument agent tools with OTel GenAI conventions v1.37+.
 
     Based on Research Paper #08, Code Snippet (Line 180-223).
@@ -86,8 +210,13 @@ def instrument_tool(tool_name: str):
     - Success/failure status
     - Execution time (automatic)
 
+    Attributes are only computed when the span is recording, so calls
+    dropped by the sampler skip PII redaction and serialization.
+
     Args:
         tool_name: Name of the tool (e.g., "search_database", "send_email")
+        sample_rate: Fraction of calls that get a span (for chatty tools).
+            Unsampled calls run the tool without tracing.
 
     Returns:
         Decorated function with tracing
@@ -97,74 +226,57 @@ def instrument_tool(tool_name: str):
         >>> async def query_db(sql: str):
         >>>     return results
     """
+    span_name = f"tool.execution.{tool_name}"
+
+    def sampled() -> bool:
+        return sample_rate >= 1.0 or random.random() < sample_rate  # noqa: S311
 
     def decorator(func: Callable):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Start a span for the tool execution
-            with tracer.start_as_current_span(
-                f"tool.execution.{tool_name}", kind=trace.SpanKind.INTERNAL
-            ) as span:
-                # Set Standard GenAI Attributes (v1.37)
-                span.set_attribute("gen_ai.system", "project38-agent")
-                span.set_attribute("gen_ai.tool.name", tool_name)
+            if not sampled():
+                return await func(*args, **kwargs)
 
-                # Capture Input Arguments (Sanitized)
-                safe_kwargs = sanitize_pii(kwargs)
-                span.set_attribute("gen_ai.tool.args", json.dumps(safe_kwargs))
+            # Start a span for the tool execution
+            with tracer.start_as_current_span(span_name, kind=trace.SpanKind.INTERNAL) as span:
+                recording = span.is_recording()
+                if recording:
+                    _start_attributes(span, tool_name, kwargs)
 
                 try:
                     result = await func(*args, **kwargs)
-
-                    # Capture Success
-                    span.set_status(Status(StatusCode.OK))
-
-                    # Capture Output (truncated to prevent bloat)
-                    result_str = str(result)
-                    if len(result_str) > 1000:
-                        result_str = result_str[:1000] + "... [TRUNCATED]"
-                    span.set_attribute("gen_ai.tool.response", result_str)
-
-                    return result
-
                 except Exception as e:
-                    # Capture Failure
-                    span.set_status(Status(StatusCode.ERROR, str(e)))
-                    span.set_attribute("error.type", type(e).__name__)
-                    span.set_attribute("error.message", str(e))
+                    if recording:
+                        _record_failure(span, e)
                     raise e
 
+                if recording:
+                    _record_success(span, result)
+                return result
+
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             # Same logic for sync functions
-            with tracer.start_as_current_span(
-                f"tool.execution.{tool_name}", kind=trace.SpanKind.INTERNAL
-            ) as span:
-                span.set_attribute("gen_ai.system", "project38-agent")
-                span.set_attribute("gen_ai.tool.name", tool_name)
+            if not sampled():
+                return func(*args, **kwargs)
 
-                safe_kwargs = sanitize_pii(kwargs)
-                span.set_attribute("gen_ai.tool.args", json.dumps(safe_kwargs))
+            with tracer.start_as_current_span(span_name, kind=trace.SpanKind.INTERNAL) as span:
+                recording = span.is_recording()
+                if recording:
+                    _start_attributes(span, tool_name, kwargs)
 
                 try:
                     result = func(*args, **kwargs)
-                    span.set_status(Status(StatusCode.OK))
-
-                    result_str = str(result)
-                    if len(result_str) > 1000:
-                        result_str = result_str[:1000] + "... [TRUNCATED]"
-                    span.set_attribute("gen_ai.tool.response", result_str)
-
-                    return result
                 except Exception as e:
-                    span.set_status(Status(StatusCode.ERROR, str(e)))
-                    span.set_attribute("error.type", type(e).__name__)
-                    span.set_attribute("error.message", str(e))
+                    if recording:
+                        _record_failure(span, e)
                     raise e
 
-        # Return appropriate wrapper based on function type
-        import inspect
+                if recording:
+                    _record_success(span, result)
+                return result
 
+        # Return appropriate wrapper based on function type
         if inspect.iscoroutinefunction(func):
             return async_wrapper
         else:
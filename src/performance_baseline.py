@@ -11,6 +11,8 @@ Features:
 - Trend analysis (improving/degrading/stable)
 - Alert generation for significant deviations
 - P50, P95, P99 percentile calculations
+- Hourly rollups (count, sum, sum of squares, min/max, quantile sketch) so
+  baseline lookups cost O(hours) instead of O(snapshots)
 
 Example:
     >>> from src.performance_baseline import PerformanceBaseline
@@ -19,6 +21,8 @@ Example:
     ...     collection_interval_minutes=5,
     ...     baseline_window_hours=24,
     ... )
+    >>> # Or share the application's asyncpg pool:
+    >>> baseline = PerformanceBaseline(pool=await get_pg_pool())
     >>> await baseline.collect_metrics()
     >>> stats = await baseline.get_baseline_stats()
     >>> print(f"P95 latency: {stats['latency_ms']['p95']:.2f}ms")
@@ -27,8 +31,14 @@ Example:
     ...     print(f"Detected {len(anomalies)} anomalies")
 """
 
+import asyncio
+import json
 import logging
+import math
+import os
 import statistics
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -37,6 +47,205 @@ import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# Read baselines from hourly rollups (sql/performance_baseline_schema.sql).
+# Falls back to raw snapshots while the rollups don't cover the window or
+# if the table is missing.
+USE_ROLLUPS = os.environ.get("PERFORMANCE_BASELINE_ROLLUPS", "true").lower() == "true"
+
+
+# =============================================================================
+# SHARED QUERIES
+# =============================================================================
+
+# All 1-hour agent_metrics aggregates in a single scan (one round trip)
+HOURLY_AGGREGATES_QUERY = """
+SELECT
+    COUNT(DISTINCT agent_id) AS active_agents,
+    COALESCE(AVG(value) FILTER (WHERE metric_name = 'latency_ms'), 0) AS avg_latency_ms,
+    COALESCE(
+        PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY value)
+            FILTER (WHERE metric_name = 'latency_ms'),
+        0
+    ) AS p95_latency_ms,
+    COALESCE(SUM(value) FILTER (WHERE metric_name = 'error_count'), 0) AS errors,
+    COALESCE(
+        SUM(value) FILTER (WHERE metric_name IN ('success_count', 'error_count')), 0
+    ) AS total_requests,
+    COALESCE(
+        SUM(value) FILTER (
+            WHERE metric_name IN ('tokens_input', 'tokens_output', 'tokens_reasoning')
+        ),
+        0
+    )::INT AS total_tokens
+FROM agent_metrics
+WHERE time >= NOW() - INTERVAL '1 hour'
+"""
+
+
+async def fetch_hourly_aggregates(conn: asyncpg.Connection) -> dict[str, Any]:
+    """Fetch all last-hour agent_metrics aggregates in one query.
+
+    Args:
+        conn: asyncpg connection (pooled or standalone)
+
+    Returns:
+        Dictionary with active_agents, avg_latency_ms, p95_latency_ms,
+        errors, total_requests and total_tokens
+    """
+    row = await conn.fetchrow(HOURLY_AGGREGATES_QUERY)
+    return dict(row) if row else {}
+
+
+def sample_system_resources() -> tuple[float, float]:
+    """Sample CPU and memory usage.
+
+    Blocks for ~100ms while psutil measures CPU; call it via
+    ``asyncio.to_thread`` from async code.
+
+    Returns:
+        Tuple of (cpu_percent, memory_percent)
+    """
+    import psutil
+
+    cpu_percent = psutil.cpu_percent(interval=0.1)
+    memory_percent = psutil.virtual_memory().percent
+    return cpu_percent, memory_percent
+
+
+# Snapshot columns with baselines, and the subset used for trend analysis
+BASELINE_METRICS = (
+    "latency_ms",
+    "p95_latency_ms",
+    "error_rate_pct",
+    "throughput_rph",
+    "cpu_percent",
+    "memory_percent",
+)
+TREND_METRICS = ("latency_ms", "error_rate_pct", "throughput_rph", "cpu_percent", "memory_percent")
+
+# Earliest raw snapshot and earliest rollup bucket in a baseline window. The
+# rollups cover the window only if they start no later than the raw data.
+ROLLUP_COVERAGE_QUERY = """
+SELECT
+    (SELECT MIN(timestamp) FROM performance_snapshots WHERE timestamp >= $1) AS first_snapshot,
+    (
+        SELECT MIN(bucket)
+        FROM performance_baseline_rollups
+        WHERE bucket >= date_trunc('hour', $1::timestamptz)
+    ) AS first_bucket
+"""
+
+# Merge one rollup row per (hour, metric) into performance_baseline_rollups.
+# Parameters are parallel arrays so one statement covers every metric.
+UPSERT_ROLLUPS_QUERY = """
+INSERT INTO performance_baseline_rollups AS r
+    (bucket, metric_name, sample_count, value_sum, value_sum_sq,
+     min_value, max_value, sketch)
+SELECT date_trunc('hour', b), m, n, s, sq, lo, hi, sk::jsonb
+FROM unnest(
+    $1::timestamptz[], $2::text[], $3::bigint[], $4::float8[], $5::float8[],
+    $6::float8[], $7::float8[], $8::text[]
+) AS t(b, m, n, s, sq, lo, hi, sk)
+ON CONFLICT (bucket, metric_name) DO UPDATE SET
+    sample_count = r.sample_count + EXCLUDED.sample_count,
+    value_sum = r.value_sum + EXCLUDED.value_sum,
+    value_sum_sq = r.value_sum_sq + EXCLUDED.value_sum_sq,
+    min_value = LEAST(r.min_value, EXCLUDED.min_value),
+    max_value = GREATEST(r.max_value, EXCLUDED.max_value),
+    sketch = (
+        SELECT jsonb_object_agg(key, total)
+        FROM (
+            SELECT key, SUM(value::bigint) AS total
+            FROM (
+                SELECT * FROM jsonb_each_text(r.sketch)
+                UNION ALL
+                SELECT * FROM jsonb_each_text(EXCLUDED.sketch)
+            ) AS bins
+            GROUP BY key
+        ) AS merged
+    )
+"""
+
+
+# =============================================================================
+# QUANTILE SKETCH
+# =============================================================================
+
+
+class QuantileSketch:
+    """Mergeable log-bucketed histogram for approximate quantiles.
+
+    Values are counted in geometric bins of ratio ``gamma``, so any quantile
+    is returned within ``relative_accuracy`` of a true sample value. Bins are
+    keyed by string so the sketch round-trips through JSONB and merges by
+    adding counts per key. Non-positive values share the ``"z"`` bin.
+
+    Attributes:
+        relative_accuracy: Maximum relative error of quantile estimates
+        bins: Mapping of bin key to count
+    """
+
+    ZERO_BIN = "z"
+
+    def __init__(self, relative_accuracy: float = 0.01, bins: dict[str, int] | None = None):
+        """Initialize the sketch.
+
+        Args:
+            relative_accuracy: Relative error bound (0.01 = 1%)
+            bins: Optional existing bin counts to start from
+        """
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: dict[str, int] = dict(bins) if bins else {}
+
+    @property
+    def count(self) -> int:
+        """Total number of values recorded."""
+        return sum(self.bins.values())
+
+    def bin_for(self, value: float) -> str:
+        """Return the bin key for a value."""
+        if value <= 0:
+            return self.ZERO_BIN
+        return str(math.ceil(math.log(value) / self._log_gamma))
+
+    def add(self, value: float) -> None:
+        """Record a value."""
+        key = self.bin_for(value)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def merge(self, bins: dict[str, int]) -> None:
+        """Add another sketch's bin counts into this one."""
+        for key, count in bins.items():
+            self.bins[key] = self.bins.get(key, 0) + int(count)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-th quantile.
+
+        Args:
+            q: Quantile in [0.0, 1.0]
+
+        Returns:
+            Estimated value, or 0.0 for an empty sketch
+        """
+        total = self.count
+        if total == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(q * total))
+        zero = self.bins.get(self.ZERO_BIN, 0)
+        if rank <= zero:
+            return 0.0
+
+        seen = zero
+        for index in sorted(int(k) for k in self.bins if k != self.ZERO_BIN):
+            seen += self.bins[str(index)]
+            if seen >= rank:
+                # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+                return 2 * self._gamma**index / (self._gamma + 1)
+        return 0.0
+
 
 # =============================================================================
 # DATA CLASSES
@@ -215,6 +424,8 @@ class PerformanceBaseline:
 
     Attributes:
         database_url: PostgreSQL connection URL
+        pool: Shared asyncpg pool (pooled mode), or None to connect per call
+        use_rollups: Whether baselines are read from hourly rollups
         baseline_window_hours: Hours of data for baseline calculation
         collection_interval_minutes: Minutes between metric collections
         anomaly_threshold_stddev: Z-score threshold for anomaly detection
@@ -222,29 +433,60 @@ class PerformanceBaseline:
 
     def __init__(
         self,
-        database_url: str,
+        database_url: str | None = None,
         baseline_window_hours: int = 24,
         collection_interval_minutes: int = 5,
         anomaly_threshold_stddev: float = 3.0,
+        pool: asyncpg.Pool | None = None,
+        use_rollups: bool | None = None,
     ):
         """Initialize performance baseline tracker.
 
         Args:
-            database_url: PostgreSQL connection URL
+            database_url: PostgreSQL connection URL (required without pool)
             baseline_window_hours: Hours of historical data for baseline
             collection_interval_minutes: Collection frequency in minutes
             anomaly_threshold_stddev: Z-score threshold for anomalies
+            pool: Shared asyncpg pool; when set, connections are acquired
+                  from it instead of opening a new one per call
+            use_rollups: Maintain and read hourly rollups instead of
+                         rescanning raw snapshots (default: env
+                         PERFORMANCE_BASELINE_ROLLUPS, on unless "false";
+                         disabled automatically if the
+                         performance_baseline_rollups table is missing)
+
+        Raises:
+            ValueError: If neither database_url nor pool is provided
         """
+        if database_url is None and pool is None:
+            raise ValueError("Either database_url or pool is required")
+
         self.database_url = database_url
+        self.pool = pool
         self.baseline_window_hours = baseline_window_hours
         self.collection_interval_minutes = collection_interval_minutes
         self.anomaly_threshold_stddev = anomaly_threshold_stddev
+        self.use_rollups = USE_ROLLUPS if use_rollups is None else use_rollups
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection from the pool, or open a dedicated one."""
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                yield conn
+        else:
+            conn = await asyncpg.connect(self.database_url)
+            try:
+                yield conn
+            finally:
+                await conn.close()
 
     async def collect_metrics(self) -> MetricSnapshot:
         """Collect current metrics snapshot.
 
-        Queries the database for current metrics and system resources,
-        then stores the snapshot in the performance_baselines table.
+        Computes all 1-hour aggregates in a single query while CPU and
+        memory are sampled off the event loop, then stores the snapshot in
+        the performance_snapshots table and folds it into the hourly rollups.
 
         Returns:
             MetricSnapshot with current values
@@ -256,88 +498,30 @@ class PerformanceBaseline:
             >>> snapshot = await baseline.collect_metrics()
             >>> print(f"Latency: {snapshot.latency_ms:.2f}ms")
         """
-        conn = await asyncpg.connect(self.database_url)
-        try:
-            # Get metrics from agent_metrics table
-            now = datetime.now(UTC)
-
-            # Average latency
-            latency_ms = await conn.fetchval(
-                """
-                SELECT COALESCE(AVG(value), 0)
-                FROM agent_metrics
-                WHERE metric_name = 'latency_ms'
-                  AND time >= NOW() - INTERVAL '1 hour'
-                """
-            )
-
-            # P95 latency
-            p95_latency_ms = await conn.fetchval(
-                """
-                SELECT COALESCE(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY value), 0)
-                FROM agent_metrics
-                WHERE metric_name = 'latency_ms'
-                  AND time >= NOW() - INTERVAL '1 hour'
-                """
-            )
-
-            # Error rate
-            errors = await conn.fetchval(
-                """
-                SELECT COALESCE(SUM(value), 0)
-                FROM agent_metrics
-                WHERE metric_name = 'error_count'
-                  AND time >= NOW() - INTERVAL '1 hour'
-                """
-            )
-
-            total_requests = await conn.fetchval(
-                """
-                SELECT COALESCE(SUM(value), 0)
-                FROM agent_metrics
-                WHERE metric_name IN ('success_count', 'error_count')
-                  AND time >= NOW() - INTERVAL '1 hour'
-                """
+        now = datetime.now(UTC)
+
+        async with self._connection() as conn:
+            # CPU sampling blocks for ~100ms, so run it in a worker thread
+            # while the aggregate query is in flight
+            (cpu_percent, memory_percent), agg = await asyncio.gather(
+                asyncio.to_thread(sample_system_resources),
+                fetch_hourly_aggregates(conn),
             )
 
+            errors = agg.get("errors") or 0
+            total_requests = agg.get("total_requests") or 0
             error_rate_pct = (
                 round((errors / total_requests) * 100, 2) if total_requests > 0 else 0.0
             )
 
-            # Active agents
-            active_agents = await conn.fetchval(
-                """
-                SELECT COUNT(DISTINCT agent_id)
-                FROM agent_metrics
-                WHERE time >= NOW() - INTERVAL '1 hour'
-                """
-            )
-
-            # Total tokens
-            total_tokens = await conn.fetchval(
-                """
-                SELECT COALESCE(SUM(value), 0)::INT
-                FROM agent_metrics
-                WHERE metric_name IN ('tokens_input', 'tokens_output', 'tokens_reasoning')
-                  AND time >= NOW() - INTERVAL '1 hour'
-                """
-            )
-
-            # System resources (mock values for now - will be populated via /metrics/system)
-            import psutil
-
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-
             snapshot = MetricSnapshot(
                 timestamp=now,
-                latency_ms=round(latency_ms or 0, 2),
-                p95_latency_ms=round(p95_latency_ms or 0, 2),
+                latency_ms=round(agg.get("avg_latency_ms") or 0, 2),
+                p95_latency_ms=round(agg.get("p95_latency_ms") or 0, 2),
                 error_rate_pct=error_rate_pct,
-                throughput_rph=int(total_requests or 0),
-                active_agents=int(active_agents or 0),
-                total_tokens_1h=int(total_tokens or 0),
+                throughput_rph=int(total_requests),
+                active_agents=int(agg.get("active_agents") or 0),
+                total_tokens_1h=int(agg.get("total_tokens") or 0),
                 cpu_percent=round(cpu_percent, 2),
                 memory_percent=round(memory_percent, 2),
             )
@@ -362,19 +546,22 @@ class PerformanceBaseline:
                 snapshot.memory_percent,
             )
 
-            logger.info(
-                "Metrics snapshot collected",
-                extra={
-                    "latency_ms": snapshot.latency_ms,
-                    "error_rate_pct": snapshot.error_rate_pct,
-                    "throughput_rph": snapshot.throughput_rph,
-                },
-            )
-
-            return snapshot
+            if self.use_rollups:
+                try:
+                    await self._upsert_rollups(conn, [snapshot])
+                except asyncpg.UndefinedTableError:
+                    self._disable_rollups()
+
+        logger.info(
+            "Metrics snapshot collected",
+            extra={
+                "latency_ms": snapshot.latency_ms,
+                "error_rate_pct": snapshot.error_rate_pct,
+                "throughput_rph": snapshot.throughput_rph,
+            },
+        )
 
-        finally:
-            await conn.close()
+        return snapshot
 
     async def get_baseline_stats(
         self,
@@ -382,6 +569,14 @@ class PerformanceBaseline:
     ) -> dict[str, BaselineStats]:
         """Calculate baseline statistics from historical data.
 
+        With rollups enabled, merges one row per metric per hour, so the cost
+        depends on the number of hours in the window rather than the number
+        of snapshots. Percentiles then come from the merged quantile sketch
+        (within 1% relative error) and the window starts at the hour
+        boundary preceding the cutoff. Falls back to scanning raw snapshots
+        when the rollups don't reach back to the oldest snapshot in the
+        window (e.g. before rebuild_rollups() has backfilled them).
+
         Args:
             metric_name: Optional specific metric name (e.g., "latency_ms")
                         If None, calculates baselines for all metrics
@@ -389,14 +584,31 @@ class PerformanceBaseline:
         Returns:
             Dictionary mapping metric names to BaselineStats
 
+        Raises:
+            ValueError: If metric_name is not a known metric
+
         Example:
             >>> stats = await baseline.get_baseline_stats()
             >>> latency_stats = stats["latency_ms"]
             >>> print(f"P95: {latency_stats.p95:.2f}ms")
         """
-        conn = await asyncpg.connect(self.database_url)
-        try:
-            cutoff = datetime.now(UTC) - timedelta(hours=self.baseline_window_hours)
+        if metric_name and metric_name not in BASELINE_METRICS:
+            raise ValueError(f"Unknown metric: {metric_name}")
+
+        metrics_to_process = [metric_name] if metric_name else list(BASELINE_METRICS)
+        cutoff = datetime.now(UTC) - timedelta(hours=self.baseline_window_hours)
+
+        async with self._connection() as conn:
+            if self.use_rollups:
+                try:
+                    if await self._rollups_cover(conn, cutoff):
+                        baselines = await self._baseline_from_rollups(
+                            conn, cutoff, metrics_to_process
+                        )
+                        if baselines:
+                            return baselines
+                except asyncpg.UndefinedTableError:
+                    self._disable_rollups()
 
             # Get historical snapshots
             rows = await conn.fetch(
@@ -409,69 +621,221 @@ class PerformanceBaseline:
                 cutoff,
             )
 
-            if not rows:
-                logger.warning("No historical data for baseline calculation")
-                return {}
+        if not rows:
+            logger.warning("No historical data for baseline calculation")
+            return {}
 
-            # Extract metric columns
-            metric_columns = [
-                "latency_ms",
-                "p95_latency_ms",
-                "error_rate_pct",
-                "throughput_rph",
-                "cpu_percent",
-                "memory_percent",
-            ]
+        baselines = {}
+        now = datetime.now(UTC)
 
-            if metric_name and metric_name not in metric_columns:
-                raise ValueError(f"Unknown metric: {metric_name}")
+        for metric in metrics_to_process:
+            values = [float(row[metric]) for row in rows if row[metric] is not None]
 
-            metrics_to_process = [metric_name] if metric_name else metric_columns
+            if not values:
+                continue
 
-            baselines = {}
-            now = datetime.now(UTC)
+            baselines[metric] = BaselineStats(
+                metric_name=metric,
+                mean=round(statistics.mean(values), 2),
+                median=round(statistics.median(values), 2),
+                p95=round(statistics.quantiles(values, n=20)[18], 2),  # 19th of 20 quantiles
+                p99=(
+                    round(statistics.quantiles(values, n=100)[98], 2)
+                    if len(values) >= 100
+                    else max(values)
+                ),
+                stddev=round(statistics.stdev(values), 2) if len(values) > 1 else 0.0,
+                min_value=round(min(values), 2),
+                max_value=round(max(values), 2),
+                sample_count=len(values),
+                calculated_at=now,
+            )
 
-            for metric in metrics_to_process:
-                values = [float(row[metric]) for row in rows if row[metric] is not None]
+        logger.info(
+            f"Calculated baseline stats for {len(baselines)} metrics",
+            extra={"sample_count": len(rows), "window_hours": self.baseline_window_hours},
+        )
+
+        return baselines
+
+    def _disable_rollups(self) -> None:
+        """Stop using rollups after finding the rollup table missing."""
+        logger.warning(
+            "performance_baseline_rollups table missing; using raw snapshots "
+            "(create it with CREATE_BASELINE_ROLLUPS_TABLE and run rebuild_rollups())"
+        )
+        self.use_rollups = False
+
+    @staticmethod
+    async def _rollups_cover(conn: asyncpg.Connection, cutoff: datetime) -> bool:
+        """Check that the rollups reach back to the oldest snapshot since ``cutoff``."""
+        row = await conn.fetchrow(ROLLUP_COVERAGE_QUERY, cutoff)
+        first_snapshot, first_bucket = row["first_snapshot"], row["first_bucket"]
+        if first_snapshot is None:
+            return first_bucket is not None
+        return first_bucket is not None and first_bucket <= first_snapshot
+
+    async def _baseline_from_rollups(
+        self,
+        conn: asyncpg.Connection,
+        cutoff: datetime,
+        metrics: list[str],
+    ) -> dict[str, BaselineStats]:
+        """Merge hourly rollups since ``cutoff`` into baseline statistics."""
+        rows = await conn.fetch(
+            """
+            SELECT metric_name, sample_count, value_sum, value_sum_sq,
+                   min_value, max_value, sketch
+            FROM performance_baseline_rollups
+            WHERE bucket >= date_trunc('hour', $1::timestamptz)
+              AND metric_name = ANY($2::text[])
+            """,
+            cutoff,
+            metrics,
+        )
+
+        merged: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            agg = merged.setdefault(
+                row["metric_name"],
+                {"n": 0, "sum": 0.0, "sum_sq": 0.0, "min": math.inf, "max": -math.inf},
+            )
+            agg["n"] += row["sample_count"]
+            agg["sum"] += row["value_sum"]
+            agg["sum_sq"] += row["value_sum_sq"]
+            agg["min"] = min(agg["min"], row["min_value"])
+            agg["max"] = max(agg["max"], row["max_value"])
+            sketch = row["sketch"]
+            agg.setdefault("sketch", QuantileSketch()).merge(
+                json.loads(sketch) if isinstance(sketch, str) else sketch
+            )
 
-                if not values:
-                    continue
+        baselines = {}
+        now = datetime.now(UTC)
 
-                baselines[metric] = BaselineStats(
-                    metric_name=metric,
-                    mean=round(statistics.mean(values), 2),
-                    median=round(statistics.median(values), 2),
-                    p95=round(statistics.quantiles(values, n=20)[18], 2),  # 19th of 20 quantiles
-                    p99=(
-                        round(statistics.quantiles(values, n=100)[98], 2)
-                        if len(values) >= 100
-                        else max(values)
-                    ),
-                    stddev=round(statistics.stdev(values), 2) if len(values) > 1 else 0.0,
-                    min_value=round(min(values), 2),
-                    max_value=round(max(values), 2),
-                    sample_count=len(values),
-                    calculated_at=now,
-                )
+        for metric in metrics:
+            agg = merged.get(metric)
+            if not agg or agg["n"] == 0:
+                continue
+
+            n = agg["n"]
+            mean = agg["sum"] / n
+            variance = max(0.0, (agg["sum_sq"] - agg["sum"] * mean) / (n - 1)) if n > 1 else 0.0
+            sketch = agg["sketch"]
+
+            # Sketch estimates are bin midpoints; keep them inside the observed range
+            median, p95, p99 = (
+                min(max(sketch.quantile(q), agg["min"]), agg["max"]) for q in (0.5, 0.95, 0.99)
+            )
+
+            baselines[metric] = BaselineStats(
+                metric_name=metric,
+                mean=round(mean, 2),
+                median=round(median, 2),
+                p95=round(p95, 2),
+                p99=round(p99, 2) if n >= 100 else agg["max"],
+                stddev=round(math.sqrt(variance), 2),
+                min_value=round(agg["min"], 2),
+                max_value=round(agg["max"], 2),
+                sample_count=n,
+                calculated_at=now,
+            )
 
+        if baselines:
             logger.info(
-                f"Calculated baseline stats for {len(baselines)} metrics",
-                extra={"sample_count": len(rows), "window_hours": self.baseline_window_hours},
+                f"Calculated baseline stats for {len(baselines)} metrics from rollups",
+                extra={"buckets": len(rows), "window_hours": self.baseline_window_hours},
+            )
+
+        return baselines
+
+    @staticmethod
+    def _rollup_rows(snapshots: list[MetricSnapshot]) -> list[list[Any]]:
+        """Aggregate snapshots into upsert arrays, one entry per (hour, metric)."""
+        groups: dict[tuple[datetime, str], list[float]] = {}
+        for snapshot in snapshots:
+            bucket = snapshot.timestamp.replace(minute=0, second=0, microsecond=0)
+            for metric in BASELINE_METRICS:
+                groups.setdefault((bucket, metric), []).append(float(getattr(snapshot, metric)))
+
+        columns: list[list[Any]] = [[] for _ in range(8)]
+        for (bucket, metric), values in groups.items():
+            sketch = QuantileSketch()
+            for value in values:
+                sketch.add(value)
+            row = (
+                bucket,
+                metric,
+                len(values),
+                math.fsum(values),
+                math.fsum(v * v for v in values),
+                min(values),
+                max(values),
+                json.dumps(sketch.bins),
             )
+            for column, value in zip(columns, row, strict=True):
+                column.append(value)
+        return columns
+
+    async def _upsert_rollups(
+        self, conn: asyncpg.Connection, snapshots: list[MetricSnapshot]
+    ) -> None:
+        """Fold snapshots into the hourly rollup table in one statement."""
+        await conn.execute(UPSERT_ROLLUPS_QUERY, *self._rollup_rows(snapshots))
+
+    async def rebuild_rollups(self, since: datetime | None = None) -> int:
+        """Recompute hourly rollups from raw snapshots.
+
+        Use once after creating the rollup table, or to repair it. Buckets
+        from the hour containing ``since`` onward are replaced atomically.
 
-            return baselines
+        Args:
+            since: Start of the range to rebuild (default: baseline window)
 
-        finally:
-            await conn.close()
+        Returns:
+            Number of snapshots folded into the rollups
+        """
+        if since is None:
+            since = datetime.now(UTC) - timedelta(hours=self.baseline_window_hours)
+
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT *
+                FROM performance_snapshots
+                WHERE timestamp >= date_trunc('hour', $1::timestamptz)
+                """,
+                since,
+            )
+            snapshots = [
+                MetricSnapshot(**{k: row[k] for k in MetricSnapshot.__dataclass_fields__})
+                for row in rows
+            ]
+
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    DELETE FROM performance_baseline_rollups
+                    WHERE bucket >= date_trunc('hour', $1::timestamptz)
+                    """,
+                    since,
+                )
+                if snapshots:
+                    await self._upsert_rollups(conn, snapshots)
+
+        logger.info(f"Rebuilt baseline rollups from {len(snapshots)} snapshots")
+        return len(snapshots)
 
     async def detect_anomalies(
         self,
         current_snapshot: MetricSnapshot | None = None,
+        baselines: dict[str, BaselineStats] | None = None,
     ) -> list[Anomaly]:
         """Detect anomalies by comparing current metrics to baseline.
 
         Args:
             current_snapshot: Optional current snapshot. If None, collects new snapshot.
+            baselines: Optional precomputed baselines. If None, fetches them.
 
         Returns:
             List of detected anomalies with severity levels
@@ -484,7 +848,8 @@ class PerformanceBaseline:
         if current_snapshot is None:
             current_snapshot = await self.collect_metrics()
 
-        baselines = await self.get_baseline_stats()
+        if baselines is None:
+            baselines = await self.get_baseline_stats()
 
         if not baselines:
             logger.warning("No baseline data available for anomaly detection")
@@ -571,8 +936,7 @@ class PerformanceBaseline:
             >>> for trend in trends:
             ...     print(f"{trend.metric_name}: {trend.trend} ({trend.change_pct:+.1f}%)")
         """
-        conn = await asyncpg.connect(self.database_url)
-        try:
+        async with self._connection() as conn:
             baseline_cutoff = datetime.now(UTC) - timedelta(hours=self.baseline_window_hours)
             recent_cutoff = datetime.now(UTC) - timedelta(hours=recent_window_hours)
 
@@ -675,9 +1039,6 @@ class PerformanceBaseline:
 
             return trends
 
-        finally:
-            await conn.close()
-
     async def get_dashboard_data(self) -> dict[str, Any]:
         """Get comprehensive dashboard data.
 
@@ -695,7 +1056,7 @@ class PerformanceBaseline:
         """
         current_snapshot = await self.collect_metrics()
         baselines = await self.get_baseline_stats()
-        anomalies = await self.detect_anomalies(current_snapshot)
+        anomalies = await self.detect_anomalies(current_snapshot, baselines)
         trends = await self.analyze_trends()
 
         return {
@@ -714,7 +1075,7 @@ class PerformanceBaseline:
 
 
 # =============================================================================
-# DATABASE SCHEMA (for reference - should be created via migration)
+# DATABASE SCHEMA (for reference - applied from sql/performance_baseline_schema.sql)
 # =============================================================================
 
 CREATE_PERFORMANCE_SNAPSHOTS_TABLE = """
@@ -735,3 +1096,17 @@ CREATE TABLE IF NOT EXISTS performance_snapshots (
 CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp
     ON performance_snapshots(timestamp DESC);
 """
+
+CREATE_BASELINE_ROLLUPS_TABLE = """
+CREATE TABLE IF NOT EXISTS performance_baseline_rollups (
+    bucket TIMESTAMPTZ NOT NULL,
+    metric_name TEXT NOT NULL,
+    sample_count BIGINT NOT NULL,
+    value_sum DOUBLE PRECISION NOT NULL,
+    value_sum_sq DOUBLE PRECISION NOT NULL,
+    min_value DOUBLE PRECISION NOT NULL,
+    max_value DOUBLE PRECISION NOT NULL,
+    sketch JSONB NOT NULL,
+    PRIMARY KEY (bucket, metric_name)
+);
+"""
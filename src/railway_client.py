@@ -2,7 +2,9 @@
 
 This module provides async client for Railway's GraphQL API with:
 - Cloudflare workaround (timestamp query param)
-- Exponential backoff retry with Tenacity
+- Long-lived pooled HTTP client (HTTP/2 when h2 is installed)
+- Jittered exponential backoff retry honoring 429 Retry-After
+- Batched GraphQL operations (several operations per POST)
 - State machine monitoring (INITIALIZING → ACTIVE/FAILED)
 - Rollback capability
 - Log retrieval
@@ -29,20 +31,65 @@ Example:
 
 import asyncio
 import logging
+import random
 import time
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+
+try:
+    import h2  # noqa: F401  # enables httpx HTTP/2 support
+except ImportError:
+    h2 = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying (rate limit + transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Errors raised before the request reached Railway; safe to retry mutations
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# GraphQL documents shared by single calls and batched dashboard calls
+DEPLOYMENT_DETAILS_QUERY = """
+query GetDeploymentDetails($id: String!) {
+  deployment(id: $id) {
+    id
+    status
+    staticUrl
+    createdAt
+    updatedAt
+    meta
+  }
+}
+"""
+
+RUNTIME_LOGS_QUERY = """
+query RuntimeLogs($deploymentId: String!, $limit: Int) {
+  runtimeLogs(deploymentId: $deploymentId, limit: $limit) {
+    lines {
+      message
+      timestamp
+      severity
+    }
+  }
+}
+"""
+
+DEPLOYMENT_METRICS_QUERY = """
+query DeploymentMetrics($id: String!) {
+  deploymentMetrics(deploymentId: $id) {
+    cpuUsage
+    memoryUsage
+    requestCount
+    responseTime
+  }
+}
+"""
+
 
 # =============================================================================
 # EXCEPTION CLASSES
@@ -52,7 +99,9 @@ logger = logging.getLogger(__name__)
 class RailwayAPIError(Exception):
     """Base exception for Railway API errors."""
 
-    pass
+    def __init__(self, message: str = "", status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class RailwayAuthenticationError(RailwayAPIError):
@@ -110,30 +159,81 @@ class RailwayClient:
 
     Implements autonomous deployment management with:
     - Cloudflare workaround (timestamp query param)
-    - Exponential backoff retry (transient failures)
+    - One pooled keep-alive HTTP client per instance
+    - Jittered exponential backoff retry (429, 5xx, network errors)
     - State machine monitoring (INITIALIZING → ACTIVE/FAILED)
     - Rollback capability (recovery mechanism)
     - Log retrieval (debugging)
 
-    The client is stateless - state management is handled by orchestrator.
+    The client holds no deployment state - state management is handled by
+    orchestrator. It owns an HTTP connection pool; use ``async with`` or
+    call ``aclose()`` when done.
 
     Example:
-        >>> client = RailwayClient(api_token="your-token")
-        >>> deployment_id = await client.trigger_deployment(
-        ...     environment_id="env-123",
-        ...     service_id="svc-456"
-        ... )
-        >>> status = await client.monitor_deployment_until_stable(deployment_id)
+        >>> async with RailwayClient(api_token="your-token") as client:
+        ...     deployment_id = await client.trigger_deployment(
+        ...         environment_id="env-123",
+        ...         service_id="svc-456"
+        ...     )
+        ...     status = await client.monitor_deployment_until_stable(deployment_id)
     """
 
-    def __init__(self, api_token: str):
+    def __init__(
+        self,
+        api_token: str,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+    ):
         """Initialize Railway API client.
 
         Args:
             api_token: Railway API token from GCP Secret Manager
+            max_retries: Retries after the first attempt for retryable failures
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Maximum delay between attempts in seconds
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle keep-alive connections to retain
         """
         self.api_token = api_token
         self.base_url = "https://backboard.railway.com/graphql/v2"
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30.0,
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._batching_supported = True
+
+    async def __aenter__(self) -> "RailwayClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the long-lived HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=h2 is not None,
+                limits=self._limits,
+                timeout=self.timeout,
+            )
+        return self._client
 
     def __del__(self):
         """Clear sensitive token from memory on cleanup."""
@@ -151,75 +251,242 @@ class RailwayClient:
         """
         return f"{self.base_url}?t={int(time.time())}"
 
-    @retry(
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        stop=stop_after_attempt(5),
-        retry=retry_if_exception_type(httpx.HTTPStatusError),
-        reraise=True,
-    )
-    async def _execute_graphql(
-        self, query: str, variables: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
-        """Execute a GraphQL query with retry logic.
-
-        Retry strategy:
-        - Attempt 1: immediate
-        - Attempt 2: wait 4s
-        - Attempt 3: wait 8s
-        - Attempt 4: wait 16s
-        - Attempt 5: wait 32s
-        - Attempt 6+: wait 60s (max)
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        cap = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, cap)  # noqa: S311
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        """Parse a Retry-After header (seconds or HTTP date), if present."""
+        value = response.headers.get("Retry-After")
+        if not isinstance(value, str):
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+    async def _post(
+        self, payload: dict[str, Any] | list[dict[str, Any]], idempotent: bool = True
+    ) -> Any:
+        """POST a GraphQL payload with retries and return the decoded JSON.
+
+        Retry strategy (up to max_retries extra attempts):
+        - 429: wait Retry-After if given, else backoff
+        - 5xx and network errors/timeouts: jittered exponential backoff
+          (random delay in [0, min(backoff_max, backoff_base * 2**attempt)])
+        - 401 and other 4xx: not retried
+
+        Non-idempotent payloads (mutations) may already have been applied
+        when a 5xx, read timeout or dropped connection comes back, so they
+        are only retried on 429 and on errors raised before the request was
+        sent (connect errors, pool timeouts).
 
         Args:
-            query: GraphQL query or mutation
-            variables: Query variables
+            payload: Single operation dict or list of operations
+            idempotent: Whether the payload is safe to send more than once
 
         Returns:
-            Parsed JSON response data
+            Parsed JSON response body
 
         Raises:
             RailwayAuthenticationError: If token is invalid
-            RailwayRateLimitError: If rate limit exceeded
-            RailwayAPIError: For other API errors
-            httpx.HTTPStatusError: If all retries fail
+            RailwayRateLimitError: If still rate limited after all retries
+            RailwayAPIError: For timeouts and other HTTP errors
         """
-        async with httpx.AsyncClient() as client:
+        client = self._get_client()
+        attempt = 0
+
+        while True:
             try:
                 response = await client.post(
                     self._build_url(),
-                    json={"query": query, "variables": variables or {}},
+                    json=payload,
                     headers={
                         "Authorization": f"Bearer {self.api_token}",
                         "Content-Type": "application/json",
                     },
-                    timeout=30.0,
+                    timeout=self.timeout,
                 )
+            except httpx.TimeoutException as e:
+                retryable = idempotent or isinstance(e, NOT_SENT_ERRORS)
+                if retryable and attempt < self.max_retries:
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(f"Request timed out, retrying in {delay:.1f}s: {e}")
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                logger.error(f"Request timed out: {e}")
+                raise RailwayAPIError(f"Request timed out after {self.timeout:g}s: {e}") from e
+            except httpx.TransportError as e:
+                retryable = idempotent or isinstance(e, NOT_SENT_ERRORS)
+                if retryable and attempt < self.max_retries:
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(f"HTTP transport error, retrying in {delay:.1f}s: {e}")
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                logger.error(f"HTTP error: {e}")
+                raise RailwayAPIError(f"HTTP error: {e}") from e
 
-                # Handle HTTP-level errors
-                if response.status_code == 401:
-                    raise RailwayAuthenticationError("Invalid or expired API token")
-
+            # Handle HTTP-level errors
+            if response.status_code == 401:
+                raise RailwayAuthenticationError("Invalid or expired API token", status_code=401)
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                retryable = idempotent or response.status_code == 429
+                if retryable and attempt < self.max_retries:
+                    retry_after = None
+                    if response.status_code == 429:
+                        retry_after = self._retry_after(response)
+                    if retry_after is not None:
+                        delay = min(retry_after, self.backoff_max)
+                    else:
+                        delay = self._backoff_delay(attempt)
+                    logger.warning(
+                        f"Railway returned {response.status_code}, retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
                 if response.status_code == 429:
-                    raise RailwayRateLimitError("Rate limit exceeded")
+                    raise RailwayRateLimitError("Rate limit exceeded", status_code=429)
 
+            try:
                 response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP error: {e}")
+                raise RailwayAPIError(f"HTTP error: {e}", status_code=response.status_code) from e
 
-                # Handle GraphQL-level errors
-                data = response.json()
-                if "errors" in data:
-                    error_messages = [e.get("message", str(e)) for e in data["errors"]]
-                    logger.error(f"GraphQL errors: {error_messages}")
-                    raise RailwayAPIError(f"GraphQL errors: {error_messages}")
+            return response.json()
 
-                return data.get("data", {})
+    @staticmethod
+    def _unwrap(data: dict[str, Any]) -> dict[str, Any]:
+        """Return the data of a GraphQL response or raise on errors."""
+        if "errors" in data:
+            error_messages = [e.get("message", str(e)) for e in data["errors"]]
+            logger.error(f"GraphQL errors: {error_messages}")
+            raise RailwayAPIError(f"GraphQL errors: {error_messages}")
+        return data.get("data", {})
 
-            except httpx.TimeoutException as e:
-                logger.error(f"Request timed out: {e}")
-                raise RailwayAPIError(f"Request timed out after 30s: {e}") from e
+    @staticmethod
+    def _is_mutation(query: str) -> bool:
+        """Whether a GraphQL document is a mutation (not safe to resend)."""
+        return query.lstrip().startswith("mutation")
 
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP error: {e}")
-                raise RailwayAPIError(f"HTTP error: {e}") from e
+    async def _execute_graphql(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Execute a GraphQL query with retry logic.
+
+        Queries are retried on transient errors; mutations only when the
+        request never reached Railway (see _post).
+
+        Args:
+            query: GraphQL query or mutation
+            variables: Query variables
+
+        Returns:
+            Parsed JSON response data
+
+        Raises:
+            RailwayAuthenticationError: If token is invalid
+            RailwayRateLimitError: If rate limit exceeded after retries
+            RailwayAPIError: For other API errors
+        """
+        data = await self._post(
+            {"query": query, "variables": variables or {}},
+            idempotent=not self._is_mutation(query),
+        )
+        return self._unwrap(data)
+
+    async def execute_batch(
+        self,
+        operations: list[tuple[str, dict[str, Any] | None]],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Execute several GraphQL operations in a single POST.
+
+        Sends a JSON array of operations (GraphQL request batching). If the
+        server explicitly rejects the array (a 4xx status or a single
+        non-array response), batching is disabled for this client and
+        operations run as individual requests over the pooled connection
+        instead. Transient failures (timeouts, 5xx) are raised as-is and
+        leave batching enabled: the batch may already have been applied,
+        so its operations are not re-sent one by one.
+
+        Args:
+            operations: (query, variables) pairs
+            return_exceptions: Put RailwayAPIError instances in the result
+                list for failed operations instead of raising the first one
+
+        Returns:
+            Response data per operation, in order
+
+        Raises:
+            RailwayAPIError: If an operation failed and return_exceptions is
+                False, or the batched request failed transiently
+
+        Example:
+            >>> details, metrics = await client.execute_batch([
+            ...     (DEPLOYMENT_DETAILS_QUERY, {"id": "deploy-123"}),
+            ...     (DEPLOYMENT_METRICS_QUERY, {"id": "deploy-123"}),
+            ... ])
+        """
+        if not operations:
+            return []
+
+        idempotent = not any(self._is_mutation(q) for q, _ in operations)
+        responses: list[Any] | None = None
+        if self._batching_supported and len(operations) > 1:
+            payload = [{"query": q, "variables": v or {}} for q, v in operations]
+            try:
+                body = await self._post(payload, idempotent=idempotent)
+            except (RailwayAuthenticationError, RailwayRateLimitError):
+                raise
+            except RailwayAPIError as e:
+                if e.status_code is None or not 400 <= e.status_code < 500:
+                    raise
+                logger.info(f"Batched GraphQL request rejected, sending individually: {e}")
+                body = None
+            if isinstance(body, list):
+                if len(body) != len(operations):
+                    raise RailwayAPIError(
+                        f"Batched response has {len(body)} results for {len(operations)} operations"
+                    )
+                responses = body
+            else:
+                # 4xx or a single (error) object: the server doesn't batch
+                self._batching_supported = False
+
+        if responses is None:
+            responses = await asyncio.gather(
+                *(
+                    self._post(
+                        {"query": q, "variables": v or {}}, idempotent=not self._is_mutation(q)
+                    )
+                    for q, v in operations
+                ),
+                return_exceptions=return_exceptions,
+            )
+
+        results: list[Any] = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                results.append(response)
+                continue
+            try:
+                results.append(self._unwrap(response))
+            except RailwayAPIError as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
 
     # =========================================================================
     # DEPLOYMENT OPERATIONS
@@ -309,22 +576,12 @@ class RailwayClient:
             >>> details = await client.get_deployment_details("deploy-123")
             >>> print(f"Status: {details.status}, URL: {details.static_url}")
         """
-        query = """
-        query GetDeploymentDetails($id: String!) {
-          deployment(id: $id) {
-            id
-            status
-            staticUrl
-            createdAt
-            updatedAt
-            meta
-          }
-        }
-        """
-
-        result = await self._execute_graphql(query, {"id": deployment_id})
-        deployment = result["deployment"]
+        result = await self._execute_graphql(DEPLOYMENT_DETAILS_QUERY, {"id": deployment_id})
+        return self._parse_deployment(result["deployment"])
 
+    @staticmethod
+    def _parse_deployment(deployment: dict[str, Any]) -> DeploymentStatus:
+        """Build a DeploymentStatus from a GraphQL deployment object."""
         return DeploymentStatus(
             id=deployment["id"],
             status=deployment["status"],
@@ -487,19 +744,9 @@ class RailwayClient:
             >>> for log in logs:
             ...     print(f"{log['timestamp']}: {log['message']}")
         """
-        query = """
-        query RuntimeLogs($deploymentId: String!, $limit: Int) {
-          runtimeLogs(deploymentId: $deploymentId, limit: $limit) {
-            lines {
-              message
-              timestamp
-              severity
-            }
-          }
-        }
-        """
-
-        result = await self._execute_graphql(query, {"deploymentId": deployment_id, "limit": limit})
+        result = await self._execute_graphql(
+            RUNTIME_LOGS_QUERY, {"deploymentId": deployment_id, "limit": limit}
+        )
         return result["runtimeLogs"]["lines"]
 
     async def get_deployment_metrics(self, deployment_id: str) -> dict[str, Any]:
@@ -520,19 +767,43 @@ class RailwayClient:
         Note:
             Metrics availability depends on Railway plan tier.
         """
-        query = """
-        query DeploymentMetrics($id: String!) {
-          deploymentMetrics(deploymentId: $id) {
-            cpuUsage
-            memoryUsage
-            requestCount
-            responseTime
-          }
-        }
+        result = await self._execute_graphql(DEPLOYMENT_METRICS_QUERY, {"id": deployment_id})
+        return result["deploymentMetrics"]
+
+    async def get_deployment_overview(
+        self, deployment_id: str, log_limit: int = 50
+    ) -> dict[str, Any]:
+        """Get details, metrics and recent runtime logs in one batched call.
+
+        Use Case: Monitoring dashboards that show a deployment card.
+
+        Args:
+            deployment_id: Railway deployment ID
+            log_limit: Max number of runtime log lines
+
+        Returns:
+            Dictionary with "details" (DeploymentStatus), "metrics" and
+            "logs"; metrics/logs are None if that operation failed
+
+        Raises:
+            RailwayAPIError: If the deployment details can't be fetched
         """
+        details, metrics, logs = await self.execute_batch(
+            [
+                (DEPLOYMENT_DETAILS_QUERY, {"id": deployment_id}),
+                (DEPLOYMENT_METRICS_QUERY, {"id": deployment_id}),
+                (RUNTIME_LOGS_QUERY, {"deploymentId": deployment_id, "limit": log_limit}),
+            ],
+            return_exceptions=True,
+        )
+        if isinstance(details, BaseException):
+            raise details
 
-        result = await self._execute_graphql(query, {"id": deployment_id})
-        return result["deploymentMetrics"]
+        return {
+            "details": self._parse_deployment(details["deployment"]),
+            "metrics": None if isinstance(metrics, BaseException) else metrics["deploymentMetrics"],
+            "logs": None if isinstance(logs, BaseException) else logs["runtimeLogs"]["lines"],
+        }
 
     # =========================================================================
     # AUTONOMOUS MONITORING
@@ -2,7 +2,6 @@
 
 import logging
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
 from functools import wraps
 from typing import Any
 
@@ -10,6 +9,11 @@ import httpx
 from fastapi import HTTPException, Request
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.google_token_provider import (
+    OAuthClientCredentials,
+    TokenRefreshError,
+    get_token_provider,
+)
 from src.workspace_mcp_bridge.config import WorkspaceConfig
 
 logger = logging.getLogger(__name__)
@@ -21,7 +25,9 @@ OAUTH_REFRESH_TIMEOUT = 30.0
 class GoogleOAuthManager:
     """Manages Google OAuth tokens and authentication.
 
-    Handles token refresh and provides access tokens for API calls.
+    Handles token refresh and provides access tokens for API calls. The
+    token cache is the shared provider for the configured OAuth client, so
+    concurrent tool calls on an expired token trigger a single refresh.
     """
 
     OAUTH_ENDPOINT = "https://oauth2.googleapis.com/token"
@@ -33,8 +39,19 @@ class GoogleOAuthManager:
             config: Workspace configuration with OAuth credentials
         """
         self.config = config
-        self._access_token: str | None = None
-        self._token_expiry: datetime | None = None
+        self._provider = get_token_provider(
+            f"workspace-mcp-bridge:{config.oauth_client_id}",
+            self._load_credentials,
+            token_url=self.OAUTH_ENDPOINT,
+            # Add 5 minute buffer before expiry
+            expiry_buffer=300.0,
+            timeout=OAUTH_REFRESH_TIMEOUT,
+        )
+
+    @property
+    def _access_token(self) -> str | None:
+        """Currently cached access token."""
+        return self._provider.access_token
 
     async def get_access_token(self) -> str:
         """Get a valid access token, refreshing if needed.
@@ -46,7 +63,7 @@ class GoogleOAuthManager:
             HTTPException: If token refresh fails
         """
         if self._is_token_valid():
-            return self._access_token  # type: ignore
+            return await self._provider.get_access_token()
 
         return await self._refresh_token()
 
@@ -56,10 +73,15 @@ class GoogleOAuthManager:
         Returns:
             True if token exists and hasn't expired
         """
-        if not self._access_token or not self._token_expiry:
-            return False
-        # Add 5 minute buffer before expiry
-        return datetime.now(UTC) < (self._token_expiry - timedelta(minutes=5))
+        return self._provider.is_valid()
+
+    def _load_credentials(self) -> OAuthClientCredentials:
+        """Build OAuth client credentials from the configuration."""
+        return OAuthClientCredentials(
+            client_id=self.config.oauth_client_id,
+            client_secret=self.config.oauth_client_secret,
+            refresh_token=self.config.oauth_refresh_token,
+        )
 
     @retry(
         wait=wait_exponential(multiplier=1, min=2, max=30),
@@ -69,6 +91,8 @@ class GoogleOAuthManager:
     async def _refresh_token(self) -> str:
         """Refresh the OAuth access token with retry logic.
 
+        Concurrent callers join the refresh already in progress.
+
         Returns:
             New access token
 
@@ -82,40 +106,18 @@ class GoogleOAuthManager:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=OAUTH_REFRESH_TIMEOUT) as client:
-                response = await client.post(
-                    self.OAUTH_ENDPOINT,
-                    data={
-                        "client_id": self.config.oauth_client_id,
-                        "client_secret": self.config.oauth_client_secret,
-                        "refresh_token": self.config.oauth_refresh_token,
-                        "grant_type": "refresh_token",
-                    },
-                )
-
-                if response.status_code == 429:
-                    logger.warning("OAuth rate limit hit, will retry")
-                    raise httpx.HTTPStatusError(
-                        "Rate limited",
-                        request=response.request,
-                        response=response,
-                    )
-
-                if response.status_code != 200:
-                    # Don't log full response text - may contain sensitive info
-                    logger.error(f"Token refresh failed: HTTP {response.status_code}")
-                    raise HTTPException(
-                        status_code=401,
-                        detail="Failed to refresh OAuth token",
-                    )
-
-                data = response.json()
-                self._access_token = data["access_token"]
-                expires_in = data.get("expires_in", 3600)
-                self._token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
-
-                logger.info("OAuth token refreshed successfully")
-                return self._access_token
+            return await self._provider.get_access_token()
+
+        except TokenRefreshError as e:
+            if e.status_code == 429:
+                logger.warning("OAuth rate limit hit, will retry")
+                raise
+            # Don't log full response text - may contain sensitive info
+            logger.error(f"Token refresh failed: HTTP {e.status_code}")
+            raise HTTPException(
+                status_code=401,
+                detail="Failed to refresh OAuth token",
+            ) from e
 
         except httpx.TimeoutException as e:
             logger.error(f"OAuth token refresh timeout after {OAUTH_REFRESH_TIMEOUT}s")
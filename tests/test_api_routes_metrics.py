@@ -84,7 +84,7 @@ class TestMetricsSummaryEndpoint:
             50000, # total tokens
         ])
 
-        with patch("src.api.routes.metrics.get_session", return_value=mock_conn):
+        with patch("src.api.routes.metrics.get_pg_connection", return_value=mock_conn):
             # Override the dependency
             app = create_test_app()
             app.dependency_overrides[lambda: None] = lambda: mock_conn
@@ -104,6 +104,39 @@ class TestMetricsSummaryEndpoint:
             assert summary.error_rate_pct == 10.0
 
 
+    def test_summary_single_round_trip(self):
+        """Test summary endpoint issues one aggregate query on a pooled connection."""
+        from src.api.database import get_pg_connection
+
+        mock_conn = AsyncMock()
+        mock_conn.fetchrow = AsyncMock(
+            return_value={
+                "active_agents": 5,
+                "avg_latency_ms": 50.0,
+                "p95_latency_ms": 100.0,
+                "errors": 10,
+                "total_requests": 100,
+                "total_tokens": 1_000_000,
+            }
+        )
+
+        async def override_conn():
+            yield mock_conn
+
+        app = create_test_app()
+        app.dependency_overrides[get_pg_connection] = override_conn
+
+        response = TestClient(app).get("/metrics/summary")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["active_agents"] == 5
+        assert data["error_rate_pct"] == 10.0
+        assert data["estimated_cost_1h"] == 9.0
+        assert mock_conn.fetchrow.await_count == 1
+        mock_conn.fetchval.assert_not_called()
+
+
 class TestAgentStatusesEndpoint:
     """Tests for GET /metrics/agents endpoint."""
 
@@ -122,6 +155,145 @@ class TestAgentStatusesEndpoint:
         assert status.error_rate_pct == 5.0
 
 
+    @staticmethod
+    def _agent_rows():
+        now = datetime.now(UTC)
+        return [
+            {
+                "agent_id": f"agent-{i}",
+                "last_seen": now,
+                "errors": 1,
+                "total_requests": 4,
+                "avg_latency_ms": 12.345,
+                "total_tokens": 100 * i,
+            }
+            for i in range(3)
+        ]
+
+    def _get_agents(self, mock_conn, limit=100):
+        from src.api.database import get_pg_connection
+
+        async def override_conn():
+            yield mock_conn
+
+        app = create_test_app()
+        app.dependency_overrides[get_pg_connection] = override_conn
+        return TestClient(app).get(f"/metrics/agents?limit={limit}")
+
+    def test_agents_single_grouped_query(self):
+        """Test that all agents are aggregated in one query, not per agent."""
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(return_value=self._agent_rows())
+
+        with patch("src.api.routes.metrics.USE_STATUS_AGGREGATE", False):
+            response = self._get_agents(mock_conn)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [a["agent_id"] for a in data] == ["agent-0", "agent-1", "agent-2"]
+        assert data[1]["error_rate_pct"] == 25.0
+        assert data[1]["avg_latency_ms"] == 12.35
+        assert data[2]["total_tokens_1h"] == 200
+        assert mock_conn.fetch.await_count == 1
+        mock_conn.fetchval.assert_not_called()
+        query, limit = mock_conn.fetch.await_args.args
+        assert "FROM agent_metrics" in query
+        assert "GROUP BY agent_id" in query
+        assert limit == 100
+
+    def test_agents_uses_continuous_aggregate(self):
+        """Test that the per-minute continuous aggregate is used when it exists."""
+        mock_conn = AsyncMock()
+        mock_conn.fetchval = AsyncMock(return_value=True)
+        mock_conn.fetch = AsyncMock(return_value=self._agent_rows())
+
+        with (
+            patch("src.api.routes.metrics.USE_STATUS_AGGREGATE", True),
+            patch("src.api.routes.metrics._status_aggregate_available", None),
+        ):
+            response = self._get_agents(mock_conn)
+            self._get_agents(mock_conn)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        # Existence is checked once, then cached
+        assert mock_conn.fetchval.await_count == 1
+        query = mock_conn.fetch.await_args.args[0]
+        assert "FROM agent_status_minutely" in query
+        assert "bucket >= NOW() - INTERVAL '1 hour'" in query
+
+    def test_agents_falls_back_without_aggregate(self):
+        """Test that a missing continuous aggregate falls back to raw rows."""
+        import asyncpg
+
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(
+            side_effect=[asyncpg.UndefinedTableError("missing"), self._agent_rows()]
+        )
+
+        with (
+            patch("src.api.routes.metrics.USE_STATUS_AGGREGATE", True),
+            patch("src.api.routes.metrics._status_aggregate_available", True),
+        ):
+            response = self._get_agents(mock_conn)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert "FROM agent_metrics" in mock_conn.fetch.await_args.args[0]
+
+
+class TestBaselineEndpoints:
+    """Tests for the pooled /metrics/baseline endpoints."""
+
+    def test_baseline_uses_shared_pool(self):
+        """Test the baseline dependency builds on the shared asyncpg pool."""
+        import asyncio
+
+        from src.api.routes.metrics import get_performance_baseline
+
+        pool = MagicMock()
+        with patch("src.api.routes.metrics.get_pg_pool", AsyncMock(return_value=pool)):
+            baseline = asyncio.run(get_performance_baseline())
+
+        assert baseline.pool is pool
+
+    def test_baseline_check_sends_alerts(self):
+        """Test a check collects once and alerts on each anomaly."""
+        from src.api.routes.metrics import get_alert_manager, get_performance_baseline
+        from src.performance_baseline import Anomaly
+
+        anomaly = Anomaly(
+            metric_name="latency_ms",
+            timestamp=datetime.now(UTC),
+            current_value=500.0,
+            expected_value=100.0,
+            deviation_stddev=4.0,
+            severity="critical",
+            message="Latency spike",
+        )
+        baseline = MagicMock()
+        baseline.collect_metrics = AsyncMock(return_value=MagicMock(timestamp=datetime.now(UTC)))
+        baseline.get_baseline_stats = AsyncMock(return_value={})
+        baseline.detect_anomalies = AsyncMock(return_value=[anomaly])
+        alert_manager = MagicMock()
+        alert_manager.send_performance_alert = AsyncMock(
+            return_value=MagicMock(success=True, suppressed=False)
+        )
+
+        app = create_test_app()
+        app.dependency_overrides[get_performance_baseline] = lambda: baseline
+        app.dependency_overrides[get_alert_manager] = lambda: alert_manager
+
+        response = TestClient(app).post("/metrics/baseline/check")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["alerts_sent"] == 1
+        assert data["anomalies"][0]["metric_name"] == "latency_ms"
+        baseline.collect_metrics.assert_awaited_once()
+        alert_manager.send_performance_alert.assert_awaited_once_with(anomaly, {})
+
+
 class TestTimeseriesEndpoint:
     """Tests for GET /metrics/timeseries endpoint."""
 
@@ -377,3 +377,38 @@ class TestCollectNowEndpoint:
         assert data["count"] == 1
         assert data["results"][0]["endpoint"] == "test"
         assert data["results"][0]["is_healthy"] is True
+
+
+class TestMemoryCacheEndpoint:
+    """Tests for GET /api/monitoring/memory-cache endpoint."""
+
+    def test_memory_cache_stats(self, client):
+        """Test cache counters are returned from live memory stores."""
+        import sys
+        import types
+
+        store_module = types.ModuleType("src.agents.smart_email.memory.store")
+        store_module.get_cache_stats = lambda: {
+            "stores": 1,
+            "profiles": {"size": 3, "hits": 8, "misses": 2, "evictions": 0, "hit_rate": 0.8},
+            "contexts": {"size": 1, "hits": 1, "misses": 1, "evictions": 0, "hit_rate": 0.5},
+        }
+
+        with patch.dict(sys.modules, {"src.agents.smart_email.memory.store": store_module}):
+            response = client.get("/api/monitoring/memory-cache")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["available"] is True
+        assert data["profiles"]["hits"] == 8
+        assert data["contexts"]["hit_rate"] == 0.5
+
+    def test_memory_cache_unavailable(self, client):
+        """Test endpoint degrades when the memory layer can't be imported."""
+        import sys
+
+        with patch.dict(sys.modules, {"src.agents.smart_email.memory.store": None}):
+            response = client.get("/api/monitoring/memory-cache")
+
+        assert response.status_code == 200
+        assert response.json() == {"available": False, "stores": 0}
@@ -13,8 +13,11 @@ Tests:
 Uses mocking to avoid real PostgreSQL and GCS calls.
 """
 
+import gzip
 import hashlib
 import json
+import subprocess
+import sys
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -148,6 +151,8 @@ def test_backup_manager_database_name_extraction(mock_database_url):
 @pytest.mark.asyncio
 async def test_create_backup_success(backup_manager):
     """Test successful backup creation."""
+    backup_manager.streaming = False
+
     with (
         patch.object(backup_manager, "_run_pg_dump", new_callable=AsyncMock) as mock_pg_dump,
         patch.object(backup_manager, "_compress_file", new_callable=AsyncMock) as mock_compress,
@@ -207,6 +212,8 @@ async def test_create_backup_success(backup_manager):
 @pytest.mark.asyncio
 async def test_create_backup_with_generated_id(backup_manager):
     """Test backup creation with auto-generated ID."""
+    backup_manager.streaming = False
+
     with (
         patch.object(backup_manager, "_run_pg_dump", new_callable=AsyncMock),
         patch.object(backup_manager, "_compress_file", new_callable=AsyncMock),
@@ -238,6 +245,8 @@ async def test_create_backup_with_generated_id(backup_manager):
 @pytest.mark.asyncio
 async def test_create_backup_failure(backup_manager):
     """Test backup creation failure handling."""
+    backup_manager.streaming = False
+
     with (
         patch.object(backup_manager, "_run_pg_dump", new_callable=AsyncMock) as mock_pg_dump,
         patch("src.backup_manager.Path.mkdir"),
@@ -253,6 +262,161 @@ async def test_create_backup_failure(backup_manager):
         assert result.metadata is None
 
 
+# Streaming Backup Tests
+
+# Stand-in for pg_dump: writes ~3MB of SQL to stdout, or fails with exit code 1
+FAKE_PG_DUMP = """
+import random
+import sys
+
+rows = random.Random(0)
+if sys.argv[1] == "fail":
+    sys.stderr.write("connection refused")
+    sys.exit(1)
+for i in range(40000):
+    sys.stdout.write(f"INSERT INTO items VALUES ({i}, '{rows.randbytes(24).hex()}');\\n")
+"""
+
+
+def _expected_dump() -> bytes:
+    return subprocess.run(
+        [sys.executable, "-c", FAKE_PG_DUMP, "ok"], capture_output=True, check=True
+    ).stdout
+
+
+class FakeGCSWriter:
+    """Collects writes like a resumable upload; data is only committed on close."""
+
+    def __init__(self):
+        self.writes: list[bytes] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self.writes.append(data)
+        return len(data)
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def data(self) -> bytes:
+        return b"".join(self.writes)
+
+
+@pytest.fixture
+def streaming_manager(mock_database_url, mock_gcs_bucket, tmp_path):
+    """BackupManager with a fake pg_dump and an in-memory upload."""
+    manager = BackupManager(
+        database_url=mock_database_url,
+        gcs_bucket=mock_gcs_bucket,
+        temp_dir=str(tmp_path),
+        chunk_size=256 * 1024,
+    )
+    manager.writer = FakeGCSWriter()
+    manager._pg_dump_command = Mock(return_value=[sys.executable, "-c", FAKE_PG_DUMP, "ok"])
+    manager._open_gcs_writer = Mock(return_value=manager.writer)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_stream_backup_gzip(streaming_manager, tmp_path):
+    """Test pg_dump output is gzipped, hashed and uploaded in chunks."""
+    size_bytes, checksum = await streaming_manager._stream_backup("gs://b/backups/x.sql.gz")
+
+    writer = streaming_manager.writer
+    assert writer.closed
+    assert gzip.decompress(writer.data) == _expected_dump()
+    assert size_bytes == len(writer.data)
+    assert checksum == hashlib.sha256(writer.data).hexdigest()
+    # Uploaded in chunk_size pieces, not as one buffer
+    assert len(writer.writes) > 1
+    assert all(len(chunk) >= 256 * 1024 for chunk in writer.writes[:-1])
+    # Nothing written to the temp directory
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_backup_zstd(mock_database_url, streaming_manager):
+    """Test zstd compression produces a decodable stream."""
+    zstandard = pytest.importorskip("zstandard")
+    streaming_manager.compression = "zstd"
+
+    size_bytes, _ = await streaming_manager._stream_backup("gs://b/backups/x.sql.zst")
+
+    data = streaming_manager.writer.data
+    assert size_bytes == len(data)
+    reader = zstandard.ZstdDecompressor().stream_reader(data)
+    assert reader.read() == _expected_dump()
+
+
+@pytest.mark.asyncio
+async def test_stream_backup_pg_dump_failure(streaming_manager):
+    """Test a failed pg_dump raises and leaves the upload unfinalized."""
+    streaming_manager._pg_dump_command.return_value = [
+        sys.executable,
+        "-c",
+        FAKE_PG_DUMP,
+        "fail",
+    ]
+
+    with pytest.raises(RuntimeError, match="pg_dump failed: connection refused"):
+        await streaming_manager._stream_backup("gs://b/backups/x.sql.gz")
+
+    assert not streaming_manager.writer.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_backup_upload_failure(streaming_manager):
+    """Test an upload error stops pg_dump and propagates."""
+    streaming_manager.writer.write = Mock(side_effect=OSError("upload failed"))
+
+    with pytest.raises(OSError, match="upload failed"):
+        await streaming_manager._stream_backup("gs://b/backups/x.sql.gz")
+
+    assert not streaming_manager.writer.closed
+
+
+@pytest.mark.asyncio
+async def test_create_backup_streaming(streaming_manager):
+    """Test create_backup streams by default and records the compression."""
+    pytest.importorskip("zstandard")
+    streaming_manager.compression = "zstd"
+
+    with (
+        patch.object(
+            streaming_manager, "_get_pg_dump_version", new_callable=AsyncMock
+        ) as mock_version,
+        patch.object(
+            streaming_manager, "_verify_gcs_upload", new_callable=AsyncMock
+        ) as mock_verify,
+        patch.object(streaming_manager, "_save_metadata", new_callable=AsyncMock),
+        patch.object(streaming_manager, "_run_pg_dump", new_callable=AsyncMock) as mock_pg_dump,
+    ):
+        mock_version.return_value = "PostgreSQL 15.3"
+        mock_verify.return_value = True
+
+        result = await streaming_manager.create_backup(backup_id="test-backup-001")
+
+    assert result.success is True
+    assert result.metadata.compression == "zstd"
+    assert result.metadata.gcs_path == "gs://test-backups-bucket/backups/test-backup-001.sql.zst"
+    assert result.metadata.size_bytes == len(streaming_manager.writer.data)
+    streaming_manager._open_gcs_writer.assert_called_once_with(result.metadata.gcs_path)
+    mock_pg_dump.assert_not_called()
+
+
+def test_backup_manager_invalid_streaming_options(mock_database_url):
+    """Test unsupported compression and chunk sizes are rejected."""
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        BackupManager(database_url=mock_database_url, gcs_bucket="b", compression="bz2")
+    with pytest.raises(ValueError, match="requires zstandard and streaming"):
+        BackupManager(
+            database_url=mock_database_url, gcs_bucket="b", compression="zstd", streaming=False
+        )
+    with pytest.raises(ValueError, match="multiple of 256 KiB"):
+        BackupManager(database_url=mock_database_url, gcs_bucket="b", chunk_size=1000)
+
+
 # Helper Method Tests
 
 
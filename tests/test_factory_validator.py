@@ -11,6 +11,16 @@ pytest.importorskip("anthropic")
 pytest.importorskip("jinja2")
 
 
+@pytest.fixture(autouse=True)
+def clear_code_cache():
+    """Validation results are cached by code hash; start each test cold."""
+    from src.harness.code_cache import get_code_cache
+
+    get_code_cache().clear()
+    yield
+    get_code_cache().clear()
+
+
 class TestValidationError:
     """Tests for ValidationError exception."""
 
@@ -338,6 +348,79 @@ def hello():
         assert any("E901" in e or "E9" in e for e in result["errors"])
 
 
+class TestValidationCache:
+    """Tests for validate_code result caching."""
+
+    CODE = '''"""Module."""
+
+
+def hello() -> str:
+    """Say hello."""
+    return "hello"
+'''
+
+    @pytest.mark.asyncio
+    async def test_unchanged_code_skips_checks(self):
+        """Re-validating the same code should not run the tools again."""
+        from src.factory.validator import validate_code
+
+        passed = {"passed": True, "messages": []}
+        with patch("src.factory.validator._run_ruff_format", return_value=passed) as mock_format:
+            with patch("src.factory.validator._run_ruff_lint", return_value=passed):
+                with patch("src.factory.validator._run_pydocstyle", return_value=passed):
+                    first = await validate_code(self.CODE)
+                    second = await validate_code(self.CODE)
+
+        assert mock_format.call_count == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_code_and_strict(self):
+        """Changed code or strict flag should validate again."""
+        from src.factory.validator import validate_code
+
+        passed = {"passed": True, "messages": []}
+        with patch("src.factory.validator._run_ruff_format", return_value=passed) as mock_format:
+            with patch("src.factory.validator._run_ruff_lint", return_value=passed):
+                with patch("src.factory.validator._run_pydocstyle", return_value=passed):
+                    await validate_code(self.CODE)
+                    await validate_code(self.CODE, strict=False)
+                    await validate_code(self.CODE + "\n# changed\n")
+
+        assert mock_format.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_a_copy(self):
+        """Mutating a returned result must not change the cached one."""
+        from src.factory.validator import validate_code
+
+        warn = {"passed": False, "messages": ["format warning"]}
+        passed = {"passed": True, "messages": []}
+        with patch("src.factory.validator._run_ruff_format", return_value=warn):
+            with patch("src.factory.validator._run_ruff_lint", return_value=passed):
+                with patch("src.factory.validator._run_pydocstyle", return_value=passed):
+                    first = await validate_code(self.CODE)
+                    first["warnings"].append("mutated")
+                    second = await validate_code(self.CODE)
+
+        assert second["warnings"] == ["format warning"]
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_not_cached(self):
+        """Results affected by a tool timeout should be re-checked."""
+        from src.factory.validator import validate_code
+
+        timed_out = {"passed": False, "messages": ["ruff format check timed out"]}
+        passed = {"passed": True, "messages": []}
+        with patch("src.factory.validator._run_ruff_format", return_value=timed_out) as mock_format:
+            with patch("src.factory.validator._run_ruff_lint", return_value=passed):
+                with patch("src.factory.validator._run_pydocstyle", return_value=passed):
+                    await validate_code(self.CODE)
+                    await validate_code(self.CODE)
+
+        assert mock_format.call_count == 2
+
+
 class TestFormatValidationReport:
     """Tests for format_validation_report function."""
 
@@ -145,9 +145,7 @@ class TestGetInstallationToken:
             mock_response.raise_for_status = Mock()
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
                 token = await github_client.get_installation_token()
 
@@ -184,9 +182,7 @@ class TestGetInstallationToken:
             mock_response.raise_for_status = Mock()
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
                 token = await github_client.get_installation_token()
 
@@ -198,16 +194,14 @@ class TestGetInstallationToken:
         with patch.object(github_client, "generate_jwt") as mock_jwt:
             mock_jwt.return_value = "fake.jwt.token"
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
             mock_response.status_code = 401
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Unauthorized", request=Mock(), response=mock_response
             )
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
                 with pytest.raises(GitHubAppAuthenticationError):
                     await github_client.get_installation_token()
@@ -229,13 +223,12 @@ class TestApiRequest:
 
             mock_response = Mock()
             mock_response.status_code = 200
+            mock_response.headers = httpx.Headers()
             mock_response.json.return_value = {"data": "test_data"}
             mock_response.raise_for_status = Mock()
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
                 result = await github_client._api_request("GET", "/test/endpoint")
 
@@ -249,12 +242,13 @@ class TestApiRequest:
 
             mock_response = Mock()
             mock_response.status_code = 201
+            mock_response.headers = httpx.Headers()
             mock_response.json.return_value = {"created": True}
             mock_response.raise_for_status = Mock()
 
             with patch("httpx.AsyncClient") as mock_client:
                 mock_request = AsyncMock(return_value=mock_response)
-                mock_client.return_value.__aenter__.return_value.request = mock_request
+                mock_client.return_value.request = mock_request
 
                 result = await github_client._api_request(
                     "POST", "/test/endpoint", json_data={"key": "value"}
@@ -272,12 +266,13 @@ class TestApiRequest:
 
             mock_response = Mock()
             mock_response.status_code = 200
+            mock_response.headers = httpx.Headers()
             mock_response.json.return_value = {"results": []}
             mock_response.raise_for_status = Mock()
 
             with patch("httpx.AsyncClient") as mock_client:
                 mock_request = AsyncMock(return_value=mock_response)
-                mock_client.return_value.__aenter__.return_value.request = mock_request
+                mock_client.return_value.request = mock_request
 
                 result = await github_client._api_request(
                     "GET", "/test/endpoint", params={"page": 1, "per_page": 10}
@@ -293,14 +288,13 @@ class TestApiRequest:
         with patch.object(github_client, "get_installation_token") as mock_get_token:
             mock_get_token.return_value = "test_token"
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
             mock_response.status_code = 204
+            mock_response.headers = httpx.Headers()
             mock_response.raise_for_status = Mock()
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
                 result = await github_client._api_request("DELETE", "/test/endpoint")
 
@@ -312,14 +306,12 @@ class TestApiRequest:
         with patch.object(github_client, "get_installation_token") as mock_get_token:
             mock_get_token.return_value = "test_token"
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
             mock_response.status_code = 429
             mock_response.headers = {"X-RateLimit-Reset": "1234567890"}
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
                 with pytest.raises(GitHubAppRateLimitError):
                     await github_client._api_request("GET", "/test/endpoint")
@@ -330,13 +322,12 @@ class TestApiRequest:
         with patch.object(github_client, "get_installation_token") as mock_get_token:
             mock_get_token.return_value = "test_token"
 
-            mock_response = AsyncMock()
+            mock_response = Mock()
             mock_response.status_code = 404
+            mock_response.headers = httpx.Headers()
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                    return_value=mock_response
-                )
+                mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
                 with pytest.raises(GitHubAppNotFoundError):
                     await github_client._api_request("GET", "/test/endpoint")
@@ -661,3 +652,173 @@ class TestRepositoryOperations:
                     "client_payload": {"environment": "production"},
                 },
             )
+
+
+# ============================================================================
+# CONNECTION POOL, ETAG & RATE LIMIT TESTS
+# ============================================================================
+
+
+class TestPooledSession:
+    """Tests for the pooled client, ETag caching and rate limit pacing."""
+
+    @staticmethod
+    def _use_transport(client, handler):
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_client_reused_and_closed(self, github_client):
+        """Test that requests share one client until aclose()."""
+        first = github_client._get_client()
+        assert github_client._get_client() is first
+
+        await github_client.aclose()
+        assert first.is_closed
+        assert github_client._client is None
+
+    @pytest.mark.asyncio
+    async def test_async_context_closes_client(self, github_client):
+        """Test that the async context manager closes the pool."""
+        async with github_client as client:
+            pooled = client._get_client()
+        assert pooled.is_closed
+
+    @pytest.mark.asyncio
+    async def test_get_uses_etag_and_serves_304_from_cache(self, github_client):
+        """Test that repeated GETs send If-None-Match and reuse the cached body."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"full_name": "o/r"}, headers={"ETag": '"v1"'})
+
+        self._use_transport(github_client, handler)
+        with patch.object(github_client, "get_installation_token", return_value="token"):
+            first = await github_client.get_repository_info("o", "r")
+            second = await github_client.get_repository_info("o", "r")
+
+        assert first == second == {"full_name": "o/r"}
+        assert seen == [None, '"v1"']
+        await github_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cached_body_is_copied_per_caller(self, github_client):
+        """Test that mutating a 304 result doesn't change the cached body."""
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"topics": ["a"]}, headers={"ETag": '"v1"'})
+
+        self._use_transport(github_client, handler)
+        with patch.object(github_client, "get_installation_token", return_value="token"):
+            first = await github_client.get_repository_info("o", "r")
+            first["topics"].append("mutated")
+            second = await github_client.get_repository_info("o", "r")
+            second["topics"].append("again")
+            third = await github_client.get_repository_info("o", "r")
+
+        assert third == {"topics": ["a"]}
+        await github_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_etag_cache_keyed_by_params(self, github_client):
+        """Test that GETs with different params don't share ETags."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(200, json={"workflow_runs": []}, headers={"ETag": '"runs"'})
+
+        self._use_transport(github_client, handler)
+        with patch.object(github_client, "get_installation_token", return_value="token"):
+            await github_client.get_workflow_runs("o", "r", limit=5)
+            await github_client.get_workflow_runs("o", "r", limit=10)
+
+        assert seen == [None, None]
+        await github_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_writes_are_not_cached(self, github_client):
+        """Test that non-GET requests never send If-None-Match."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            return httpx.Response(201, json={"number": 1}, headers={"ETag": '"i"'})
+
+        self._use_transport(github_client, handler)
+        with patch.object(github_client, "get_installation_token", return_value="token"):
+            await github_client.create_issue("o", "r", title="a", body="b")
+            await github_client.create_issue("o", "r", title="a", body="b")
+
+        assert seen == [None, None]
+        assert len(github_client._etag_cache) == 0
+        await github_client.aclose()
+
+    def test_rate_limit_headers_recorded(self, github_client):
+        """Test that X-RateLimit headers update client state."""
+        github_client._update_rate_limit(
+            httpx.Headers({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": "1700000000"})
+        )
+
+        assert github_client.rate_limit_remaining == 42
+        assert github_client.rate_limit_reset == 1700000000
+
+    def test_pacing_spreads_requests_when_quota_low(self, github_client):
+        """Test that low quota spreads remaining requests over the window."""
+        with patch("src.github_app_client.time.time", return_value=1000.0):
+            github_client.rate_limit_remaining = 10
+            github_client.rate_limit_reset = 1100.0
+            assert github_client._pacing_delay() == pytest.approx(10.0)
+
+            github_client.rate_limit_remaining = 4000
+            assert github_client._pacing_delay() == 0.0
+
+            github_client.rate_limit_remaining = 0
+            assert github_client._pacing_delay() == pytest.approx(100.0)
+
+    @pytest.mark.asyncio
+    async def test_pace_waits_for_reset(self, github_client):
+        """Test that an exhausted quota sleeps until reset before requesting."""
+        github_client.rate_limit_remaining = 0
+        github_client.rate_limit_reset = 1030.0
+
+        with (
+            patch("src.github_app_client.time.time", return_value=1000.0),
+            patch("src.github_app_client.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            await github_client._pace()
+
+        mock_sleep.assert_awaited_once_with(pytest.approx(30.0))
+
+    @pytest.mark.asyncio
+    async def test_pace_fails_fast_beyond_max_wait(self, github_client):
+        """Test that waits longer than max_rate_limit_wait raise immediately."""
+        github_client.rate_limit_remaining = 0
+        github_client.rate_limit_reset = 5000.0
+        github_client.max_rate_limit_wait = 60.0
+
+        with patch("src.github_app_client.time.time", return_value=1000.0):
+            with pytest.raises(GitHubAppRateLimitError):
+                await github_client._pace()
+
+    @pytest.mark.asyncio
+    async def test_secondary_rate_limit_403(self, github_client):
+        """Test that 403 with Retry-After is treated as a rate limit."""
+        self._use_transport(
+            github_client,
+            lambda request: httpx.Response(403, headers={"Retry-After": "1"}),
+        )
+
+        with (
+            patch.object(github_client, "get_installation_token", return_value="token"),
+            patch("src.github_app_client.asyncio.sleep", new=AsyncMock()),
+            patch.object(GitHubAppClient._api_request.retry, "sleep", new=AsyncMock()),
+        ):
+            with pytest.raises(GitHubAppRateLimitError):
+                await github_client._api_request("GET", "/repos/o/r")
+
+        await github_client.aclose()
@@ -0,0 +1,272 @@
+"""Tests for the shared Google OAuth token provider.
+
+Tests the provider in src/google_token_provider.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.google_token_provider import (
+    GoogleTokenProvider,
+    OAuthClientCredentials,
+    TokenRefreshError,
+    get_token_provider,
+    reset_token_providers,
+)
+
+CREDENTIALS = OAuthClientCredentials("client-id", "client-secret", "refresh-token")
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Start every test with an empty provider registry."""
+    reset_token_providers()
+    yield
+    reset_token_providers()
+
+
+def _token_response(token: str = "new-token", status_code: int = 200) -> MagicMock:  # noqa: S107
+    """Build a mock token endpoint response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = "error" if status_code != 200 else ""
+    response.json.return_value = {"access_token": token, "expires_in": 3600}
+    return response
+
+
+def _mock_token_endpoint(mock_client: MagicMock, *responses: MagicMock) -> AsyncMock:
+    """Make the patched httpx.AsyncClient answer token posts after a short delay."""
+    queue = list(responses)
+
+    async def post(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    instance = AsyncMock()
+    instance.post.side_effect = post
+    mock_client.return_value.__aenter__.return_value = instance
+    return instance
+
+
+class TestSingleFlight:
+    """Tests for coalesced token refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self):
+        """Test 50 concurrent calls on an empty cache trigger one refresh."""
+        loader = MagicMock(return_value=CREDENTIALS)
+        provider = GoogleTokenProvider(loader)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            instance = _mock_token_endpoint(mock_client, _token_response())
+
+            tokens = await asyncio.gather(
+                *(provider.get_access_token() for _ in range(50))
+            )
+
+        assert tokens == ["new-token"] * 50
+        assert instance.post.call_count == 1
+        assert loader.call_count == 1
+        assert provider.refresh_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter(self):
+        """Test a failed refresh raises in all callers and is not cached."""
+        provider = GoogleTokenProvider(MagicMock(return_value=CREDENTIALS))
+
+        with patch("httpx.AsyncClient") as mock_client:
+            instance = _mock_token_endpoint(
+                mock_client, _token_response(status_code=500), _token_response("retry")
+            )
+
+            results = await asyncio.gather(
+                *(provider.get_access_token() for _ in range(5)),
+                return_exceptions=True,
+            )
+            token = await provider.get_access_token()
+
+        assert all(isinstance(r, TokenRefreshError) for r in results)
+        assert results[0].status_code == 500
+        assert token == "retry"
+        assert instance.post.call_count == 2
+
+    def test_threads_with_own_event_loops_share_one_refresh(self):
+        """Test callers running asyncio.run in separate threads share a refresh."""
+        provider = GoogleTokenProvider(MagicMock(return_value=CREDENTIALS))
+        tokens: list[str] = []
+
+        with patch("httpx.AsyncClient") as mock_client:
+            instance = _mock_token_endpoint(mock_client, _token_response())
+
+            def call() -> None:
+                tokens.append(asyncio.run(provider.get_access_token()))
+
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert tokens == ["new-token"] * 8
+        assert instance.post.call_count == 1
+
+
+class TestCaching:
+    """Tests for token and credential caching."""
+
+    @pytest.mark.asyncio
+    async def test_credentials_loaded_once(self):
+        """Test secrets are loaded once across refreshes."""
+        loader = MagicMock(return_value=CREDENTIALS)
+        provider = GoogleTokenProvider(loader)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            _mock_token_endpoint(mock_client, _token_response())
+            await provider.refresh()
+            provider.invalidate()
+            await provider.get_access_token()
+
+        assert loader.call_count == 1
+        assert provider.refresh_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_credentials_reloaded(self):
+        """Test credentials are reloaded after the endpoint rejects them."""
+        loader = MagicMock(return_value=CREDENTIALS)
+        provider = GoogleTokenProvider(loader)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            _mock_token_endpoint(
+                mock_client, _token_response(status_code=400), _token_response()
+            )
+            with pytest.raises(TokenRefreshError):
+                await provider.get_access_token()
+            token = await provider.get_access_token()
+
+        assert token == "new-token"
+        assert loader.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials_propagate(self):
+        """Test a failing loader raises and leaves nothing cached."""
+        loader = MagicMock(side_effect=ValueError("Missing OAuth secrets"))
+        provider = GoogleTokenProvider(loader)
+
+        with pytest.raises(ValueError, match="Missing OAuth secrets"):
+            await provider.get_access_token()
+
+        assert provider.access_token is None
+
+
+class TestRefreshAhead:
+    """Tests for proactive background refresh."""
+
+    @pytest.mark.asyncio
+    async def test_token_near_expiry_refreshed_in_background(self):
+        """Test a token close to expiry is returned while a refresh runs."""
+        provider = GoogleTokenProvider(
+            MagicMock(return_value=CREDENTIALS), expiry_buffer=60, refresh_ahead=300
+        )
+        provider._access_token = "old-token"
+        provider._expires_at = time.time() + 200
+
+        with patch("httpx.AsyncClient") as mock_client:
+            instance = _mock_token_endpoint(mock_client, _token_response())
+
+            tokens = await asyncio.gather(
+                *(provider.get_access_token() for _ in range(10))
+            )
+            assert tokens == ["old-token"] * 10
+            background = provider._background
+            assert background is not None
+
+            background.join(timeout=5)
+
+        assert instance.post.call_count == 1
+        assert await provider.get_access_token() == "new-token"
+
+    @pytest.mark.asyncio
+    async def test_fresh_token_not_refreshed(self):
+        """Test a token far from expiry does not start a refresh."""
+        provider = GoogleTokenProvider(MagicMock(return_value=CREDENTIALS))
+        provider._access_token = "token"
+        provider._expires_at = time.time() + 3600
+
+        assert await provider.get_access_token() == "token"
+        assert provider._background is None
+
+    @pytest.mark.asyncio
+    async def test_background_failure_keeps_current_token(self):
+        """Test a failed background refresh leaves the current token usable."""
+        provider = GoogleTokenProvider(MagicMock(return_value=CREDENTIALS))
+        provider._access_token = "old-token"
+        provider._expires_at = time.time() + 200
+
+        with patch("httpx.AsyncClient") as mock_client:
+            _mock_token_endpoint(mock_client, _token_response(status_code=503))
+            assert await provider.get_access_token() == "old-token"
+            provider._background.join(timeout=5)
+
+        assert provider.access_token == "old-token"
+        assert provider.is_valid()
+
+    def test_background_refresh_outlives_request_loop(self):
+        """Test the refresh finishes after the caller's asyncio.run returns."""
+        provider = GoogleTokenProvider(MagicMock(return_value=CREDENTIALS))
+        provider._access_token = "old-token"
+        provider._expires_at = time.time() + 200
+
+        with patch("httpx.AsyncClient") as mock_client:
+            _mock_token_endpoint(mock_client, _token_response())
+            # Like a Flask router: one short-lived loop per request
+            assert asyncio.run(provider.get_access_token()) == "old-token"
+            background = provider._background
+            background.join(timeout=5)
+
+        assert provider.access_token == "new-token"
+
+
+class TestCancellation:
+    """Tests for refreshes whose leader is cancelled."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_retry_after_leader_cancelled(self):
+        """Test a cancelled leader doesn't fail the callers waiting on it."""
+        provider = GoogleTokenProvider(MagicMock(return_value=CREDENTIALS))
+
+        with patch("httpx.AsyncClient") as mock_client:
+            instance = _mock_token_endpoint(mock_client, _token_response())
+            leader = asyncio.create_task(provider.refresh())
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(provider.refresh())
+            await asyncio.sleep(0.01)
+            leader.cancel()
+
+            assert await waiter == "new-token"
+
+        assert leader.cancelled()
+        assert instance.post.call_count == 2
+
+
+class TestRegistry:
+    """Tests for the process-wide provider registry."""
+
+    def test_same_name_returns_same_provider(self):
+        """Test providers are shared by name."""
+        first = get_token_provider("workspace", lambda: CREDENTIALS)
+        second = get_token_provider("workspace", lambda: CREDENTIALS, expiry_buffer=1)
+
+        assert first is second
+        assert first.expiry_buffer == 60
+
+    def test_different_names_are_separate(self):
+        """Test different names get separate caches."""
+        assert get_token_provider("a", lambda: CREDENTIALS) is not get_token_provider(
+            "b", lambda: CREDENTIALS
+        )
@@ -368,7 +368,7 @@ class TestSchedulerIntegration:
 
         scheduler = AgentScheduler(mock_session_factory)
 
-        assert scheduler.scheduler is not None
+        assert scheduler.queue is not None
         assert scheduler.running is False
 
     @pytest.mark.asyncio
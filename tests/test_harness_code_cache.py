@@ -0,0 +1,194 @@
+"""Tests for src/harness/code_cache.py - Agent Code Cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Skip all tests if dependencies not installed (harness/__init__.py imports psutil)
+pytest.importorskip("psutil")
+
+AGENT_CODE = """
+class Agent:
+    def __init__(self, config):
+        self.config = config
+
+    async def execute(self):
+        return {"config": self.config}
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_code_cache(monkeypatch):
+    """Give each test its own global cache, with entries and counters at zero."""
+    from src.harness import code_cache
+
+    monkeypatch.setattr(code_cache, "_global_cache", None)
+
+
+class TestAgentCodeCache:
+    """Tests for AgentCodeCache."""
+
+    def test_hash_code_is_content_addressed(self):
+        """Same source gives the same key; any change gives a new one."""
+        from src.harness.code_cache import hash_code
+
+        assert hash_code(AGENT_CODE) == hash_code(AGENT_CODE)
+        assert hash_code(AGENT_CODE) != hash_code(AGENT_CODE + "\n")
+        assert len(hash_code(AGENT_CODE)) == 64
+
+    def test_get_prepares_once(self):
+        """A second get for unchanged code should be a hit."""
+        from src.harness.code_cache import AgentCodeCache
+
+        cache = AgentCodeCache()
+        first = cache.get(AGENT_CODE)
+        second = cache.get(AGENT_CODE)
+
+        assert first is second
+        assert "class Agent" in first.wrapper_code
+        assert first.syntax_error is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_wrapper_does_not_depend_on_config(self):
+        """Config is passed at run time, so one artifact serves every config."""
+        from src.harness.code_cache import build_wrapper_code
+
+        assert "AGENT_CONFIG" in build_wrapper_code(AGENT_CODE)
+
+    def test_syntax_error_captured(self):
+        """Artifacts for broken code record the SyntaxError."""
+        from src.harness.code_cache import AgentCodeCache
+
+        artifact = AgentCodeCache().get("class Agent\n    pass")
+
+        assert artifact.syntax_error is not None
+        assert "SyntaxError" in artifact.syntax_error
+
+    def test_lru_eviction(self):
+        """Least recently used artifacts are dropped past maxsize."""
+        from src.harness.code_cache import AgentCodeCache
+
+        cache = AgentCodeCache(maxsize=2)
+        cache.get("a = 1")
+        cache.get("b = 2")
+        cache.get("a = 1")
+        cache.get("c = 3")
+
+        assert "a = 1" in cache
+        assert "b = 2" not in cache
+        assert len(cache) == 2
+
+    def test_invalidate(self):
+        """invalidate drops the artifact and its validations."""
+        from src.harness.code_cache import AgentCodeCache
+
+        cache = AgentCodeCache()
+        cache.set_validation(AGENT_CODE, True, {"errors": [], "warnings": [], "passed": True})
+
+        assert cache.invalidate(AGENT_CODE) is True
+        assert cache.get_validation(AGENT_CODE, True) is None
+        assert cache.invalidate(AGENT_CODE) is False
+
+    def test_validation_keyed_by_strict(self):
+        """Strict and non-strict validations are cached separately."""
+        from src.harness.code_cache import AgentCodeCache
+
+        cache = AgentCodeCache()
+        cache.set_validation(AGENT_CODE, False, {"errors": [], "warnings": [], "passed": True})
+
+        assert cache.get_validation(AGENT_CODE, True) is None
+        assert cache.get_validation(AGENT_CODE, False)["passed"] is True
+
+
+class TestExecutorUsesCache:
+    """Tests for execute_agent_code integration."""
+
+    @pytest.mark.asyncio
+    async def test_syntax_error_skips_subprocess(self):
+        """Broken code fails from the cached syntax check without a process."""
+        from src.harness.executor import execute_agent_code
+
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            result = await execute_agent_code("class Agent\n    pass", config={})
+
+        mock_exec.assert_not_called()
+        assert result.status == "error"
+        assert result.exit_code != 0
+        assert "SyntaxError" in result.stderr
+
+    @pytest.mark.asyncio
+    async def test_config_passed_at_run_time(self):
+        """The same cached artifact runs with different JSON configs."""
+        from src.harness.code_cache import get_code_cache
+        from src.harness.executor import execute_agent_code
+
+        first = await execute_agent_code(AGENT_CODE, config={"enabled": True, "n": None})
+        second = await execute_agent_code(AGENT_CODE, config={"enabled": False})
+
+        assert first.result == {"config": {"enabled": True, "n": None}}
+        assert second.result == {"config": {"enabled": False}}
+        assert get_code_cache().stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_worker_receives_source_once(self):
+        """A worker only gets the source on its first run of a hash."""
+        import os
+
+        if not hasattr(os, "fork"):
+            pytest.skip("warm workers need os.fork")
+
+        from src.harness.worker_pool import WarmWorkerPool, _Worker
+
+        sent = []
+        original_send = _Worker.send
+
+        async def record_send(worker, message):
+            sent.append(message)
+            await original_send(worker, message)
+
+        async with WarmWorkerPool(size=1) as pool:
+            with patch.object(_Worker, "send", record_send):
+                first = await pool.execute(AGENT_CODE, config={"run": 1})
+                second = await pool.execute(AGENT_CODE, config={"run": 2})
+
+        assert first.result == {"config": {"run": 1}}
+        assert second.result == {"config": {"run": 2}}
+        assert sum("code" in message for message in sent) == 1
+
+
+class TestAgentsApiInvalidation:
+    """Tests for cache invalidation from the agents API."""
+
+    @pytest.mark.asyncio
+    async def test_update_code_invalidates_old_artifact(self):
+        """Updating Agent.code should drop the old code's artifact."""
+        pytest.importorskip("anthropic")
+        from datetime import datetime
+
+        from src.api.routes.agents import AgentUpdateRequest, update_agent
+        from src.harness.code_cache import get_code_cache
+
+        agent = MagicMock()
+        agent.id = 1
+        agent.name = "Test"
+        agent.description = "Test agent"
+        agent.code = AGENT_CODE
+        agent.status = "active"
+        agent.created_at = datetime.utcnow()
+        agent.updated_at = datetime.utcnow()
+        agent.created_by = None
+        agent.config = None
+
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = agent
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.execute.return_value = result
+
+        get_code_cache().get(AGENT_CODE)
+        new_code = AGENT_CODE + "\n# v2\n"
+        await update_agent(1, AgentUpdateRequest(code=new_code), session=session)
+
+        assert AGENT_CODE not in get_code_cache()
+        assert agent.code == new_code
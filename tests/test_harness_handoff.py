@@ -389,3 +389,258 @@ class TestGetHandoffManager:
         manager1 = get_handoff_manager()
         manager2 = get_handoff_manager()
         assert manager1 is manager2
+
+
+class TestStateCodec:
+    """Tests for encode_value/decode_value and LazyState."""
+
+    def test_roundtrip(self):
+        """Values survive encode/decode."""
+        from src.harness.handoff import decode_value, encode_value
+
+        value = {"count": 3, "items": [1, 2, {"a": None}], "flag": True}
+        blob, size = encode_value(value)
+
+        assert decode_value(blob) == value
+        assert size > 0
+
+    def test_large_values_compressed(self):
+        """Large values are compressed but report their uncompressed size."""
+        pytest.importorskip("zstandard")
+        from src.harness.handoff import encode_value
+
+        blob, size = encode_value("x" * 100_000)
+
+        assert blob[:1] == b"z"
+        assert len(blob) < 1_000
+        assert size >= 100_000
+
+    def test_unserializable_raises(self):
+        """Values that can't be serialized raise HandoffError."""
+        from src.harness.handoff import HandoffError, encode_value
+
+        with pytest.raises(HandoffError):
+            encode_value(object())
+
+    def test_lazy_state_decodes_on_access(self):
+        """Keys stay encoded until read."""
+        from src.harness.handoff import LazyState, encode_value
+
+        state = LazyState(encoded={"history": encode_value(list(range(1000)))})
+        state["count"] = 1
+
+        assert not state.is_decoded("history")
+        assert state["history"][-1] == 999
+        assert state.is_decoded("history")
+        assert state == {"history": list(range(1000)), "count": 1}
+
+    def test_lazy_state_size_is_incremental(self):
+        """size() reuses stored sizes for keys never read."""
+        from unittest.mock import patch
+
+        from src.harness import handoff
+        from src.harness.handoff import LazyState, encode_value
+
+        history = encode_value(list(range(1000)))
+        state = LazyState(encoded={"history": history})
+        state["count"] = 1
+
+        with patch.object(handoff, "encode_value", wraps=handoff.encode_value) as mock_encode:
+            size = state.size()
+
+        assert size == history[1] + encode_value(1)[1]
+        assert mock_encode.call_count == 1
+
+    def test_nested_lazy_state_stays_encoded(self):
+        """A LazyState stored inside state is not decoded to save it."""
+        from src.harness.handoff import LazyState, decode_value, encode_value
+
+        inner = LazyState(encoded={"big": encode_value(list(range(1000)))})
+        blob, _ = encode_value(inner)
+        restored = decode_value(blob)
+
+        assert not inner.is_decoded("big")
+        assert isinstance(restored, LazyState)
+        assert restored["big"][0] == 0
+
+    def test_artifact_to_json_with_lazy_state(self):
+        """Artifacts with LazyState still serialize to JSON."""
+        from src.harness.handoff import HandoffArtifact, LazyState
+
+        nested = LazyState(data={"a": 1})
+        artifact = HandoffArtifact(agent_id=1, state=LazyState(data={"previous_run": nested}))
+
+        assert json.loads(artifact.to_json())["state"] == {"previous_run": {"a": 1}}
+
+    def test_compress_state_uses_serialized_size(self):
+        """compress_state measures LazyState without decoding it."""
+        from src.harness.handoff import HandoffManager, LazyState, encode_value
+
+        state = LazyState(encoded={"big": encode_value("x" * 1000)})
+        manager = HandoffManager()
+
+        assert manager.compress_state(state, max_size=10_000) is state
+        assert not state.is_decoded("big")
+
+    @pytest.mark.asyncio
+    async def test_previous_run_does_not_nest(self):
+        """previous_run carries one level of history, not every run."""
+        from src.harness.handoff import HandoffManager
+
+        manager = HandoffManager()
+        await manager.create_next_artifact(1, {"run": 1})
+        await manager.create_next_artifact(1, {"run": 2})
+        artifact = await manager.create_next_artifact(1, {"run": 3})
+
+        assert artifact.state["previous_run"]["current_result"] == {"run": 2}
+        assert "previous_run" not in artifact.state["previous_run"]
+
+
+@pytest.fixture
+async def session_factory():
+    """In-memory SQLite session factory with handoff tables."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel
+
+    from src.models.handoff import HandoffRecord, HandoffStateEntry
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            SQLModel.metadata.create_all,
+            tables=[HandoffRecord.__table__, HandoffStateEntry.__table__],
+        )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestSQLHandoffStore:
+    """Tests for durable handoff storage."""
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, session_factory):
+        """A new manager on the same store sees saved artifacts."""
+        from src.harness.handoff import HandoffArtifact, HandoffManager, SQLHandoffStore
+
+        first = HandoffManager(store=SQLHandoffStore(session_factory))
+        await first.save_artifact(
+            HandoffArtifact(
+                agent_id=1,
+                run_number=4,
+                state={"count": 4, "seen": ["a", "b"]},
+                metadata={"duration": 1.5},
+                summary="ok",
+            )
+        )
+
+        second = HandoffManager(store=SQLHandoffStore(session_factory))
+        loaded = await second.load_artifact(1)
+
+        assert loaded.run_number == 4
+        assert loaded.metadata == {"duration": 1.5}
+        assert loaded.summary == "ok"
+        assert loaded.state == {"count": 4, "seen": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test_load_is_lazy(self, session_factory):
+        """Loaded state is decoded only for keys that are read."""
+        from src.harness.handoff import HandoffArtifact, HandoffManager, LazyState, SQLHandoffStore
+
+        store = SQLHandoffStore(session_factory)
+        await HandoffManager(store=store).save_artifact(
+            HandoffArtifact(agent_id=1, state={"history": list(range(5000)), "count": 1})
+        )
+
+        loaded = await HandoffManager(store=store).load_artifact(1)
+
+        assert isinstance(loaded.state, LazyState)
+        assert loaded.state["count"] == 1
+        assert not loaded.state.is_decoded("history")
+
+    @pytest.mark.asyncio
+    async def test_only_changed_keys_written(self, session_factory):
+        """A save writes only keys whose value changed and drops removed keys."""
+        from sqlmodel import select
+
+        from src.harness.handoff import HandoffArtifact, HandoffManager, SQLHandoffStore
+        from src.models.handoff import HandoffStateEntry
+
+        manager = HandoffManager(store=SQLHandoffStore(session_factory))
+        history = list(range(1000))
+        await manager.save_artifact(
+            HandoffArtifact(agent_id=1, run_number=1, state={"h": history, "n": 1, "old": 0})
+        )
+        await manager.save_artifact(
+            HandoffArtifact(agent_id=1, run_number=2, state={"h": history, "n": 2})
+        )
+
+        async with session_factory() as session:
+            rows = (await session.execute(select(HandoffStateEntry))).scalars().all()
+
+        written_in = {row.key: row.run_number for row in rows}
+        assert written_in == {"h": 1, "n": 2}
+
+    @pytest.mark.asyncio
+    async def test_create_next_artifact_carries_history_encoded(self, session_factory):
+        """Carried cumulative_data is neither decoded nor rewritten."""
+        from sqlmodel import select
+
+        from src.harness.handoff import HandoffArtifact, HandoffManager, SQLHandoffStore
+        from src.models.handoff import HandoffStateEntry
+
+        store = SQLHandoffStore(session_factory)
+        await HandoffManager(store=store).save_artifact(
+            HandoffArtifact(agent_id=1, state={"cumulative_data": list(range(5000))})
+        )
+
+        manager = HandoffManager(store=store)
+        artifact = await manager.create_next_artifact(1, {"ok": True})
+
+        assert artifact.run_number == 2
+        assert not artifact.state.is_decoded("cumulative_data")
+        async with session_factory() as session:
+            row = (
+                await session.execute(
+                    select(HandoffStateEntry).where(HandoffStateEntry.key == "cumulative_data")
+                )
+            ).scalar_one()
+        assert row.run_number == 1
+
+        reloaded = await HandoffManager(store=store).load_artifact(1)
+        assert reloaded.state["cumulative_data"][-1] == 4999
+        assert reloaded.state["previous_run"]["cumulative_data"][0] == 0
+
+    @pytest.mark.asyncio
+    async def test_replicas_see_each_others_writes(self, session_factory):
+        """A manager notices when another replica saved a newer artifact."""
+        from src.harness.handoff import HandoffArtifact, HandoffManager, SQLHandoffStore
+
+        store = SQLHandoffStore(session_factory)
+        replica_a = HandoffManager(store=store)
+        replica_b = HandoffManager(store=store)
+
+        await replica_a.save_artifact(HandoffArtifact(agent_id=1, run_number=1, state={"v": 1}))
+        assert (await replica_b.load_artifact(1)).state == {"v": 1}
+
+        await replica_a.save_artifact(HandoffArtifact(agent_id=1, run_number=2, state={"v": 2}))
+        # B last saw v=1; writing v=1 again must not be skipped as "unchanged"
+        await replica_b.save_artifact(HandoffArtifact(agent_id=1, run_number=3, state={"v": 1}))
+
+        assert (await replica_a.load_artifact(1)).state == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_clear_artifact(self, session_factory):
+        """clear_artifact removes the stored artifact."""
+        from src.harness.handoff import HandoffArtifact, HandoffManager, SQLHandoffStore
+
+        manager = HandoffManager(store=SQLHandoffStore(session_factory))
+        await manager.save_artifact(HandoffArtifact(agent_id=1, state={"v": 1}))
+        await manager.clear_artifact(1)
+
+        assert await HandoffManager(store=SQLHandoffStore(session_factory)).load_artifact(1) is None
@@ -1,5 +1,6 @@
 """Tests for src/harness/scheduler.py - Task Scheduler."""
 
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -274,25 +275,29 @@ class TestAgentScheduler:
         mock_agent.status = "active"
         mock_agent.config = '{"schedule": "0 * * * *"}'
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [mock_agent]
+        agents_result = MagicMock()
+        agents_result.scalars.return_value.all.return_value = [mock_agent]
+        empty_result = MagicMock()
+        empty_result.scalars.return_value.all.return_value = []
 
         mock_session = AsyncMock()
-        mock_session.execute.return_value = mock_result
+        mock_session.add = MagicMock()
+        # Agents, stored schedules, pending retries
+        mock_session.execute.side_effect = [agents_result, empty_result, empty_result]
 
         @asynccontextmanager
         async def mock_factory():
             yield mock_session
 
-
-        scheduler = AgentScheduler(mock_factory)
+        scheduler = AgentScheduler(mock_factory, worker_pool=MagicMock(start=AsyncMock()))
 
         with patch.object(scheduler, "_schedule_agent", new_callable=AsyncMock) as mock_schedule:
+            mock_schedule.return_value = None
             await scheduler.start()
-            mock_schedule.assert_called_once_with(mock_agent)
+            mock_schedule.assert_called_once_with(mock_agent, None)
 
         assert scheduler.running is True
-        scheduler.scheduler.shutdown(wait=False)
+        scheduler._loop_task.cancel()
 
     @pytest.mark.asyncio
     async def test_start_raises_if_already_running(self):
@@ -315,11 +320,51 @@ class TestAgentScheduler:
         scheduler = AgentScheduler(mock_factory)
         scheduler.running = True
 
-        with patch.object(scheduler.scheduler, "shutdown") as mock_shutdown:
-            await scheduler.stop()
+        await scheduler.stop()
 
         assert scheduler.running is False
 
+    @pytest.mark.asyncio
+    async def test_stop_drains_inflight_before_closing_pool(self):
+        """stop should let in-flight runs finish before closing the pool."""
+        import asyncio
+
+        from src.harness.scheduler import AgentScheduler
+
+        events = []
+        pool = MagicMock(close=AsyncMock(side_effect=lambda: events.append("close")))
+        scheduler = AgentScheduler(MagicMock(), worker_pool=pool)
+        scheduler.running = True
+
+        async def run():
+            await asyncio.sleep(0.05)
+            events.append("run done")
+
+        scheduler._inflight.add(asyncio.create_task(run()))
+        await scheduler.stop()
+
+        assert events == ["run done", "close"]
+
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_runs_after_timeout(self):
+        """stop should close the pool once the drain timeout expires."""
+        import asyncio
+
+        from src.harness.scheduler import AgentScheduler
+
+        release = asyncio.Event()
+        pool = MagicMock(close=AsyncMock(side_effect=lambda: release.set()))
+        scheduler = AgentScheduler(MagicMock(), worker_pool=pool)
+        scheduler.running = True
+        # Stands in for a run that only ends when the pool interrupts it
+        run = asyncio.create_task(release.wait())
+        scheduler._inflight.add(run)
+
+        await scheduler.stop(timeout=0.01)
+
+        pool.close.assert_awaited_once()
+        assert run.done()
+
     @pytest.mark.asyncio
     async def test_stop_when_not_running(self):
         """stop should do nothing when not running."""
@@ -389,9 +434,11 @@ class TestAgentScheduler:
         mock_agent.name = "Test Agent"
         mock_agent.config = '{"schedule": "0 */6 * * *"}'
 
-        with patch.object(scheduler.scheduler, "add_job") as mock_add:
-            await scheduler._schedule_agent(mock_agent)
-            mock_add.assert_called_once()
+        due = await scheduler._schedule_agent(mock_agent)
+
+        assert due is not None
+        assert due.minute == 0
+        assert ("agent", 1) in scheduler.queue
 
     @pytest.mark.asyncio
     async def test_add_agent_dynamically(self):
@@ -407,6 +454,7 @@ class TestAgentScheduler:
         mock_agent.config = '{"schedule": "*/5 * * * *"}'
 
         with patch.object(scheduler, "_schedule_agent", new_callable=AsyncMock) as mock_schedule:
+            mock_schedule.return_value = None
             await scheduler.add_agent(mock_agent)
             mock_schedule.assert_called_once_with(mock_agent)
 
@@ -415,15 +463,20 @@ class TestAgentScheduler:
         """remove_agent should remove agent from scheduler."""
         from src.harness.scheduler import AgentScheduler
 
-        mock_factory = MagicMock()
+        mock_session = AsyncMock()
+        mock_session.get.return_value = None
+
+        @asynccontextmanager
+        async def mock_factory():
+            yield mock_session
+
         scheduler = AgentScheduler(mock_factory)
+        scheduler.queue.push(("agent", 1), 0.0)
+
+        await scheduler.remove_agent(1)
 
-        # Add a mock job
-        mock_job = MagicMock()
-        with patch.object(scheduler.scheduler, "get_job", return_value=mock_job):
-            with patch.object(scheduler.scheduler, "remove_job") as mock_remove:
-                await scheduler.remove_agent(1)
-                mock_remove.assert_called_once_with("agent_1")
+        assert ("agent", 1) not in scheduler.queue
+        mock_session.get.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_remove_agent_not_found(self):
@@ -433,9 +486,8 @@ class TestAgentScheduler:
         mock_factory = MagicMock()
         scheduler = AgentScheduler(mock_factory)
 
-        with patch.object(scheduler.scheduler, "get_job", return_value=None):
-            # Should not raise
-            await scheduler.remove_agent(999)
+        # Should not raise
+        await scheduler.remove_agent(999)
 
 
 class TestCronParsing:
@@ -454,9 +506,7 @@ class TestCronParsing:
         mock_agent.name = "Test"
         mock_agent.config = '{"schedule": "* * * * *"}'
 
-        with patch.object(scheduler.scheduler, "add_job") as mock_add:
-            await scheduler._schedule_agent(mock_agent)
-            mock_add.assert_called_once()
+        assert await scheduler._schedule_agent(mock_agent) is not None
 
     @pytest.mark.asyncio
     async def test_hourly(self):
@@ -471,9 +521,7 @@ class TestCronParsing:
         mock_agent.name = "Test"
         mock_agent.config = '{"schedule": "0 * * * *"}'
 
-        with patch.object(scheduler.scheduler, "add_job") as mock_add:
-            await scheduler._schedule_agent(mock_agent)
-            mock_add.assert_called_once()
+        assert await scheduler._schedule_agent(mock_agent) is not None
 
     @pytest.mark.asyncio
     async def test_daily_at_midnight(self):
@@ -488,6 +536,455 @@ class TestCronParsing:
         mock_agent.name = "Test"
         mock_agent.config = '{"schedule": "0 0 * * *"}'
 
-        with patch.object(scheduler.scheduler, "add_job") as mock_add:
-            await scheduler._schedule_agent(mock_agent)
-            mock_add.assert_called_once()
+        assert await scheduler._schedule_agent(mock_agent) is not None
+
+
+class TestRunQueue:
+    """Tests for the RunQueue heap."""
+
+    def test_pop_due_in_order(self):
+        """pop_due returns due keys earliest first and leaves the rest."""
+        from src.harness.run_queue import RunQueue
+
+        queue = RunQueue()
+        queue.push("late", 30.0)
+        queue.push("early", 10.0)
+        queue.push("middle", 20.0)
+
+        assert queue.pop_due(25.0) == ["early", "middle"]
+        assert queue.next_due() == 30.0
+        assert len(queue) == 1
+
+    def test_push_reschedules(self):
+        """Pushing an existing key replaces its due time."""
+        from src.harness.run_queue import RunQueue
+
+        queue = RunQueue()
+        queue.push("a", 10.0)
+        queue.push("a", 50.0)
+
+        assert queue.pop_due(20.0) == []
+        assert queue.due_at("a") == 50.0
+        assert queue.pop_due(50.0) == ["a"]
+
+    def test_remove(self):
+        """Removed keys are never popped."""
+        from src.harness.run_queue import RunQueue
+
+        queue = RunQueue()
+        queue.push("a", 10.0)
+
+        assert queue.remove("a") is True
+        assert queue.remove("a") is False
+        assert queue.next_due() is None
+        assert queue.pop_due(100.0) == []
+
+    def test_stale_entries_compacted(self):
+        """Repeated reschedules don't grow the heap without bound."""
+        from src.harness.run_queue import RunQueue
+
+        queue = RunQueue()
+        for i in range(1000):
+            queue.push("a", float(i))
+
+        assert len(queue._heap) <= 128
+        assert queue.pop_due(1000.0) == ["a"]
+
+
+class TestRetryQueue:
+    """Tests for persistent retries queued by run_agent_task."""
+
+    def test_retry_delay_backoff(self):
+        """retry_delay doubles per attempt and is capped."""
+        from src.harness.scheduler import MAX_RETRY_DELAY, retry_delay
+
+        assert [retry_delay(n) for n in (1, 2, 3)] == [2, 4, 8]
+        assert retry_delay(30) == MAX_RETRY_DELAY
+
+    @pytest.mark.asyncio
+    async def test_failed_run_queues_pending_retry(self):
+        """A failed run adds a pending retry Task with backoff."""
+        from datetime import UTC, datetime
+
+        from src.harness.scheduler import run_agent_task
+        from src.models.task import Task
+
+        session = AsyncMock()
+        session.add = MagicMock()
+        agent = MagicMock(id=1, code="", config='{"max_retries": 2}')
+        task = Task(id=10, agent_id=1, status="running", retry_count=1)
+
+        with patch("src.harness.scheduler.execute_agent_code", new_callable=AsyncMock) as mock_exec:
+            mock_exec.return_value = MagicMock(status="error", error="boom")
+            before = datetime.now(UTC)
+            retry = await run_agent_task(session, agent, task)
+
+        assert task.status == "failed"
+        assert task.retry_count == 1
+        assert retry.status == "pending"
+        assert retry.retry_count == 2
+        assert (retry.scheduled_at - before).total_seconds() >= 4
+        session.add.assert_called_once_with(retry)
+
+    @pytest.mark.asyncio
+    async def test_no_retry_after_max_retries(self):
+        """Exhausted retries don't queue another run."""
+        from src.harness.scheduler import run_agent_task
+        from src.models.task import Task
+
+        session = AsyncMock()
+        session.add = MagicMock()
+        agent = MagicMock(id=1, code="", config='{"max_retries": 2}')
+        task = Task(id=10, agent_id=1, status="running", retry_count=2)
+
+        with patch("src.harness.scheduler.execute_agent_code", new_callable=AsyncMock) as mock_exec:
+            mock_exec.return_value = MagicMock(status="error", error="boom")
+            assert await run_agent_task(session, agent, task) is None
+
+        session.add.assert_not_called()
+
+
+@pytest.fixture
+async def session_factory():
+    """In-memory SQLite session factory with scheduler tables."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel
+
+    from src.models.agent import Agent
+    from src.models.schedule import AgentSchedule
+    from src.models.task import Task
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            SQLModel.metadata.create_all,
+            tables=[Agent.__table__, Task.__table__, AgentSchedule.__table__],
+        )
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    factory.engine = engine
+    yield factory
+    await engine.dispose()
+
+
+async def add_agents(session_factory, count, config='{"schedule": "0 * * * *"}', **fields):
+    """Insert count agents and return their IDs."""
+    from src.models.agent import Agent
+
+    async with session_factory() as session:
+        agents = [
+            Agent(name=f"agent-{i}", description="test", code="", config=config, **fields)
+            for i in range(count)
+        ]
+        session.add_all(agents)
+        await session.commit()
+        return [agent.id for agent in agents]
+
+
+def make_scheduler(session_factory):
+    """Scheduler whose loop doesn't run and whose runs are recorded."""
+    from src.harness.scheduler import AgentScheduler
+
+    scheduler = AgentScheduler(
+        session_factory, worker_pool=MagicMock(start=AsyncMock(), close=AsyncMock())
+    )
+    scheduler.dispatched = []
+    scheduler._run_loop = AsyncMock()
+    scheduler._dispatch = lambda agent, task_id: scheduler.dispatched.append((agent.id, task_id))
+    return scheduler
+
+
+class TestSchedulerRuns:
+    """Tests for due-run dispatch against a real database."""
+
+    @pytest.mark.asyncio
+    async def test_due_agents_loaded_in_constant_queries(self, session_factory):
+        """A tick costs the same number of statements for 5 or 200 due agents."""
+        import time
+
+        from sqlalchemy import event
+
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        event.listen(session_factory.engine.sync_engine, "before_cursor_execute", count)
+
+        counts = []
+        for total in (5, 200):
+            ids = await add_agents(session_factory, total)
+            scheduler = make_scheduler(session_factory)
+            await scheduler.start()
+            # Pretend every agent is due now
+            for agent_id in ids:
+                scheduler.queue.push(("agent", agent_id), 0.0)
+            await mark_all_due(session_factory)
+
+            statements.clear()
+            assert await scheduler.run_due(time.time()) == total
+            counts.append(len(statements))
+            await scheduler.stop()
+
+        event.remove(session_factory.engine.sync_engine, "before_cursor_execute", count)
+        assert counts[0] == counts[1]
+        assert counts[1] <= 3
+
+    @pytest.mark.asyncio
+    async def test_missed_runs_coalesced_on_start(self, session_factory):
+        """Fires missed during downtime collapse into one immediate run."""
+        import time
+        from datetime import timedelta
+
+        from src.harness.scheduler import _utcnow
+        from src.models.schedule import AgentSchedule
+
+        (agent_id,) = await add_agents(session_factory, 1)
+        async with session_factory() as session:
+            # Down for five hourly fires
+            session.add(
+                AgentSchedule(agent_id=agent_id, next_run_at=_utcnow() - timedelta(hours=5))
+            )
+            await session.commit()
+
+        scheduler = make_scheduler(session_factory)
+        await scheduler.start()
+
+        assert await scheduler.run_due(time.time()) == 1
+        assert scheduler.dispatched == [(agent_id, None)]
+        # Next fire is back on the hourly schedule
+        assert scheduler.queue.next_due() > time.time()
+        async with session_factory() as session:
+            row = await session.get(AgentSchedule, agent_id)
+            assert row.next_run_at > _utcnow()
+            assert row.last_run_at is not None
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_catch_up_disabled(self, session_factory):
+        """catch_up: false skips missed fires and waits for the next one."""
+        import time
+        from datetime import timedelta
+
+        from src.harness.scheduler import _utcnow
+        from src.models.schedule import AgentSchedule
+
+        config = '{"schedule": "0 * * * *", "catch_up": false}'
+        (agent_id,) = await add_agents(session_factory, 1, config=config)
+        async with session_factory() as session:
+            session.add(
+                AgentSchedule(agent_id=agent_id, next_run_at=_utcnow() - timedelta(hours=5))
+            )
+            await session.commit()
+
+        scheduler = make_scheduler(session_factory)
+        await scheduler.start()
+
+        assert await scheduler.run_due(time.time()) == 0
+        assert scheduler.queue.next_due() > time.time()
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_replicas_claim_each_fire_once(self, session_factory):
+        """Two schedulers on one database run a due fire only once."""
+        import time
+
+        ids = await add_agents(session_factory, 10)
+        first = make_scheduler(session_factory)
+        second = make_scheduler(session_factory)
+        await first.start()
+        await second.start()
+        await mark_all_due(session_factory)
+        for scheduler in (first, second):
+            for agent_id in ids:
+                scheduler.queue.push(("agent", agent_id), 0.0)
+
+        now = time.time()
+        started = await first.run_due(now) + await second.run_due(now)
+
+        assert started == 10
+        assert sorted(a for a, _ in first.dispatched + second.dispatched) == sorted(ids)
+        await first.stop()
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_fire_coalesced_while_running(self, session_factory):
+        """A fire due while the agent is still running is skipped."""
+        import time
+
+        (agent_id,) = await add_agents(session_factory, 1)
+        scheduler = make_scheduler(session_factory)
+        await scheduler.start()
+        await mark_all_due(session_factory)
+        scheduler.queue.push(("agent", agent_id), 0.0)
+        scheduler._running_agents.add(agent_id)
+
+        assert await scheduler.run_due(time.time()) == 0
+        assert ("agent", agent_id) in scheduler.queue
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_paused_agent_dropped(self, session_factory):
+        """Agents paused since they were scheduled leave the queue when due."""
+        import time
+
+        (agent_id,) = await add_agents(session_factory, 1, status="paused")
+        scheduler = make_scheduler(session_factory)
+        scheduler.queue.push(("agent", agent_id), 0.0)
+
+        assert await scheduler.run_due(time.time()) == 0
+        assert ("agent", agent_id) not in scheduler.queue
+
+    @pytest.mark.asyncio
+    async def test_retry_survives_restart(self, session_factory):
+        """A failed run's retry is stored, reloaded and run once by a new scheduler."""
+        from sqlmodel import select
+
+        from src.harness.scheduler import AgentScheduler
+        from src.models.agent import Agent
+        from src.models.task import Task
+
+        (agent_id,) = await add_agents(session_factory, 1)
+        scheduler = AgentScheduler(session_factory)
+        async with session_factory() as session:
+            agent = await session.get(Agent, agent_id)
+
+        with patch("src.harness.scheduler.execute_agent_code", new_callable=AsyncMock) as mock_exec:
+            mock_exec.return_value = MagicMock(status="error", error="boom")
+            await scheduler._execute_agent_wrapper(agent)
+
+        async with session_factory() as session:
+            result = await session.execute(select(Task).where(Task.status == "pending"))
+            (retry,) = result.scalars().all()
+        assert retry.retry_count == 1
+
+        # "Restart": a fresh scheduler picks the retry up from the database
+        restarted = make_scheduler(session_factory)
+        await restarted.start()
+        assert restarted.get_status()["queued_retries"] == 1
+
+        due = restarted.queue.due_at(("retry", retry.id))
+        assert await restarted.run_due(due - 1) == 0
+        assert await restarted.run_due(due) == 1
+        assert restarted.dispatched == [(agent_id, retry.id)]
+
+        async with session_factory() as session:
+            claimed = await session.get(Task, retry.id)
+            assert claimed.status == "running"
+        await restarted.stop()
+
+    @pytest.mark.asyncio
+    async def test_agent_never_runs_on_two_replicas(self, session_factory):
+        """A fire due on one replica waits while another replica runs the agent."""
+        import time
+
+        from src.models.schedule import AgentSchedule
+
+        (agent_id,) = await add_agents(session_factory, 1)
+        first = make_scheduler(session_factory)
+        second = make_scheduler(session_factory)
+        await first.start()
+        await second.start()
+        await mark_all_due(session_factory)
+        first.queue.push(("agent", agent_id), 0.0)
+        assert await first.run_due(time.time()) == 1  # still running
+
+        # The next fire comes due on the other replica mid-run
+        await mark_all_due(session_factory)
+        second.queue.push(("agent", agent_id), 0.0)
+        assert await second.run_due(time.time()) == 0
+        assert second.dispatched == []
+
+        await first._release_lease(agent_id)
+        async with session_factory() as session:
+            row = await session.get(AgentSchedule, agent_id)
+            assert (row.running_until, row.running_by) == (None, None)
+        second.queue.push(("agent", agent_id), 0.0)
+        assert await second.run_due(time.time()) == 1
+        await first.stop()
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_retry_deferred_while_other_replica_runs(self, session_factory):
+        """A retry claimed while the agent is leased elsewhere goes back to pending."""
+        import time
+        from datetime import UTC, datetime
+
+        from src.harness.scheduler import DEFER_SECONDS
+        from src.models.task import Task
+
+        (agent_id,) = await add_agents(session_factory, 1)
+        first = make_scheduler(session_factory)
+        second = make_scheduler(session_factory)
+        await first.start()
+        await second.start()
+        await mark_all_due(session_factory)
+        first.queue.push(("agent", agent_id), 0.0)
+        assert await first.run_due(time.time()) == 1
+
+        async with session_factory() as session:
+            retry = Task(
+                agent_id=agent_id,
+                status="pending",
+                scheduled_at=datetime.now(UTC),
+                retry_count=1,
+            )
+            session.add(retry)
+            await session.commit()
+        now = time.time()
+        second._push_retry(retry.id, agent_id, now)
+
+        assert await second.run_due(now) == 0
+        assert second.queue.due_at(("retry", retry.id)) == now + DEFER_SECONDS
+        async with session_factory() as session:
+            assert (await session.get(Task, retry.id)).status == "pending"
+        await first.stop()
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_taken_over(self, session_factory):
+        """A lease left by a replica that died mid-run lapses."""
+        import time
+        from datetime import datetime
+
+        from sqlalchemy import update
+
+        from src.models.schedule import AgentSchedule
+
+        (agent_id,) = await add_agents(session_factory, 1)
+        scheduler = make_scheduler(session_factory)
+        await scheduler.start()
+        async with session_factory() as session:
+            await session.execute(
+                update(AgentSchedule).values(
+                    next_run_at=datetime(2000, 1, 1),
+                    running_until=datetime(2000, 1, 1, 0, 10),
+                    running_by="dead-replica",
+                )
+            )
+            await session.commit()
+        scheduler.queue.push(("agent", agent_id), 0.0)
+
+        assert await scheduler.run_due(time.time()) == 1
+        async with session_factory() as session:
+            row = await session.get(AgentSchedule, agent_id)
+            assert row.running_by == scheduler.worker_id
+        await scheduler.stop()
+
+
+async def mark_all_due(session_factory):
+    """Move every stored next run time into the past."""
+    from datetime import datetime
+
+    from sqlalchemy import update
+
+    from src.models.schedule import AgentSchedule
+
+    async with session_factory() as session:
+        await session.execute(update(AgentSchedule).values(next_run_at=datetime(2000, 1, 1)))
+        await session.commit()
@@ -0,0 +1,194 @@
+"""Tests for src/harness/worker_pool.py - Warm Worker Pool."""
+
+import os
+
+import pytest
+
+# Skip all tests if dependencies not installed (harness/__init__.py imports psutil)
+psutil = pytest.importorskip("psutil")
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="warm workers need os.fork")
+
+SUCCESS_AGENT = """
+class Agent:
+    def __init__(self, config):
+        self.config = config
+
+    async def execute(self):
+        print("running")
+        return {"status": "success", "value": self.config.get("key")}
+"""
+
+SLOW_AGENT = """
+import asyncio
+
+class Agent:
+    def __init__(self, config):
+        pass
+
+    async def execute(self):
+        await asyncio.sleep(10)
+        return {"status": "success"}
+"""
+
+PID_AGENT = """
+import os
+
+class Agent:
+    def __init__(self, config):
+        pass
+
+    async def execute(self):
+        return {"pid": os.getpid(), "ppid": os.getppid()}
+"""
+
+
+@pytest.fixture
+async def pool():
+    from src.harness.worker_pool import WarmWorkerPool
+
+    pool = WarmWorkerPool(size=2, max_runs_per_worker=100)
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+class TestWarmWorkerPool:
+    """Tests for WarmWorkerPool."""
+
+    @pytest.mark.asyncio
+    async def test_start_prefork_workers(self, pool):
+        """start should leave size workers idle and warm."""
+        status = pool.get_status()
+        assert status["idle"] == 2
+        assert status["spawned"] == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_success(self, pool):
+        """Successful runs return the agent result, config and stdout."""
+        result = await pool.execute(SUCCESS_AGENT, config={"key": "v"})
+
+        assert result.status == "success"
+        assert result.result == {"status": "success", "value": "v"}
+        assert "running" in result.stdout
+        assert result.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_agent_code_uses_pool(self, pool):
+        """execute_agent_code should delegate to the pool when given one."""
+        from src.harness.executor import execute_agent_code
+
+        result = await execute_agent_code(PID_AGENT, config={}, pool=pool)
+
+        assert result.status == "success"
+        worker_pids = {worker.pid for worker in pool._idle}
+        assert result.result["ppid"] in worker_pids
+
+    @pytest.mark.asyncio
+    async def test_each_run_is_a_separate_process(self, pool):
+        """Runs are forked, so agent state never leaks between runs."""
+        leaky = """
+import builtins
+
+class Agent:
+    def __init__(self, config):
+        pass
+
+    async def execute(self):
+        seen = hasattr(builtins, "leaked")
+        builtins.leaked = True
+        return {"seen": seen}
+"""
+        first = await pool.execute(leaky)
+        second = await pool.execute(leaky)
+
+        assert first.result == {"seen": False}
+        assert second.result == {"seen": False}
+
+    @pytest.mark.asyncio
+    async def test_agent_error(self, pool):
+        """Agent exceptions map to status error with a non-zero exit code."""
+        agent_code = """
+class Agent:
+    def __init__(self, config):
+        pass
+
+    async def execute(self):
+        raise ValueError("Agent error")
+"""
+        result = await pool.execute(agent_code)
+
+        assert result.status == "error"
+        assert result.exit_code != 0
+        assert "Agent error" in result.error
+
+    @pytest.mark.asyncio
+    async def test_syntax_error(self, pool):
+        """Syntax errors are reported like the cold path."""
+        result = await pool.execute("class Agent\n    pass")
+
+        assert result.status == "error"
+        assert result.exit_code != 0
+        assert "SyntaxError" in result.stderr
+        assert "warm_worker" not in result.stderr
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_run_and_recovers(self, pool):
+        """A timed-out run kills its worker; the pool keeps serving."""
+        result = await pool.execute(SLOW_AGENT, timeout=1)
+
+        assert result.status == "timeout"
+        assert "timeout" in result.error.lower()
+        assert pool.get_status()["recycled"] == 1
+
+        result = await pool.execute(SUCCESS_AGENT, config={"key": 1})
+        assert result.status == "success"
+
+    @pytest.mark.asyncio
+    async def test_recycle_after_max_runs(self):
+        """Workers are replaced once they reach max_runs_per_worker."""
+        from src.harness.worker_pool import WarmWorkerPool
+
+        async with WarmWorkerPool(size=1, max_runs_per_worker=2) as pool:
+            first = await pool.execute(PID_AGENT)
+            second = await pool.execute(PID_AGENT)
+            third = await pool.execute(PID_AGENT)
+
+            assert first.result["ppid"] == second.result["ppid"]
+            assert third.result["ppid"] != first.result["ppid"]
+            assert pool.get_status()["recycled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recycle_on_memory_growth(self):
+        """Workers whose RSS grows past the limit are replaced."""
+        from src.harness.worker_pool import WarmWorkerPool
+
+        async with WarmWorkerPool(size=1, max_memory_growth_mb=-1) as pool:
+            first = await pool.execute(PID_AGENT)
+            second = await pool.execute(PID_AGENT)
+
+            assert first.result["ppid"] != second.result["ppid"]
+
+    @pytest.mark.asyncio
+    async def test_size_defaults_to_resource_limits(self):
+        """Pool size follows ResourceLimits.max_concurrent_agents."""
+        from src.harness.resources import ResourceLimits
+        from src.harness.worker_pool import WarmWorkerPool
+
+        pool = WarmWorkerPool(limits=ResourceLimits(max_concurrent_agents=3))
+        assert pool.size == 3
+
+    @pytest.mark.asyncio
+    async def test_close_stops_workers(self):
+        """close should terminate every worker process."""
+        from src.harness.worker_pool import WarmWorkerPool, WorkerPoolError
+
+        pool = WarmWorkerPool(size=2)
+        await pool.start()
+        pids = [worker.pid for worker in pool._idle]
+        await pool.close()
+
+        for pid in pids:
+            assert not psutil.pid_exists(pid) or psutil.Process(pid).status() == "zombie"
+        with pytest.raises(WorkerPoolError, match="closed"):
+            await pool.execute(SUCCESS_AGENT)
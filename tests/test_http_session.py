@@ -0,0 +1,73 @@
+"""Tests for the shared pooled HTTP session and ETag cache."""
+
+import pytest
+
+from src.http_session import ETagCache, PooledHTTPClient
+
+
+class _Client(PooledHTTPClient):
+    def __init__(self):
+        self.timeout = 5.0
+        self.max_connections = 2
+        self.max_keepalive_connections = 1
+        self._client = None
+
+
+class TestPooledHTTPClient:
+    """Tests for the PooledHTTPClient mixin."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_and_recreated_after_close(self):
+        """Test one client is shared until aclose(), then recreated."""
+        async with _Client() as client:
+            pooled = client._get_client()
+            assert client._get_client() is pooled
+        assert pooled.is_closed
+        assert client._client is None
+        assert client._get_client() is not pooled
+        await client.aclose()
+
+
+class TestETagCache:
+    """Tests for ETagCache."""
+
+    def test_key_sorts_params(self):
+        """Test params are part of the key regardless of order."""
+        assert ETagCache.key("u", None) == "u"
+        assert ETagCache.key("u", {"b": 2, "a": 1}) == "u?a=1&b=2"
+
+    def test_not_modified_returns_copies(self):
+        """Test callers can't mutate the cached body."""
+        cache = ETagCache(maxsize=2)
+        body = {"items": [1]}
+        cache.store("k", '"e"', body)
+        body["items"].append(2)
+
+        entry = cache.get("k")
+        first = cache.not_modified("k", entry)
+        first["items"].append(3)
+
+        assert entry[0] == '"e"'
+        assert cache.not_modified("k", entry) == {"items": [1]}
+
+    def test_lru_eviction_and_disabled(self):
+        """Test the least recently revalidated entry is evicted first."""
+        cache = ETagCache(maxsize=2)
+        cache.store("a", '"a"', 1)
+        cache.store("b", '"b"', 2)
+        cache.not_modified("a", cache.get("a"))
+        cache.store("c", '"c"', 3)
+
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+        disabled = ETagCache(maxsize=0)
+        disabled.store("a", '"a"', 1)
+        assert not disabled.enabled
+        assert len(disabled) == 0
+
+    def test_responses_without_etag_not_cached(self):
+        """Test a missing ETag header leaves the cache untouched."""
+        cache = ETagCache()
+        cache.store("a", None, {"x": 1})
+        assert cache.get("a") is None
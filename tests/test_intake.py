@@ -2,6 +2,7 @@
 
 Tests cover:
 - IntakeQueue (Redis Streams wrapper with in-memory fallback)
+- IntakeConsumer (batched consumer-group worker, against fakeredis)
 - TransactionalOutbox (reliability pattern)
 - DomainClassifier (personal/business/mixed)
 - ProductDetector (product potential identification)
@@ -111,6 +112,212 @@ class TestIntakeQueue:
         assert stats["pending"] == 2
 
 
+@pytest.fixture
+async def redis_queue():
+    """IntakeQueue on an in-process fakeredis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    queue = IntakeQueue(redis_client=client)
+    await queue.initialize()
+    yield queue
+    await client.aclose()
+
+
+class TestIntakeConsumer:
+    """Tests for batched consumption with IntakeConsumer."""
+
+    @pytest.mark.asyncio
+    async def test_burst_consumed_and_acked(self, redis_queue):
+        """A pushed burst is handled once per event and fully acknowledged."""
+        from src.intake.queue import IntakeConsumer
+
+        seen = []
+
+        async def handler(event):
+            seen.append(event.content)
+
+        events = [IntakeEvent(content=f"msg {i}") for i in range(120)]
+        ids = await redis_queue.push_many(events)
+        assert len(ids) == 120
+
+        consumer = IntakeConsumer(redis_queue, handler=handler, batch_size=50, block_ms=0)
+        while await consumer.run_once():
+            pass
+        await consumer.flush()
+
+        assert sorted(seen) == sorted(e.content for e in events)
+        stats = await redis_queue.get_stats()
+        assert stats["pending"] == 0
+        assert stats["lag"] == 0
+        assert stats["acknowledged"] == 120
+        assert stats["throughput_per_sec"] > 0
+
+    @pytest.mark.asyncio
+    async def test_acks_are_pipelined_with_reads(self, redis_queue):
+        """Acknowledgements ride along with reads instead of one XACK per event."""
+        from src.intake.queue import IntakeConsumer
+
+        await redis_queue.push_many([IntakeEvent(content=str(i)) for i in range(30)])
+        redis_queue._redis.xack = AsyncMock(side_effect=AssertionError("unpipelined XACK"))
+
+        consumer = IntakeConsumer(
+            redis_queue, handler=lambda event: None, batch_size=10, block_ms=0
+        )
+        for _ in range(4):
+            await consumer.run_once()
+
+        stats = await redis_queue.get_stats()
+        assert stats["acknowledged"] == 30
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_ack_kept_for_next_cycle(self, redis_queue):
+        """Acks whose pipelined XACK fails are resent, not dropped."""
+        from src.intake.queue import IntakeConsumer
+
+        await redis_queue.push_many([IntakeEvent(content=str(i)) for i in range(3)])
+        consumer = IntakeConsumer(redis_queue, lambda event: None, block_ms=0)
+        assert await consumer.run_once() == 3
+        unacked = list(consumer._unacked)
+
+        pipeline = redis_queue._redis.pipeline
+        broken = MagicMock()
+        broken.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+        redis_queue._redis.pipeline = MagicMock(return_value=broken)
+        with pytest.raises(ConnectionError):
+            await consumer.run_once()
+        assert consumer._unacked == unacked
+
+        redis_queue._redis.pipeline = pipeline
+        await consumer.run_once()
+        assert (await redis_queue.get_stats())["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_acks(self, redis_queue):
+        """A flush whose XACK fails keeps the IDs instead of forgetting them."""
+        from src.intake.queue import IntakeConsumer
+
+        await redis_queue.push_many([IntakeEvent(content=str(i)) for i in range(3)])
+        consumer = IntakeConsumer(redis_queue, lambda event: None, block_ms=0)
+        assert await consumer.run_once() == 3
+        unacked = list(consumer._unacked)
+
+        xack = redis_queue._redis.xack
+        redis_queue._redis.xack = AsyncMock(side_effect=ConnectionError("redis down"))
+        assert await consumer.flush() == 0
+        assert consumer._unacked == unacked
+
+        redis_queue._redis.xack = xack
+        assert await consumer.flush() == 3
+        assert consumer._unacked == []
+        assert (await redis_queue.get_stats())["pending"] == 0
+
+    def test_handler_is_required(self, redis_queue):
+        """There is no default handler that would ack without persisting."""
+        from src.intake.queue import IntakeConsumer
+
+        with pytest.raises(TypeError):
+            IntakeConsumer(redis_queue)
+
+    @pytest.mark.asyncio
+    async def test_batch_handled_concurrently(self, redis_queue):
+        """Slow handlers overlap within a batch."""
+        import asyncio
+        import time
+
+        from src.intake.queue import IntakeConsumer
+
+        async def slow(event):
+            await asyncio.sleep(0.1)
+
+        await redis_queue.push_many([IntakeEvent(content=str(i)) for i in range(20)])
+        consumer = IntakeConsumer(redis_queue, handler=slow, batch_size=20, concurrency=20)
+
+        start = time.perf_counter()
+        assert await consumer.run_once() == 20
+        assert time.perf_counter() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_events_stay_pending(self, redis_queue):
+        """Events whose handler raises are not acknowledged."""
+        from src.intake.queue import IntakeConsumer
+
+        def handler(event):
+            if event.content == "bad":
+                raise ValueError("cannot classify")
+
+        await redis_queue.push_many([IntakeEvent(content="ok"), IntakeEvent(content="bad")])
+        consumer = IntakeConsumer(redis_queue, handler=handler, block_ms=0)
+        await consumer.run_once()
+        await consumer.flush()
+
+        stats = await consumer.get_stats()
+        assert stats["processed"] == 1
+        assert stats["failed"] == 1
+        assert stats["queue"]["pending"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_claimed_from_dead_consumer(self, redis_queue):
+        """Entries a dead consumer read but never acked are taken over."""
+        from src.intake.queue import IntakeConsumer
+
+        await redis_queue.push_many([IntakeEvent(content=str(i)) for i in range(5)])
+        # "dead" reads everything and disappears without acknowledging
+        assert len(await redis_queue.read_pending(consumer_name="dead", count=10)) == 5
+
+        seen = []
+        survivor = IntakeConsumer(
+            redis_queue,
+            handler=lambda event: seen.append(event.content),
+            consumer_name="survivor",
+            block_ms=0,
+            claim_idle_ms=0,
+        )
+        assert await survivor.run_once() == 5
+        await survivor.flush()
+
+        assert sorted(seen) == ["0", "1", "2", "3", "4"]
+        stats = await redis_queue.get_stats()
+        assert stats["claimed"] == 5
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_memory_fallback(self):
+        """The consumer also drains the in-memory backend."""
+        from src.intake.queue import IntakeConsumer
+
+        queue = IntakeQueue(redis_client=None)
+        await queue.push_many([IntakeEvent(content="a"), IntakeEvent(content="b")])
+
+        seen = []
+        consumer = IntakeConsumer(queue, handler=lambda event: seen.append(event.content))
+        assert await consumer.run_once() == 2
+        await consumer.flush()
+
+        assert sorted(seen) == ["a", "b"]
+        assert await queue.read_pending() == []
+        assert (await queue.get_stats())["acknowledged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_until_stopped(self, redis_queue):
+        """run() keeps consuming until stop() and flushes on exit."""
+        import asyncio
+
+        from src.intake.queue import IntakeConsumer
+
+        consumer = IntakeConsumer(redis_queue, handler=lambda event: None, block_ms=50)
+        task = asyncio.create_task(consumer.run())
+        await redis_queue.push_many([IntakeEvent(content=str(i)) for i in range(10)])
+        for _ in range(50):
+            if (await consumer.get_stats())["processed"] == 10:
+                break
+            await asyncio.sleep(0.02)
+        consumer.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+        assert (await redis_queue.get_stats())["pending"] == 0
+
+
 class TestTransactionalOutbox:
     """Tests for TransactionalOutbox."""
 
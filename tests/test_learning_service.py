@@ -8,19 +8,37 @@ Comprehensive tests for the learning and adaptation system:
 - Integration with controllers
 """
 
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.learning_service import (
     BASE_CONFIDENCE_SCORES,
     LearningConfig,
     LearningService,
     create_learning_service,
+    to_async_database_url,
 )
+from src.models.action_record import ActionRecord
 
 
 # ============================================================================
 # FIXTURES
 # ============================================================================
+async def record_at(service: LearningService, days_ago: float, **fields) -> None:
+    """Insert an action record with a backdated timestamp."""
+    record = ActionRecord(
+        timestamp=datetime.now(UTC) - timedelta(days=days_ago),
+        **fields,
+    )
+    async with service._get_session() as session:
+        session.add(record)
+        await session.commit()
+
+
 @pytest.fixture
 def learning_config():
     """Create test configuration."""
@@ -124,6 +142,50 @@ class TestLearningServiceInit:
         service = create_learning_service()
         assert service is not None
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+            ("postgres://u:p@db/x", "postgresql+asyncpg://u:p@db/x"),
+            ("postgresql://u:p@db/x", "postgresql+asyncpg://u:p@db/x"),
+            ("postgresql+asyncpg://u:p@db/x", "postgresql+asyncpg://u:p@db/x"),
+        ],
+    )
+    def test_async_database_url(self, url, expected):
+        """Test database URLs are mapped to async drivers."""
+        assert to_async_database_url(url) == expected
+
+    @pytest.mark.asyncio
+    async def test_uses_async_engine(self, learning_service):
+        """Test queries run on an async engine and don't block the loop."""
+        assert isinstance(learning_service.engine, AsyncEngine)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        for _ in range(5):
+            await learning_service.record_action(action_type="DEPLOY", success=True)
+        await learning_service.get_action_stats(action_type="DEPLOY")
+        task.cancel()
+
+        assert ticks > 0
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        """Test close disposes the engine."""
+        service = LearningService(database_url="sqlite:///:memory:")
+        await service.initialize()
+        await service.close()
+
+        assert service.engine is None
+        assert not service.initialized
+
 
 # ============================================================================
 # ACTION RECORDING TESTS
@@ -286,12 +348,13 @@ class TestTrendCalculation:
     @pytest.mark.asyncio
     async def test_trend_improving(self, learning_service):
         """Test improving trend detection."""
-        # Record failures first, then successes
-        for i in range(10):
-            success = i >= 5  # First 5 fail, last 5 succeed
+        # Failures in the older half of the window, successes in the newer half
+        for _ in range(5):
+            await record_at(learning_service, 5, action_type="DEPLOY", success=False)
+        for _ in range(5):
             await learning_service.record_action(
                 action_type="DEPLOY",
-                success=success,
+                success=True,
                 confidence_score=0.8,
             )
 
@@ -301,18 +364,125 @@ class TestTrendCalculation:
     @pytest.mark.asyncio
     async def test_trend_declining(self, learning_service):
         """Test declining trend detection."""
-        # Record successes first, then failures
-        for i in range(10):
-            success = i < 5  # First 5 succeed, last 5 fail
+        # Successes in the older half of the window, failures in the newer half
+        for _ in range(5):
+            await record_at(learning_service, 5, action_type="DEPLOY", success=True)
+        for _ in range(5):
             await learning_service.record_action(
                 action_type="DEPLOY",
-                success=success,
+                success=False,
                 confidence_score=0.8,
             )
 
         stats = await learning_service.get_action_stats(action_type="DEPLOY")
         assert stats.confidence_trend == "declining"
 
+    @pytest.mark.asyncio
+    async def test_trend_needs_both_halves(self, learning_service):
+        """Test that actions only in the recent half report a stable trend."""
+        for i in range(10):
+            await learning_service.record_action(action_type="DEPLOY", success=i >= 5)
+
+        stats = await learning_service.get_action_stats(action_type="DEPLOY")
+        assert stats.confidence_trend == "stable"
+
+
+# ============================================================================
+# SQL AGGREGATION & INCREMENTAL CACHE TESTS
+# ============================================================================
+class TestStatsAggregation:
+    """Tests for SQL-side aggregation and the incremental stats cache."""
+
+    @pytest.mark.asyncio
+    async def test_sql_aggregates_match_records(self, learning_service):
+        """Test that SQL aggregates match the recorded values."""
+        await record_at(
+            learning_service,
+            6,
+            action_type="DEPLOY",
+            success=True,
+            confidence_score=0.5,
+            execution_time_ms=1000,
+        )
+        await record_at(
+            learning_service,
+            1,
+            action_type="DEPLOY",
+            success=False,
+            confidence_score=0.7,
+            execution_time_ms=3000,
+        )
+        await record_at(learning_service, 30, action_type="DEPLOY", success=True)
+
+        stats = await learning_service.get_action_stats(action_type="DEPLOY")
+
+        assert stats.total_count == 2
+        assert stats.success_count == 1
+        assert stats.avg_confidence == pytest.approx(0.6)
+        assert stats.avg_execution_time_ms == pytest.approx(2000)
+        assert stats.last_executed > datetime.now(UTC) - timedelta(days=2)
+
+    @pytest.mark.asyncio
+    async def test_record_action_updates_cache_incrementally(self, populated_service):
+        """Test that writes update cached stats instead of clearing them."""
+        await populated_service.get_action_stats(action_type="DEPLOY")
+        await populated_service.get_action_stats(agent_type="DeployAgent")
+
+        with patch.object(populated_service, "_aggregate_stats") as mock_aggregate:
+            await populated_service.record_action(
+                action_type="DEPLOY",
+                agent_type="DeployAgent",
+                success=False,
+                confidence_score=0.5,
+                execution_time_ms=0,
+            )
+            deploy = await populated_service.get_action_stats(action_type="DEPLOY")
+            by_agent = await populated_service.get_action_stats(agent_type="DeployAgent")
+
+        mock_aggregate.assert_not_called()
+        assert deploy.total_count == 6
+        assert deploy.failure_count == 1
+        assert by_agent.total_count == 9
+
+    @pytest.mark.asyncio
+    async def test_record_action_skips_non_matching_entries(self, populated_service):
+        """Test that writes only touch cache entries matching their filters."""
+        before = await populated_service.get_action_stats(action_type="ROLLBACK")
+
+        await populated_service.record_action(action_type="DEPLOY", success=True)
+
+        after = await populated_service.get_action_stats(action_type="ROLLBACK")
+        assert after.total_count == before.total_count
+
+    @pytest.mark.asyncio
+    async def test_all_stats_cache_incremental(self, populated_service):
+        """Test that get_all_stats stays cached across writes, including new types."""
+        await populated_service.get_all_stats()
+
+        with patch.object(populated_service, "_aggregate_stats") as mock_aggregate:
+            await populated_service.record_action(action_type="DEPLOY", success=True)
+            await populated_service.record_action(action_type="ALERT", success=True)
+            all_stats = await populated_service.get_all_stats()
+
+        mock_aggregate.assert_not_called()
+        by_type = {s.action_type: s.total_count for s in all_stats}
+        assert by_type["DEPLOY"] == 6
+        assert by_type["ALERT"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_expires_after_ttl(self, populated_service):
+        """Test that cached totals are recomputed after the TTL."""
+        await populated_service.get_action_stats(action_type="DEPLOY")
+        populated_service._cache_ttl_seconds = 0
+
+        with patch.object(
+            populated_service, "_aggregate_stats", wraps=populated_service._aggregate_stats
+        ) as mock_aggregate:
+            stats = await populated_service.get_action_stats(action_type="DEPLOY")
+
+        mock_aggregate.assert_awaited_once()
+        assert stats.total_count == 5
+
 
 # ============================================================================
 # CONFIDENCE ADJUSTMENT TESTS
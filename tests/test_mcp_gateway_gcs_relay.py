@@ -0,0 +1,283 @@
+"""Tests for the MCP Gateway GCS relay.
+
+Tests the relay worker in src/mcp_gateway/gcs_relay.py against an in-memory
+fake GCS bucket that enforces generation-match preconditions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.mcp_gateway import gcs_relay
+from src.mcp_gateway.gcs_relay import GCSRelayWorker
+
+PREFIX = "mcp-relay"
+
+
+class PreconditionFailed(Exception):
+    """Stand-in for google.api_core.exceptions.PreconditionFailed."""
+
+    code = 412
+
+
+class NotFound(Exception):
+    """Stand-in for google.api_core.exceptions.NotFound."""
+
+    code = 404
+
+
+class FakeBlob:
+    """Blob handle backed by a FakeBucket, mirroring google.cloud.storage.Blob."""
+
+    def __init__(self, bucket: FakeBucket, name: str, generation: int | None = None):
+        self.bucket = bucket
+        self.name = name
+        self.generation = generation
+
+    def _check(self, if_generation_match: int | None) -> None:
+        current = self.bucket.objects.get(self.name)
+        current_generation = current[1] if current else 0
+        if if_generation_match is not None and if_generation_match != current_generation:
+            raise PreconditionFailed(f"{self.name}: generation mismatch")
+
+    def upload_from_string(
+        self, data: str, content_type: str = "text/plain", if_generation_match: int | None = None
+    ) -> None:
+        with self.bucket.lock:
+            self._check(if_generation_match)
+            self.generation = next(self.bucket.generations)
+            self.bucket.objects[self.name] = (data, self.generation)
+
+    def download_as_text(self, if_generation_match: int | None = None) -> str:
+        with self.bucket.lock:
+            if self.name not in self.bucket.objects:
+                raise NotFound(self.name)
+            self._check(if_generation_match)
+            return self.bucket.objects[self.name][0]
+
+    def reload(self) -> None:
+        with self.bucket.lock:
+            if self.name not in self.bucket.objects:
+                raise NotFound(self.name)
+            self.generation = self.bucket.objects[self.name][1]
+
+    def delete(self, if_generation_match: int | None = None) -> None:
+        with self.bucket.lock:
+            if self.name not in self.bucket.objects:
+                raise NotFound(self.name)
+            self._check(if_generation_match)
+            del self.bucket.objects[self.name]
+
+
+class FakeBucket:
+    """Thread-safe in-memory bucket with object generations."""
+
+    def __init__(self):
+        self.objects: dict[str, tuple[str, int]] = {}
+        self.generations = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    def list_blobs(self, prefix: str = "") -> list[FakeBlob]:
+        with self.lock:
+            return [
+                FakeBlob(self, name, generation)
+                for name, (_, generation) in sorted(self.objects.items())
+                if name.startswith(prefix)
+            ]
+
+    def put(self, name: str, data: dict) -> None:
+        self.blob(name).upload_from_string(json.dumps(data))
+
+    def get(self, name: str) -> dict | None:
+        entry = self.objects.get(name)
+        return json.loads(entry[0]) if entry else None
+
+
+def _add_request(bucket: FakeBucket, request_id: int, tool: str = "echo") -> None:
+    """Upload a tools/call request with a response path."""
+    bucket.put(
+        f"{PREFIX}/requests/req-{request_id}.json",
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": tool, "arguments": {"value": request_id}},
+            "_bridge": {"responsePath": f"{PREFIX}/responses/req-{request_id}.json"},
+        },
+    )
+
+
+@pytest.fixture
+def bucket() -> FakeBucket:
+    return FakeBucket()
+
+
+@pytest.fixture
+def tool_calls():
+    """Install a slow echo tool and a shared MCP server stand-in."""
+    calls: list[int] = []
+
+    async def echo(value: int) -> dict:
+        calls.append(value)
+        await asyncio.sleep(0.1)
+        return {"echo": value}
+
+    gcs_relay._get_mcp_server.cache_clear()
+    with (
+        patch.object(gcs_relay, "_get_tool_map", return_value={"echo": echo}),
+        patch("src.mcp_gateway.server.create_mcp_server", return_value=MagicMock()) as create,
+    ):
+        yield calls, create
+    gcs_relay._get_mcp_server.cache_clear()
+
+
+class TestGCSRelayWorker:
+    """Tests for GCSRelayWorker."""
+
+    @pytest.mark.asyncio
+    async def test_requests_processed_concurrently(self, bucket, tool_calls):
+        """Test a poll answers every request in parallel and cleans up."""
+        calls, create = tool_calls
+        for i in range(10):
+            _add_request(bucket, i)
+
+        worker = GCSRelayWorker(bucket, prefix=PREFIX, max_concurrency=10)
+        start = time.perf_counter()
+        processed = await worker.poll_once()
+        elapsed = time.perf_counter() - start
+        worker.close()
+
+        assert processed == 10
+        assert sorted(calls) == list(range(10))
+        # Ten 100 ms tool calls overlap instead of taking a second
+        assert elapsed < 0.5
+        for i in range(10):
+            assert bucket.get(f"{PREFIX}/responses/req-{i}.json")["result"] == {"echo": i}
+        # Requests and claims are gone
+        assert not [name for name in bucket.objects if "/responses/" not in name]
+        # One MCP server for all requests
+        assert create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, bucket, tool_calls):
+        """Test no more than max_concurrency requests run at once."""
+        for i in range(6):
+            _add_request(bucket, i)
+
+        worker = GCSRelayWorker(bucket, prefix=PREFIX, max_concurrency=2)
+        start = time.perf_counter()
+        assert await worker.poll_once() == 6
+        worker.close()
+
+        assert time.perf_counter() - start >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_replicas_process_each_request_once(self, bucket, tool_calls):
+        """Test replicas polling one prefix never double-process."""
+        calls, _ = tool_calls
+        for i in range(20):
+            _add_request(bucket, i)
+
+        workers = [GCSRelayWorker(bucket, prefix=PREFIX) for _ in range(3)]
+        counts = await asyncio.gather(*(w.poll_once() for w in workers))
+        for worker in workers:
+            worker.close()
+
+        assert sum(counts) == 20
+        assert sorted(calls) == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_live_claim_skipped(self, bucket, tool_calls):
+        """Test a request claimed by a live replica is left alone."""
+        calls, _ = tool_calls
+        _add_request(bucket, 1)
+        bucket.put(f"{PREFIX}/claims/req-1.json", {"owner": "other", "claimed_at": time.time()})
+
+        worker = GCSRelayWorker(bucket, prefix=PREFIX)
+        assert await worker.poll_once() == 0
+        worker.close()
+
+        assert calls == []
+        assert bucket.get(f"{PREFIX}/requests/req-1.json") is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_claim_taken_over(self, bucket, tool_calls):
+        """Test a claim left by a dead replica is taken over."""
+        calls, _ = tool_calls
+        _add_request(bucket, 1)
+        bucket.put(
+            f"{PREFIX}/claims/req-1.json",
+            {"owner": "dead", "claimed_at": time.time() - 3600},
+        )
+
+        worker = GCSRelayWorker(bucket, prefix=PREFIX, claim_timeout=60)
+        assert await worker.poll_once() == 1
+        worker.close()
+
+        assert calls == [1]
+        assert bucket.get(f"{PREFIX}/claims/req-1.json") is None
+
+    @pytest.mark.asyncio
+    async def test_replaced_request_not_deleted(self, bucket):
+        """Test a request re-uploaded during processing survives for the next poll."""
+        _add_request(bucket, 1)
+
+        async def echo(value: int) -> dict:
+            # A client reuses the request name while the first one is running
+            _add_request(bucket, 1)
+            return {"echo": value}
+
+        with (
+            patch.object(gcs_relay, "_get_tool_map", return_value={"echo": echo}),
+            patch.object(gcs_relay, "_get_mcp_server", return_value=MagicMock()),
+        ):
+            worker = GCSRelayWorker(bucket, prefix=PREFIX)
+            assert await worker.poll_once() == 1
+            worker.close()
+
+        assert bucket.get(f"{PREFIX}/requests/req-1.json") is not None
+
+    @pytest.mark.asyncio
+    async def test_request_without_response_path_deleted(self, bucket, tool_calls):
+        """Test requests with no response path are dropped."""
+        calls, _ = tool_calls
+        bucket.put(f"{PREFIX}/requests/bad.json", {"id": 1, "method": "initialize"})
+
+        worker = GCSRelayWorker(bucket, prefix=PREFIX)
+        assert await worker.poll_once() == 0
+        worker.close()
+
+        assert bucket.objects == {}
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_failed_request_released_for_retry(self, bucket, tool_calls):
+        """Test a request whose response upload fails stays for the next poll."""
+        _add_request(bucket, 1)
+
+        worker = GCSRelayWorker(bucket, prefix=PREFIX)
+        real_blob = bucket.blob
+
+        def blob(name: str) -> FakeBlob:
+            handle = real_blob(name)
+            if "/responses/" in name:
+                handle.upload_from_string = MagicMock(side_effect=RuntimeError("upload failed"))
+            return handle
+
+        with patch.object(bucket, "blob", side_effect=blob):
+            assert await worker.poll_once() == 0
+
+        # Claim released, request kept, and the next poll succeeds
+        assert bucket.get(f"{PREFIX}/claims/req-1.json") is None
+        assert await worker.poll_once() == 1
+        worker.close()
@@ -0,0 +1,234 @@
+"""Tests for the GitHub MCP relay.
+
+Tests GitHubMCPRelay in src/mcp_gateway/github_relay.py against a mocked
+GitHub issue comments API (httpx.MockTransport).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from src.mcp_gateway import github_relay
+from src.mcp_gateway.config import MCPGatewayConfig
+from src.mcp_gateway.github_relay import (
+    REQUEST_MARKER,
+    RESPONSE_MARKER,
+    GitHubMCPRelay,
+    _decode_message,
+    _encode_message,
+)
+
+
+class FakeIssue:
+    """In-memory issue comments API with ETag support."""
+
+    def __init__(self):
+        self.comments: list[dict] = []
+        self.posts = 0
+        self.gets = 0
+
+    @property
+    def etag(self) -> str:
+        return f'"{len(self.comments)}"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            self.gets += 1
+            if request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json=self.comments[-50:], headers={"ETag": self.etag}
+            )
+
+        self.posts += 1
+        body = json.loads(request.content)["body"]
+        self.comments.append({"id": len(self.comments), "body": body})
+        return httpx.Response(201, json={"id": len(self.comments)})
+
+    def add_request(self, request_id: str, tool: str = "slow_tool") -> None:
+        payload = _encode_message(
+            {"method": "tools/call", "params": {"name": tool, "arguments": {}}}
+        )
+        self.comments.append(
+            {"id": len(self.comments), "body": f"{REQUEST_MARKER}{request_id}:{payload} -->"}
+        )
+
+    def responses(self) -> dict[str, dict]:
+        """Decode every response marker across all comments."""
+        found = {}
+        for comment in self.comments:
+            for line in comment["body"].splitlines():
+                if line.startswith(RESPONSE_MARKER):
+                    request_id, encoded = line[len(RESPONSE_MARKER) : -len(" -->")].split(":", 1)
+                    found[request_id] = _decode_message(encoded)
+        return found
+
+
+@pytest.fixture
+def issue() -> FakeIssue:
+    return FakeIssue()
+
+
+@pytest.fixture
+def relay(issue, monkeypatch) -> GitHubMCPRelay:
+    client = httpx.AsyncClient(
+        base_url="https://api.github.com", transport=httpx.MockTransport(issue.handler)
+    )
+    relay = GitHubMCPRelay(
+        MCPGatewayConfig(
+            railway_token="rt",
+            railway_service_id="rsid",
+            railway_environment_id="reid",
+            railway_project_id="rpid",
+            n8n_base_url="http://n8n",
+            n8n_api_key="n8k",
+            gateway_token="gt",
+            production_url="https://prod",
+            github_relay_repo="owner/repo",
+            github_relay_issue=1,
+        ),
+        github_client=client,
+        write_interval=0.2,
+    )
+    relay._github_token = "token"
+
+    async def slow_tool(tool_name: str, arguments: dict) -> dict:
+        await asyncio.sleep(0.1)
+        return {"result": {"tool": tool_name}}
+
+    monkeypatch.setattr(relay, "_execute_tool", slow_tool)
+    return relay
+
+
+class TestPollOnce:
+    """Tests for concurrent processing and aggregated responses."""
+
+    @pytest.mark.asyncio
+    async def test_burst_answered_in_few_comments(self, relay, issue):
+        """Test a burst of requests runs concurrently and shares comments."""
+        for i in range(8):
+            issue.add_request(f"req-{i}")
+
+        start = time.perf_counter()
+        processed = await relay.poll_once()
+        elapsed = time.perf_counter() - start
+
+        assert processed == 8
+        assert sorted(issue.responses()) == sorted(f"req-{i}" for i in range(8))
+        assert issue.responses()["req-3"]["result"] == {"tool": "slow_tool"}
+        # Eight 100 ms calls, four at a time, well under a serial 0.8 s + writes
+        assert elapsed < 0.8
+        assert issue.posts < 8
+        assert relay.stats["responses_posted"] == 8
+
+    @pytest.mark.asyncio
+    async def test_comment_size_limit(self, relay, issue):
+        """Test responses are split at max_responses_per_comment."""
+        relay.max_responses_per_comment = 2
+        relay.max_concurrency = 6
+        for i in range(6):
+            issue.add_request(f"req-{i}")
+
+        await relay.poll_once()
+
+        assert issue.posts == 3
+        assert len(issue.responses()) == 6
+
+    @pytest.mark.asyncio
+    async def test_requests_processed_once(self, relay, issue):
+        """Test a second poll does not re-run answered requests."""
+        issue.add_request("req-1")
+
+        assert await relay.poll_once() == 1
+        assert await relay.poll_once() == 0
+        assert issue.posts == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_issue_not_modified(self, relay, issue):
+        """Test polls of an unchanged issue are conditional and return 304."""
+        issue.add_request("req-1")
+        await relay.poll_once()
+        await relay.poll_once()
+        await relay.poll_once()
+
+        assert relay.stats["not_modified"] == 1
+        assert relay.stats["polls"] == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_method_still_answered(self, relay, issue):
+        """Test non-tool requests are answered with the rest of the batch."""
+        issue.comments.append(
+            {
+                "id": 0,
+                "body": f"{REQUEST_MARKER}req-x:{_encode_message({'method': 'bogus'})} -->",
+            }
+        )
+        issue.add_request("req-1")
+
+        assert await relay.poll_once() == 2
+        assert issue.responses()["req-x"]["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_mutating_tools_run_serially_oldest_first(self, relay, issue, monkeypatch):
+        """Test deploy/rollback/trigger calls never overlap and keep comment order."""
+        events = []
+        running = set()
+
+        async def recording_tool(tool_name: str, arguments: dict) -> dict:
+            if tool_name in github_relay.MUTATING_TOOLS:
+                assert not running, f"{tool_name} overlapped {running}"
+                running.add(tool_name)
+                events.append(tool_name)
+            await asyncio.sleep(0.05)
+            running.discard(tool_name)
+            return {"result": {"tool": tool_name}}
+
+        monkeypatch.setattr(relay, "_execute_tool", recording_tool)
+        for i, tool in enumerate(
+            ["railway_deploy", "health_check", "railway_rollback", "n8n_list", "n8n_trigger"]
+        ):
+            issue.add_request(f"req-{i}", tool)
+        issue.comments.reverse()  # the API returns newest first
+
+        assert await relay.poll_once() == 5
+        assert events == ["railway_deploy", "railway_rollback", "n8n_trigger"]
+        assert len(issue.responses()) == 5
+
+    @pytest.mark.asyncio
+    async def test_failing_request_answered_with_error(self, relay, issue):
+        """Test a request that raises gets an error response and the rest are posted."""
+        issue.comments.append(
+            {"id": 0, "body": f"{REQUEST_MARKER}req-bad:{_encode_message([1, 2])} -->"}
+        )
+        issue.add_request("req-1")
+
+        assert await relay.poll_once() == 2
+        responses = issue.responses()
+        assert responses["req-bad"]["error"]["code"] == -32603
+        assert responses["req-1"]["result"] == {"tool": "slow_tool"}
+
+
+class TestAdaptivePolling:
+    """Tests for the adaptive poll interval."""
+
+    def test_backs_off_while_idle(self, relay):
+        """Test idle polls double the interval up to the maximum."""
+        intervals = []
+        for _ in range(8):
+            relay._poll_interval = relay._next_poll_interval(0)
+            intervals.append(relay._poll_interval)
+
+        assert intervals[0] == github_relay.POLL_INTERVAL * 2
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == github_relay.MAX_POLL_INTERVAL
+
+    def test_speeds_up_on_traffic(self, relay):
+        """Test a poll with requests resets to the fast interval."""
+        relay._poll_interval = github_relay.MAX_POLL_INTERVAL
+
+        assert relay._next_poll_interval(3) == github_relay.MIN_POLL_INTERVAL
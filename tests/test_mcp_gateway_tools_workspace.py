@@ -5,6 +5,7 @@ Tests the workspace module in src/mcp_gateway/tools/workspace.py.
 
 from __future__ import annotations
 
+import json
 import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -32,6 +33,16 @@ def mock_oauth_module():
         sys.modules.pop("src.mcp_gateway.tools.oauth", None)
 
 
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """Start every test with an empty shared token cache."""
+    from src.google_token_provider import reset_token_providers
+
+    reset_token_providers()
+    yield
+    reset_token_providers()
+
+
 def _can_import_httpx() -> bool:
     """Check if httpx is available for tests."""
     try:
@@ -49,6 +60,33 @@ pytestmark = [
 ]
 
 
+def _batch_response(*parts: tuple[int, dict]) -> MagicMock:
+    """Build a mock multipart/mixed Gmail batch response, one part per call."""
+    boundary = "batch_test"
+    lines = []
+    for index, (status, body) in enumerate(parts):
+        lines.extend(
+            [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <response-item{index}>",
+                "",
+                f"HTTP/1.1 {status} OK",
+                "Content-Type: application/json; charset=UTF-8",
+                "",
+                json.dumps(body),
+                "",
+            ]
+        )
+    lines.append(f"--{boundary}--")
+
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"content-type": f"multipart/mixed; boundary={boundary}"}
+    response.content = "\r\n".join(lines).encode()
+    return response
+
+
 # =============================================================================
 # WorkspaceAuth Tests
 # =============================================================================
@@ -72,9 +110,6 @@ class TestWorkspaceAuth:
         from src.mcp_gateway.tools.workspace import WorkspaceAuth
 
         auth = WorkspaceAuth()
-        # Reset state
-        auth._access_token = None
-        auth._token_expiry = 0
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -98,7 +133,7 @@ class TestWorkspaceAuth:
                 token = await auth.get_access_token()
 
         assert token == "new-token"
-        assert auth._access_token == "new-token"
+        assert auth.provider.access_token == "new-token"
 
     @pytest.mark.asyncio
     async def test_get_access_token_uses_cached_when_valid(self):
@@ -108,8 +143,8 @@ class TestWorkspaceAuth:
         from src.mcp_gateway.tools.workspace import WorkspaceAuth
 
         auth = WorkspaceAuth()
-        auth._access_token = "cached-token"
-        auth._token_expiry = time.time() + 3600  # Expires in 1 hour
+        auth.provider._access_token = "cached-token"
+        auth.provider._expires_at = time.time() + 3600  # Expires in 1 hour
 
         # Should return cached token without making API call
         token = await auth.get_access_token()
@@ -121,8 +156,6 @@ class TestWorkspaceAuth:
         from src.mcp_gateway.tools.workspace import WorkspaceAuth
 
         auth = WorkspaceAuth()
-        auth._access_token = None
-        auth._token_expiry = 0
 
         with patch("src.mcp_gateway.tools.workspace.get_secret") as mock_secret:
             mock_secret.return_value = None  # All secrets missing
@@ -136,8 +169,6 @@ class TestWorkspaceAuth:
         from src.mcp_gateway.tools.workspace import WorkspaceAuth
 
         auth = WorkspaceAuth()
-        auth._access_token = None
-        auth._token_expiry = 0
 
         mock_response = MagicMock()
         mock_response.status_code = 401
@@ -282,9 +313,7 @@ class TestGmailSearch:
             "messages": [{"id": "msg-1"}, {"id": "msg-2"}]
         }
 
-        msg_response = MagicMock()
-        msg_response.status_code = 200
-        msg_response.json.return_value = {
+        msg_data = {
             "threadId": "thread-1",
             "snippet": "Preview text...",
             "payload": {
@@ -302,7 +331,11 @@ class TestGmailSearch:
 
             with patch("httpx.AsyncClient") as mock_client:
                 mock_instance = AsyncMock()
-                mock_instance.get.side_effect = [list_response, msg_response, msg_response]
+                mock_instance.get.return_value = list_response
+                mock_instance.post.return_value = _batch_response(
+                    (200, {**msg_data, "id": "msg-1"}),
+                    (200, {**msg_data, "id": "msg-2"}),
+                )
                 mock_client.return_value.__aenter__.return_value = mock_instance
 
                 result = await gmail_search(query="from:sender@example.com", max_results=5)
@@ -310,6 +343,10 @@ class TestGmailSearch:
         assert result["success"] is True
         assert result["count"] == 2
         assert len(result["messages"]) == 2
+        assert [m["id"] for m in result["messages"]] == ["msg-1", "msg-2"]
+        assert result["messages"][0]["subject"] == "Test Subject"
+        # Both metadata fetches share one batch request
+        assert mock_instance.post.call_count == 1
 
     @pytest.mark.asyncio
     async def test_gmail_search_empty_results(self):
@@ -369,9 +406,8 @@ class TestGmailList:
             "messages": [{"id": "msg-1"}]
         }
 
-        msg_response = MagicMock()
-        msg_response.status_code = 200
-        msg_response.json.return_value = {
+        msg_data = {
+            "id": "msg-1",
             "snippet": "Email preview...",
             "payload": {
                 "headers": [
@@ -387,7 +423,8 @@ class TestGmailList:
 
             with patch("httpx.AsyncClient") as mock_client:
                 mock_instance = AsyncMock()
-                mock_instance.get.side_effect = [list_response, msg_response]
+                mock_instance.get.return_value = list_response
+                mock_instance.post.return_value = _batch_response((200, msg_data))
                 mock_client.return_value.__aenter__.return_value = mock_instance
 
                 result = await gmail_list(label="INBOX", max_results=10)
@@ -500,16 +537,17 @@ class TestGmailBatchTrash:
             "messages": [{"id": "msg-1"}, {"id": "msg-2"}, {"id": "msg-3"}]
         }
 
-        trash_response = MagicMock()
-        trash_response.status_code = 200
-
         with patch("src.mcp_gateway.tools.workspace._get_headers", new_callable=AsyncMock) as mock_headers:
             mock_headers.return_value = {"Authorization": "Bearer token"}
 
             with patch("httpx.AsyncClient") as mock_client:
                 mock_instance = AsyncMock()
                 mock_instance.get.return_value = search_response
-                mock_instance.post.return_value = trash_response
+                mock_instance.post.return_value = _batch_response(
+                    (200, {"id": "msg-1"}),
+                    (200, {"id": "msg-2"}),
+                    (200, {"id": "msg-3"}),
+                )
                 mock_client.return_value.__aenter__.return_value = mock_instance
 
                 result = await gmail_batch_trash(
@@ -581,12 +619,6 @@ class TestGmailBatchTrash:
             "messages": [{"id": "msg-1"}, {"id": "msg-2"}]
         }
 
-        success_response = MagicMock()
-        success_response.status_code = 200
-
-        fail_response = MagicMock()
-        fail_response.status_code = 500
-
         with patch("src.mcp_gateway.tools.workspace._get_headers", new_callable=AsyncMock) as mock_headers:
             mock_headers.return_value = {"Authorization": "Bearer token"}
 
@@ -594,14 +626,113 @@ class TestGmailBatchTrash:
                 mock_instance = AsyncMock()
                 mock_instance.get.return_value = search_response
                 # First trash succeeds, second fails
-                mock_instance.post.side_effect = [success_response, fail_response]
+                mock_instance.post.return_value = _batch_response(
+                    (200, {"id": "msg-1"}),
+                    (500, {"error": {"code": 500}}),
+                )
                 mock_client.return_value.__aenter__.return_value = mock_instance
 
                 result = await gmail_batch_trash(query="test")
 
         assert result["success"] is True
         assert result["trashed_count"] == 1
-        assert len(result["errors"]) == 1
+        assert result["errors"] == [{"id": "msg-2", "error": 500}]
+
+
+class TestGmailBatchLayer:
+    """Tests for the batched Gmail fetch layer."""
+
+    @pytest.mark.asyncio
+    async def test_hundred_messages_take_two_batch_requests(self):
+        """Test 100 metadata fetches are split into two batch requests."""
+        from src.mcp_gateway.tools.workspace import gmail_list
+
+        list_response = MagicMock()
+        list_response.status_code = 200
+        list_response.json.return_value = {
+            "messages": [{"id": f"msg-{i}"} for i in range(100)]
+        }
+
+        def batch_post(url, headers, content):
+            count = content.decode().count("Content-Type: application/http")
+            return _batch_response(*[(200, {"id": f"m{i}"}) for i in range(count)])
+
+        with patch(
+            "src.mcp_gateway.tools.workspace._get_headers", new_callable=AsyncMock
+        ) as mock_headers:
+            mock_headers.return_value = {"Authorization": "Bearer token"}
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.get.return_value = list_response
+                mock_instance.post.side_effect = batch_post
+                mock_client.return_value.__aenter__.return_value = mock_instance
+
+                result = await gmail_list(max_results=100)
+
+        assert result["count"] == 100
+        assert mock_instance.get.call_count == 1
+        assert mock_instance.post.call_count == 2
+
+        call = mock_instance.post.call_args_list[0]
+        assert call.args[0] == "https://gmail.googleapis.com/batch/gmail/v1"
+        assert call.kwargs["headers"]["Authorization"] == "Bearer token"
+        body = call.kwargs["content"].decode()
+        assert "GET /gmail/v1/users/me/messages/msg-0?format=metadata" in body
+        assert "fields=id%2CthreadId%2Csnippet%2Cpayload%2Fheaders" in body
+
+    @pytest.mark.asyncio
+    async def test_batch_request_failure(self):
+        """Test a rejected batch request fails the tool."""
+        from src.mcp_gateway.tools.workspace import gmail_search
+
+        list_response = MagicMock()
+        list_response.status_code = 200
+        list_response.json.return_value = {"messages": [{"id": "msg-1"}]}
+
+        batch_response = MagicMock()
+        batch_response.status_code = 400
+        batch_response.text = "Bad batch"
+
+        with patch(
+            "src.mcp_gateway.tools.workspace._get_headers", new_callable=AsyncMock
+        ) as mock_headers:
+            mock_headers.return_value = {"Authorization": "Bearer token"}
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_instance = AsyncMock()
+                mock_instance.get.return_value = list_response
+                mock_instance.post.return_value = batch_response
+                mock_client.return_value.__aenter__.return_value = mock_instance
+
+                result = await gmail_search(query="test")
+
+        assert result["success"] is False
+        assert "Bad batch" in result["error"]
+
+    def test_parse_batch_response_matches_content_ids(self):
+        """Test parts are matched to requests by Content-ID, not position."""
+        from src.mcp_gateway.tools.workspace import _parse_batch_response
+
+        content = (
+            b"--b\r\nContent-Type: application/http\r\n"
+            b"Content-ID: <response-item1>\r\n\r\n"
+            b"HTTP/1.1 404 Not Found\r\nContent-Type: application/json\r\n\r\n"
+            b'{"error": {"code": 404}}\r\n'
+            b"--b\r\nContent-Type: application/http\r\n"
+            b"Content-ID: <response-item0>\r\n\r\n"
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            b'{"id": "a"}\r\n'
+            b"--b--"
+        )
+
+        results = _parse_batch_response(content, 'multipart/mixed; boundary="b"', 3)
+
+        assert results == [
+            (200, {"id": "a"}),
+            (404, {"error": {"code": 404}}),
+            (0, None),
+        ]
 
 
 class TestGmailUnsubscribeFilter:
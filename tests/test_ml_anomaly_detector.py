@@ -2,6 +2,8 @@
 
 Tests cover:
 - Data management (add points, batch, clear)
+- Streaming window statistics
+- Vectorized batch detection
 - Individual detection algorithms
 - Ensemble detection
 - Seasonal pattern learning
@@ -9,6 +11,8 @@ Tests cover:
 - Status and reporting
 """
 
+import math
+import random
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -21,6 +25,7 @@ from src.ml_anomaly_detector import (
     MLAnomaly,
     MLAnomalyDetector,
     SeasonalPattern,
+    StreamingWindowStats,
 )
 
 
@@ -208,6 +213,107 @@ class TestStatisticsCalculation:
         assert stats.ema > stats.mean  # Trending up
 
 
+# ============================================================================
+# STREAMING STATISTICS TESTS
+# ============================================================================
+class TestStreamingWindowStats:
+    """Tests for the O(log n) sliding-window statistics engine."""
+
+    @staticmethod
+    def _batch_stats(values: list[float]) -> dict[str, float]:
+        """Recompute window statistics the slow way for comparison."""
+        n = len(values)
+        ordered = sorted(values)
+        mean = sum(values) / n
+        return {
+            "mean": mean,
+            "variance": sum((x - mean) ** 2 for x in values) / n,
+            "p25": ordered[int(n * 0.25)],
+            "p75": ordered[int(n * 0.75)],
+            "p95": ordered[int(n * 0.95)],
+            "min": ordered[0],
+            "max": ordered[-1],
+        }
+
+    def test_matches_batch_recomputation(self):
+        """Test sliding statistics match a full recompute of the window."""
+        rng = random.Random(42)  # noqa: S311
+        window = StreamingWindowStats(window_size=50)
+        history: list[float] = []
+
+        for _ in range(500):
+            value = rng.gauss(100, 15)
+            window.push(value)
+            history.append(value)
+
+            expected = self._batch_stats(history[-50:])
+            assert len(window) == min(len(history), 50)
+            assert math.isclose(window.mean, expected["mean"], rel_tol=1e-9)
+            assert math.isclose(window.variance, expected["variance"], rel_tol=1e-6)
+            assert window.quantile(0.25) == expected["p25"]
+            assert window.quantile(0.75) == expected["p75"]
+            assert window.quantile(0.95) == expected["p95"]
+            assert window.min() == expected["min"]
+            assert window.max() == expected["max"]
+
+    def test_constant_values_have_zero_variance(self):
+        """Test constant data does not accumulate spurious variance."""
+        window = StreamingWindowStats(window_size=10)
+        for _ in range(100):
+            window.push(5.0)
+
+        assert window.variance == 0.0
+        assert window.median() == 5.0
+
+    def test_detector_ring_buffer_holds_window(self, detector):
+        """Test detector keeps 2x window_size points but computes stats on the window."""
+        for i in range(250):
+            detector.add_data_point("latency", float(i))
+
+        assert len(detector.data["latency"]) == detector.window_size * 2
+        assert detector.data["latency"][0].value == 50.0
+        assert detector.stats["latency"].count == detector.window_size
+        assert detector.stats["latency"].min_val == 150.0
+        assert detector.stats["latency"].max_val == 249.0
+
+    def test_seasonal_learning_uses_full_history(self):
+        """Test seasonal learning sees up to 2x window_size points."""
+        detector = MLAnomalyDetector(window_size=30)
+        base_time = datetime(2026, 1, 1, tzinfo=UTC)
+        for i in range(60):
+            detector.add_data_point("latency", 100.0 + i % 3, base_time + timedelta(hours=i))
+
+        detector._learn_seasonal_pattern("latency")
+
+        assert "latency" in detector.seasonal_patterns
+
+    def test_add_batch_matches_point_by_point(self, normal_data):
+        """Test add_batch produces the same stats as individual adds."""
+        base_time = datetime.now(UTC)
+        values = [(v, base_time + timedelta(minutes=i)) for i, v in enumerate(normal_data)]
+
+        single = MLAnomalyDetector(window_size=40)
+        for value, ts in values:
+            single.add_data_point("latency", value, ts)
+
+        batched = MLAnomalyDetector(window_size=40)
+        batched.add_batch("latency", values)
+
+        assert batched.stats["latency"] == single.stats["latency"]
+
+    def test_window_resize_rebuilds_buffer(self, detector):
+        """Test changing window_size after ingest takes effect."""
+        for i in range(80):
+            detector.add_data_point("latency", float(i))
+
+        detector.window_size = 20
+        detector.add_data_point("latency", 80.0)
+
+        assert len(detector.data["latency"]) == 40
+        assert detector.stats["latency"].count == 20
+        assert detector.stats["latency"].min_val == 61.0
+
+
 # ============================================================================
 # INDIVIDUAL DETECTION ALGORITHM TESTS
 # ============================================================================
@@ -430,6 +536,85 @@ class TestEnsembleDetection:
         assert isinstance(anomalies, list)
 
 
+# ============================================================================
+# VECTORIZED BATCH DETECTION TESTS
+# ============================================================================
+class TestVectorizedDetection:
+    """Tests for the NumPy batch path of detect_all_anomalies."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    @staticmethod
+    def _populate(detector: MLAnomalyDetector, metrics: int = 60) -> dict[str, float]:
+        """Fill many metrics with mixed shapes and return probe values."""
+        rng = random.Random(7)  # noqa: S311
+        base_time = datetime(2026, 1, 1, tzinfo=UTC)
+        probes: dict[str, float] = {}
+        for m in range(metrics):
+            name = f"metric_{m}"
+            scale = rng.uniform(1, 500)
+            for i in range(rng.randint(5, 120)):
+                ts = base_time + timedelta(hours=i)
+                if m % 7 == 0:
+                    value = scale  # constant series
+                elif m % 5 == 0:
+                    value = scale + 20 * math.sin(2 * math.pi * ts.hour / 24)
+                else:
+                    value = rng.gauss(scale, scale * 0.1)
+                detector.add_data_point(name, value, ts)
+            spread = detector.stats[name].stddev if name in detector.stats else 1.0
+            probes[name] = scale + rng.choice([0.0, 0.5, 2.0, 3.5, 8.0, -6.0]) * spread
+        return probes
+
+    def _assert_same(self, scalar: list[MLAnomaly], batch: list[MLAnomaly]) -> None:
+        assert [a.to_dict() for a in batch] == [a.to_dict() for a in scalar]
+
+    def test_matches_scalar_for_current_values(self):
+        """Test batch output equals the scalar path for explicit values."""
+        detector = MLAnomalyDetector(sensitivity=0.7, min_data_points=10)
+        probes = self._populate(detector)
+
+        scalar = detector.detect_all_anomalies(probes, vectorized=False)
+        batch = detector.detect_all_anomalies(probes, vectorized=True)
+
+        assert scalar  # the probe mix must exercise the anomaly path
+        for a, b in zip(scalar, batch, strict=True):
+            a.timestamp = b.timestamp  # each call stamps its own "now"
+        self._assert_same(scalar, batch)
+
+    def test_matches_scalar_for_latest_points(self):
+        """Test batch output equals the scalar path on stored data."""
+        detector = MLAnomalyDetector(sensitivity=0.9, min_data_points=5)
+        self._populate(detector)
+
+        scalar = detector.detect_all_anomalies(vectorized=False)
+        batch = detector.detect_all_anomalies(vectorized=True)
+
+        self._assert_same(scalar, batch)
+
+    def test_tracks_updates_between_batches(self, normal_data):
+        """Test columnar rows refresh after new points and clears."""
+        detector = MLAnomalyDetector(min_data_points=10)
+        for value in normal_data:
+            detector.add_data_point("latency", value)
+
+        assert detector.detect_all_anomalies({"latency": 100.0}, vectorized=True) == []
+
+        detector.add_data_point("latency", 1000.0)
+        batch = detector.detect_all_anomalies(vectorized=True)
+        scalar = detector.detect_all_anomalies(vectorized=False)
+        self._assert_same(scalar, batch)
+
+        detector.clear_data("latency")
+        assert detector.detect_all_anomalies({"latency": 1000.0}, vectorized=True) == []
+
+    def test_unknown_metric_ignored(self, detector):
+        """Test metrics without data are skipped in batch mode."""
+        assert detector.detect_all_anomalies({"missing": 1.0}, vectorized=True) == []
+
+
 # ============================================================================
 # SEVERITY TESTS
 # ============================================================================
@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -30,6 +31,7 @@ from src.multi_agent import (
     TaskStatus,
     create_orchestrator,
 )
+from src.multi_agent.orchestrator import FairTaskQueue, TaskQueueItem
 
 
 # =============================================================================
@@ -683,6 +685,197 @@ class TestTaskPriorityRouting:
         assert selected.agent_id == "agent-2"
 
 
+# =============================================================================
+# Worker Pool Tests
+# =============================================================================
+class TrackingAgent(MonitoringAgent):
+    """MonitoringAgent whose tasks sleep and record peak concurrency."""
+
+    def __init__(self, *args, delay: float = 0.1, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+
+    async def _execute_task_internal(self, task: AgentTask) -> AgentResult:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return AgentResult(task_id=task.task_id, success=True)
+
+
+def monitoring_task(task_type: str = "check_health", **kwargs) -> AgentTask:
+    """Build a monitoring-domain task."""
+    return AgentTask(task_type=task_type, parameters={}, domain=AgentDomain.MONITORING, **kwargs)
+
+
+class TestWorkerPool:
+    """Tests for concurrent dispatch, caps, fairness and bounded retention."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_run_in_parallel(self) -> None:
+        """Test that queued tasks run concurrently across workers."""
+        orchestrator = AgentOrchestrator()
+        agent = TrackingAgent(delay=0.2)
+        orchestrator.register_agent(agent)
+        await orchestrator.start()
+
+        try:
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *(orchestrator.submit_and_wait(monitoring_task()) for _ in range(4))
+            )
+            elapsed = time.monotonic() - start
+        finally:
+            await orchestrator.stop()
+
+        assert all(r.success for r in results)
+        assert agent.peak == 4
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_domain_cap(self) -> None:
+        """Test that a domain never exceeds its concurrency limit."""
+        config = OrchestratorConfig(domain_concurrency_limits={AgentDomain.MONITORING: 2})
+        orchestrator = AgentOrchestrator(config=config)
+        agent_a = TrackingAgent(agent_id="mon-a", delay=0.05)
+        agent_b = TrackingAgent(agent_id="mon-b", delay=0.05)
+        orchestrator.register_agent(agent_a)
+        orchestrator.register_agent(agent_b)
+        await orchestrator.start()
+
+        try:
+            results = await asyncio.gather(
+                *(orchestrator.submit_and_wait(monitoring_task()) for _ in range(6))
+            )
+        finally:
+            await orchestrator.stop()
+
+        assert all(r.success for r in results)
+        assert agent_a.peak + agent_b.peak <= 2
+        assert orchestrator._domain_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_agent_cap(self) -> None:
+        """Test that one agent never exceeds max_tasks_per_agent."""
+        orchestrator = AgentOrchestrator(config=OrchestratorConfig(max_tasks_per_agent=1))
+        agent = TrackingAgent(delay=0.02)
+        orchestrator.register_agent(agent)
+        await orchestrator.start()
+
+        try:
+            results = await asyncio.gather(
+                *(orchestrator.submit_and_wait(monitoring_task()) for _ in range(3))
+            )
+        finally:
+            await orchestrator.stop()
+
+        assert all(r.success for r in results)
+        assert agent.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_capability_limit_queues_instead_of_failing(self) -> None:
+        """Test that tasks beyond a capability's max_concurrent wait their turn."""
+        orchestrator = AgentOrchestrator()
+        agent = TrackingAgent(delay=0.02)
+        orchestrator.register_agent(agent)
+        await orchestrator.start()
+
+        try:
+            # generate_report allows one concurrent execution per agent
+            results = await asyncio.gather(
+                *(
+                    orchestrator.submit_and_wait(monitoring_task("generate_report"))
+                    for _ in range(3)
+                )
+            )
+        finally:
+            await orchestrator.stop()
+
+        assert all(r.success for r in results)
+        assert agent.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_and_wait_uses_future(self) -> None:
+        """Test that waiting resolves through a future, not polling."""
+        orchestrator = AgentOrchestrator()
+        orchestrator.register_agent(TrackingAgent(delay=0))
+        await orchestrator.start()
+
+        try:
+            with patch("src.multi_agent.orchestrator.asyncio.sleep") as mock_sleep:
+                result = await orchestrator.submit_and_wait(monitoring_task())
+        finally:
+            await orchestrator.stop()
+
+        assert result.success is True
+        # Only the agent's own sleep(0); no 100ms polling
+        assert all(c.args == (0,) for c in mock_sleep.call_args_list)
+        assert orchestrator._result_futures == {}
+
+    @pytest.mark.asyncio
+    async def test_direct_execution_removes_queued_item(self) -> None:
+        """Test that submit_and_wait without workers doesn't leave the task queued."""
+        orchestrator = AgentOrchestrator()
+        orchestrator.register_agent(TrackingAgent(delay=0))
+
+        result = await orchestrator.submit_and_wait(monitoring_task())
+
+        assert result.success is True
+        assert orchestrator._task_queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_result_and_message_retention(self) -> None:
+        """Test that results and messages are bounded."""
+        config = OrchestratorConfig(result_retention_count=2, message_retention_count=3)
+        orchestrator = AgentOrchestrator(config=config)
+        orchestrator.register_agent(TrackingAgent(delay=0))
+
+        tasks = [monitoring_task() for _ in range(3)]
+        for task in tasks:
+            await orchestrator.submit_and_wait(task)
+        for i in range(5):
+            await orchestrator.route_message(
+                AgentMessage(from_agent="test", message_type=f"m{i}", payload={})
+            )
+
+        assert list(orchestrator._task_results) == [tasks[1].task_id, tasks[2].task_id]
+        assert orchestrator.get_task_result(tasks[0].task_id) is None
+        assert [m.message_type for m in orchestrator._message_history] == ["m2", "m3", "m4"]
+
+    @pytest.mark.asyncio
+    async def test_fair_queue_serves_low_priority(self) -> None:
+        """Test weighted fair scheduling doesn't starve low priorities."""
+        queue = FairTaskQueue({TaskPriority.HIGH: 4, TaskPriority.LOW: 1})
+        for _ in range(10):
+            queue.put_nowait(TaskQueueItem(task=monitoring_task(priority=TaskPriority.LOW)))
+            queue.put_nowait(TaskQueueItem(task=monitoring_task(priority=TaskPriority.HIGH)))
+
+        order = [(await queue.get()).task.priority for _ in range(10)]
+
+        assert order[0] == TaskPriority.HIGH
+        assert order.count(TaskPriority.LOW) == 2
+        assert order.count(TaskPriority.HIGH) == 8
+
+    @pytest.mark.asyncio
+    async def test_fair_queue_skips_ineligible_items(self) -> None:
+        """Test a blocked item doesn't hold up eligible items behind it."""
+        queue = FairTaskQueue()
+        blocked = monitoring_task(priority=TaskPriority.HIGH)
+        ready = monitoring_task(priority=TaskPriority.HIGH)
+        queue.put_nowait(TaskQueueItem(task=blocked))
+        queue.put_nowait(TaskQueueItem(task=ready))
+
+        item, assignment = await queue.get_eligible(lambda i: i.task is not blocked)
+
+        assert item.task is ready
+        assert assignment is True
+        assert queue.qsize() == 1
+
+
 # =============================================================================
 # Error Handling Tests
 # =============================================================================
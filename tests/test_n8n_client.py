@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from src.n8n_client import (
@@ -80,9 +81,7 @@ class TestApiRequest:
         mock_response.raise_for_status = Mock()
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await n8n_client._api_request("GET", "/workflows")
 
@@ -98,7 +97,7 @@ class TestApiRequest:
 
         with patch("httpx.AsyncClient") as mock_client:
             mock_request = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.request = mock_request
+            mock_client.return_value.request = mock_request
 
             result = await n8n_client._api_request("POST", "/workflows", json_data={"name": "Test"})
 
@@ -114,9 +113,7 @@ class TestApiRequest:
         mock_response.raise_for_status = Mock()
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await n8n_client._api_request("DELETE", "/workflows/123")
 
@@ -129,9 +126,7 @@ class TestApiRequest:
         mock_response.status_code = 401
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(N8nAuthenticationError):
                 await n8n_client._api_request("GET", "/workflows")
@@ -143,9 +138,7 @@ class TestApiRequest:
         mock_response.status_code = 404
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(N8nNotFoundError):
                 await n8n_client._api_request("GET", "/workflows/invalid")
@@ -158,9 +151,7 @@ class TestApiRequest:
         mock_response.text = "Invalid workflow structure"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(N8nValidationError):
                 await n8n_client._api_request("POST", "/workflows", json_data={})
@@ -437,3 +428,43 @@ class TestWorkflowImportExport:
             call_args = mock_request.call_args
             workflow_data = call_args[1]["json_data"]
             assert workflow_data["active"] is False
+
+
+# ============================================================================
+# CONNECTION POOL & ETAG TESTS
+# ============================================================================
+
+
+class TestPooledSession:
+    """Tests for the pooled client and ETag caching."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_and_closed(self, n8n_client):
+        """Test that requests share one client until aclose()."""
+        async with n8n_client as client:
+            pooled = client._get_client()
+            assert client._get_client() is pooled
+        assert pooled.is_closed
+        assert n8n_client._client is None
+
+    @pytest.mark.asyncio
+    async def test_list_workflows_uses_etag(self, n8n_client):
+        """Test that an unchanged workflow list is served from the ETag cache."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"w1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"data": [{"id": "1", "active": True}]}, headers={"ETag": '"w1"'}
+            )
+
+        n8n_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await n8n_client.list_workflows()
+        second = await n8n_client.list_workflows()
+
+        assert first == second == [{"id": "1", "active": True}]
+        assert seen == [None, '"w1"']
+        await n8n_client.aclose()
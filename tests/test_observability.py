@@ -6,13 +6,17 @@ based on Research Paper #08 (Real-Time Observability Dashboard).
 """
 
 import asyncio
+import re
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
 
+from src.observability import tracer as tracer_module
 from src.observability.metrics import AgentMetric, MetricsCollector
-from src.observability.tracer import get_tracer, instrument_tool, sanitize_pii
+from src.observability.tracer import get_tracer, instrument_tool, result_preview, sanitize_pii
 
 # =============================================================================
 # Tracer Tests
@@ -123,6 +127,114 @@ class TestTracer:
         result = await function_with_kwargs(name="Alice", age=30)
         assert result == "Alice is 30"
 
+    def test_sanitize_pii_matches_sequential_patterns(self):
+        """Test the combined PII regex redacts like the four separate passes."""
+
+        def sequential(text):
+            text = re.sub(
+                r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[EMAIL_REDACTED]", text
+            )
+            text = re.sub(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b", "[PHONE_REDACTED]", text)
+            text = re.sub(r"\b\d{3}-\d{2}-\d{4}\b", "[SSN_REDACTED]", text)
+            return re.sub(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b", "[CC_REDACTED]", text)
+
+        samples = [
+            "mail a.b@example.com or call 555.123.4567, SSN 123-45-6789",
+            "card 1234-5678-9012-3456 and 1234567890123456 then 5551234567",
+            "order 42 shipped to bob@mail.co.uk at 10:30",
+            "no pii here at all",
+        ]
+        for text in samples:
+            assert sanitize_pii(text) == sequential(text)
+
+    def test_result_preview_truncates_large_results(self):
+        """Test result previews stay bounded for large strings and containers."""
+        assert result_preview("short") == "short"
+        assert result_preview("x" * 5000) == "x" * 1000 + "... [TRUNCATED]"
+        preview = result_preview(list(range(1_000_000)))
+        assert len(preview) <= 1000 + len("... [TRUNCATED]")
+
+    def test_result_preview_small_containers_match_str(self):
+        """Test small results are shown in full, exactly as str() renders them."""
+        results = [
+            {"name": "x", "id": 1, "rows": 2, "elapsed": 0.3, "ok": True, "tags": ["a"]},
+            list(range(10)),
+            (1,),
+            {"nested": {"a": [1, {"b": (2, 3)}], "c": {4, 5}}, "d": frozenset({6})},
+            [b"bytes", None, "quote's", 1.5e-7],
+            set(),
+        ]
+        for result in results:
+            assert result_preview(result) == str(result)
+
+    def test_result_preview_large_nested_result_is_bounded(self):
+        """Test a large nested result is cut at the limit without rendering it all."""
+        result = {"rows": [{"id": i, "value": "v" * 50} for i in range(100_000)]}
+
+        preview = result_preview(result)
+
+        assert preview.endswith("... [TRUNCATED]")
+        assert preview[:1000] == str(result)[:1000]
+
+    def test_result_preview_scalars_and_objects_use_str(self):
+        """Test non-container results are previewed with str(), not repr()."""
+        from datetime import datetime
+        from pathlib import PurePosixPath
+
+        class Report:
+            def __str__(self):
+                return "report: 3 rows"
+
+        results = [PurePosixPath("/srv/x.csv"), datetime(2026, 1, 2, 3, 4), Report(), None, 1.5]
+        for result in results:
+            assert result_preview(result) == str(result)
+
+    def test_result_preview_container_subclasses_are_bounded(self):
+        """Test dict/list subclasses are walked with the budget, not repr()'d in full."""
+        from collections import OrderedDict, defaultdict
+
+        class Rows(list):
+            def __repr__(self):
+                raise AssertionError("full repr of a large result")
+
+        results = [
+            OrderedDict((i, "v" * 50) for i in range(100_000)),
+            defaultdict(list, {i: [i] * 20 for i in range(100_000)}),
+            Rows(range(1_000_000)),
+        ]
+        for result in results:
+            preview = result_preview(result)
+            assert preview.endswith("... [TRUNCATED]")
+            assert len(preview) == 1000 + len("... [TRUNCATED]")
+        assert result_preview(Rows([1, 2])) == "[1, 2]"
+
+    def test_non_recording_span_skips_serialization(self):
+        """Test args/results aren't sanitized when the span is dropped."""
+        off_tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer("test")
+
+        @instrument_tool("dropped_tool")
+        def tool(query: str):
+            return query.upper()
+
+        with (
+            patch.object(tracer_module, "tracer", off_tracer),
+            patch.object(tracer_module, "sanitize_pii") as mock_sanitize,
+        ):
+            assert tool(query="abc") == "ABC"
+        mock_sanitize.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_sample_rate_zero_skips_span(self):
+        """Test per-tool sample_rate=0 runs the tool without a span."""
+
+        @instrument_tool("chatty_tool", sample_rate=0.0)
+        async def tool(value: int):
+            return value + 1
+
+        with patch.object(tracer_module, "tracer") as mock_tracer:
+            assert await tool(value=1) == 2
+        mock_tracer.start_as_current_span.assert_not_called()
+
 
 # =============================================================================
 # Metrics Tests
@@ -178,12 +290,12 @@ class TestMetricsCollector:
 
     @pytest.mark.asyncio
     async def test_record_metric_with_db_pool(self):
-        """Test recording metric to database."""
+        """Test recording metric to database (unbuffered)."""
         mock_pool = MagicMock()
         mock_conn = AsyncMock()
         mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
 
-        collector = MetricsCollector(db_pool=mock_pool)
+        collector = MetricsCollector(db_pool=mock_pool, buffered=False)
 
         metric = AgentMetric(
             agent_id="agent-1",
@@ -288,6 +400,191 @@ class TestMetricsCollector:
         assert len(metrics) == 4
 
 
+def _mock_pool():
+    """Create a mock asyncpg pool and its connection."""
+    mock_pool = MagicMock()
+    mock_conn = AsyncMock()
+    mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+    return mock_pool, mock_conn
+
+
+def _copied_rows(mock_conn):
+    """Collect all records passed to copy_records_to_table."""
+    rows = []
+    for call in mock_conn.copy_records_to_table.await_args_list:
+        rows.extend(call.kwargs["records"])
+    return rows
+
+
+class TestMetricsWriteBuffer:
+    """Tests for the MetricsCollector write-behind buffer."""
+
+    @pytest.mark.asyncio
+    async def test_record_does_not_hit_database(self):
+        """Test buffered record_metric only enqueues."""
+        mock_pool, mock_conn = _mock_pool()
+        collector = MetricsCollector(db_pool=mock_pool, flush_interval=60)
+
+        await collector.record_latency("agent-1", 0.5)
+
+        mock_conn.execute.assert_not_awaited()
+        mock_conn.copy_records_to_table.assert_not_awaited()
+        assert collector.get_buffer_stats()["pending"] == 1
+        await collector.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_with_copy(self):
+        """Test close() writes pending metrics in one COPY."""
+        mock_pool, mock_conn = _mock_pool()
+        collector = MetricsCollector(db_pool=mock_pool, flush_interval=60)
+
+        await collector.record_tokens("agent-1", 100, 50, "claude", reasoning_tokens=10)
+        await collector.close()
+
+        mock_conn.copy_records_to_table.assert_awaited_once()
+        call = mock_conn.copy_records_to_table.await_args
+        assert call.args == ("agent_metrics",)
+        assert call.kwargs["columns"][3] == "metric_name"
+        names = [row[3] for row in call.kwargs["records"]]
+        assert names == ["tokens_input", "tokens_output", "tokens_reasoning"]
+        assert collector.get_buffer_stats()["flushed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_triggers_flush(self):
+        """Test reaching batch_size flushes without waiting for the interval."""
+        mock_pool, mock_conn = _mock_pool()
+        collector = MetricsCollector(db_pool=mock_pool, batch_size=5, flush_interval=60)
+
+        for i in range(5):
+            await collector.record_latency(f"agent-{i}", 0.1)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert len(_copied_rows(mock_conn)) == 5
+        await collector.close()
+
+    @pytest.mark.asyncio
+    async def test_interval_triggers_flush(self):
+        """Test pending metrics are flushed after flush_interval."""
+        mock_pool, mock_conn = _mock_pool()
+        collector = MetricsCollector(db_pool=mock_pool, flush_interval=0.01)
+
+        await collector.record_success("agent-1", "search")
+        await asyncio.sleep(0.05)
+
+        assert len(_copied_rows(mock_conn)) == 1
+        await collector.close()
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_oldest_without_blocking(self):
+        """Test record calls don't wait when the database is stuck."""
+        mock_pool, mock_conn = _mock_pool()
+        release = asyncio.Event()
+
+        async def stuck_copy(*args, **kwargs):
+            await release.wait()
+
+        mock_conn.copy_records_to_table.side_effect = stuck_copy
+        collector = MetricsCollector(
+            db_pool=mock_pool, batch_size=10, flush_interval=60, max_buffer=20
+        )
+
+        async def record_all():
+            for i in range(100):
+                await collector.record_latency(f"agent-{i}", 0.1)
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(record_all(), timeout=1)
+
+        stats = collector.get_buffer_stats()
+        assert stats["pending"] == 20
+        # One batch of 10 is in flight; the rest beyond max_buffer is dropped
+        assert stats["dropped"] == 70
+        assert collector._pending[-1].agent_id == "agent-99"
+
+        release.set()
+        mock_conn.copy_records_to_table.side_effect = None
+        await collector.close()
+        assert len(_copied_rows(mock_conn)) == 30
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_in_flight_batch(self):
+        """Test close() lets a running flush finish instead of losing its batch."""
+        mock_pool, mock_conn = _mock_pool()
+
+        async def slow_copy(*args, **kwargs):
+            await asyncio.sleep(0.05)
+
+        mock_conn.copy_records_to_table.side_effect = slow_copy
+        collector = MetricsCollector(db_pool=mock_pool, batch_size=5, flush_interval=60)
+
+        for i in range(5):
+            await collector.record_latency(f"agent-{i}", 0.1)
+        await asyncio.sleep(0.01)  # flusher is now inside the COPY
+        assert collector.get_buffer_stats()["pending"] == 0
+
+        await collector.close()
+
+        assert len(_copied_rows(mock_conn)) == 5
+        assert collector.get_buffer_stats()["flushed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_requeues_batch(self):
+        """Test a flush cancelled mid-write puts its batch back."""
+        mock_pool, mock_conn = _mock_pool()
+        mock_conn.copy_records_to_table.side_effect = asyncio.CancelledError
+        collector = MetricsCollector(db_pool=mock_pool, batch_size=5, flush_interval=60)
+        collector._pending.extend(
+            [
+                AgentMetric("agent-1", None, "latency_ms", 1.0, {}, datetime.now(UTC))
+                for _ in range(3)
+            ]
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await collector.flush()
+
+        assert collector.get_buffer_stats()["pending"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_and_drops_oldest(self):
+        """Test failed batches are kept, bounded by max_buffer."""
+        mock_pool, mock_conn = _mock_pool()
+        mock_conn.copy_records_to_table.side_effect = ConnectionError("db down")
+        collector = MetricsCollector(
+            db_pool=mock_pool, batch_size=5, flush_interval=60, max_buffer=5
+        )
+
+        for i in range(5):
+            await collector.record_latency(f"agent-{i}", 0.1)
+        assert await collector.flush() == 0
+        assert collector.get_buffer_stats()["pending"] == 5
+
+        collector._pending.extend(collector._pending[:2])
+        await collector.flush()
+        stats = collector.get_buffer_stats()
+        assert stats["pending"] == 5
+        assert stats["dropped"] == 2
+        assert stats["flush_errors"] >= 2
+
+        mock_conn.copy_records_to_table.side_effect = None
+        await collector.close()
+        assert collector.get_buffer_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_tracker_uses_buffer(self):
+        """Test LatencyTracker doesn't write to the database inline."""
+        from src.observability.metrics import LatencyTracker
+
+        mock_pool, mock_conn = _mock_pool()
+        async with MetricsCollector(db_pool=mock_pool, flush_interval=60) as collector:
+            async with LatencyTracker(collector, "agent-1"):
+                pass
+            mock_conn.copy_records_to_table.assert_not_awaited()
+
+        assert [row[3] for row in _copied_rows(mock_conn)] == ["latency_ms"]
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
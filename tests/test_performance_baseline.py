@@ -3,22 +3,28 @@
 Tests cover:
 - Metric snapshot collection
 - Baseline statistics calculation
+- Hourly rollups and quantile sketch
 - Anomaly detection
 - Trend analysis
 - Dashboard data generation
 """
 
+import json
+import random
+import statistics
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from asyncpg import Connection
+from asyncpg import Connection, UndefinedTableError
 
 from src.performance_baseline import (
+    BASELINE_METRICS,
     Anomaly,
     BaselineStats,
     MetricSnapshot,
     PerformanceBaseline,
+    QuantileSketch,
     TrendAnalysis,
 )
 
@@ -27,6 +33,18 @@ from src.performance_baseline import (
 # =============================================================================
 
 
+def _aggregate_row(latency, p95, errors, total_requests, active_agents, tokens):
+    """Build the single-row result of HOURLY_AGGREGATES_QUERY."""
+    return {
+        "avg_latency_ms": latency,
+        "p95_latency_ms": p95,
+        "errors": errors,
+        "total_requests": total_requests,
+        "active_agents": active_agents,
+        "total_tokens": tokens,
+    }
+
+
 @pytest.fixture
 def database_url():
     """Mock database URL."""
@@ -35,12 +53,21 @@ def database_url():
 
 @pytest.fixture
 def baseline(database_url):
-    """Performance baseline instance."""
+    """Performance baseline instance (raw-snapshot path)."""
     return PerformanceBaseline(
         database_url=database_url,
         baseline_window_hours=24,
         collection_interval_minutes=5,
         anomaly_threshold_stddev=3.0,
+        use_rollups=False,
+    )
+
+
+@pytest.fixture
+def rollup_baseline(database_url):
+    """Performance baseline instance reading hourly rollups."""
+    return PerformanceBaseline(
+        database_url=database_url, baseline_window_hours=720, use_rollups=True
     )
 
 
@@ -278,7 +305,7 @@ async def test_collect_metrics_success(baseline, mock_snapshot):
     mock_conn = AsyncMock(spec=Connection)
 
     # Mock database queries - use side_effect with list of return values
-    mock_conn.fetchval.side_effect = [150.5, 350.2, 15, 1000, 5, 50000]
+    mock_conn.fetchrow.return_value = _aggregate_row(150.5, 350.2, 15, 1000, 5, 50000)
     mock_conn.execute = AsyncMock()
 
     with (
@@ -306,7 +333,7 @@ async def test_collect_metrics_zero_requests(baseline):
     """Test metrics collection with zero requests."""
     mock_conn = AsyncMock(spec=Connection)
 
-    mock_conn.fetchval.side_effect = [0.0, 0.0, 0, 0, 0, 0]
+    mock_conn.fetchrow.return_value = _aggregate_row(0.0, 0.0, 0, 0, 0, 0)
     mock_conn.execute = AsyncMock()
     mock_conn.close = AsyncMock()
 
@@ -324,6 +351,65 @@ async def test_collect_metrics_zero_requests(baseline):
         assert snapshot.throughput_rph == 0
 
 
+@pytest.mark.asyncio
+async def test_collect_metrics_single_query(baseline):
+    """Test collection uses one aggregate query plus one insert."""
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow.return_value = _aggregate_row(120.0, 300.0, 2, 200, 3, 1000)
+    mock_conn.execute = AsyncMock()
+    mock_conn.close = AsyncMock()
+
+    with (
+        patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect,
+        patch("psutil.cpu_percent", return_value=20.0),
+        patch("psutil.virtual_memory", return_value=MagicMock(percent=40.0)),
+    ):
+        mock_connect.return_value = mock_conn
+
+        snapshot = await baseline.collect_metrics()
+
+    assert mock_conn.fetchrow.await_count == 1
+    assert "FILTER" in mock_conn.fetchrow.await_args.args[0]
+    mock_conn.fetchval.assert_not_called()
+    assert mock_conn.execute.await_count == 1
+    assert snapshot.error_rate_pct == 1.0
+    assert snapshot.total_tokens_1h == 1000
+
+
+@pytest.mark.asyncio
+async def test_collect_metrics_pooled_mode():
+    """Test pooled mode acquires from the shared pool instead of connecting."""
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow.return_value = _aggregate_row(100.0, 200.0, 0, 10, 1, 50)
+    mock_conn.execute = AsyncMock()
+
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=mock_conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = acquire_ctx
+
+    baseline = PerformanceBaseline(pool=pool)
+
+    with (
+        patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect,
+        patch("psutil.cpu_percent", return_value=5.0),
+        patch("psutil.virtual_memory", return_value=MagicMock(percent=10.0)),
+    ):
+        snapshot = await baseline.collect_metrics()
+
+    mock_connect.assert_not_called()
+    pool.acquire.assert_called_once()
+    mock_conn.close.assert_not_called()
+    assert snapshot.throughput_rph == 10
+
+
+def test_performance_baseline_requires_url_or_pool():
+    """Test constructor rejects missing connection settings."""
+    with pytest.raises(ValueError, match="database_url or pool"):
+        PerformanceBaseline()
+
+
 # =============================================================================
 # BASELINE STATS CALCULATION TESTS
 # =============================================================================
@@ -439,6 +525,216 @@ async def test_get_baseline_stats_invalid_metric(baseline, mock_historical_data)
             await baseline.get_baseline_stats(metric_name="invalid_metric")
 
 
+# =============================================================================
+# ROLLUP TESTS
+# =============================================================================
+
+
+def _snapshots(hours: int, per_hour: int = 12, seed: int = 3) -> list[MetricSnapshot]:
+    """Generate 5-minute snapshots spanning ``hours`` hours."""
+    rng = random.Random(seed)  # noqa: S311
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        MetricSnapshot(
+            timestamp=start + timedelta(minutes=5 * i),
+            latency_ms=rng.gauss(150, 20),
+            p95_latency_ms=rng.gauss(350, 40),
+            error_rate_pct=abs(rng.gauss(1.5, 0.5)),
+            throughput_rph=rng.randint(900, 1300),
+            active_agents=5,
+            total_tokens_1h=50000,
+            cpu_percent=rng.uniform(20, 80),
+            memory_percent=rng.uniform(40, 70),
+        )
+        for i in range(hours * per_hour)
+    ]
+
+
+def _rollup_records(snapshots: list[MetricSnapshot]) -> list[dict]:
+    """Simulate performance_baseline_rollups rows for the given snapshots."""
+    buckets, metrics, counts, sums, sum_sqs, mins, maxs, sketches = (
+        PerformanceBaseline._rollup_rows(snapshots)
+    )
+    return [
+        {
+            "metric_name": metrics[i],
+            "sample_count": counts[i],
+            "value_sum": sums[i],
+            "value_sum_sq": sum_sqs[i],
+            "min_value": mins[i],
+            "max_value": maxs[i],
+            "sketch": sketches[i],
+        }
+        for i in range(len(metrics))
+    ]
+
+
+def test_quantile_sketch_relative_accuracy():
+    """Test sketch quantiles stay within the configured relative error."""
+    rng = random.Random(11)  # noqa: S311
+    values = [rng.lognormvariate(5, 1) for _ in range(5000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[max(0, int(q * len(ordered)) - 1)]
+        assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+
+
+def test_quantile_sketch_merge_and_zero_bin():
+    """Test merging sketches matches a single sketch and handles zeros."""
+    left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for value in [0.0, 0.0, 1.0, 2.0, 3.0]:
+        left.add(value)
+        combined.add(value)
+    for value in [4.0, 5.0, 6.0]:
+        right.add(value)
+        combined.add(value)
+
+    left.merge(json.loads(json.dumps(right.bins)))
+
+    assert left.bins == combined.bins
+    assert left.count == 8
+    assert left.quantile(0.25) == 0.0
+    assert QuantileSketch().quantile(0.5) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_get_baseline_stats_from_rollups(rollup_baseline):
+    """Test 30-day baselines merge hourly rollups instead of raw rows."""
+    snapshots = _snapshots(hours=720)
+    records = _rollup_records(snapshots)
+    assert len(records) == 720 * len(BASELINE_METRICS)
+
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow = AsyncMock(
+        return_value={
+            "first_snapshot": snapshots[0].timestamp,
+            "first_bucket": snapshots[0].timestamp,
+        }
+    )
+    mock_conn.fetch = AsyncMock(return_value=records)
+    mock_conn.close = AsyncMock()
+
+    with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
+        stats = await rollup_baseline.get_baseline_stats()
+
+    assert mock_conn.fetch.await_count == 1
+    assert "performance_baseline_rollups" in mock_conn.fetch.await_args.args[0]
+
+    latency = [s.latency_ms for s in snapshots]
+    result = stats["latency_ms"]
+    assert result.sample_count == len(latency)
+    assert result.mean == pytest.approx(statistics.mean(latency), abs=0.01)
+    assert result.stddev == pytest.approx(statistics.stdev(latency), abs=0.01)
+    assert result.min_value == round(min(latency), 2)
+    assert result.max_value == round(max(latency), 2)
+    exact_p95 = statistics.quantiles(latency, n=20)[18]
+    assert result.p95 == pytest.approx(exact_p95, rel=0.011)
+    assert set(stats) == set(BASELINE_METRICS)
+
+
+@pytest.mark.asyncio
+async def test_get_baseline_stats_rollups_fall_back_to_raw(rollup_baseline, mock_historical_data):
+    """Test empty rollups fall back to scanning raw snapshots."""
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow = AsyncMock(
+        return_value={"first_snapshot": datetime.now(UTC), "first_bucket": None}
+    )
+    mock_conn.fetch = AsyncMock(return_value=mock_historical_data)
+    mock_conn.close = AsyncMock()
+
+    with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
+        stats = await rollup_baseline.get_baseline_stats("latency_ms")
+
+    assert mock_conn.fetch.await_count == 1
+    assert stats["latency_ms"].sample_count == len(mock_historical_data)
+
+
+@pytest.mark.asyncio
+async def test_get_baseline_stats_partial_rollups_use_raw(rollup_baseline, mock_historical_data):
+    """Test rollups starting after the oldest snapshot are not used."""
+    now = datetime.now(UTC)
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow = AsyncMock(
+        return_value={
+            "first_snapshot": now - timedelta(days=20),
+            "first_bucket": now - timedelta(hours=2),
+        }
+    )
+    mock_conn.fetch = AsyncMock(return_value=mock_historical_data)
+    mock_conn.close = AsyncMock()
+
+    with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
+        stats = await rollup_baseline.get_baseline_stats("latency_ms")
+
+    assert mock_conn.fetch.await_count == 1
+    assert "performance_snapshots" in mock_conn.fetch.await_args.args[0]
+    assert stats["latency_ms"].sample_count == len(mock_historical_data)
+
+
+@pytest.mark.asyncio
+async def test_missing_rollup_table_disables_rollups(rollup_baseline, mock_historical_data):
+    """Test a missing rollup table falls back to raw snapshots."""
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow = AsyncMock(side_effect=UndefinedTableError("no rollups"))
+    mock_conn.fetch = AsyncMock(return_value=mock_historical_data)
+    mock_conn.close = AsyncMock()
+
+    with patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
+        stats = await rollup_baseline.get_baseline_stats("latency_ms")
+
+    assert rollup_baseline.use_rollups is False
+    assert stats["latency_ms"].sample_count == len(mock_historical_data)
+
+
+def test_rollups_default_from_env(database_url):
+    """Test rollups follow PERFORMANCE_BASELINE_ROLLUPS unless passed explicitly."""
+    with patch("src.performance_baseline.USE_ROLLUPS", True):
+        assert PerformanceBaseline(database_url=database_url).use_rollups is True
+        explicit = PerformanceBaseline(database_url=database_url, use_rollups=False)
+        assert explicit.use_rollups is False
+    with patch("src.performance_baseline.USE_ROLLUPS", False):
+        assert PerformanceBaseline(database_url=database_url).use_rollups is False
+
+
+def test_rollup_table_shipped_in_sql():
+    """Test the rollup DDL ships with the SQL schema files."""
+    from pathlib import Path
+
+    schema = Path(__file__).parent.parent / "sql" / "performance_baseline_schema.sql"
+    assert "CREATE TABLE IF NOT EXISTS performance_baseline_rollups" in schema.read_text()
+
+
+@pytest.mark.asyncio
+async def test_collect_metrics_updates_rollups(rollup_baseline):
+    """Test each snapshot is folded into the rollups in one statement."""
+    mock_conn = AsyncMock(spec=Connection)
+    mock_conn.fetchrow.return_value = _aggregate_row(120.0, 300.0, 2, 200, 3, 1000)
+    mock_conn.execute = AsyncMock()
+    mock_conn.close = AsyncMock()
+
+    with (
+        patch("asyncpg.connect", new_callable=AsyncMock) as mock_connect,
+        patch("psutil.cpu_percent", return_value=20.0),
+        patch("psutil.virtual_memory", return_value=MagicMock(percent=40.0)),
+    ):
+        mock_connect.return_value = mock_conn
+        await rollup_baseline.collect_metrics()
+
+    assert mock_conn.execute.await_count == 2
+    upsert_args = mock_conn.execute.await_args_list[1].args
+    assert "ON CONFLICT (bucket, metric_name)" in upsert_args[0]
+    assert upsert_args[2] == list(BASELINE_METRICS)
+    assert upsert_args[3] == [1] * len(BASELINE_METRICS)
+
+
 # =============================================================================
 # ANOMALY DETECTION TESTS
 # =============================================================================
@@ -479,7 +775,7 @@ async def test_detect_anomalies_none(baseline, mock_snapshot, mock_historical_da
         return mock_records
 
     mock_conn.fetch = mock_fetch
-    mock_conn.fetchval.side_effect = [150.5, 350.2, 19, 1180, 5, 50000]
+    mock_conn.fetchrow.return_value = _aggregate_row(150.5, 350.2, 19, 1180, 5, 50000)
     mock_conn.execute = AsyncMock()
     mock_conn.close = AsyncMock()
 
@@ -672,7 +968,7 @@ async def test_get_dashboard_data(baseline, mock_historical_data):
     mock_records = [MockRecord(d) for d in mock_historical_data]
 
     # Mock fetchval for collect_metrics (called once during get_dashboard_data)
-    mock_conn.fetchval.side_effect = [150.5, 350.2, 15, 1000, 5, 50000]
+    mock_conn.fetchrow.return_value = _aggregate_row(150.5, 350.2, 15, 1000, 5, 50000)
 
     # Mock fetch for get_baseline_stats, detect_anomalies, and analyze_trends
     async def mock_fetch_side_effect(*args, **kwargs):
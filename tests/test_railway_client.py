@@ -96,13 +96,21 @@ async def test_execute_graphql_rate_limit_error(railway_client):
     """Test GraphQL execution with 429 Rate Limit."""
     mock_response = MagicMock(spec=httpx.Response)
     mock_response.status_code = 429
+    mock_response.headers = httpx.Headers()
 
-    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        patch("src.railway_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
         mock_post.return_value = mock_response
 
         with pytest.raises(RailwayRateLimitError, match="Rate limit exceeded"):
             await railway_client._execute_graphql("query { test }")
 
+    # Retried max_retries times before giving up
+    assert mock_post.call_count == railway_client.max_retries + 1
+    assert mock_sleep.await_count == railway_client.max_retries
+
 
 @pytest.mark.asyncio
 async def test_execute_graphql_errors_in_response(railway_client):
@@ -126,15 +134,199 @@ async def test_execute_graphql_errors_in_response(railway_client):
 @pytest.mark.asyncio
 async def test_execute_graphql_timeout(railway_client):
     """Test GraphQL execution with timeout."""
-    with patch(
-        "httpx.AsyncClient.post",
-        new_callable=AsyncMock,
-        side_effect=httpx.TimeoutException("Request timed out"),
+    with (
+        patch(
+            "httpx.AsyncClient.post",
+            new_callable=AsyncMock,
+            side_effect=httpx.TimeoutException("Request timed out"),
+        ),
+        patch("src.railway_client.asyncio.sleep", new_callable=AsyncMock),
     ):
         with pytest.raises(RailwayAPIError, match="Request timed out after 30s"):
             await railway_client._execute_graphql("query { test }")
 
 
+def _response(status_code, json_body=None, headers=None):
+    """Create a mock httpx response with headers."""
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.headers = httpx.Headers(headers or {})
+    response.json.return_value = json_body if json_body is not None else {"data": {}}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_execute_graphql_retries_honor_retry_after(railway_client):
+    """Test 429 waits Retry-After and 5xx backs off before succeeding."""
+    ok = _response(200, {"data": {"ok": True}})
+
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        patch("src.railway_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        mock_post.side_effect = [
+            _response(429, headers={"Retry-After": "7"}),
+            _response(503),
+            ok,
+        ]
+        result = await railway_client._execute_graphql("query { ok }")
+
+    assert result == {"ok": True}
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert delays[0] == 7.0
+    assert 0 <= delays[1] <= railway_client.backoff_base * 2
+
+
+@pytest.mark.asyncio
+async def test_execute_graphql_reuses_pooled_client(railway_client):
+    """Test one HTTP client is kept across calls and closed by aclose()."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_post.return_value = _response(200)
+        await railway_client._execute_graphql("query { a }")
+        client = railway_client._client
+        await railway_client._execute_graphql("query { b }")
+
+    assert railway_client._client is client
+    await railway_client.aclose()
+    assert client.is_closed
+    assert railway_client._client is None
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_single_post(railway_client):
+    """Test several operations are sent as one JSON array POST."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_post.return_value = _response(
+            200,
+            [
+                {"data": {"a": 1}},
+                {"errors": [{"message": "boom"}]},
+            ],
+        )
+        results = await railway_client.execute_batch(
+            [("query { a }", None), ("query { b }", {"x": 1})],
+            return_exceptions=True,
+        )
+
+    assert mock_post.call_count == 1
+    payload = mock_post.call_args.kwargs["json"]
+    assert [op["query"] for op in payload] == ["query { a }", "query { b }"]
+    assert results[0] == {"a": 1}
+    assert isinstance(results[1], RailwayAPIError)
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_falls_back_when_unsupported(railway_client):
+    """Test operations are sent individually if the server rejects arrays."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = [
+            _response(200, {"errors": [{"message": "batching not supported"}]}),
+            _response(200, {"data": {"a": 1}}),
+            _response(200, {"data": {"b": 2}}),
+        ]
+        results = await railway_client.execute_batch([("query { a }", None), ("query { b }", None)])
+
+    assert results == [{"a": 1}, {"b": 2}]
+    assert mock_post.call_count == 3
+    assert railway_client._batching_supported is False
+
+
+@pytest.mark.asyncio
+async def test_mutation_not_retried_after_it_may_have_run(railway_client):
+    """Test mutations aren't re-sent on read timeouts or 5xx."""
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        patch("src.railway_client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        mock_post.side_effect = httpx.ReadTimeout("no response")
+        with pytest.raises(RailwayAPIError, match="timed out"):
+            await railway_client.trigger_deployment("env-1", "svc-1")
+        assert mock_post.call_count == 1
+
+        mock_post.reset_mock()
+        mock_post.side_effect = [
+            httpx.Response(503, request=httpx.Request("POST", railway_client.base_url))
+        ]
+        with pytest.raises(RailwayAPIError, match="HTTP error"):
+            await railway_client.rollback_deployment("deploy-1")
+        assert mock_post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_mutation_retried_when_not_sent(railway_client):
+    """Test mutations are retried on connect errors and 429."""
+    ok = _response(200, {"data": {"serviceInstanceRedeploy": "deploy-2"}})
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        patch("src.railway_client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        mock_post.side_effect = [httpx.ConnectError("refused"), _response(429), ok]
+        assert await railway_client.rollback_deployment("deploy-1") == "deploy-2"
+
+    assert mock_post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_transient_failure_keeps_batching(railway_client):
+    """Test a timed-out batch is raised, not re-sent per operation."""
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        patch("src.railway_client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        mock_post.side_effect = [httpx.ReadTimeout("slow")] * (railway_client.max_retries + 1)
+        with pytest.raises(RailwayAPIError, match="timed out"):
+            await railway_client.execute_batch([("query { a }", None), ("query { b }", None)])
+
+    assert mock_post.call_count == railway_client.max_retries + 1
+    assert all(isinstance(c.kwargs["json"], list) for c in mock_post.call_args_list)
+    assert railway_client._batching_supported is True
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_falls_back_on_client_error(railway_client):
+    """Test a 4xx reply to the array disables batching."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = [
+            _response(400),
+            _response(200, {"data": {"a": 1}}),
+            _response(200, {"data": {"b": 2}}),
+        ]
+        results = await railway_client.execute_batch([("query { a }", None), ("query { b }", None)])
+
+    assert results == [{"a": 1}, {"b": 2}]
+    assert railway_client._batching_supported is False
+
+
+@pytest.mark.asyncio
+async def test_get_deployment_overview(railway_client):
+    """Test dashboard overview batches details, metrics and logs."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_post.return_value = _response(
+            200,
+            [
+                {
+                    "data": {
+                        "deployment": {
+                            "id": "deploy-123",
+                            "status": "ACTIVE",
+                            "staticUrl": "app.railway.app",
+                            "createdAt": "2026-01-12T10:00:00Z",
+                            "updatedAt": "2026-01-12T10:05:00Z",
+                        }
+                    }
+                },
+                {"errors": [{"message": "metrics unavailable on plan"}]},
+                {"data": {"runtimeLogs": {"lines": [{"message": "started"}]}}},
+            ],
+        )
+        overview = await railway_client.get_deployment_overview("deploy-123")
+
+    assert mock_post.call_count == 1
+    assert overview["details"].status == "ACTIVE"
+    assert overview["metrics"] is None
+    assert overview["logs"] == [{"message": "started"}]
+
+
 # =============================================================================
 # DEPLOYMENT OPERATIONS TESTS
 # =============================================================================
@@ -0,0 +1,166 @@
+"""Tests for smart-email bounded-parallel fan-out.
+
+Tests cover:
+- gather_bounded ordering and per-item failure isolation
+- ProviderLimiter in-flight cap
+- classify, research and memory_enrich nodes running concurrently
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.smart_email.concurrency import ProviderLimiter, gather_bounded
+from src.agents.smart_email.nodes.classify import classify_emails_node
+from src.agents.smart_email.nodes.memory import memory_enrich_node
+from src.agents.smart_email.nodes.research import research_node
+from src.agents.smart_email.state import (
+    EmailCategory,
+    EmailItem,
+    Priority,
+    ResearchResult,
+    create_initial_state,
+)
+
+
+class TestConcurrentNodes:
+    """Tests for bounded-parallel node execution."""
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_keeps_order_and_isolates_errors(self):
+        """Test results keep input order and failures use the default."""
+        in_flight = 0
+        peak = 0
+
+        async def worker(n):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (5 - n % 5))
+            in_flight -= 1
+            if n == 3:
+                raise ValueError("boom")
+            return n * 10
+
+        results = await gather_bounded(range(10), worker, concurrency=3, default=-1)
+
+        assert results == [0, 10, 20, -1, 40, 50, 60, 70, 80, 90]
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_provider_limiter_caps_in_flight(self):
+        """Test provider limit applies across concurrent callers."""
+        limiter = ProviderLimiter(max_concurrent=2)
+        in_flight = 0
+        peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_classify_node_runs_llm_calls_concurrently(self):
+        """Test classification latency is ~one call, not the sum."""
+
+        async def slow_llm(**kwargs):
+            await asyncio.sleep(0.1)
+            return {"category": "מידע", "priority": "P3", "reason": kwargs["subject"]}
+
+        raw_emails = [
+            {
+                "id": f"email_{i}",
+                "subject": f"subject {i}",
+                "sender": "Dana",
+                "sender_email": f"dana{i}@example.com",
+                "snippet": "hi",
+            }
+            for i in range(10)
+        ]
+        state = create_initial_state(max_concurrency=10)
+        state["raw_emails"] = raw_emails
+
+        with (
+            patch("src.agents.smart_email.nodes.classify.classify_with_llm", side_effect=slow_llm),
+            patch.dict("src.agents.smart_email.concurrency.PROVIDER_LIMITS", {"llm": (10, 0.0)}),
+        ):
+            start = time.perf_counter()
+            result = await classify_emails_node(state)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert [e.id for e in result["emails"]] == [f"email_{i}" for i in range(10)]
+        assert [e.priority_reason for e in result["emails"]] == [f"subject {i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_research_node_isolates_failures(self):
+        """Test one failed research call doesn't drop the others."""
+        emails = [
+            EmailItem(
+                id=f"email_{i}",
+                thread_id=f"t{i}",
+                subject=f"s{i}",
+                sender="BTL",
+                sender_email="info@btl.gov.il",
+                date="2026-01-24",
+                snippet="",
+                category=EmailCategory.BUREAUCRACY,
+                priority=Priority.P1,
+            )
+            for i in range(3)
+        ]
+
+        async def research(email, litellm_url):
+            if email.id == "email_1":
+                raise RuntimeError("gateway down")
+            return ResearchResult(email_id=email.id, query="q", summary=f"sum {email.id}")
+
+        state = create_initial_state()
+        state["emails"] = emails
+        with patch("src.agents.smart_email.nodes.research.research_with_llm", side_effect=research):
+            result = await research_node(state)
+
+        assert [r.email_id for r in result["research_results"]] == ["email_0", "email_2"]
+        assert result["research_count"] == 2
+        assert emails[1].research is None
+
+    @pytest.mark.asyncio
+    async def test_memory_enrich_creates_profile_once_per_sender(self):
+        """Test new senders are created in one batch, once each."""
+        store = MagicMock()
+        store.get_sender_memories = AsyncMock(return_value={})
+        store.create_sender_profiles = AsyncMock()
+
+        state = create_initial_state()
+        state["raw_emails"] = [
+            {"id": "1", "sender": "Dana", "sender_email": "dana@example.com"},
+            {"id": "2", "sender": "Avi", "sender_email": "avi@example.com"},
+            {"id": "3", "sender": "Dana", "sender_email": "Dana@example.com"},
+        ]
+
+        with (
+            patch.dict(os.environ, {"DATABASE_URL": "postgresql://test"}),
+            patch(
+                "src.agents.smart_email.nodes.memory.get_memory_store",
+                AsyncMock(return_value=store),
+            ),
+        ):
+            result = await memory_enrich_node(state)
+
+        assert result["memory_enabled"] is True
+        assert [e["id"] for e in result["raw_emails"]] == ["1", "2", "3"]
+        store.get_sender_memories.assert_awaited_once()
+        store.create_sender_profiles.assert_awaited_once_with(
+            {"dana@example.com": "Dana", "avi@example.com": "Avi"}
+        )
+        assert result["raw_emails"][2]["sender_relationship"] == "new"
+        assert result["raw_emails"][2]["sender_email"] == "Dana@example.com"
@@ -0,0 +1,195 @@
+"""Tests for bulk smart-email sender memory.
+
+Tests cover:
+- MemoryStore bulk profile, history and context lookups
+- Batched sender profile creation
+- Draft node bulk-loading contexts missing from enrichment
+"""
+
+import os
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.smart_email.memory.store import MemoryStore
+from src.agents.smart_email.nodes.draft import load_sender_contexts
+from src.agents.smart_email.state import (
+    EmailCategory,
+    EmailItem,
+    Priority,
+    create_initial_state,
+)
+
+
+class TestBulkSenderMemory:
+    """Tests for batched MemoryStore sender lookups."""
+
+    @staticmethod
+    def _store_with_conn():
+        store = MemoryStore(database_url="postgresql://test")
+        conn = AsyncMock()
+        store._pool = MagicMock()
+        store._pool.acquire.return_value.__aenter__.return_value = conn
+        return store, conn
+
+    @pytest.mark.asyncio
+    async def test_get_sender_memories_uses_two_queries(self):
+        """Test profiles and histories for N senders cost two queries."""
+        store, conn = self._store_with_conn()
+        conn.fetch.side_effect = [
+            [{"email": "dana@example.com", "name": "Dana", "total_interactions": 4}],
+            [
+                {
+                    "sender_email": "dana@example.com",
+                    "subject": "b",
+                    "timestamp": datetime(2026, 1, 2),
+                },
+                {
+                    "sender_email": "dana@example.com",
+                    "subject": "a",
+                    "timestamp": datetime(2026, 1, 1),
+                },
+            ],
+        ]
+
+        memories = await store.get_sender_memories(
+            ["Dana@example.com", "avi@example.com", "dana@example.com"]
+        )
+
+        assert conn.fetch.await_count == 2
+        profile_sql, profile_keys = conn.fetch.await_args_list[0].args
+        assert "ANY($1::text[])" in profile_sql
+        assert profile_keys == ["avi@example.com", "dana@example.com"]
+        history_sql, history_keys, limit = conn.fetch.await_args_list[1].args
+        assert "LATERAL" in history_sql
+        assert history_keys == ["dana@example.com"]
+        assert limit == 5
+
+        assert memories["avi@example.com"] == {"profile": None, "history": []}
+        assert memories["dana@example.com"]["profile"]["name"] == "Dana"
+        assert [h["subject"] for h in memories["dana@example.com"]["history"]] == ["b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_create_sender_profiles_single_statement(self):
+        """Test new profiles are inserted with one unnest statement."""
+        store, conn = self._store_with_conn()
+        conn.fetch.return_value = [
+            {"email": "dana@example.com", "name": "Dana"},
+            {"email": "avi@example.com", "name": ""},
+        ]
+
+        count = await store.create_sender_profiles(
+            {"Dana@example.com": "Dana", "dana@example.com": "D", "avi@example.com": ""}
+        )
+
+        assert count == 2
+        conn.fetch.assert_awaited_once()
+        _, emails, names, _ = conn.fetch.await_args.args
+        assert emails == ["dana@example.com", "avi@example.com"]
+        assert names == ["Dana", ""]
+
+    @pytest.mark.asyncio
+    async def test_get_sender_histories_groups_by_sender(self):
+        """Test one LATERAL query returns histories grouped per sender."""
+        store, conn = self._store_with_conn()
+        conn.fetch.return_value = [
+            {"sender_email": "dana@example.com", "subject": "b"},
+            {"sender_email": "avi@example.com", "subject": "x"},
+            {"sender_email": "dana@example.com", "subject": "a"},
+        ]
+
+        histories = await store.get_sender_histories(
+            ["Dana@example.com", "avi@example.com"], limit=3
+        )
+
+        conn.fetch.assert_awaited_once()
+        _, keys, limit = conn.fetch.await_args.args
+        assert keys == ["avi@example.com", "dana@example.com"]
+        assert limit == 3
+        assert [h["subject"] for h in histories["dana@example.com"]] == ["b", "a"]
+        assert [h["subject"] for h in histories["avi@example.com"]] == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_get_sender_contexts_for_llm_in_two_queries(self):
+        """Test contexts for N senders cost one profile and one history query."""
+        store, conn = self._store_with_conn()
+        conn.fetch.side_effect = [
+            [{"email": "dana@example.com", "name": "Dana", "total_interactions": 2}],
+            [
+                {
+                    "sender_email": "dana@example.com",
+                    "subject": "דוח",
+                    "timestamp": datetime(2026, 1, 15),
+                }
+            ],
+        ]
+
+        contexts = await store.get_sender_contexts_for_llm(["dana@example.com", "avi@example.com"])
+
+        assert conn.fetch.await_count == 2
+        assert contexts["avi@example.com"] == "שולח חדש: avi@example.com"
+        assert "15/01: דוח" in contexts["dana@example.com"]
+
+    def test_format_sender_context_matches_single_lookup(self):
+        """Test context text is built from loaded profile and history."""
+        context = MemoryStore.format_sender_context(
+            "dana@example.com",
+            {
+                "name": "Dana",
+                "role": "רואת חשבון",
+                "total_interactions": 7,
+                "relationship_type": "recurring",
+                "typical_priority": "P2",
+            },
+            [{"subject": "דוח שנתי", "timestamp": datetime(2026, 1, 15)}],
+        )
+
+        assert "Dana הוא רואת חשבון" in context
+        assert "בדרך כלל עדיפות P2" in context
+        assert "15/01: דוח שנתי" in context
+        assert MemoryStore.format_sender_context("x@y.com", None, []) == "שולח חדש: x@y.com"
+
+    @pytest.mark.asyncio
+    async def test_draft_node_loads_missing_contexts_in_bulk(self):
+        """Test draft node reuses enriched context and bulk-loads the rest."""
+        emails = [
+            EmailItem(
+                id=str(i),
+                thread_id="t",
+                subject="s",
+                sender="S",
+                sender_email=sender,
+                date="",
+                snippet="",
+                category=EmailCategory.ACTION_REQUIRED,
+                priority=Priority.P1,
+            )
+            for i, sender in enumerate(["dana@example.com", "avi@example.com", "eli@example.com"])
+        ]
+        state = create_initial_state()
+        state["raw_emails"] = [
+            {"id": "0", "sender_email": "dana@example.com", "sender_context": "known"},
+        ]
+        store = MagicMock()
+        store.get_sender_contexts_for_llm = AsyncMock(
+            return_value={"avi@example.com": "ctx avi", "eli@example.com": "ctx eli"}
+        )
+
+        with (
+            patch.dict(os.environ, {"DATABASE_URL": "postgresql://test"}),
+            patch(
+                "src.agents.smart_email.nodes.memory.get_memory_store",
+                AsyncMock(return_value=store),
+            ),
+        ):
+            contexts = await load_sender_contexts(state, emails)
+
+        store.get_sender_contexts_for_llm.assert_awaited_once_with(
+            ["avi@example.com", "eli@example.com"]
+        )
+        assert contexts == {
+            "dana@example.com": "known",
+            "avi@example.com": "ctx avi",
+            "eli@example.com": "ctx eli",
+        }
@@ -0,0 +1,168 @@
+"""Tests for smart-email sender memory caching.
+
+Tests cover:
+- TTLCache LRU eviction, expiry and counters
+- MemoryStore profile/context caching and invalidation on writes
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.smart_email.memory.cache import TTLCache
+from src.agents.smart_email.memory.store import MemoryStore
+
+
+class TestMemoryCache:
+    """Tests for MemoryStore profile/context caching."""
+
+    def test_ttl_cache_lru_eviction_and_counters(self):
+        """Test LRU eviction order and hit/miss counters."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # a is now most recent
+        cache.set("c", 3)  # evicts b
+
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+        assert stats["size"] == 2
+
+    def test_ttl_cache_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("src.agents.smart_email.memory.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.agents.smart_email.memory.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @staticmethod
+    def _store_with_conn():
+        store = MemoryStore(database_url="postgresql://test")
+        conn = AsyncMock()
+        store._pool = MagicMock()
+        store._pool.acquire.return_value.__aenter__.return_value = conn
+        return store, conn
+
+    @pytest.mark.asyncio
+    async def test_profile_cached_and_invalidated(self):
+        """Test repeated lookups hit the cache until the profile changes."""
+        store, conn = self._store_with_conn()
+        conn.fetchrow.return_value = {"email": "dana@example.com", "total_interactions": 1}
+
+        first = await store.get_sender_profile("Dana@example.com")
+        first["total_interactions"] = 99  # callers get copies
+        second = await store.get_sender_profile("dana@example.com")
+
+        assert conn.fetchrow.await_count == 1
+        assert second["total_interactions"] == 1
+
+        await store.increment_interaction("dana@example.com")
+        await store.get_sender_profile("dana@example.com")
+        assert conn.fetchrow.await_count == 2
+
+        stats = store.get_cache_stats()["profiles"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_context_cached_until_record_interaction(self):
+        """Test LLM context is reused and dropped by a new interaction."""
+        store, conn = self._store_with_conn()
+        conn.fetchrow.return_value = {"email": "dana@example.com", "name": "Dana"}
+        conn.fetch.return_value = []
+
+        first = await store.get_sender_context_for_llm("dana@example.com")
+        again = await store.get_sender_context_for_llm("DANA@example.com")
+        assert first == again
+        assert conn.fetch.await_count == 1  # history queried once
+
+        await store.record_interaction("dana@example.com", "m1", "t1", "subject")
+        assert "dana@example.com" not in store._context_cache
+        assert "dana@example.com" not in store._profile_cache
+
+    @pytest.mark.asyncio
+    async def test_bulk_profiles_only_query_misses(self):
+        """Test bulk lookup serves cached senders and queries the rest."""
+        store, conn = self._store_with_conn()
+        store._profile_cache.set("dana@example.com", {"email": "dana@example.com"})
+        conn.fetch.return_value = [{"email": "avi@example.com"}]
+
+        profiles = await store.get_sender_profiles(["dana@example.com", "avi@example.com"])
+
+        assert set(profiles) == {"dana@example.com", "avi@example.com"}
+        assert conn.fetch.await_args.args[1] == ["avi@example.com"]
+        assert "avi@example.com" in store._profile_cache
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_after_commit(self):
+        """Test a read racing an update can't leave the old row cached."""
+        store, conn = self._store_with_conn()
+        conn.fetchrow.return_value = {"email": "dana@example.com", "role": "old"}
+
+        async def racing_read(*args):
+            # Another task reads (and caches) the row while the write is in flight
+            await store.get_sender_profile("dana@example.com")
+
+        conn.execute.side_effect = racing_read
+
+        assert await store.update_sender_profile("dana@example.com", role="new")
+        assert "dana@example.com" not in store._profile_cache
+
+        await store.increment_interaction("dana@example.com")
+        assert "dana@example.com" not in store._profile_cache
+
+    @pytest.mark.asyncio
+    async def test_read_suspended_across_write_does_not_cache_old_row(self):
+        """Test a read that fetched the old row before a write doesn't cache it."""
+        store, conn = self._store_with_conn()
+        fetched = asyncio.Event()
+        written = asyncio.Event()
+
+        async def slow_fetchrow(*args):
+            row = {"email": "dana@example.com", "role": "old"}
+            fetched.set()
+            await written.wait()  # suspended holding the old row
+            return row
+
+        conn.fetchrow.side_effect = slow_fetchrow
+
+        reader = asyncio.create_task(store.get_sender_profile("dana@example.com"))
+        await fetched.wait()
+        assert await store.update_sender_profile("dana@example.com", role="new")
+        written.set()
+
+        assert (await reader)["role"] == "old"
+        assert "dana@example.com" not in store._profile_cache
+
+        conn.fetchrow.side_effect = None
+        conn.fetchrow.return_value = {"email": "dana@example.com", "role": "new"}
+        await store.get_sender_profile("dana@example.com")
+        assert store._profile_cache.get("dana@example.com")["role"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_context_read_suspended_across_write_does_not_cache(self):
+        """Test a context build spanning a write doesn't cache the old context."""
+        store, conn = self._store_with_conn()
+        conn.fetchrow.return_value = {"email": "dana@example.com", "name": "Dana"}
+        fetched = asyncio.Event()
+        written = asyncio.Event()
+
+        async def slow_history(*args):
+            fetched.set()
+            await written.wait()
+            return []
+
+        conn.fetch.side_effect = slow_history
+
+        reader = asyncio.create_task(store.get_sender_context_for_llm("dana@example.com"))
+        await fetched.wait()
+        await store.increment_interaction("dana@example.com")
+        written.set()
+        await reader
+
+        assert "dana@example.com" not in store._context_cache